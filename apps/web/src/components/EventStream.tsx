@@ -7,6 +7,7 @@ declare global {
   interface EventSourceEventMap {
     history: MessageEvent
     domain_event: MessageEvent
+    resync: MessageEvent
   }
 }
 
@@ -56,6 +57,12 @@ export default function EventStream({ paused = false }: EventStreamProps) {
       setIsConnected(false)
     }
 
+    // Reconexão sem retomada possível: o servidor reenvia o histórico
+    eventSource.addEventListener('resync', () => {
+      console.log('[EventStream] Ressincronizando (histórico será reenviado)')
+      setEvents([])
+    })
+
     // Eventos de histórico
     eventSource.addEventListener('history', (e) => {
       try {
@@ -11,14 +11,23 @@ CRUD no Kanban emitam eventos que são consumidos pelos clientes SSE.
 Cada workspace tem seu próprio bus para isolamento (ADR024).
 """
 import asyncio
+import threading
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
-from typing import Any, Dict
+from typing import Any, AsyncIterator, Deque, Dict, Hashable, List, Optional
 from datetime import datetime
 import json
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Eventos que carregam o estado completo do card: com o consumidor atrasado,
+# só o mais recente por card importa (coalescência)
+COALESCIBLE_EVENT_TYPES = frozenset({"card_updated"})
+
+# Políticas para consumidor lento (buffer do subscriber cheio)
+SLOW_CONSUMER_POLICIES = ("coalesce", "drop_oldest")
+
 
 @dataclass
 class KanbanEvent:
@@ -28,18 +37,83 @@ class KanbanEvent:
     data: Dict[str, Any]
     workspace_id: str
     timestamp: datetime = field(default_factory=datetime.utcnow)
+    sequence: int = 0  # Posição no log do workspace (0 = não publicado)
 
     def to_sse_format(self) -> str:
-        """Converte evento para formato SSE."""
-        return f"event: {self.event_type}\ndata: {json.dumps(self.data)}\n\n"
+        """Converte evento para formato SSE (com id para Last-Event-ID)."""
+        event_id = f"id: {self.sequence}\n" if self.sequence else ""
+        return f"event: {self.event_type}\ndata: {json.dumps(self.data)}\n{event_id}\n"
+
+
+class _Subscriber:
+    """Buffer limitado de um cliente SSE (fan-out: um por subscriber)."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, max_buffer: int, policy: str):
+        self.loop = loop
+        self.max_buffer = max_buffer
+        self.policy = policy
+        self.buffer: "OrderedDict[Hashable, KanbanEvent]" = OrderedDict()
+        self.wakeup = asyncio.Event()
+        self.dropped = 0
+        self.coalesced = 0
+
+    def offer(self, event: KanbanEvent) -> None:
+        """Enfileira evento aplicando a política de consumidor lento (com lock do bus)."""
+        card_id = event.data.get("id")
+        key: Hashable = ("seq", event.sequence)
+
+        if self.policy == "coalesce" and card_id is not None:
+            if event.event_type in COALESCIBLE_EVENT_TYPES:
+                key = (event.event_type, card_id)
+            if event.event_type == "card_deleted":
+                # Atualização pendente de card deletado não importa mais
+                for pending_type in COALESCIBLE_EVENT_TYPES:
+                    if self.buffer.pop((pending_type, card_id), None) is not None:
+                        self.coalesced += 1
+            elif self.buffer.pop(key, None) is not None:
+                # Estado mais recente substitui o pendente (reposicionado no fim
+                # para manter a entrega em ordem de sequence)
+                self.coalesced += 1
+
+        if len(self.buffer) >= self.max_buffer:
+            self.buffer.popitem(last=False)
+            self.dropped += 1
+
+        self.buffer[key] = event
+
+    def notify(self) -> None:
+        """Acorda o subscriber (thread-safe: publish pode vir de outro loop)."""
+        try:
+            self.loop.call_soon_threadsafe(self.wakeup.set)
+        except RuntimeError:
+            # Loop encerrado; subscriber é removido ao sair
+            pass
+
+
+class _WorkspaceChannel:
+    """Estado de um workspace: log de replay e subscribers."""
+
+    def __init__(self, replay_window: int):
+        self.sequence = 0
+        self.delivered = 0  # Maior sequence já entregue a algum subscriber
+        self.log: Deque[KanbanEvent] = deque(maxlen=replay_window)
+        self.subscribers: List[_Subscriber] = []
 
 
 class KanbanEventBus:
     """
     EventBus para eventos Kanban com isolamento por workspace.
 
-    Gerencia filas de eventos por workspace, permitindo que clientes SSE
-    se inscrevam para receber eventos em tempo real.
+    Cada workspace tem um log de replay (últimos replay_window eventos,
+    numerados por sequence) e cada subscriber recebe sua própria cópia dos
+    eventos (fan-out) em um buffer limitado. Duas abas abertas recebem
+    todos os eventos; um cliente lento só afeta o próprio buffer:
+    - coalesce (padrão): card_updated pendente do mesmo card é substituído
+      pelo mais recente; card_deleted descarta updates pendentes do card
+    - drop_oldest: buffer cheio descarta o evento mais antigo
+
+    Reconexões informam o último sequence recebido (Last-Event-ID) e
+    recebem apenas o que perderam, enquanto estiver na janela de replay.
 
     Uso:
         bus = KanbanEventBus.get_instance()
@@ -55,10 +129,30 @@ class KanbanEventBus:
     _instance: "KanbanEventBus | None" = None
     _lock = asyncio.Lock()
 
-    def __init__(self):
-        # workspace_id -> asyncio.Queue[KanbanEvent]
-        self._queues: Dict[str, asyncio.Queue] = {}
-        self._subscribers_count: Dict[str, int] = {}
+    def __init__(
+        self,
+        replay_window: int = 500,
+        subscriber_buffer: int = 256,
+        slow_consumer_policy: str = "coalesce",
+    ):
+        """
+        Inicializa o bus.
+
+        Args:
+            replay_window: Eventos mantidos por workspace para reconexão
+            subscriber_buffer: Eventos pendentes por subscriber
+            slow_consumer_policy: "coalesce" ou "drop_oldest"
+        """
+        if slow_consumer_policy not in SLOW_CONSUMER_POLICIES:
+            raise ValueError(f"Política inválida: {slow_consumer_policy}")
+
+        self.replay_window = replay_window
+        self.subscriber_buffer = subscriber_buffer
+        self.slow_consumer_policy = slow_consumer_policy
+        # workspace_id -> canal (log + subscribers); publish pode vir de
+        # outra thread (worker), então o estado é protegido por threading.Lock
+        self._channels: Dict[str, _WorkspaceChannel] = {}
+        self._state_lock = threading.Lock()
 
     @classmethod
     def get_instance(cls) -> "KanbanEventBus":
@@ -67,44 +161,112 @@ class KanbanEventBus:
             cls._instance = cls()
         return cls._instance
 
-    def _get_or_create_queue(self, workspace_id: str) -> asyncio.Queue:
-        """Retorna fila para o workspace, criando se necessário."""
-        if workspace_id not in self._queues:
-            self._queues[workspace_id] = asyncio.Queue(maxsize=1000)
-            self._subscribers_count[workspace_id] = 0
-            logger.debug(f"[KanbanEventBus] Criada fila para workspace: {workspace_id}")
-        return self._queues[workspace_id]
+    def _get_or_create_channel(self, workspace_id: str) -> _WorkspaceChannel:
+        """Retorna canal do workspace, criando se necessário (com lock)."""
+        channel = self._channels.get(workspace_id)
+        if channel is None:
+            channel = _WorkspaceChannel(self.replay_window)
+            self._channels[workspace_id] = channel
+            logger.debug(f"[KanbanEventBus] Criado canal para workspace: {workspace_id}")
+        return channel
 
     async def publish(self, event_type: str, data: Dict[str, Any], workspace_id: str) -> None:
         """
         Publica evento no bus.
 
+        O evento entra no log de replay e no buffer de cada subscriber;
+        nunca bloqueia o publicador.
+
         Args:
             event_type: Tipo do evento (card_created, card_updated, etc)
             data: Dados do evento (será serializado para JSON)
             workspace_id: ID do workspace (ADR024)
         """
-        event = KanbanEvent(
-            event_type=event_type,
-            data=data,
-            workspace_id=workspace_id
+        with self._state_lock:
+            channel = self._get_or_create_channel(workspace_id)
+            channel.sequence += 1
+            event = KanbanEvent(
+                event_type=event_type,
+                data=data,
+                workspace_id=workspace_id,
+                sequence=channel.sequence,
+            )
+            channel.log.append(event)
+
+            subscribers = list(channel.subscribers)
+            for subscriber in subscribers:
+                subscriber.offer(event)
+
+        for subscriber in subscribers:
+            subscriber.notify()
+
+        logger.debug(
+            f"[KanbanEventBus] Evento publicado: {event_type} "
+            f"(workspace={workspace_id}, seq={event.sequence}, subscribers={len(subscribers)})"
         )
 
-        queue = self._get_or_create_queue(workspace_id)
+    def last_sequence(self, workspace_id: str) -> int:
+        """Retorna o sequence do último evento publicado no workspace."""
+        with self._state_lock:
+            channel = self._channels.get(workspace_id)
+            return channel.sequence if channel else 0
 
-        try:
-            # Não bloqueia se fila estiver cheia (descarta evento antigo)
-            queue.put_nowait(event)
-            logger.debug(f"[KanbanEventBus] Evento publicado: {event_type} (workspace={workspace_id})")
-        except asyncio.QueueFull:
-            logger.warning(f"[KanbanEventBus] Fila cheia para workspace {workspace_id}, evento descartado")
+    def can_resume(self, workspace_id: str, last_event_id: int) -> bool:
+        """
+        Verifica se um cliente pode retomar a partir de last_event_id.
+
+        Falso quando eventos posteriores já saíram da janela de replay (ou o
+        id é de outra execução do servidor): o cliente precisa de snapshot.
+
+        Args:
+            workspace_id: ID do workspace
+            last_event_id: Último sequence recebido pelo cliente
+
+        Returns:
+            True se todos os eventos após last_event_id estão no log
+        """
+        with self._state_lock:
+            channel = self._channels.get(workspace_id)
+            current = channel.sequence if channel else 0
+            if last_event_id > current:
+                return False
+            if last_event_id == current:
+                return True
+            oldest = channel.log[0].sequence if channel.log else current + 1
+            return last_event_id >= oldest - 1
+
+    def get_events_after(self, workspace_id: str, after_sequence: int) -> List[KanbanEvent]:
+        """
+        Retorna eventos do log de replay posteriores a um sequence.
+
+        Args:
+            workspace_id: ID do workspace
+            after_sequence: Último sequence já recebido
+
+        Returns:
+            Eventos com sequence > after_sequence, em ordem
+        """
+        with self._state_lock:
+            channel = self._channels.get(workspace_id)
+            if channel is None:
+                return []
+            return [event for event in channel.log if event.sequence > after_sequence]
 
-    async def subscribe(self, workspace_id: str) -> KanbanEvent:
+    async def subscribe(
+        self,
+        workspace_id: str,
+        after_sequence: Optional[int] = None,
+        heartbeat: Optional[float] = None,
+    ) -> AsyncIterator[Optional[KanbanEvent]]:
         """
         Generator que yield eventos de um workspace.
 
         Args:
             workspace_id: ID do workspace para ouvir eventos
+            after_sequence: Último sequence já recebido (replay a partir dele).
+                None = eventos ainda não entregues a nenhum subscriber
+            heartbeat: Se definido, yield None após `heartbeat` segundos sem
+                eventos (permite heartbeat no SSE)
 
         Yields:
             KanbanEvent: Eventos do workspace em tempo real
@@ -113,24 +275,56 @@ class KanbanEventBus:
             async for event in bus.subscribe("core"):
                 yield event.to_sse_format()
         """
-        queue = self._get_or_create_queue(workspace_id)
-        self._subscribers_count[workspace_id] += 1
+        subscriber = _Subscriber(
+            asyncio.get_running_loop(), self.subscriber_buffer, self.slow_consumer_policy
+        )
+
+        with self._state_lock:
+            channel = self._get_or_create_channel(workspace_id)
+            start = channel.delivered if after_sequence is None else after_sequence
+            # Replay + registro atômicos: nenhum evento cai entre os dois
+            for event in channel.log:
+                if event.sequence > start:
+                    subscriber.offer(event)
+            channel.subscribers.append(subscriber)
+            total = len(channel.subscribers)
 
-        logger.info(f"[KanbanEventBus] Novo subscriber para workspace: {workspace_id} (total: {self._subscribers_count[workspace_id]})")
+        logger.info(f"[KanbanEventBus] Novo subscriber para workspace: {workspace_id} (total: {total})")
 
         try:
             while True:
-                # Aguarda próximo evento (timeout para permitir heartbeat)
-                try:
-                    event = await asyncio.wait_for(queue.get(), timeout=1.0)
+                with self._state_lock:
+                    event = (
+                        subscriber.buffer.popitem(last=False)[1]
+                        if subscriber.buffer
+                        else None
+                    )
+                    if event is not None:
+                        channel.delivered = max(channel.delivered, event.sequence)
+                    else:
+                        subscriber.wakeup.clear()
+
+                if event is not None:
                     yield event
-                except asyncio.TimeoutError:
-                    # Timeout normal - permite enviar heartbeat no SSE
                     continue
+
+                try:
+                    await asyncio.wait_for(subscriber.wakeup.wait(), timeout=heartbeat)
+                except asyncio.TimeoutError:
+                    # Sem eventos no intervalo - permite enviar heartbeat no SSE
+                    yield None
         finally:
-            self._subscribers_count[workspace_id] -= 1
+            with self._state_lock:
+                channel.subscribers.remove(subscriber)
+            if subscriber.dropped or subscriber.coalesced:
+                logger.warning(
+                    f"[KanbanEventBus] Subscriber lento em {workspace_id}: "
+                    f"{subscriber.dropped} descartados, {subscriber.coalesced} coalescidos"
+                )
             logger.info(f"[KanbanEventBus] Subscriber removido para workspace: {workspace_id}")
 
     def get_subscribers_count(self, workspace_id: str) -> int:
         """Retorna número de subscribers ativos para um workspace."""
-        return self._subscribers_count.get(workspace_id, 0)
+        with self._state_lock:
+            channel = self._channels.get(workspace_id)
+            return len(channel.subscribers) if channel else 0
@@ -12,17 +12,78 @@ DOC: ADR024 - Workspace isolation
 
 import asyncio
 import logging
+import re
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Callable, Optional
 
 from core.kanban.domain.card import Card, CardStatus
+from core.kanban.domain.database import KanbanCard, KanbanList
 from core.kanban.ports.kanban_port import KanbanPort
 from infra.kanban.adapters.sqlite_kanban_adapter import SQLiteKanbanAdapter
 from kernel import Result
 
 logger = logging.getLogger(__name__)
 
+# Recuo aplicado à marca d'água do sync incremental (tolera diferença de
+# relógio com o Trello; reaplicar um card é idempotente)
+WATERMARK_OVERLAP = timedelta(minutes=2)
+
+# Padrões de nome de lista por status do Trello (com/sem emoji, PT/EN)
+STATUS_LIST_PATTERNS = {
+    "todo": ["A Fazer", "To Do", "📋 A Fazer", "todo"],
+    "in_progress": ["Em Andamento", "In Progress", "🚧 Em Andamento", "in progress", "doing"],
+    "review": ["Em Revisão", "Review", "👁️ Em Revisão", "review", "testing"],
+    "done": ["Publicar", "Done", "🚀 Publicar", "done", "pronto"],
+    "backlog": ["Issues", "Backlog", "💡 Brainstorm", "brainstorm"],
+}
+
+# Emojis ignorados ao comparar nomes de listas
+_EMOJI_RE = re.compile(r'[\U0001F300-\U0001F9FF]')
+
+
+class _ListIndex:
+    """
+    Mapeamentos status → lista e nome → lista de um board local.
+
+    Montado uma vez por sync a partir de list_lists(), evitando consultas
+    e comparações de nomes repetidas para cada card do Trello.
+    """
+
+    def __init__(self, lists: list[KanbanList]):
+        self._lists = lists
+        self._by_status: dict[str, Optional[str]] = {}
+        self._by_name: dict[str, str] = {}
+        for lst in lists:
+            self._by_name.setdefault(_EMOJI_RE.sub('', lst.name).lower(), lst.id)
+        self.first_list_id: Optional[str] = lists[0].id if lists else None
+
+    def for_status(self, status: Optional[CardStatus]) -> Optional[str]:
+        """ID da primeira lista (por posição) cujo nome casa com o status."""
+        if not status:
+            return None
+
+        if status.value not in self._by_status:
+            patterns = STATUS_LIST_PATTERNS.get(status.value, [status.value.title()])
+            match = None
+            for lst in self._lists:
+                lst_name_lower = lst.name.lower()
+                if any(
+                    pattern.lower() in lst_name_lower or lst_name_lower in pattern.lower()
+                    for pattern in patterns
+                ):
+                    match = lst.id
+                    break
+            self._by_status[status.value] = match
+
+        return self._by_status[status.value]
+
+    def for_name(self, list_name: Optional[str]) -> Optional[str]:
+        """ID da lista com o mesmo nome, ignorando emojis e caixa."""
+        if not list_name:
+            return None
+        return self._by_name.get(_EMOJI_RE.sub('', list_name).lower())
+
 
 @dataclass
 class SyncOperation:
@@ -44,17 +105,34 @@ class TrelloSyncService:
     - Gerenciar fila de operações para processamento assíncrono
     - Detectar e resolver conflitos (última escrita vence)
 
+    Pipeline de escrita (kanban.db → Trello):
+    - Operações pendentes são agrupadas por card: várias do mesmo tipo
+      viram uma (cada operação lê o estado atual do card no kanban.db)
+    - Cards diferentes são processados em paralelo por até
+      max_concurrency workers; operações do mesmo card são serializadas
+    - O ritmo das requisições fica a cargo do rate limiter do TrelloAdapter
+    - Operações que esgotam os retries vão para a DLQ em sync_dead_letters
+
     Atributes:
         db: Adapter do kanban.db (SQLite)
         trello: Adapter do Trello API
-        _queue: asyncio.Queue para operações de sync
-        _dlq: Dead Letter Queue para operações falhas
-        _worker_task: Task assíncrona do worker
+        _queue: asyncio.Queue com IDs de cards prontos para processar
+        _pending: Operações pendentes por card (já agrupadas)
+        _active: Cards sendo processados por algum worker
+        _dlq: Fallback em memória se a DLQ não puder ser gravada no banco
+        _worker_tasks: Tasks assíncronas dos workers
         _max_retries: Número máximo de retries
-        _running: Se o worker está rodando
+        _max_concurrency: Número de workers (cards processados em paralelo)
+        _running: Se os workers estão rodando
     """
 
-    def __init__(self, db: SQLiteKanbanAdapter, trello: KanbanPort, max_retries: int = 3):
+    def __init__(
+        self,
+        db: SQLiteKanbanAdapter,
+        trello: KanbanPort,
+        max_retries: int = 3,
+        max_concurrency: int = 4,
+    ):
         """
         Inicializa o serviço de sincronização.
 
@@ -62,13 +140,17 @@ class TrelloSyncService:
             db: Adapter do kanban.db
             trello: Adapter do Trello API
             max_retries: Número máximo de retries para operações falhas
+            max_concurrency: Número máximo de cards sincronizados em paralelo
         """
         self.db = db
         self.trello = trello
         self._queue: asyncio.Queue = asyncio.Queue()
+        self._pending: dict[str, list[SyncOperation]] = {}
+        self._active: set[str] = set()
         self._dlq: list[SyncOperation] = []
-        self._worker_task: Optional[asyncio.Task] = None
+        self._worker_tasks: list[asyncio.Task] = []
         self._max_retries = max_retries
+        self._max_concurrency = max(1, max_concurrency)
         self._running = False
 
     async def sync_card_created(self, card_id: str) -> Result[Card, str]:
@@ -240,30 +322,36 @@ class TrelloSyncService:
             logger.error(f"Erro ao sincronizar card movido: {e}")
             return Result.err(f"Erro ao sync_card_moved: {str(e)}")
 
-    async def sync_from_trello(self, board_id: str, force: bool = False) -> Result[int, str]:
+    async def sync_from_trello(
+        self,
+        board_id: str,
+        force: bool = False,
+        incremental: bool = True,
+    ) -> Result[int, str]:
         """
         Sincroniza mudanças do Trello → kanban.db (polling/webhook).
 
         Fluxo:
         1. Garante que o board e listas existem no kanban.db
-        2. Busca todos os cards do Trello
+        2. Busca cards do Trello: só os alterados desde a marca d'água
+           do último sync (incremental) ou todos (primeiro sync/force)
         3. Para cada card, busca correspondente no kanban.db por trello_card_id
         4. Compara timestamps (updated_at)
         5. Se Trello é mais recente (ou force=True), atualiza kanban.db
         6. Se card mudou de lista, move no kanban.db
         7. Se card não existe no kanban.db, cria
+        8. Grava todas as mudanças e a nova marca d'água em uma transação
 
         Args:
             board_id: ID do board no Trello
-            force: Se True, ignora timestamps e sempre atualiza do Trello
+            force: Se True, ignora timestamps e marca d'água e sempre atualiza do Trello
+            incremental: Se True, busca apenas cards alterados desde o último sync
 
         Returns:
             Result.ok(int) com contagem de cards sincronizados
             Result.err(str) com mensagem de erro se falhar
         """
         try:
-            from datetime import datetime
-
             # 0. Garante que board existe no kanban.db
             logger.info(f"[SYNC] Verificando/criando board no kanban.db para Trello board_id={board_id}")
             boards_result = self.db.list_boards()
@@ -307,126 +395,98 @@ class TrelloSyncService:
                 config = get_trello_kanban_lists_config()
                 default_lists = config.get_list_names()
 
-                for pos, name in enumerate(default_lists):
-                    from core.kanban.domain.database import KanbanList
-                    new_list = KanbanList(
-                        id=f"list-default-{pos}",
-                        board_id=kanban_board_id,
-                        name=name,
-                        position=pos,
-                    )
-                    self.db.create_list(new_list)
+                with self.db.transaction():
+                    for pos, name in enumerate(default_lists):
+                        new_list = KanbanList(
+                            id=f"list-default-{pos}",
+                            board_id=kanban_board_id,
+                            name=name,
+                            position=pos,
+                        )
+                        self.db.create_list(new_list)
                 logger.info(f"[SYNC] {len(default_lists)} listas padrão criadas")
+                lists_result = self.db.list_lists(kanban_board_id)
+
+            # Mapeamentos status → lista e nome → lista, montados uma vez por sync
+            local_lists = lists_result.value if lists_result.is_ok else []
+            list_index = _ListIndex(local_lists)
+
+            # 2. Busca cards do Trello (incremental a partir da marca d'água)
+            watermark_source = f"trello:{board_id}"
+            sync_started_at = datetime.utcnow()
+            watermark = None
+            if incremental and not force:
+                watermark_result = self.db.get_sync_watermark(watermark_source)
+                if watermark_result.is_ok:
+                    watermark = watermark_result.value
+
+            if watermark:
+                since = watermark - WATERMARK_OVERLAP
+                logger.info(f"[SYNC] Buscando cards alterados no Trello desde {since.isoformat()}")
+                trello_cards_result = await self.trello.list_cards_since(board_id, since)
+            else:
+                logger.info(f"[SYNC] Buscando todos os cards do Trello para board_id={board_id}")
+                trello_cards_result = await self.trello.list_cards(board_id)
 
-            # 2. Busca cards do Trello
-            logger.info(f"[SYNC] Buscando cards do Trello para board_id={board_id}")
-            trello_cards_result = await self.trello.list_cards(board_id)
             if trello_cards_result.is_err:
                 return Result.err(f"Erro ao buscar cards do Trello: {trello_cards_result.error}")
 
             trello_cards = trello_cards_result.value
-            synced_count = 0
-
             logger.info(f"[SYNC] {len(trello_cards)} cards retornados do Trello")
 
-            # 2. Para cada card do Trello
-            logger.info(f"[SYNC] Iniciando processamento de {len(trello_cards)} cards do Trello")
-
-            # Busca cards locais uma vez (para não buscar a cada iteração)
-            local_cards_result = self.db.list_cards()
+            # 3. Cards locais correspondentes: só os afetados no modo incremental,
+            # o board inteiro no sync completo
             local_cards_by_trello_id = {}
-            if local_cards_result.is_ok:
-                for lc in local_cards_result.value:
-                    if lc.trello_card_id:
-                        local_cards_by_trello_id[lc.trello_card_id] = lc
+            if watermark:
+                local_cards_result = self.db.list_cards_by_trello_ids(
+                    [getattr(trello_card, 'id', None) for trello_card in trello_cards]
+                )
+                if local_cards_result.is_ok:
+                    local_cards_by_trello_id = local_cards_result.value
+            else:
+                local_cards_result = self.db.list_cards()
+                if local_cards_result.is_ok:
+                    for lc in local_cards_result.value:
+                        if lc.trello_card_id:
+                            local_cards_by_trello_id[lc.trello_card_id] = lc
 
             logger.info(f"[SYNC] {len(local_cards_by_trello_id)} cards locais encontrados com trello_card_id")
 
+            # 4. Decide criações/atualizações sem tocar no banco
+            import time
+
+            to_create: list[KanbanCard] = []
+            to_update: list[tuple[str, dict]] = []
+
             for trello_card in trello_cards:
                 trello_id = getattr(trello_card, 'id', 'NO_ID')
-                trello_title = getattr(trello_card, 'title', 'NO TITLE')
                 trello_status = getattr(trello_card, 'status', None)
-                logger.info(f"[SYNC] Card Trello: id={trello_id}, title={trello_title}, status={trello_status}")
+                logger.debug(
+                    f"[SYNC] Card Trello: id={trello_id}, "
+                    f"title={getattr(trello_card, 'title', 'NO TITLE')}, status={trello_status}"
+                )
 
                 # Busca card local por trello_card_id (usando dicionário)
                 local_card = local_cards_by_trello_id.get(trello_id)
 
                 # PRD026 RF-013: Se não existe card local, CRIAR novo card
                 if not local_card:
-                    # Determina lista destino baseado no status do card Trello
-                    trello_status = getattr(trello_card, 'status', None)
-                    target_list_id = None
-
-                    # PRIORIDADE 1: Tenta mapear por status
-                    if trello_status:
-                        # Mapeamento: CardStatus → nome da lista
-                        status_to_list_name = {
-                            "todo": "A Fazer",
-                            "in_progress": "Em Andamento",
-                            "review": "Em Revisão",
-                            "done": "Publicar",
-                            "backlog": "Issues",
-                        }
-                        expected_list_name = status_to_list_name.get(
-                            trello_status.value,
-                            trello_status.value.title()
-                        )
-
-                        # Busca lista no kanban.db usando padrões flexíveis
-                        lists_result = self.db.list_lists(kanban_board_id)
-                        if lists_result.is_ok:
-                            status_match_patterns = {
-                                "todo": ["A Fazer", "To Do", "📋 A Fazer", "todo"],
-                                "in_progress": ["Em Andamento", "In Progress", "🚧 Em Andamento", "in progress"],
-                                "review": ["Em Revisão", "Review", "👁️ Em Revisão", "review"],
-                                "done": ["Publicar", "Done", "🚀 Publicar", "done"],
-                                "backlog": ["Issues", "Backlog", "💡 Brainstorm"],
-                            }
-                            patterns = status_match_patterns.get(trello_status.value, [expected_list_name])
-
-                            for lst in lists_result.value:
-                                lst_name_lower = lst.name.lower()
-                                for pattern in patterns:
-                                    if pattern.lower() in lst_name_lower or lst_name_lower in pattern.lower():
-                                        target_list_id = lst.id
-                                        break
-                                if target_list_id:
-                                    break
-
-                    # PRIORIDADE 2: Se não achou por status, busca lista pelo NOME da lista do Trello
-                    if not target_list_id:
-                        # Tenta pegar o nome da lista diretamente do card Trello
-                        # (alguns adapters podem ter list.name no card)
-                        trello_list_name = getattr(trello_card, 'list_name', None)
-                        if trello_list_name:
-                            lists_result = self.db.list_lists(kanban_board_id)
-                            if lists_result.is_ok:
-                                for lst in lists_result.value:
-                                    # Compara ignorando emoji
-                                    import re
-                                    lst_name_clean = re.sub(r'[\U0001F300-\U0001F9FF]', '', lst.name)
-                                    trello_name_clean = re.sub(r'[\U0001F300-\U0001F9FF]', '', trello_list_name)
-                                    if lst_name_clean.lower() == trello_name_clean.lower():
-                                        target_list_id = lst.id
-                                        break
-
-                    # PRIORIDADE 3: Fallback - usa primeira lista disponível
+                    # PRIORIDADE 1: status; PRIORIDADE 2: nome da lista do Trello
+                    # (alguns adapters podem ter list_name no card); PRIORIDADE 3: primeira lista
+                    target_list_id = (
+                        list_index.for_status(trello_status)
+                        or list_index.for_name(getattr(trello_card, 'list_name', None))
+                    )
                     if not target_list_id:
-                        lists_result = self.db.list_lists(kanban_board_id)
-                        if lists_result.is_ok and lists_result.value:
-                            target_list_id = lists_result.value[0].id
-                            logger.warning(
-                                f"Usando primeira lista como fallback para card {trello_card.id}"
-                            )
-                        else:
+                        if not list_index.first_list_id:
                             logger.warning(f"Não encontrou nenhuma lista para card {trello_card.id}, pulando criação")
                             continue
+                        target_list_id = list_index.first_list_id
+                        logger.warning(
+                            f"Usando primeira lista como fallback para card {trello_card.id}"
+                        )
 
-                    # Cria novo card no kanban.db
-                    from core.kanban.domain.database import KanbanCard
-                    import time
-
-                    new_card = KanbanCard(
+                    to_create.append(KanbanCard(
                         id=f"card-trello-{trello_card.id}-{int(time.time())}",
                         list_id=target_list_id,
                         title=trello_card.title,
@@ -434,78 +494,62 @@ class TrelloSyncService:
                         position=0,
                         trello_card_id=trello_card.id,
                         being_processed=False,
-                    )
-
-                    create_result = self.db.create_card(new_card)
-                    if create_result.is_ok:
-                        synced_count += 1
-                        logger.info(
-                            f"✅ Card CRIADO do Trello: {new_card.id} "
-                            f"(trello_id={trello_card.id}, lista={target_list_id})"
-                        )
-                    else:
-                        logger.error(f"Erro ao criar card do Trello: {create_result.error}")
-
+                    ))
                     continue  # Próximo card
 
-                # 3. Card existe: Compara timestamps (última escrita vence)
+                # Card existe: Compara timestamps (última escrita vence)
                 trello_updated = getattr(trello_card, 'updated_at', None)
                 local_updated = local_card.updated_at
 
                 should_update = force or (trello_updated and local_updated and trello_updated > local_updated)
-                print(f"[SYNC] trello_updated={trello_updated}, local_updated={local_updated}, force={force}, will_update={should_update}")
+                logger.debug(
+                    f"[SYNC] trello_updated={trello_updated}, local_updated={local_updated}, "
+                    f"force={force}, will_update={should_update}"
+                )
 
                 # Se Trello é mais recente (ou force=True), atualiza
                 if should_update:
-                    # Atualiza título e descrição
                     update_params = {
                         "title": trello_card.title,
                         "description": trello_card.description,
                     }
 
                     # Verifica se mudou de lista (status)
-                    trello_status = getattr(trello_card, 'status', None)
-                    if trello_status:
-                        # Busca lista destino pelo nome do status no kanban.db
-                        # Tenta múltiplos padrões de nome
-                        lists_result = self.db.list_lists(kanban_board_id)
-                        if lists_result.is_ok:
-                            target_list = None
-                            for lst in lists_result.value:
-                                # Múltiplos padrões de nome para cada status
-                                status_match_patterns = {
-                                    "todo": ["A Fazer", "To Do", "📋 A Fazer", "todo"],
-                                    "in_progress": ["Em Andamento", "In Progress", "🚧 Em Andamento", "in progress", "doing"],
-                                    "review": ["Em Revisão", "Review", "👁️ Em Revisão", "review", "testing"],
-                                    "done": ["Publicar", "Done", "🚀 Publicar", "done", "pronto"],
-                                    "backlog": ["Issues", "Backlog", "💡 Brainstorm", "brainstorm"],
-                                }
-
-                                patterns = status_match_patterns.get(trello_status.value, [trello_status.value.title()])
-                                lst_name_lower = lst.name.lower()
-
-                                for pattern in patterns:
-                                    if pattern.lower() in lst_name_lower or lst_name_lower in pattern.lower():
-                                        target_list = lst
-                                        break
-
-                                if target_list:
-                                    break
-                                    target_list = lst
-                                    break
-
-                            if target_list:
-                                update_params["list_id"] = target_list.id
-
-                    self.db.update_card(local_card.id, **update_params)
-                    synced_count += 1
-                    logger.info(
-                        f"Card sincronizado do Trello: {local_card.id} "
-                        f"(trello_id={trello_card.id})"
-                    )
+                    target_list_id = list_index.for_status(trello_status)
+                    if target_list_id:
+                        update_params["list_id"] = target_list_id
+
+                    to_update.append((local_card.id, update_params))
+
+            # 5. Aplica tudo em uma única transação (um commit por sync)
+            synced_count = 0
+            with self.db.transaction():
+                for new_card in to_create:
+                    create_result = self.db.create_card(new_card)
+                    if create_result.is_ok:
+                        synced_count += 1
+                        logger.info(
+                            f"✅ Card CRIADO do Trello: {new_card.id} "
+                            f"(trello_id={new_card.trello_card_id}, lista={new_card.list_id})"
+                        )
+                    else:
+                        logger.error(f"Erro ao criar card do Trello: {create_result.error}")
+
+                for local_card_id, update_params in to_update:
+                    update_result = self.db.update_card(local_card_id, **update_params)
+                    if update_result.is_ok:
+                        synced_count += 1
+                        logger.info(f"Card sincronizado do Trello: {local_card_id}")
+                    else:
+                        logger.error(f"Erro ao atualizar card do Trello: {update_result.error}")
+
+                watermark_result = self.db.set_sync_watermark(watermark_source, sync_started_at)
+                if watermark_result.is_err:
+                    logger.warning(f"[SYNC] Marca d'água não gravada: {watermark_result.error}")
 
             logger.info(
                 f"Sync from Trello completo: {synced_count}/{len(trello_cards)} cards sincronizados"
+                f" ({'incremental' if watermark else 'completo'})"
             )
 
             return Result.ok(synced_count)
@@ -523,6 +567,9 @@ class TrelloSyncService:
         """
         Enfileira operação de sincronização para processamento assíncrono.
 
+        Se o card já tem operações pendentes, a nova é agrupada com elas
+        (ver _merge_pending) em vez de gerar outra chamada à API.
+
         Args:
             operation: Tipo de operação ('create', 'update', 'move', 'delete')
             card_id: ID do card
@@ -534,57 +581,103 @@ class TrelloSyncService:
         """
         try:
             op = SyncOperation(operation=operation, card_id=card_id, kwargs=kwargs)
-            await self._queue.put(op)
+
+            # Card já agendado (ou em processamento, que reagenda ao terminar)
+            needs_schedule = card_id not in self._pending and card_id not in self._active
+            self._merge_pending(op)
+            if needs_schedule:
+                await self._queue.put(card_id)
+
             logger.info(f"Operação enfileirada: {operation} - {card_id}")
             return Result.ok(None)
         except Exception as e:
             return Result.err(f"Erro ao enfileirar operação: {str(e)}")
 
+    def _merge_pending(self, op: SyncOperation) -> None:
+        """
+        Agrupa operação com as pendentes do mesmo card.
+
+        As operações leem o estado atual do card no kanban.db ao executar,
+        então repetições são redundantes:
+        - Mesmo tipo já pendente → mantém uma (vários moves viram um move final)
+        - 'create' pendente → 'update'/'move' são descartados (o create já
+          envia título, descrição e lista atuais)
+
+        Args:
+            op: Operação a agrupar
+        """
+        ops = self._pending.setdefault(op.card_id, [])
+
+        if op.operation in ("update", "move") and any(p.operation == "create" for p in ops):
+            logger.debug(f"Operação {op.operation} - {op.card_id} coberta pelo create pendente")
+            return
+
+        for i, pending in enumerate(ops):
+            if pending.operation == op.operation:
+                ops[i] = op
+                logger.debug(f"Operação {op.operation} - {op.card_id} agrupada com pendente")
+                return
+
+        ops.append(op)
+
     async def start_queue_worker(self) -> None:
         """
-        Inicia o worker assíncrono que processa a fila de sincronização.
+        Inicia os workers assíncronos que processam a fila de sincronização.
         """
         if self._running:
             logger.warning("Worker já está rodando")
             return
 
         self._running = True
-        self._worker_task = asyncio.create_task(self._queue_worker())
-        logger.info("Worker de sincronização iniciado")
+        self._worker_tasks = [
+            asyncio.create_task(self._queue_worker())
+            for _ in range(self._max_concurrency)
+        ]
+        logger.info(f"Worker de sincronização iniciado ({self._max_concurrency} workers)")
 
     async def stop_queue_worker(self) -> None:
         """
-        Para o worker assíncrono.
+        Para os workers assíncronos.
         """
         if not self._running:
             return
 
         self._running = False
 
-        # Envia sentinela para parar worker
-        await self._queue.put(None)
+        # Envia uma sentinela por worker
+        for _ in self._worker_tasks:
+            await self._queue.put(None)
 
-        if self._worker_task:
-            await asyncio.wait_for(self._worker_task, timeout=5)
-            self._worker_task = None
+        if self._worker_tasks:
+            await asyncio.wait_for(asyncio.gather(*self._worker_tasks), timeout=5)
+            self._worker_tasks = []
 
         logger.info("Worker de sincronização parado")
 
     async def _queue_worker(self) -> None:
         """
-        Worker assíncrono que processa operações da fila.
+        Worker assíncrono que processa as operações pendentes de um card por vez.
         """
         while self._running:
             try:
                 # Timeout de 1 segundo para verificar _running
-                op = await asyncio.wait_for(self._queue.get(), timeout=1.0)
+                card_id = await asyncio.wait_for(self._queue.get(), timeout=1.0)
 
                 # Sentinela para parar
-                if op is None:
+                if card_id is None:
                     break
 
-                # Processa operação com retry
-                await self._process_operation_with_retry(op)
+                ops = self._pending.pop(card_id, [])
+                self._active.add(card_id)
+                try:
+                    # Processa operações do card em ordem, com retry
+                    for op in ops:
+                        await self._process_operation_with_retry(op)
+                finally:
+                    self._active.discard(card_id)
+                    # Operações que chegaram durante o processamento
+                    if card_id in self._pending:
+                        self._queue.put_nowait(card_id)
 
                 self._queue.task_done()
 
@@ -601,6 +694,7 @@ class TrelloSyncService:
             op: Operação a processar
         """
         max_retries = self._max_retries
+        last_error = None
 
         while op.retry_count < max_retries:
             result = await self._execute_operation(op)
@@ -609,6 +703,7 @@ class TrelloSyncService:
                 logger.info(f"Operação {op.operation} - {op.card_id} completada")
                 return
 
+            last_error = result.error
             op.retry_count += 1
 
             if op.retry_count < max_retries:
@@ -619,7 +714,24 @@ class TrelloSyncService:
                 logger.error(
                     f"Operação {op.operation} - {op.card_id} falhou após {max_retries} tentativas"
                 )
-                self._dlq.append(op)
+                self._add_to_dlq(op, last_error)
+
+    def _add_to_dlq(self, op: SyncOperation, error: Optional[str]) -> None:
+        """
+        Persiste operação falha na DLQ (sync_dead_letters no kanban.db).
+
+        Se o banco falhar, mantém em memória para não perder a operação.
+        """
+        result = self.db.add_sync_dead_letter(
+            operation=op.operation,
+            card_id=op.card_id,
+            kwargs=op.kwargs,
+            retry_count=op.retry_count,
+            error=error,
+        )
+        if result.is_err:
+            logger.error(f"DLQ não persistida, mantendo em memória: {result.error}")
+            self._dlq.append(op)
 
     async def _execute_operation(self, op: SyncOperation) -> Result:
         """
@@ -699,6 +811,8 @@ class TrelloSyncService:
         Retorna o número de operações na Dead Letter Queue.
 
         Returns:
-            Tamanho da DLQ
+            Tamanho da DLQ (persistida + fallback em memória)
         """
-        return len(self._dlq)
+        count_result = self.db.count_sync_dead_letters()
+        persisted = count_result.value if count_result.is_ok else 0
+        return persisted + len(self._dlq)
@@ -100,6 +100,32 @@ CREATE TABLE IF NOT EXISTS card_history (
 CREATE INDEX IF NOT EXISTS idx_card_history_card ON card_history(card_id);
 CREATE INDEX IF NOT EXISTS idx_card_history_created ON card_history(created_at);
 
+-- =============================================================================
+-- Sync State (marca d'água do sync incremental por origem)
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    source TEXT PRIMARY KEY,  -- ex: 'trello:<board_id>'
+    watermark TIMESTAMP,      -- UTC: mudanças até aqui já aplicadas
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- =============================================================================
+-- Sync Dead Letters (operações kanban.db → Trello que esgotaram retries)
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS sync_dead_letters (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    operation TEXT NOT NULL,  -- 'create', 'update', 'move'
+    card_id TEXT NOT NULL,
+    kwargs TEXT,              -- JSON
+    retry_count INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_sync_dead_letters_card ON sync_dead_letters(card_id);
+
 -- =============================================================================
 -- Triggers para atualizar updated_at automaticamente
 -- =============================================================================
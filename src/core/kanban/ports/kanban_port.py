@@ -7,6 +7,7 @@ para integração com sistemas Kanban externos (Trello, GitHub Projects, etc).
 """
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Optional
 
 from kernel import Result
@@ -139,3 +140,32 @@ class KanbanPort(ABC):
             Result.err(str) com mensagem de erro se falhar
         """
         pass
+
+    async def list_cards_since(
+        self,
+        board_id: str,
+        since: datetime,
+    ) -> Result[list[Card], str]:
+        """
+        Lista cards alterados desde um instante (sync incremental).
+
+        Implementação padrão: busca todos os cards e filtra por updated_at.
+        Adapters com API de atividades devem sobrescrever para buscar
+        apenas o que mudou.
+
+        Args:
+            board_id: ID do board no sistema externo
+            since: Instante (UTC naive) a partir do qual buscar mudanças
+
+        Returns:
+            Result.ok(list[Card]) com cards alterados
+            Result.err(str) com mensagem de erro se falhar
+        """
+        result = await self.list_cards(board_id)
+        if result.is_err:
+            return result
+
+        return Result.ok([
+            card for card in result.value
+            if card.updated_at is None or card.updated_at >= since
+        ])
@@ -293,6 +293,9 @@ class ChatScreen(Screen):
                         metadata=stream_event.metadata,
                     ))
 
+            # Renderiza o restante da resposta antes de finalizar o turno
+            await turno.end_response()
+
             # PRD-REACT-001: Ao completar, finaliza o AgenticLoopPanel
             turno.finalize_agentic_loop()
 
@@ -46,6 +46,7 @@ from core.sky.chat.textual_ui.widgets.turn import (
     TurnSeparator,
     ThinkingEntry,
 )
+from core.sky.chat.textual_ui.widgets.transcript import TurnRecord, TurnPlaceholder
 
 __all__ = [
     # Original
@@ -92,4 +93,7 @@ __all__ = [
     "TurnSeparator",
     # Turn internals
     "ThinkingEntry",
+    # Transcript virtualizado
+    "TurnRecord",
+    "TurnPlaceholder",
 ]
@@ -4,8 +4,16 @@ Bubbles para chat - SkyBubble com Markdown, UserBubble com texto simples.
 
 SkyBubble usa Markdown widget para renderização rica de markdown.
 UserBubble usa Static para texto plano do usuário.
+
+Streaming (SkyBubble.stream):
+- Chunks são acumulados e renderizados no máximo STREAM_FPS vezes por segundo
+- Cada frame faz Markdown.append() do fragmento: só o último bloco aberto é
+  re-parseado, blocos completos ficam congelados
+- O custo por frame não cresce com o tamanho da resposta
 """
 
+import asyncio
+from time import monotonic
 from typing import TYPE_CHECKING, Callable
 
 from textual.app import ComposeResult
@@ -15,9 +23,15 @@ from textual.widget import Widget
 from textual.widgets import Static, Markdown, Button
 
 if TYPE_CHECKING:
+    from textual.timer import Timer
+
     from core.sky.chat.textual_ui.widgets.thinking import AgenticLoopPanel
 
 
+# Limite de renders por segundo durante streaming
+STREAM_FPS = 30
+
+
 class SkyBubble(Widget):
     """Bubble para mensagem da Sky com suporte a Markdown."""
 
@@ -71,6 +85,11 @@ class SkyBubble(Widget):
         self._on_retry = on_retry
         self._agentic_panel = agentic_panel
         self._parent_turn = parent_turn  # Turn pai para disparar scroll
+        # Streaming: chunks pendentes até o próximo frame
+        self._stream_pending: list[str] = []
+        self._stream_timer: "Timer | None" = None
+        self._stream_last_frame = 0.0
+        self._stream_lock = asyncio.Lock()
         # Atribuição após super().__init__() para acionar o reactive
         self.content = content
 
@@ -96,6 +115,60 @@ class SkyBubble(Widget):
             # DOM ainda não está pronto - o valor inicial será usado no compose()
             pass
 
+    # ------------------------------------------------------------------
+    # Streaming
+    # ------------------------------------------------------------------
+
+    def stream(self, text: str) -> None:
+        """
+        Adiciona chunk de streaming (render coalescido por frame).
+
+        Args:
+            text: Chunk de texto da resposta.
+        """
+        if not text:
+            return
+        self._stream_pending.append(text)
+        self._schedule_stream_frame()
+
+    async def end_stream(self) -> None:
+        """Renderiza imediatamente os chunks pendentes (fim da resposta)."""
+        await self._render_stream_frame()
+
+    def _schedule_stream_frame(self) -> None:
+        """Agenda o próximo frame respeitando STREAM_FPS."""
+        if self._stream_timer is not None:
+            return
+        delay = self._stream_last_frame + 1 / STREAM_FPS - monotonic()
+        self._stream_timer = self.set_timer(max(delay, 0), self._render_stream_frame)
+
+    async def _render_stream_frame(self) -> None:
+        """Anexa ao Markdown tudo que chegou desde o último frame."""
+        async with self._stream_lock:
+            self._stream_timer = None
+            if not self._stream_pending:
+                return
+            fragment = "".join(self._stream_pending)
+            self._stream_pending.clear()
+            self._stream_last_frame = monotonic()
+            # set_reactive: mantém content completo sem acionar watch_content (re-render total)
+            self.set_reactive(SkyBubble.content, self.content + fragment)
+            try:
+                markdown = self.query_one("#sky-message", Markdown)
+            except Exception:
+                return  # DOM ainda não está pronto - compose() usa o content
+            await markdown.append(fragment)
+
+        # Chunks que chegaram durante o append vão no próximo frame
+        if self._stream_pending:
+            self._schedule_stream_frame()
+
+        if self._parent_turn is not None:
+            try:
+                self._parent_turn.trigger_scroll()
+            except Exception:
+                pass
+
     def show_actions(self, on_retry: Callable[[], None] | None = None) -> None:
         """
         PRD-REACT-001: Mostra ActionBar com botões Copy/Retry.
@@ -8,6 +8,13 @@ Responsabilidades:
 - Scroll automático ao final após cada atualização
 - Limpar todos os Turns via limpar()
 
+Virtualização (sessões longas):
+- Só os últimos MAX_LIVE_TURNS turnos ficam como árvore de widgets
+- Turnos concluídos mais antigos viram TurnRecord (transcript, fora do DOM)
+  + um TurnPlaceholder leve no lugar
+- Placeholders próximos da viewport são re-hidratados no scroll; os
+  distantes liberam o renderable e mantêm só a altura
+
 O método legado adicionar_mensagem() é mantido para
 compatibilidade com código de teste, mas não cria Turn.
 """
@@ -15,12 +22,24 @@ compatibilidade com código de teste, mas não cria Turn.
 from textual.containers import VerticalScroll
 from textual.widgets import Static
 
+from core.sky.chat.textual_ui.widgets.transcript import TurnPlaceholder, TurnRecord
 from core.sky.chat.textual_ui.widgets.turn import Turn
 
 
+# Turnos mantidos como widgets completos (o resto vira placeholder)
+MAX_LIVE_TURNS = 10
+
+
 class ChatScroll(VerticalScroll):
     """VerticalScroll que gerencia o histórico de turnos do chat."""
 
+    def __init__(self, *args, max_live_turns: int = MAX_LIVE_TURNS, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.max_live_turns = max_live_turns
+        self._turn_count = 0
+        # Modelo de dados dos turnos arquivados (fora da árvore de widgets)
+        self._transcript: list[TurnRecord] = []
+
     # ------------------------------------------------------------------
     # API principal — usada pelo ChatScreen
     # ------------------------------------------------------------------
@@ -29,8 +48,8 @@ class ChatScroll(VerticalScroll):
         """
         Abre um novo turno com a mensagem do usuário.
 
-        Calcula o número do turno contando os Turns existentes,
-        monta o widget e ativa o ThinkingIndicator.
+        Monta o widget (que ativa o ThinkingIndicator) e arquiva
+        turnos concluídos fora da janela de turnos vivos.
 
         Args:
             user_message: Texto enviado pelo usuário.
@@ -38,12 +57,48 @@ class ChatScroll(VerticalScroll):
         Returns:
             Turn recém-montado (ainda sem resposta).
         """
-        turn_number = len(self.query(Turn)) + 1
-        turn = Turn(user_message, turn_number)
+        self._turn_count += 1
+        turn = Turn(user_message, self._turn_count)
         self.mount(turn)
+        self._archive_turns()
         self.call_later(self.scroll_end)
         return turn
 
+    # ------------------------------------------------------------------
+    # Virtualização
+    # ------------------------------------------------------------------
+
+    def _archive_turns(self) -> None:
+        """Troca turnos concluídos fora da janela viva por placeholders."""
+        turns = [child for child in self.children if isinstance(child, Turn)]
+        for turn in turns[: max(len(turns) - self.max_live_turns, 0)]:
+            if not turn.is_finished:
+                continue
+            record = turn.to_record()
+            self._transcript.append(record)
+            self.mount(TurnPlaceholder(record), before=turn)
+            turn.remove()
+        self.call_after_refresh(self._update_viewport)
+
+    def _update_viewport(self) -> None:
+        """Hidrata placeholders perto da viewport e desidrata os demais."""
+        margin = self.size.height
+        top = self.scroll_offset.y - margin
+        bottom = self.scroll_offset.y + self.size.height + margin
+        for child in self.children:
+            if not isinstance(child, TurnPlaceholder):
+                continue
+            region = child.virtual_region
+            if region.y < bottom and region.bottom > top:
+                child.hydrate()
+            else:
+                child.dehydrate()
+
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        super().watch_scroll_y(old_value, new_value)
+        if round(old_value) != round(new_value):
+            self._update_viewport()
+
     # ------------------------------------------------------------------
     # Métodos legados — mantidos para compatibilidade
     # ------------------------------------------------------------------
@@ -82,11 +137,18 @@ class ChatScroll(VerticalScroll):
     def limpar(self) -> None:
         """Remove todos os widgets filhos (limpa a sessão)."""
         self.remove_children()
+        self._transcript.clear()
+        self._turn_count = 0
 
     @property
     def turn_count(self) -> int:
         """Número de turnos na sessão atual."""
-        return len(self.query(Turn))
+        return self._turn_count
+
+    @property
+    def transcript(self) -> list[TurnRecord]:
+        """Turnos arquivados (sem widgets), em ordem."""
+        return list(self._transcript)
 
 
 __all__ = ["ChatScroll"]
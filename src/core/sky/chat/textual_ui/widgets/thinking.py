@@ -850,6 +850,14 @@ class StepWidget(Static):
         """Retorna True se o Step tem texto de pensamento."""
         return self._thought is not None
 
+    @property
+    def summary(self) -> str:
+        """Resumo em texto do Step (usado no transcript virtualizado)."""
+        lines = [self._thought] if self._thought else []
+        if self._action_tool_name:
+            lines.append(f"⎿ {self._action_tool_name}: {self._action_param or ''}")
+        return "\n".join(lines)
+
 
 class AgenticLoopPanel(Collapsible):
     """
@@ -1037,6 +1045,10 @@ class AgenticLoopPanel(Collapsible):
     def step_count(self) -> int:
         return self._step_count
 
+    @property
+    def steps(self) -> list[StepWidget]:
+        return list(self._steps)
+
     @property
     def is_frozen(self) -> bool:
         return self._frozen
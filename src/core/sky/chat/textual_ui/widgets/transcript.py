@@ -0,0 +1,116 @@
+# coding: utf-8
+"""
+Transcript - Modelo de dados e placeholders para ChatScroll virtualizado.
+
+Turnos antigos não ficam como árvore de widgets (bubbles, AgenticLoopPanel,
+StepWidgets, DiffWidgets...). O ChatScroll guarda um TurnRecord por turno
+(fora do DOM) e monta no lugar um único TurnPlaceholder:
+
+- Fora da viewport: placeholder vazio com a altura já medida (scroll estável)
+- Na viewport: re-hidratado com um renderable Rich (um único Static)
+"""
+
+from dataclasses import dataclass, field
+
+from rich.console import Group, RenderableType
+from rich.markdown import Markdown
+from rich.text import Text
+from textual.widgets import Static
+
+from core.sky.chat.textual_ui.widgets.turn import TurnState
+
+
+@dataclass
+class TurnRecord:
+    """
+    Turno da conversa sem widgets associados.
+
+    Attributes:
+        turn_number: Índice 1-based do turno na sessão.
+        user_message: Texto enviado pelo usuário.
+        response: Resposta da Sky (markdown) ou mensagem de erro.
+        state: Estado final do turno.
+        steps: Resumo em texto de cada Step do loop agentic.
+        height: Última altura renderizada (linhas), 0 se desconhecida.
+    """
+    turn_number: int
+    user_message: str
+    response: str = ""
+    state: TurnState = TurnState.DONE
+    steps: list[str] = field(default_factory=list)
+    height: int = 0
+
+
+def render_turn_record(record: TurnRecord) -> RenderableType:
+    """
+    Renderable compacto de um turno arquivado.
+
+    Args:
+        record: Turno a renderizar.
+
+    Returns:
+        Grupo Rich com pergunta, resumo dos Steps e resposta.
+    """
+    parts: list[RenderableType] = [
+        Text(record.user_message, style="bold", justify="right"),
+    ]
+    if record.steps:
+        summary = Text(f"⟳ {len(record.steps)} steps", style="dim")
+        for step in record.steps:
+            summary.append("\n" + step, style="dim italic")
+        parts.append(summary)
+    if record.state == TurnState.CANCELLED:
+        parts.append(Text("(interrompido)", style="dim"))
+    if record.response:
+        parts.append(Markdown(record.response))
+    return Group(*parts)
+
+
+class TurnPlaceholder(Static):
+    """
+    Substituto leve de um Turn fora da janela de turnos vivos.
+
+    Começa desidratado; o ChatScroll chama hydrate()/dehydrate()
+    conforme o placeholder entra ou sai da viewport.
+    """
+
+    DEFAULT_CSS = """
+    TurnPlaceholder {
+        height: auto;
+        width: 100%;
+        padding: 1;
+        margin: 0;
+    }
+    """
+
+    def __init__(self, record: TurnRecord) -> None:
+        super().__init__("")
+        self.record = record
+        self._hydrated = False
+        self.styles.height = max(record.height, 1)
+
+    def hydrate(self) -> None:
+        """Renderiza o turno (conteúdo cacheado pelo Static até dehydrate)."""
+        if self._hydrated:
+            return
+        self._hydrated = True
+        self.styles.height = "auto"
+        self.update(render_turn_record(self.record))
+
+    def dehydrate(self) -> None:
+        """Libera o renderable mantendo a altura ocupada."""
+        if not self._hydrated:
+            return
+        self._hydrated = False
+        if self.outer_size.height:
+            self.record.height = self.outer_size.height
+        self.styles.height = max(self.record.height, 1)
+        self.update("")
+
+    @property
+    def is_hydrated(self) -> bool:
+        """True se o turno está renderizado."""
+        return self._hydrated
+
+
+__all__ = ["TurnRecord", "TurnPlaceholder", "render_turn_record"]
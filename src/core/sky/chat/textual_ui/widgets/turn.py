@@ -16,7 +16,8 @@ abre um turno e o fecha ao receber a resposta.
 Streaming (PRD019 Fase 1):
 - append_response() adiciona texto incrementalmente ao SkyBubble
 - SkyBubble é criado preguiçosamente no primeiro append_response()
-- watch_content do Textual atualiza automaticamente
+- SkyBubble.stream() coalesce chunks por frame e só re-parseia o último bloco
+- end_response() renderiza o que restar ao fim do streaming
 
 Thinking UI (PRD019 Fase 2):
 - ThinkingPanel mostra processo de pensamento da Sky
@@ -39,7 +40,7 @@ from core.sky.chat.textual_ui.widgets.thinking import ThinkingIndicator, Thinkin
 
 # Type hints
 if TYPE_CHECKING:
-    pass  # type: ignore
+    from core.sky.chat.textual_ui.widgets.transcript import TurnRecord
 
 
 # =============================================================================
@@ -255,7 +256,8 @@ class Turn(Widget):
         Adiciona texto incrementalmente ao SkyBubble durante streaming.
 
         Cria o SkyBubble preguiçosamente no primeiro chamado.
-        O watch_content do Textual atualiza automaticamente a UI.
+        O render é coalescido por frame (SkyBubble.stream), então o custo
+        por chunk não cresce com o tamanho da resposta.
 
         Args:
             text: Chunk de texto para adicionar à resposta.
@@ -279,12 +281,16 @@ class Turn(Widget):
                 agentic_panel=self._agentic_loop_panel,
                 parent_turn=self
             )
-            self.mount(self._sky_bubble)
+            await self.mount(self._sky_bubble)
 
-        # Adiciona texto ao conteúdo existente
-        # O reactive em SkyBubble.content aciona watch_content automaticamente
-        # que dispara scroll no ChatScroll
-        self._sky_bubble.content += text
+        # Render acontece no próximo frame, que também dispara scroll no ChatScroll
+        self._sky_bubble.stream(text)
+
+    async def end_response(self) -> None:
+        """Renderiza chunks ainda pendentes e marca o turno como concluído."""
+        self._state = TurnState.DONE
+        if self._sky_bubble is not None:
+            await self._sky_bubble.end_stream()
 
     # ------------------------------------------------------------------
     # PRD-REACT-001: API de Agentic Loop (ReAct)
@@ -507,6 +513,34 @@ class Turn(Widget):
         if self._thinking_panel is not None:
             self._thinking_panel.collapse_done()
 
+    # ------------------------------------------------------------------
+    # Transcript virtualizado
+    # ------------------------------------------------------------------
+
+    def to_record(self) -> "TurnRecord":
+        """
+        Extrai o turno para o modelo de dados do transcript.
+
+        Usado pelo ChatScroll antes de desmontar turnos antigos.
+
+        Returns:
+            TurnRecord com pergunta, resposta e resumo dos Steps.
+        """
+        from core.sky.chat.textual_ui.widgets.transcript import TurnRecord
+
+        steps: list[str] = []
+        if self._agentic_loop_panel is not None:
+            steps = [step.summary for step in self._agentic_loop_panel.steps]
+
+        return TurnRecord(
+            turn_number=self._turn_number,
+            user_message=self._user_message,
+            response="\n\n".join(bubble.content for bubble in self.query(SkyBubble)),
+            state=self._state,
+            steps=steps,
+            height=self.outer_size.height,
+        )
+
     # ------------------------------------------------------------------
     # Propriedades
     # ------------------------------------------------------------------
@@ -531,6 +565,11 @@ class Turn(Widget):
         """PRD-REACT-001: Retorna True se o turno foi cancelado."""
         return self._state == TurnState.CANCELLED
 
+    @property
+    def is_finished(self) -> bool:
+        """True se o turno não recebe mais atualizações."""
+        return self._state in (TurnState.DONE, TurnState.ERROR, TurnState.CANCELLED)
+
 
 __all__ = [
     "Turn",
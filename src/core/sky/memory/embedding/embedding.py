@@ -3,6 +3,11 @@
 Embedding Client - Geração de embeddings locais.
 
 Interface e implementação para embeddings usando sentence-transformers.
+
+Cache de embeddings em dois níveis:
+- LRU em memória com os vetores recentes (consultas RAG de cada turno)
+- SQLite com conexão persistente: lotes consultados com um único
+  IN (...) e misses gravados numa única transação
 """
 
 from __future__ import annotations
@@ -10,9 +15,11 @@ from __future__ import annotations
 import hashlib
 import os
 import sqlite3
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from runtime.observability.logger import get_logger
 
@@ -30,6 +37,10 @@ except ImportError:
 DEFAULT_MODEL = "paraphrase-multilingual-MiniLM-L12-v2"
 # Dimensão do embedding (modelo MiniLM)
 EMBEDDING_DIM = 384
+# Vetores recentes mantidos em memória
+DEFAULT_MEMORY_CACHE_SIZE = 1024
+# Hashes por consulta IN (...) (SQLite antigo limita a 999 parâmetros)
+CACHE_LOOKUP_CHUNK = 500
 
 
 class EmbeddingClient(ABC):
@@ -73,13 +84,15 @@ class SentenceTransformerEmbedding(EmbeddingClient):
     """
     Cliente de embedding usando sentence-transformers.
 
-    Usa cache SQLite para evitar re-gerar embeddings do mesmo texto.
+    Usa cache SQLite (conexão persistente) e LRU em memória para evitar
+    re-gerar embeddings do mesmo texto.
     """
 
     def __init__(
         self,
         model_name: str = DEFAULT_MODEL,
         db_path: Optional[Path] = None,
+        memory_cache_size: int = DEFAULT_MEMORY_CACHE_SIZE,
     ):
         """
         Inicializa cliente de embedding.
@@ -87,9 +100,15 @@ class SentenceTransformerEmbedding(EmbeddingClient):
         Args:
             model_name: Nome do modelo HuggingFace.
             db_path: Caminho para banco de cache. Padrão: ~/.skybridge/sky_memory.db
+            memory_cache_size: Vetores recentes mantidos em memória (0 desativa).
         """
         self._model_name = model_name
         self._model: Optional[SentenceTransformer] = None
+        self._memory_cache: OrderedDict[str, List[float]] = OrderedDict()
+        self._memory_cache_size = memory_cache_size
+        self._conn: Optional[sqlite3.Connection] = None
+        # Conexão compartilhada entre threads (workers da UI, to_thread)
+        self._lock = threading.Lock()
 
         # Configurar cache
         if db_path is None:
@@ -102,7 +121,8 @@ class SentenceTransformerEmbedding(EmbeddingClient):
 
     def _init_cache(self) -> None:
         """Inicializa tabela de cache de embeddings."""
-        conn = sqlite3.connect(self._db_path)
+        self._conn = sqlite3.connect(self._db_path, check_same_thread=False)
+        conn = self._conn
         conn.execute("PRAGMA journal_mode=WAL")
         conn.execute("PRAGMA busy_timeout=5000")
         cursor = conn.cursor()
@@ -125,7 +145,6 @@ class SentenceTransformerEmbedding(EmbeddingClient):
         """)
 
         conn.commit()
-        conn.close()
 
     def _get_model(self) -> SentenceTransformer:
         """
@@ -204,6 +223,53 @@ class SentenceTransformerEmbedding(EmbeddingClient):
         dim = len(data) // 4  # 4 bytes por float
         return list(struct.unpack(f"{dim}f", data))
 
+    def _remember(self, text_hash: str, embedding: List[float]) -> None:
+        """Adiciona vetor ao LRU em memória (chamador segura o lock)."""
+        if self._memory_cache_size <= 0:
+            return
+        self._memory_cache[text_hash] = embedding
+        self._memory_cache.move_to_end(text_hash)
+        while len(self._memory_cache) > self._memory_cache_size:
+            self._memory_cache.popitem(last=False)
+
+    def _get_many_from_cache(self, text_hashes: List[str]) -> Dict[str, List[float]]:
+        """
+        Busca embeddings do cache (LRU e depois SQLite em lotes IN (...)).
+
+        Args:
+            text_hashes: Hashes dos textos.
+
+        Returns:
+            Mapa hash -> embedding dos encontrados.
+        """
+        found: Dict[str, List[float]] = {}
+        missing: List[str] = []
+
+        with self._lock:
+            for text_hash in dict.fromkeys(text_hashes):
+                cached = self._memory_cache.get(text_hash)
+                if cached is not None:
+                    self._memory_cache.move_to_end(text_hash)
+                    found[text_hash] = cached
+                else:
+                    missing.append(text_hash)
+
+            assert self._conn is not None
+            for start in range(0, len(missing), CACHE_LOOKUP_CHUNK):
+                chunk = missing[start:start + CACHE_LOOKUP_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT text_hash, embedding FROM embeddings_cache "
+                    f"WHERE model_name = ? AND text_hash IN ({placeholders})",
+                    (self._model_name, *chunk),
+                ).fetchall()
+                for text_hash, data in rows:
+                    embedding = self._deserialize_embedding(data)
+                    self._remember(text_hash, embedding)
+                    found[text_hash] = embedding
+
+        return found
+
     def _get_from_cache(self, text_hash: str) -> Optional[List[float]]:
         """
         Busca embedding do cache.
@@ -214,21 +280,35 @@ class SentenceTransformerEmbedding(EmbeddingClient):
         Returns:
             Embedding se encontrado, None caso contrário.
         """
-        conn = sqlite3.connect(self._db_path)
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute("PRAGMA busy_timeout=5000")
-        cursor = conn.cursor()
+        return self._get_many_from_cache([text_hash]).get(text_hash)
 
-        cursor.execute(
-            "SELECT embedding FROM embeddings_cache WHERE text_hash = ? AND model_name = ?",
-            (text_hash, self._model_name)
-        )
-        row = cursor.fetchone()
-        conn.close()
+    def _save_many_to_cache(self, entries: List[Tuple[str, str, List[float]]]) -> None:
+        """
+        Salva embeddings no cache numa única transação.
 
-        if row:
-            return self._deserialize_embedding(row[0])
-        return None
+        Args:
+            entries: Tuplas (hash, texto original, embedding).
+        """
+        if not entries:
+            return
+
+        rows = [
+            (text_hash, text, self._serialize_embedding(embedding), self._model_name)
+            for text_hash, text, embedding in entries
+        ]
+
+        with self._lock:
+            assert self._conn is not None
+            with self._conn:  # commit (ou rollback) do lote inteiro
+                self._conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO embeddings_cache (text_hash, text, embedding, model_name)
+                    VALUES (?, ?, ?, ?)
+                    """,
+                    rows,
+                )
+            for text_hash, _text, embedding in entries:
+                self._remember(text_hash, embedding)
 
     def _save_to_cache(self, text_hash: str, text: str, embedding: List[float]) -> None:
         """
@@ -239,23 +319,7 @@ class SentenceTransformerEmbedding(EmbeddingClient):
             text: Texto original.
             embedding: Vetor de embedding.
         """
-        conn = sqlite3.connect(self._db_path)
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute("PRAGMA busy_timeout=5000")
-        cursor = conn.cursor()
-
-        serialized = self._serialize_embedding(embedding)
-
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO embeddings_cache (text_hash, text, embedding, model_name)
-            VALUES (?, ?, ?, ?)
-            """,
-            (text_hash, text, serialized, self._model_name)
-        )
-
-        conn.commit()
-        conn.close()
+        self._save_many_to_cache([(text_hash, text, embedding)])
 
     def encode(self, text: str) -> List[float]:
         """
@@ -292,33 +356,29 @@ class SentenceTransformerEmbedding(EmbeddingClient):
         Returns:
             Lista de vetores de embedding.
         """
-        results = []
-        missed_indices = []
-        missed_texts = []
-
-        # Primeiro: verificar cache para todos
-        for i, text in enumerate(texts):
-            text_hash = self._hash_text(text)
-            cached = self._get_from_cache(text_hash)
-            if cached is not None:
-                results.append(cached)
-            else:
-                results.append(None)  # Placeholder
-                missed_indices.append(i)
-                missed_texts.append(text)
-
-        # Segundo: gerar embeddings para textos não cacheados
-        if missed_texts:
-            model = self._get_model()
-            new_embeddings = model.encode(missed_texts).tolist()
+        hashes = [self._hash_text(text) for text in texts]
 
-            # Salvar no cache e preencher resultados
-            for idx, text, embedding in zip(missed_indices, missed_texts, new_embeddings):
-                text_hash = self._hash_text(text)
-                self._save_to_cache(text_hash, text, embedding)
-                results[idx] = embedding
+        # Primeiro: uma consulta ao cache para o lote inteiro
+        found = self._get_many_from_cache(hashes)
 
-        return results  # type: ignore
+        # Segundo: gerar embeddings para textos não cacheados (uma vez por texto)
+        missed: Dict[str, str] = {}
+        for text_hash, text in zip(hashes, texts):
+            if text_hash not in found:
+                missed.setdefault(text_hash, text)
+
+        if missed:
+            model = self._get_model()
+            new_embeddings = model.encode(list(missed.values())).tolist()
+            entries = [
+                (text_hash, text, embedding)
+                for (text_hash, text), embedding in zip(missed.items(), new_embeddings)
+            ]
+            self._save_many_to_cache(entries)
+            for text_hash, _text, embedding in entries:
+                found[text_hash] = embedding
+
+        return [found[text_hash] for text_hash in hashes]
 
     def get_dimension(self) -> int:
         """
@@ -331,13 +391,18 @@ class SentenceTransformerEmbedding(EmbeddingClient):
 
     def clear_cache(self) -> None:
         """Limpa todo o cache de embeddings."""
-        conn = sqlite3.connect(self._db_path)
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute("PRAGMA busy_timeout=5000")
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM embeddings_cache")
-        conn.commit()
-        conn.close()
+        with self._lock:
+            assert self._conn is not None
+            with self._conn:
+                self._conn.execute("DELETE FROM embeddings_cache")
+            self._memory_cache.clear()
+
+    def close(self) -> None:
+        """Fecha conexão com banco de cache."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
 
 
 # Singleton global
@@ -13,6 +13,9 @@ from core.webhooks.application.handlers import (
 from core.webhooks.application.job_orchestrator import (
     JobOrchestrator,
 )
+from core.webhooks.application.webhook_intake import (
+    WebhookIntake,
+)
 from core.webhooks.application.webhook_processor import (
     WebhookProcessor,
 )
@@ -22,6 +25,7 @@ from core.webhooks.application.worktree_manager import (
 
 __all__ = [
     "WebhookProcessor",
+    "WebhookIntake",
     "WorktreeManager",
     "JobOrchestrator",
     "receive_github_webhook",
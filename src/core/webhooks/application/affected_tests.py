@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+"""
+Seleção de testes afetados por grafo de imports.
+
+O pytest guardrail rodava a suíte inteira do worktree a cada validação.
+Aqui os imports de todos os arquivos Python do worktree são extraídos
+(via ast, com cache por hash de conteúdo) para montar o grafo reverso de
+dependências; a partir dos arquivos alterados chega-se aos arquivos de
+teste que os importam direta ou transitivamente.
+
+Fallback para a suíte inteira quando a seleção não é confiável:
+- conftest.py ou configuração de testes/dependências alterada
+- arquivos não-Python (fixtures, dados) alterados
+- seleção grande demais para valer a pena
+"""
+from __future__ import annotations
+
+import ast
+import os
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+
+from core.webhooks.application.guardrails_cache import (
+    GuardrailsCache,
+    content_hash,
+    guardrails_cache,
+)
+
+
+# Arquivos cuja alteração pode afetar qualquer teste
+FULL_SUITE_TRIGGERS = frozenset({
+    "conftest.py",
+    "pytest.ini",
+    "pyproject.toml",
+    "setup.cfg",
+    "setup.py",
+    "tox.ini",
+    "requirements.txt",
+})
+
+# Arquivos não-Python que não afetam testes
+DOC_SUFFIXES = frozenset({".md", ".rst", ".txt"})
+
+# Diretórios ignorados ao montar o grafo
+SKIP_DIRS = frozenset({
+    ".git",
+    ".venv",
+    "venv",
+    ".tox",
+    "node_modules",
+    "__pycache__",
+    ".mypy_cache",
+    ".pytest_cache",
+    "build",
+    "dist",
+})
+
+# Raízes de pacotes além da raiz do worktree (layout src/)
+SOURCE_ROOTS = ("src",)
+
+# Acima disso roda a suíte inteira (linha de comando e ganho pequeno)
+MAX_SELECTED_TEST_FILES = 200
+
+
+@dataclass
+class PytestSelection:
+    """
+    Alvos do pytest para uma validação.
+
+    Attributes:
+        targets: Arquivos de teste a rodar (vazio com full_suite=True)
+        full_suite: Se deve rodar os diretórios de teste inteiros
+        reason: Motivo da decisão (vai para a metadata do guardrail)
+    """
+    targets: list[str] = field(default_factory=list)
+    full_suite: bool = False
+    reason: str = ""
+
+
+def is_test_file(path: str) -> bool:
+    """True se o caminho segue a convenção de arquivos de teste do pytest."""
+    name = PurePosixPath(path).name
+    return name.endswith(".py") and (name.startswith("test_") or name.endswith("_test.py"))
+
+
+def module_names(path: str) -> list[str]:
+    """
+    Nomes de módulo possíveis para um arquivo (raiz e raízes de código).
+
+    Ex: "src/core/foo.py" -> ["src.core.foo", "core.foo"]
+    """
+    parts = list(PurePosixPath(path).with_suffix("").parts)
+    if parts and parts[-1] == "__init__":
+        parts = parts[:-1]
+    if not parts:
+        return []
+
+    names = [".".join(parts)]
+    if parts[0] in SOURCE_ROOTS and len(parts) > 1:
+        names.append(".".join(parts[1:]))
+    return names
+
+
+def extract_imports(source: bytes, cache: GuardrailsCache = guardrails_cache) -> list[tuple[str, tuple[str, ...], int]]:
+    """
+    Extrai imports de um arquivo Python (com cache por hash).
+
+    Args:
+        source: Conteúdo do arquivo
+        cache: Cache de resultados
+
+    Returns:
+        Lista de (módulo, nomes importados, nível relativo)
+    """
+    digest = content_hash(source)
+    cached = cache.get("imports", digest)
+    if cached is not None:
+        return cached
+
+    imports: list[tuple[str, tuple[str, ...], int]] = []
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        tree = None
+
+    if tree is not None:
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                imports.extend((alias.name, (), 0) for alias in node.names)
+            elif isinstance(node, ast.ImportFrom):
+                imports.append((node.module or "", tuple(a.name for a in node.names), node.level))
+
+    cache.set("imports", digest, imports)
+    return imports
+
+
+def _resolve(
+    importer: str,
+    imports: list[tuple[str, tuple[str, ...], int]],
+    modules: dict[str, str],
+) -> set[str]:
+    """Resolve imports de `importer` para arquivos do worktree."""
+    importer_names = module_names(importer)
+    package = importer_names[-1].split(".") if importer_names else []
+    if not importer.endswith("__init__.py"):
+        package = package[:-1]
+
+    targets: set[str] = set()
+    for module, names, level in imports:
+        if level:
+            base = package[:len(package) - (level - 1)] if level > 1 else package
+            module = ".".join([*base, module] if module else base)
+        if not module:
+            continue
+
+        candidates = [f"{module}.{name}" for name in names]
+        parts = module.split(".")
+        # Importar a.b.c executa a/__init__, a/b/__init__ e a/b/c
+        candidates.extend(".".join(parts[:i]) for i in range(len(parts), 0, -1))
+
+        for candidate in candidates:
+            path = modules.get(candidate)
+            if path is not None and path != importer:
+                targets.add(path)
+    return targets
+
+
+def _walk_python_files(root: Path) -> list[str]:
+    """Lista arquivos .py do worktree (caminhos relativos POSIX)."""
+    files = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS and not d.startswith(".")]
+        rel_dir = Path(dirpath).relative_to(root)
+        for name in filenames:
+            if name.endswith(".py"):
+                files.append((rel_dir / name).as_posix())
+    return files
+
+
+def select_affected_tests(
+    worktree_path: str,
+    changed_files: list[str],
+    test_dirs: list[str],
+    cache: GuardrailsCache = guardrails_cache,
+) -> PytestSelection:
+    """
+    Seleciona os arquivos de teste afetados pelos arquivos alterados.
+
+    Operação síncrona (lê e analisa arquivos): rodar em thread.
+
+    Args:
+        worktree_path: Caminho para o worktree
+        changed_files: Arquivos alterados (relativos ao worktree)
+        test_dirs: Diretórios de teste do worktree (ex: ["tests"])
+        cache: Cache de imports por hash
+
+    Returns:
+        PytestSelection com os alvos ou fallback para a suíte inteira
+    """
+    changed = [PurePosixPath(f).as_posix() for f in changed_files]
+
+    for path in changed:
+        pure = PurePosixPath(path)
+        if pure.name in FULL_SUITE_TRIGGERS:
+            return PytestSelection(full_suite=True, reason=f"config_changed:{path}")
+        if pure.suffix != ".py" and pure.suffix not in DOC_SUFFIXES:
+            return PytestSelection(full_suite=True, reason=f"non_python_changed:{path}")
+
+    changed_py = [f for f in changed if f.endswith(".py")]
+    if not changed_py:
+        return PytestSelection(reason="no_python_changes")
+
+    root = Path(worktree_path)
+    files = _walk_python_files(root)
+
+    # Arquivos removidos continuam resolvíveis: quem os importava é afetado
+    modules: dict[str, str] = {}
+    for path in [*files, *changed_py]:
+        for name in module_names(path):
+            modules.setdefault(name, path)
+
+    reverse: dict[str, set[str]] = {}
+    for path in files:
+        try:
+            source = (root / path).read_bytes()
+        except OSError:
+            continue
+        for target in _resolve(path, extract_imports(source, cache), modules):
+            reverse.setdefault(target, set()).add(path)
+
+    visited = set(changed_py)
+    queue = deque(changed_py)
+    while queue:
+        current = queue.popleft()
+        for dependent in reverse.get(current, ()):
+            if dependent not in visited:
+                visited.add(dependent)
+                queue.append(dependent)
+
+    prefixes = tuple(f"{d.rstrip('/')}/" for d in test_dirs)
+    targets = sorted(
+        path for path in visited
+        if is_test_file(path) and path.startswith(prefixes) and (root / path).exists()
+    )
+
+    if len(targets) > MAX_SELECTED_TEST_FILES:
+        return PytestSelection(full_suite=True, reason="too_many_affected_tests")
+    if not targets:
+        # Python alterado sem teste alcançável por imports estáticos (import
+        # dinâmico, fixtures, plugins): sem prova de irrelevância, roda tudo
+        return PytestSelection(full_suite=True, reason="no_affected_tests")
+    return PytestSelection(targets=targets, reason="import_graph")
@@ -16,6 +16,7 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from core.webhooks.domain import WebhookJob
 
+from infra.process import AsyncProcessRunner, default_runner
 from kernel.contracts.result import Result
 
 
@@ -32,6 +33,7 @@ class CommitMessageGenerator:
 
     Attributes:
         agent_adapter: Adapter para chamar o agente
+        runner: Executor de processos (git diff)
     """
 
     # Conventional commit types
@@ -49,17 +51,19 @@ class CommitMessageGenerator:
         "style": "style",
     }
 
-    def __init__(self, agent_adapter=None):
+    def __init__(self, agent_adapter=None, runner: AsyncProcessRunner | None = None):
         """
         Inicializa gerador.
 
         Args:
             agent_adapter: Adapter do agente (opcional, cria ClaudeSDKAdapter se None)
+            runner: Executor de processos (padrão: runner compartilhado)
         """
         if agent_adapter is None:
             from core.webhooks.infrastructure.agents.claude_sdk_adapter import ClaudeSDKAdapter
             agent_adapter = ClaudeSDKAdapter()
         self.agent_adapter = agent_adapter
+        self.runner = runner or default_runner
 
     async def generate(self, job: "WebhookJob", worktree_path: str) -> Result[str, str]:
         """
@@ -150,20 +154,18 @@ class CommitMessageGenerator:
         """
         try:
             # git diff --stat para resumo estatístico
-            diff_stat = subprocess.check_output(
+            diff_stat = (await self.runner.run(
                 ["git", "diff", "--stat"],
                 cwd=worktree_path,
-                text=True,
-                stderr=subprocess.DEVNULL,
-            )
+                check=True,
+            )).stdout
 
             # git diff --name-only para lista de arquivos
-            diff_files = subprocess.check_output(
+            diff_files = (await self.runner.run(
                 ["git", "diff", "--name-only"],
                 cwd=worktree_path,
-                text=True,
-                stderr=subprocess.DEVNULL,
-            )
+                check=True,
+            )).stdout
 
             # Combina as informações
             summary = f"Files changed:\n{diff_files.strip()}\n\nStatistics:\n{diff_stat.strip()}"
@@ -22,6 +22,7 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from kernel.contracts.result import Result
 
+from infra.process import AsyncProcessRunner, default_runner
 from kernel.contracts.result import Result
 
 
@@ -72,18 +73,24 @@ class GitService:
     - Capturar output e erros
     - Retornar resultados estruturados
 
+    Comandos rodam via AsyncProcessRunner para não bloquear o event loop
+    durante operações lentas (ex: git push).
+
     Attributes:
         timeout: Timeout padrão para comandos git (segundos)
+        runner: Executor assíncrono de processos
     """
 
-    def __init__(self, timeout: int = 60):
+    def __init__(self, timeout: int = 60, runner: AsyncProcessRunner | None = None):
         """
         Inicializa serviço.
 
         Args:
             timeout: Timeout padrão para comandos (segundos)
+            runner: Executor de processos (padrão: runner compartilhado)
         """
         self.timeout = timeout
+        self.runner = runner or default_runner
 
     async def add_all(self, worktree_path: str) -> Result[None, str]:
         """
@@ -96,13 +103,11 @@ class GitService:
             Result ok ou erro
         """
         try:
-            subprocess.run(
+            await self.runner.run(
                 ["git", "add", "."],
                 cwd=worktree_path,
-                check=True,
-                capture_output=True,
-                encoding='utf-8',
                 timeout=self.timeout,
+                check=True,
             )
             return Result.ok(None)
 
@@ -134,13 +139,11 @@ class GitService:
         """
         try:
             # Executa commit
-            proc = subprocess.run(
+            proc = await self.runner.run(
                 ["git", "commit", "-m", message],
                 cwd=worktree_path,
-                check=True,
-                capture_output=True,
-                encoding='utf-8',
                 timeout=self.timeout,
+                check=True,
             )
 
             # Extrai hash do commit criado
@@ -208,13 +211,11 @@ class GitService:
             cmd.append(branch_name)
 
             # Executa push
-            subprocess.run(
+            await self.runner.run(
                 cmd,
                 cwd=worktree_path,
-                check=True,
-                capture_output=True,
-                encoding='utf-8',
                 timeout=self.timeout * 2,  # Push pode demorar mais
+                check=True,
             )
 
             # Extrai hash do último commit
@@ -252,13 +253,12 @@ class GitService:
             Result com dict de status ou erro
         """
         try:
-            output = subprocess.check_output(
+            output = (await self.runner.run(
                 ["git", "status", "--porcelain"],
                 cwd=worktree_path,
-                encoding='utf-8',
-                stderr=subprocess.DEVNULL,
                 timeout=self.timeout,
-            )
+                check=True,
+            )).stdout
 
             lines = output.strip().splitlines()
 
@@ -277,6 +277,8 @@ class GitService:
 
         except subprocess.CalledProcessError as e:
             return Result.err(f"git status falhou: {e}")
+        except subprocess.TimeoutExpired:
+            return Result.err(f"git status timeout após {self.timeout}s")
         except FileNotFoundError:
             return Result.err("Git não encontrado")
 
@@ -298,31 +300,29 @@ class GitService:
     async def _get_last_commit_hash(self, worktree_path: str) -> Result[str, str]:
         """Obtém hash do último commit."""
         try:
-            output = subprocess.check_output(
+            output = (await self.runner.run(
                 ["git", "rev-parse", "HEAD"],
                 cwd=worktree_path,
-                encoding='utf-8',
-                stderr=subprocess.DEVNULL,
                 timeout=self.timeout,
-            )
+                check=True,
+            )).stdout
             return Result.ok(output.strip())
 
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
             return Result.err("Erro ao obter hash do commit")
 
     async def _get_current_branch(self, worktree_path: str) -> Result[str, str]:
         """Obtém nome do branch atual."""
         try:
-            output = subprocess.check_output(
+            output = (await self.runner.run(
                 ["git", "rev-parse", "--abbrev-ref", "HEAD"],
                 cwd=worktree_path,
-                encoding='utf-8',
-                stderr=subprocess.DEVNULL,
                 timeout=self.timeout,
-            )
+                check=True,
+            )).stdout
             return Result.ok(output.strip())
 
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
             return Result.err("Erro ao obter branch atual")
 
     async def _get_commit_stats(self, worktree_path: str, commit_hash: str) -> dict:
@@ -337,13 +337,12 @@ class GitService:
             Dict com stats
         """
         try:
-            output = subprocess.check_output(
+            output = (await self.runner.run(
                 ["git", "show", "--stat", "--format=", commit_hash],
                 cwd=worktree_path,
-                encoding='utf-8',
-                stderr=subprocess.DEVNULL,
                 timeout=self.timeout,
-            )
+                check=True,
+            )).stdout
 
             # Parse output: " 1 file changed, 10 insertions(+), 2 deletions(-)"
             stats = {
@@ -367,20 +366,19 @@ class GitService:
 
             return stats
 
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
             return {"files_changed": 0, "insertions": 0, "deletions": 0}
 
     async def _get_remote_url(self, worktree_path: str, remote: str) -> Result[str, str]:
         """Obtém URL do remoto."""
         try:
-            output = subprocess.check_output(
+            output = (await self.runner.run(
                 ["git", "remote", "get-url", remote],
                 cwd=worktree_path,
-                encoding='utf-8',
-                stderr=subprocess.DEVNULL,
                 timeout=self.timeout,
-            )
+                check=True,
+            )).stdout
             return Result.ok(output.strip())
 
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
             return Result.err(f"Erro ao obter URL do remoto {remote}")
@@ -4,14 +4,18 @@ Guardrails para validação de jobs.
 
 PRD018 Fase 3: Validações rápidas antes de commit/push/PR.
 - Diff check: arquivos modificados
-- Syntax check: py_compile para validar Python
-- Pytest check: roda testes (não-bloqueante, marca metadata)
+- Syntax check: compile() em paralelo nos arquivos Python alterados
+- Pytest check: roda testes afetados (não-bloqueante, marca metadata)
 
 Os guardrails são executados após o agente modificar arquivos
-e antes das operações de commit/push/PR.
+e antes das operações de commit/push/PR. Resultados por arquivo e de
+pytest ficam em cache por hash de conteúdo (guardrails_cache), então
+revalidar após uma pequena correção só reprocessa o que mudou.
 """
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import re
 import subprocess
 from pathlib import Path
@@ -20,6 +24,13 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from kernel.contracts.result import Result
 
+from core.webhooks.application.affected_tests import select_affected_tests
+from core.webhooks.application.guardrails_cache import (
+    GuardrailsCache,
+    content_hash,
+    guardrails_cache,
+)
+from infra.process import AsyncProcessRunner, default_runner
 from kernel.contracts.result import Result
 
 
@@ -78,23 +89,44 @@ class JobGuardrails:
     - Pytest check: roda testes (não-bloqueante)
 
     O guardrails retornam Result com metadata para ser usado
-    no commit/push/PR.
+    no commit/push/PR. Comandos externos (git, pytest) rodam via
+    AsyncProcessRunner, sem bloquear o event loop.
     """
 
-    def __init__(self, timeout_syntax: int = 30, timeout_pytest: int = 120):
+    def __init__(
+        self,
+        timeout_syntax: int = 30,
+        timeout_pytest: int = 120,
+        runner: AsyncProcessRunner | None = None,
+        cache: GuardrailsCache | None = None,
+    ):
         """
         Inicializa guardrails.
 
         Args:
             timeout_syntax: Timeout em segundos para syntax check
             timeout_pytest: Timeout em segundos para pytest
+            runner: Executor de processos (padrão: runner compartilhado)
+            cache: Cache de resultados (padrão: cache compartilhado)
         """
         self.timeout_syntax = timeout_syntax
         self.timeout_pytest = timeout_pytest
+        self.runner = runner or default_runner
+        self.cache = cache or guardrails_cache
+
+    async def _git_output(self, worktree_path: str, *args: str) -> str:
+        """Executa comando git no worktree e retorna stdout."""
+        result = await self.runner.run(
+            ["git", *args],
+            cwd=worktree_path,
+            timeout=self.timeout_syntax,
+            check=True,
+        )
+        return result.stdout
 
     async def validate_all(self, worktree_path: str) -> Result[GuardrailsResult, str]:
         """
-        Executa todos os guardrails em sequência.
+        Executa todos os guardrails.
 
         Args:
             worktree_path: Caminho para o worktree
@@ -105,24 +137,42 @@ class JobGuardrails:
         Note:
             Diff check e syntax check são BLOQUEANTES.
             Pytest check é NÃO-BLOQUEANTE (apenas aviso).
+            Pytest roda em paralelo com o syntax check e é cancelado
+            se a syntax falhar.
         """
         result = GuardrailsResult()
 
+        changes_result = await self._list_changes(worktree_path)
+        if changes_result.is_err:
+            return Result.err(changes_result.error)
+        changes = changes_result.value
+
         # Guardrail 1: Diff check (BLOQUEANTE)
-        diff_result = await self._diff_check(worktree_path)
+        diff_result = await self._diff_check(worktree_path, changes)
         if diff_result.is_err:
             return Result.err(diff_result.error)
         result.update_metadata("diff", diff_result.value)
         result.add_passed("diff_check")
 
-        # Guardrail 2: Syntax check (BLOQUEANTE)
-        syntax_result = await self._syntax_check(worktree_path)
-        if syntax_result.is_err:
-            return Result.err(syntax_result.error)
-        result.add_passed("syntax_check")
+        # Guardrail 3 começa junto com o 2
+        pytest_task = asyncio.create_task(
+            self._pytest_check(worktree_path, [*changes[0], *changes[1]])
+        )
+        try:
+            # Guardrail 2: Syntax check (BLOQUEANTE)
+            syntax_result = await self._syntax_check(worktree_path, changes)
+            if syntax_result.is_err:
+                return Result.err(syntax_result.error)
+            result.add_passed("syntax_check")
+
+            # Guardrail 3: Pytest check (NÃO-BLOQUEANTE)
+            pytest_result = await pytest_task
+        finally:
+            if not pytest_task.done():
+                pytest_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await pytest_task
 
-        # Guardrail 3: Pytest check (NÃO-BLOQUEANTE)
-        pytest_result = await self._pytest_check(worktree_path)
         if pytest_result.is_ok:
             pytest_data = pytest_result.value
 
@@ -145,127 +195,141 @@ class JobGuardrails:
 
         return Result.ok(result)
 
-    async def _diff_check(self, worktree_path: str) -> Result[dict, str]:
+    async def _list_changes(self, worktree_path: str) -> Result[tuple[list[str], list[str]], str]:
         """
-        Verifica se arquivos foram modificados (git diff).
+        Lista arquivos modificados e untracked do worktree.
 
         Args:
             worktree_path: Caminho para o worktree
 
         Returns:
-            Result com dict de diff ou erro
-
-        Note:
-            BLOQUEANTE: Se nenhum arquivo foi modificado, retorna erro.
+            Result com (modificados, untracked) ou erro
         """
         try:
-            # Verifica arquivos modificados
-            modified = subprocess.check_output(
-                ["git", "diff", "--name-only"],
-                cwd=worktree_path,
-                text=True,
-                stderr=subprocess.DEVNULL,
-            )
-
-            # Verifica arquivos untracked
-            untracked = subprocess.check_output(
-                ["git", "ls-files", "--others", "--exclude-standard"],
-                cwd=worktree_path,
-                text=True,
-                stderr=subprocess.DEVNULL,
+            modified, untracked = await asyncio.gather(
+                self._git_output(worktree_path, "diff", "--name-only"),
+                self._git_output(worktree_path, "ls-files", "--others", "--exclude-standard"),
             )
-
-            modified_files = [f for f in modified.strip().splitlines() if f]
-            untracked_files = [f for f in untracked.strip().splitlines() if f]
-
-            all_changes = modified_files + untracked_files
-
-            if not all_changes:
-                return Result.err("Agente não modificou nenhum arquivo")
-
-            return Result.ok({
-                "modified_count": len(modified_files),
-                "untracked_count": len(untracked_files),
-                "total_changes": len(all_changes),
-                "files": all_changes[:20],  # Limita a 20 arquivos
-            })
-
         except subprocess.CalledProcessError as e:
             return Result.err(f"Erro ao verificar diff: {e}")
+        except subprocess.TimeoutExpired:
+            return Result.err(f"Timeout ao verificar diff (>{self.timeout_syntax}s)")
         except FileNotFoundError:
             return Result.err("Git não encontrado no worktree")
 
-    async def _syntax_check(self, worktree_path: str) -> Result[dict, str]:
+        return Result.ok((
+            [f for f in modified.strip().splitlines() if f],
+            [f for f in untracked.strip().splitlines() if f],
+        ))
+
+    async def _diff_check(
+        self,
+        worktree_path: str,
+        changes: tuple[list[str], list[str]] | None = None,
+    ) -> Result[dict, str]:
         """
-        Valida syntax de arquivos Python (py_compile).
+        Verifica se arquivos foram modificados (git diff).
 
         Args:
             worktree_path: Caminho para o worktree
+            changes: (modificados, untracked) já listados (None = lista agora)
 
         Returns:
-            Result com dict de status ou erro
+            Result com dict de diff ou erro
 
         Note:
-            BLOQUEANTE: Se há erro de syntax, retorna erro.
+            BLOQUEANTE: Se nenhum arquivo foi modificado, retorna erro.
         """
-        try:
-            # Encontra arquivos .py modificados
-            result = subprocess.check_output(
-                ["git", "diff", "--name-only", "--diff-filter=MR", "*.py"],
-                cwd=worktree_path,
-                text=True,
-                stderr=subprocess.DEVNULL,
-            )
-
-            modified_py_files = [f for f in result.strip().splitlines() if f]
-
-            # Encontra arquivos .py untracked
-            untracked_result = subprocess.check_output(
-                ["git", "ls-files", "--others", "--exclude-standard", "*.py"],
-                cwd=worktree_path,
-                text=True,
-                stderr=subprocess.DEVNULL,
-            )
-
-            untracked_py_files = [f for f in untracked_result.strip().splitlines() if f]
-
-            all_py_files = modified_py_files + untracked_py_files
-
-            if not all_py_files:
-                # Nenhum arquivo Python modificado
-                return Result.ok({"checked": False, "reason": "no_python_files"})
-
-            # Compila cada arquivo para validar syntax
-            errors = []
-            for py_file in all_py_files:
-                full_path = Path(worktree_path) / py_file
-                try:
-                    with open(full_path, encoding="utf-8") as f:
-                        compile(f.read(), py_file, "exec")
-                except SyntaxError as e:
-                    errors.append(f"{py_file}:{e.lineno}: {e.msg}")
+        if changes is None:
+            changes_result = await self._list_changes(worktree_path)
+            if changes_result.is_err:
+                return Result.err(changes_result.error)
+            changes = changes_result.value
+
+        modified_files, untracked_files = changes
+        all_changes = modified_files + untracked_files
+
+        if not all_changes:
+            return Result.err("Agente não modificou nenhum arquivo")
+
+        return Result.ok({
+            "modified_count": len(modified_files),
+            "untracked_count": len(untracked_files),
+            "total_changes": len(all_changes),
+            "files": all_changes[:20],  # Limita a 20 arquivos
+        })
+
+    async def _syntax_check(
+        self,
+        worktree_path: str,
+        changes: tuple[list[str], list[str]] | None = None,
+    ) -> Result[dict, str]:
+        """
+        Valida syntax de arquivos Python alterados.
 
-            if errors:
-                return Result.err(f"Erros de syntax:\n" + "\n".join(errors))
+        Os arquivos são compilados em paralelo (threads do executor
+        padrão) e o resultado de cada um fica em cache pelo hash do
+        conteúdo.
 
-            return Result.ok({
-                "checked": True,
-                "files_checked": len(all_py_files),
-                "files": all_py_files[:20],
-            })
+        Args:
+            worktree_path: Caminho para o worktree
+            changes: (modificados, untracked) já listados (None = lista agora)
 
-        except subprocess.CalledProcessError:
-            # Git command pode falhar se não há .py files
-            return Result.ok({"checked": False, "reason": "git_diff_failed"})
-        except FileNotFoundError:
-            return Result.err("Git não encontrado no worktree")
+        Returns:
+            Result com dict de status ou erro
 
-    async def _pytest_check(self, worktree_path: str) -> Result[dict, str]:
+        Note:
+            BLOQUEANTE: Se há erro de syntax, retorna erro.
+        """
+        if changes is None:
+            changes_result = await self._list_changes(worktree_path)
+            if changes_result.is_err:
+                # Git command pode falhar se não há .py files
+                return Result.ok({"checked": False, "reason": "git_diff_failed"})
+            changes = changes_result.value
+
+        # Arquivos removidos não existem mais no worktree
+        worktree = Path(worktree_path)
+        all_py_files = [
+            f for f in [*changes[0], *changes[1]]
+            if f.endswith(".py") and (worktree / f).is_file()
+        ]
+
+        if not all_py_files:
+            # Nenhum arquivo Python modificado
+            return Result.ok({"checked": False, "reason": "no_python_files"})
+
+        outcomes = await asyncio.gather(*[
+            asyncio.to_thread(_compile_file, worktree, py_file, self.cache)
+            for py_file in all_py_files
+        ])
+
+        errors = [error for error in outcomes if error]
+        if errors:
+            return Result.err(f"Erros de syntax:\n" + "\n".join(errors))
+
+        return Result.ok({
+            "checked": True,
+            "files_checked": len(all_py_files),
+            "files": all_py_files[:20],
+        })
+
+    async def _pytest_check(
+        self,
+        worktree_path: str,
+        changed_files: list[str] | None = None,
+    ) -> Result[dict, str]:
         """
         Roda pytest para validar código (NÃO-BLOQUEANTE).
 
+        Com `changed_files`, roda apenas os testes afetados pelo grafo de
+        imports (ou a suíte inteira quando a seleção não é confiável) e
+        reaproveita o resultado anterior se nenhum arquivo alterado mudou
+        de conteúdo.
+
         Args:
             worktree_path: Caminho para o worktree
+            changed_files: Arquivos alterados (None = suíte inteira)
 
         Returns:
             Result com dict de resultados ou erro
@@ -287,63 +351,96 @@ class JobGuardrails:
         if not test_dirs:
             return Result.ok({"skipped": "no_tests_found"})
 
+        targets = test_dirs
+        selection_info = {"mode": "full", "reason": "no_change_list"}
+        state_key = None
+
+        if changed_files is not None:
+            selection = await asyncio.to_thread(
+                select_affected_tests, worktree_path, changed_files, test_dirs, self.cache
+            )
+            if not selection.full_suite:
+                if not selection.targets:
+                    return Result.ok({"skipped": selection.reason})
+                targets = selection.targets
+            selection_info = {
+                "mode": "full" if selection.full_suite else "affected",
+                "reason": selection.reason,
+                "test_files": len(targets),
+            }
+
+            # Slots do pool reaproveitam o mesmo path após reset para outra base:
+            # o HEAD entra na chave para não reaproveitar resultado de outro commit
+            try:
+                head = (await self._git_output(worktree_path, "rev-parse", "HEAD")).strip()
+            except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
+                head = None
+
+            if head:
+                state_key = await asyncio.to_thread(
+                    _tree_state_key, worktree, head, changed_files, targets
+                )
+                cached = self.cache.get("pytest", state_key)
+                if cached is not None:
+                    return Result.ok({**cached, "cached": True})
+
         # Roda pytest
         try:
-            proc = await asyncio.create_subprocess_exec(
-                "python",
-                "-m", "pytest",
-                "--tb=short",
-                "-v",
-                "--no-header",
-                "-x",
-                *test_dirs,
+            proc = await self.runner.run(
+                [
+                    "python",
+                    "-m", "pytest",
+                    "--tb=short",
+                    "-v",
+                    "--no-header",
+                    "-x",
+                    *targets,
+                ],
                 cwd=worktree_path,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+                timeout=self.timeout_pytest,
             )
 
-            try:
-                stdout, stderr = await asyncio.wait_for(
-                    proc.communicate(),
-                    timeout=self.timeout_pytest,
-                )
-            except asyncio.TimeoutError:
-                proc.kill()
-                await proc.wait()
-                return Result.ok({
-                    "timeout": True,
-                    "pytest_failed": True,
-                    "output": "pytest timeout after {self.timeout_pytest}s"
-                })
-
-            output = stdout.decode("utf-8", errors="replace")
+            output = proc.stdout
 
             if proc.returncode == 0:
                 # Testes passaram
-                return Result.ok({
+                data = {
                     "passed": self._extract_passed_count(output),
                     "failed": 0,
                     "duration": self._extract_duration(output),
                     "output": output,
                     "pytest_failed": False,
-                })
+                }
             else:
                 # Testes falharam - NÃO BLOQUEIA
-                output += stderr.decode("utf-8", errors="replace")
+                output += proc.stderr
                 failed_tests = self._extract_failed_tests(output)
 
-                return Result.ok({
+                data = {
                     "passed": self._extract_passed_count(output),
                     "failed": len(failed_tests),
                     "failed_tests": failed_tests,
                     "pytest_failed": True,
                     "output": output,
-                })
+                }
 
+        except subprocess.TimeoutExpired:
+            # Runner já matou o processo (e filhos)
+            return Result.ok({
+                "timeout": True,
+                "pytest_failed": True,
+                "output": f"pytest timeout after {self.timeout_pytest}s",
+                "selection": selection_info,
+            })
         except FileNotFoundError:
             # Pytest não instalado - skip
             return Result.ok({"skipped": "pytest_not_installed"})
 
+        data["selection"] = selection_info
+        if state_key is not None:
+            self.cache.set("pytest", state_key, data)
+        return Result.ok(data)
+
     def _extract_passed_count(self, output: str) -> int:
         """Extrai quantidade de testes que passaram do output."""
         match = re.search(r"(\d+)\s+passed", output)
@@ -368,5 +465,44 @@ class JobGuardrails:
         return list(set(failed))  # Remove duplicatas
 
 
-# Import asyncio aqui para evitar import circular
-import asyncio
+def _compile_file(worktree: Path, py_file: str, cache: GuardrailsCache) -> str | None:
+    """
+    Compila um arquivo Python (com cache por hash do conteúdo).
+
+    Returns:
+        Mensagem de erro "arquivo:linha: msg" ou None se válido
+    """
+    try:
+        source = (worktree / py_file).read_bytes()
+    except OSError:
+        return None
+
+    digest = content_hash(source)
+    error = cache.get("syntax", digest)
+    if error is None:
+        try:
+            compile(source, py_file, "exec", dont_inherit=True)
+            error = ""
+        except (SyntaxError, ValueError) as e:
+            lineno = getattr(e, "lineno", None)
+            error = f"{lineno}: {getattr(e, 'msg', None) or e}"
+        cache.set("syntax", digest, error)
+
+    return f"{py_file}:{error}" if error else None
+
+
+def _tree_state_key(
+    worktree: Path, head: str, changed_files: list[str], targets: list[str]
+) -> str:
+    """
+    Chave do estado relevante para o pytest: worktree, commit HEAD, alvos e
+    conteúdo dos arquivos alterados (arquivos não alterados vêm do HEAD).
+    """
+    parts = [str(worktree.resolve()), head, *targets]
+    for path in sorted(set(changed_files)):
+        try:
+            digest = content_hash((worktree / path).read_bytes())
+        except OSError:
+            digest = "missing"
+        parts.append(f"{path}={digest}")
+    return content_hash("\0".join(parts).encode("utf-8"))
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+Cache de resultados dos guardrails por hash de conteúdo.
+
+Após uma pequena correção do agente, os guardrails rodam de novo sobre
+quase os mesmos arquivos. Resultados por arquivo (syntax check, imports
+extraídos para seleção de testes) e resultados de pytest são indexados
+pelo SHA-256 do conteúdo, então só o que mudou é reprocessado.
+
+O cache é compartilhado pelo processo e limitado (LRU).
+"""
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any
+
+
+# Entradas mantidas antes de descartar as menos usadas
+DEFAULT_MAX_ENTRIES = 8192
+
+
+def content_hash(data: bytes) -> str:
+    """Retorna o SHA-256 (hex) do conteúdo."""
+    return hashlib.sha256(data).hexdigest()
+
+
+class GuardrailsCache:
+    """
+    Cache LRU thread-safe indexado por (tipo, hash).
+
+    Thread-safe porque o syntax check e a análise de imports rodam em
+    threads do executor padrão.
+
+    Attributes:
+        max_entries: Quantidade máxima de entradas
+    """
+
+    _MISSING = object()
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Inicializa o cache.
+
+        Args:
+            max_entries: Quantidade máxima de entradas
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, kind: str, digest: str, default: Any = None) -> Any:
+        """
+        Busca um resultado.
+
+        Args:
+            kind: Tipo do resultado ("syntax", "imports", "pytest")
+            digest: Hash do conteúdo
+            default: Valor retornado se não houver entrada
+
+        Returns:
+            Resultado em cache ou `default`
+        """
+        key = (kind, digest)
+        with self._lock:
+            value = self._entries.get(key, self._MISSING)
+            if value is self._MISSING:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, kind: str, digest: str, value: Any) -> None:
+        """
+        Armazena um resultado.
+
+        Args:
+            kind: Tipo do resultado
+            digest: Hash do conteúdo
+            value: Resultado a armazenar
+        """
+        key = (kind, digest)
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove todas as entradas."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# Cache compartilhado pelo processo
+guardrails_cache = GuardrailsCache()
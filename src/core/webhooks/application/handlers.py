@@ -6,13 +6,21 @@ Handlers registrados para processamento de webhooks via Sky-RPC.
 """
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
+import functools
 import logging
 
 from kernel.registry.decorators import command
 from kernel.contracts.result import Result
+from core.webhooks.application.webhook_intake import WebhookIntake
 from core.webhooks.application.webhook_processor import (
+    LIST_TO_AUTONOMY,
     WebhookProcessor,
+    extract_issue_number_from_card,
+    extract_repository_from_card,
 )
+from core.webhooks.domain import WebhookDelivery, WebhookSource
 from core.webhooks.ports.job_queue_port import JobQueuePort
 
 logger = logging.getLogger(__name__)
@@ -29,17 +37,8 @@ _trello_service = None
 # TrelloService (opcional, singleton)
 _trello_kanban_service = None
 
-# PRD020: Mapeamento listas Trello → AutonomyLevel
-# Usa nomes COM emoji porque o webhook do Trello envia nomes com emoji
-# DOC: core.kanban.domain.kanban_lists_config - FONTE ÚNICA DA VERDADE para emojis
-LIST_TO_AUTONOMY = {
-    "📥 Issues": "analysis",
-    "🧠 Brainstorm": "analysis",
-    "📋 A Fazer": "development",
-    "🚧 Em Andamento": "development",
-    "👁️ Em Revisão": "review",
-    "🚀 Publicar": "publish",
-}
+# Intake de webhooks por workspace (inbox durável + consumidor)
+_webhook_intakes: dict[str, WebhookIntake] = {}
 
 
 def get_trello_service():
@@ -217,6 +216,97 @@ def get_agent_execution_store():
     return _agent_execution_stores[workspace_id]
 
 
+def get_webhook_intake(workspace_id: str | None = None) -> WebhookIntake:
+    """
+    Retorna o intake de webhooks do workspace (inbox durável + consumidor).
+
+    DOC: ADR024 - Cada workspace tem seu próprio inbox isolado
+    (workspace/{workspace_id}/data/webhook_inbox.log).
+
+    Args:
+        workspace_id: Workspace (padrão: workspace atual do contexto)
+
+    Returns:
+        WebhookIntake do workspace
+    """
+    from runtime.workspace.workspace_context import get_current_workspace
+    from pathlib import Path
+
+    workspace_id = workspace_id or get_current_workspace()
+
+    if workspace_id not in _webhook_intakes:
+        from infra.webhooks.adapters.journal_webhook_inbox import JournalWebhookInbox
+
+        inbox_path = Path.cwd() / "workspace" / workspace_id / "data" / "webhook_inbox.log"
+        _webhook_intakes[workspace_id] = WebhookIntake(
+            JournalWebhookInbox(inbox_path),
+            functools.partial(_process_delivery, workspace_id),
+        )
+        logger.info(
+            f"Intake de webhooks inicializado para workspace '{workspace_id}': {inbox_path}"
+        )
+
+    return _webhook_intakes[workspace_id]
+
+
+async def stop_webhook_intakes() -> None:
+    """Para os consumidores de todos os workspaces (shutdown)."""
+    for intake in list(_webhook_intakes.values()):
+        await intake.stop()
+
+
+def get_webhook_processor(source: str | None = None) -> WebhookProcessor:
+    """
+    Retorna WebhookProcessor do workspace atual pronto para ingest().
+
+    Args:
+        source: Fonte do webhook (TrelloService só é resolvido para "trello")
+
+    Returns:
+        WebhookProcessor com fila, event bus e intake do workspace
+    """
+    trello_service = (
+        get_trello_kanban_service() if source == WebhookSource.TRELLO.value else None
+    )
+    return WebhookProcessor(
+        get_job_queue(),
+        event_bus=get_event_bus(),
+        intake=get_webhook_intake(),
+        trello_service=trello_service,
+    )
+
+
+def _run_sync(coro) -> Result:
+    """
+    Executa corrotina a partir dos handlers Sky-RPC síncronos.
+
+    Pelo HandlerExecutor (modo "thread") não há loop na thread e
+    asyncio.run basta; chamadas diretas de dentro de um event loop
+    (scripts/testes legados) caem numa thread auxiliar.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result(timeout=30)
+
+
+async def _process_delivery(workspace_id: str, delivery: WebhookDelivery) -> Result:
+    """Estágio de intake: interpreta a entrega no workspace em que foi recebida."""
+    from runtime.workspace.workspace_context import set_current_workspace
+
+    # A task do intake tem contexto próprio; não afeta requisições
+    set_current_workspace(workspace_id)
+    processor = WebhookProcessor(
+        get_job_queue(),
+        event_bus=get_event_bus(),
+        trello_service=get_trello_kanban_service() if delivery.source == WebhookSource.TRELLO.value else None,
+    )
+    return await processor.process_delivery(delivery)
+
+
 @command(
     name="webhooks.github.receive",
     description="Recebe e processa webhook do GitHub",
@@ -241,6 +331,10 @@ def receive_github_webhook(args: dict) -> Result:
     """
     Recebe webhook do GitHub e cria job para processamento assíncrono.
 
+    Entrada Sky-RPC (síncrona, executada fora do event loop pelo
+    HandlerExecutor). O endpoint HTTP /webhooks/github usa
+    WebhookProcessor.ingest() diretamente.
+
     Args:
         args: Dicionário contendo:
             - payload: Payload JSON do webhook
@@ -260,27 +354,15 @@ def receive_github_webhook(args: dict) -> Result:
         >>> job_id = result.value
     """
     # Obtém processor com fila e event bus compartilhados
-    job_queue = get_job_queue()
-    event_bus = get_event_bus()
-    processor = WebhookProcessor(job_queue, event_bus=event_bus)
-
-    # Processa webhook (executa async em thread separada)
-    import asyncio
-    import concurrent.futures
+    processor = WebhookProcessor(get_job_queue(), event_bus=get_event_bus())
 
-    async def _process():
-        return await processor.process_github_issue(
+    return _run_sync(
+        processor.process_github_issue(
             payload=args["payload"],
             event_type=args["event_type"],
             signature=args.get("signature"),
         )
-
-    # Executa em thread separada para evitar conflitos de loop
-    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-        future = executor.submit(lambda: asyncio.run(_process()))
-        result = future.result(timeout=30)
-
-    return result
+    )
 
 
 @command(
@@ -308,8 +390,9 @@ def receive_trello_webhook(args: dict) -> Result:
     Recebe webhook do Trello e processa eventos de cards.
 
     PRD020: Fluxo bidirecional Trello → GitHub.
-    Detecta movimentos de cards entre listas e cria jobs apropriados
-    baseado no autonomy level da lista de destino.
+    Entrada Sky-RPC (síncrona, executada fora do event loop pelo
+    HandlerExecutor). O endpoint HTTP /webhooks/trello usa
+    WebhookProcessor.ingest() diretamente.
 
     Args:
         args: Dicionário contendo:
@@ -331,301 +414,15 @@ def receive_trello_webhook(args: dict) -> Result:
     if not trello_service:
         return Result.err("TrelloService não configurado")
 
-    payload = args.get("payload", {})
-    trello_webhook_id = args.get("trello_webhook_id", "")
-
-    # Detecta tipo de evento
-    action_type = payload.get("action", {}).get("type", "")
-    action_data = payload.get("action", {}).get("data", {})
-    model = payload.get("model", {})
-
-    # Lista TODO é usada em múltiplos lugares, definir antes do bloco condicional
-    todo_list_name = "📋 A Fazer"
-
-    import asyncio
-    import json
-    import logging
-    import re
-    from datetime import datetime
-
-    logger = logging.getLogger(__name__)
-
-    # Timestamp preciso para medição de latência
-    timestamp_ms = datetime.now().isoformat(timespec='milliseconds')
-
-    # Log ANTES de processar (fora da thread) - usa print para garantir que aparece
-    print(f"📩 [DEBUG] Webhook Trello recebido | action_type={action_type} | timestamp={timestamp_ms}")
-    logger.info(f"📩 Webhook Trello recebido | action_type={action_type} | timestamp={timestamp_ms}")
-    logger.info(f"   Payload keys: {list(payload.keys())}")
-
-    async def _process():
-        # Evento: Card atualizado (movido entre listas)
-        if action_type == "updateCard":
-            # IMPORTANTE: action.data.card contém o ID do card, não model.id (que é o board)
-            card_data = action_data.get("card", {})
-            card_id = card_data.get("id")
-            card_name = card_data.get("name", "")
-            card_desc = card_data.get("desc", "")
-
-            # PRD026: Detectar arquivamento/deleção de card
-            # Se card.closed == true, trata como arquivado/deletado
-            card_closed = card_data.get("closed", False)
-
-            # Extrai informações de movimento do payload
-            list_before = action_data.get("listBefore", {})
-            list_after = action_data.get("listAfter", {})
-
-            list_before_name = list_before.get("name", "Desconhecido")
-            list_after_name = list_after.get("name", "Desconhecido")
-
-            # Log da transição detectada (INFO para sempre aparecer)
-            logger.info(
-                f"📦 Card atualizado: '{card_name}' | "
-                f"listas: {list_before_name} → {list_after_name}"
-            )
-            logger.info(f"   Card ID: {card_id}")
-
-            # PRD020: Emitir TrelloWebhookReceivedEvent (obter event_bus PRIMEIRO)
-            event_bus = get_event_bus()
-
-            # Se card foi arquivado/deletado, não processar movimento
-            if card_closed:
-                logger.info(
-                    f"📦 Card arquivado/deletado: '{card_name}' (ID: {card_id})"
-                )
-
-                # PRD026: Emitir TrelloCardArchivedEvent
-                from core.domain_events.trello_events import TrelloCardArchivedEvent
-                await event_bus.publish(
-                    TrelloCardArchivedEvent(
-                        aggregate_id=card_id,
-                        card_id=card_id,
-                        card_name=card_name,
-                        reason="archived via webhook"
-                    )
-                )
-                logger.info(f"✅ TrelloCardArchivedEvent emitido para card '{card_name}'")
-            else:
-                # Se não foi arquivado, processa movimento normalmente (para jobs)
-                # PRD020: Emitir TrelloWebhookReceivedEvent
-                from core.domain_events.trello_events import TrelloWebhookReceivedEvent
-                await event_bus.publish(
-                    TrelloWebhookReceivedEvent(
-                        aggregate_id=card_id,
-                        webhook_id=trello_webhook_id,
-                        action_type=action_type,
-                        card_id=card_id,
-                        card_name=card_name,
-                        list_before_name=list_before_name,
-                        list_after_name=list_after_name,
-                    )
-                )
-                logger.info(f"✅ TrelloWebhookReceivedEvent emitido para card '{card_name}'")
-
-                # Determinar autonomy_level baseado na lista de destino
-                from core.webhooks.domain.autonomy_level import AutonomyLevel
-                autonomy_level_str = LIST_TO_AUTONOMY.get(list_after_name, "development")
-                try:
-                    autonomy_level = AutonomyLevel(autonomy_level_str)
-                except ValueError:
-                    autonomy_level = AutonomyLevel.DEVELOPMENT
-
-                logger.info(f"   Autonomy Level: {autonomy_level.value} (baseado na lista '{list_after_name}')")
-
-                # Verifica se foi movido PARA "📋 A Fazer"
-                from runtime.config.config import get_trello_kanban_lists_config
-
-                kanban_config = get_trello_kanban_lists_config()
-                # Nomes das listas (não IDs) para comparação
-                in_progress_list_name = "🚧 Em Andamento"
-
-                if list_after_name == todo_list_name:
-                    logger.info(f"✅ Card detectado em '{todo_list_name}' - movendo para '{in_progress_list_name}'...")
+    processor = WebhookProcessor(
+        get_job_queue(),
+        event_bus=get_event_bus(),
+        trello_service=trello_service,
+    )
 
-                    # Card foi movido para "📋 A Fazer" - mover automaticamente para "🚧 Em Andamento"
-                    handle_result = await trello_service.handle_card_moved_to_todo(
-                        card_id=card_id
-                    )
-                    if handle_result.is_err:
-                        logger.error(f"❌ Erro ao processar card movido para '📋 A Fazer': {handle_result.error}")
-                        return Result.err(handle_result.error)
-
-                    logger.info(f"✅ Card movido automaticamente para '{in_progress_list_name}'")
-
-                    # PRD020: Extrair issue_number do card e criar job
-                    issue_number = extract_issue_number_from_card(card_name, card_desc)
-                    repository = extract_repository_from_card(card_desc)
-
-                    if issue_number:
-                        # Criar WebhookEvent e WebhookJob
-                        from core.webhooks.domain import WebhookSource, WebhookEvent, WebhookJob
-                        from core.domain_events.job_events import JobCreatedEvent
-                        from core.webhooks.domain.trigger_mappings import get_trello_list_slug, build_card_moved_event_type
-
-                        # Usa slug da lista Trello para event_type (evita problemas com emojis)
-                        list_slug = get_trello_list_slug(list_after_name)
-                        event_type = build_card_moved_event_type(list_slug) if list_slug else f"card.moved.{list_after_name}"
-
-                        webhook_event = WebhookEvent(
-                            source=WebhookSource.TRELLO,
-                            event_type=event_type,
-                            event_id=card_id,
-                            payload=payload,
-                            received_at=datetime.utcnow(),
-                            delivery_id=trello_webhook_id,
-                        )
-
-                        job = WebhookJob.create(webhook_event)
-                        job.autonomy_level = autonomy_level
-                        job.metadata.update({
-                            "trello_card_id": card_id,
-                            "trello_card_name": card_name,
-                            "trello_list_name": list_after_name,  # Mantém nome original com emoji
-                        })
-
-                        # Enfileirar job
-                        job_queue = get_job_queue()
-                        job_id = await job_queue.enqueue(job)
-
-                        logger.info(f"✅ Job criado: job_id={job_id} | issue=#{issue_number} | autonomy={autonomy_level.value}")
-
-                        # Emitir JobCreatedEvent
-                        await event_bus.publish(
-                            JobCreatedEvent(
-                                aggregate_id=job_id,
-                                job_id=job_id,
-                                issue_number=issue_number,
-                            )
-                        )
-
-                        return Result.ok(
-                            {"processed": True, "action": "moved_to_progress", "job_id": job_id}
-                        )
-                    else:
-                        logger.warning(f"⚠️ Card '{card_name}' não possui issue_number - pulando criação de job")
-
-                # PRD020: Para outras listas, também criar job se tiver issue_number
-                if list_after_name in LIST_TO_AUTONOMY and list_after_name != todo_list_name:
-                    issue_number = extract_issue_number_from_card(card_name, card_desc)
-                    if issue_number:
-                        from core.webhooks.domain import WebhookSource, WebhookEvent, WebhookJob
-                        from core.domain_events.job_events import JobCreatedEvent
-                        from core.webhooks.domain.trigger_mappings import get_trello_list_slug, build_card_moved_event_type
-
-                        # Usa slug da lista Trello para event_type (evita problemas com emojis)
-                        list_slug = get_trello_list_slug(list_after_name)
-                        event_type = build_card_moved_event_type(list_slug) if list_slug else f"card.moved.{list_after_name}"
-
-                        webhook_event = WebhookEvent(
-                            source=WebhookSource.TRELLO,
-                            event_type=event_type,
-                            event_id=card_id,
-                            payload=payload,
-                            received_at=datetime.utcnow(),
-                            delivery_id=trello_webhook_id,
-                        )
-
-                        job = WebhookJob.create(webhook_event)
-                        job.autonomy_level = autonomy_level
-                        job.metadata.update({
-                            "trello_card_id": card_id,
-                            "trello_card_name": card_name,
-                            "trello_list_name": list_after_name,
-                        })
-
-                        job_queue = get_job_queue()
-                        job_id = await job_queue.enqueue(job)
-
-                        logger.info(f"✅ Job criado: job_id={job_id} | issue=#{issue_number} | autonomy={autonomy_level.value} | lista={list_after_name}")
-
-                        event_bus = get_event_bus()
-                        await event_bus.publish(
-                            JobCreatedEvent(
-                                aggregate_id=job_id,
-                                job_id=job_id,
-                                issue_number=issue_number,
-                            )
-                        )
-
-                        return Result.ok(
-                            {"processed": True, "action": "job_created", "job_id": job_id}
-                        )
-
-        return Result.ok({"processed": True, "action": "ignored"})
-
-    def extract_issue_number_from_card(card_name: str, card_desc: str) -> int | None:
-        """Extrai issue number do nome ou descrição do card."""
-        # Tenta extrair do nome (ex: "#123 Issue Title")
-        match = re.search(r"#(\d+)", card_name)
-        if match:
-            return int(match.group(1))
-
-        # Tenta extrair da descrição (ex: "Issue #123")
-        match = re.search(r"#(\d+)", card_desc or "")
-        if match:
-            return int(match.group(1))
-
-        return None
-
-    def extract_repository_from_card(card_desc: str) -> str | None:
-        """Extrai repositório da descrição do card."""
-        if not card_desc:
-            return None
-
-        # Tenta extrair formato "owner/repo"
-        match = re.search(r"([a-zA-Z0-9_-]+)/([a-zA-Z0-9_-]+)", card_desc)
-        if match:
-            return f"{match.group(1)}/{match.group(2)}"
-
-        return None
-
-    # Executa em thread separada para evitar conflitos de loop
-    # Cria um NOVO event loop explicitamente ao invés de usar asyncio.run()
-    import concurrent.futures
-
-    def run_in_new_loop():
-        """Cria um novo event loop e rota a função async."""
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            return loop.run_until_complete(_process())
-        finally:
-            loop.close()
-
-    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-        future = executor.submit(run_in_new_loop)
-        result = future.result(timeout=30)
-
-    return result
-
-
-def extract_issue_number_from_card(card_name: str, card_desc: str) -> int | None:
-    """Extrai issue number do nome ou descrição do card."""
-    import re
-
-    # Tenta extrair do nome (ex: "#123 Issue Title")
-    match = re.search(r"#(\d+)", card_name)
-    if match:
-        return int(match.group(1))
-
-    # Tenta extrair da descrição (ex: "Issue #123")
-    match = re.search(r"#(\d+)", card_desc or "")
-    if match:
-        return int(match.group(1))
-
-    return None
-
-
-def extract_repository_from_card(card_desc: str) -> str | None:
-    """Extrai repositório da descrição do card."""
-    import re
-
-    if not card_desc:
-        return None
-
-    # Tenta extrair formato "owner/repo"
-    match = re.search(r"([a-zA-Z0-9_-]+)/([a-zA-Z0-9_-]+)", card_desc)
-    if match:
-        return f"{match.group(1)}/{match.group(2)}"
-
-    return None
+    return _run_sync(
+        processor.process_trello_webhook(
+            args.get("payload", {}),
+            trello_webhook_id=args.get("trello_webhook_id", ""),
+        )
+    )
@@ -38,6 +38,7 @@ from core.domain_events.job_events import (
     JobPushedEvent,
     PRCreatedEvent,
 )
+from infra.process import AsyncProcessRunner, default_runner
 from kernel.contracts.result import Result
 from runtime.observability.snapshot.git_diff import get_git_diff
 
@@ -84,6 +85,7 @@ class JobOrchestrator:
         github_client=None,
         enable_auto_commit: bool = True,
         enable_auto_pr: bool = True,
+        runner: "AsyncProcessRunner | None" = None,
     ):
         """
         Inicializa orchestrator.
@@ -99,6 +101,7 @@ class JobOrchestrator:
             github_client: Cliente GitHub API (opcional)
             enable_auto_commit: Habilita commit/push automático (default: True)
             enable_auto_pr: Habilita criação de PR automática (default: True)
+            runner: Executor de processos (padrão: runner compartilhado)
         """
         self.job_queue = job_queue
         self.worktree_manager = worktree_manager
@@ -117,9 +120,38 @@ class JobOrchestrator:
         self.github_client = github_client
         self.enable_auto_commit = enable_auto_commit
         self.enable_auto_pr = enable_auto_pr
+        self.runner = runner or default_runner
         self._job_start_time: dict[str, datetime] = {}
         logger = logging.getLogger(__name__)
 
+    @staticmethod
+    def _final_snapshot_data(extractor, worktree_path: str, job, validation: dict | None) -> dict:
+        """
+        Captura snapshot final e diffs do git (síncrono; roda via asyncio.to_thread).
+
+        Args:
+            extractor: GitExtractor usado no snapshot inicial
+            worktree_path: Caminho do worktree
+            job: Job com snapshot inicial
+            validation: Resultado da validação do worktree
+
+        Returns:
+            Dicionário pronto para _save_snapshot_with_status
+        """
+        final_snapshot = extractor.capture(worktree_path)
+
+        return {
+            "initial": job.initial_snapshot,
+            "final": {
+                "metadata": final_snapshot.metadata.model_dump(),
+                "stats": final_snapshot.stats.model_dump(),
+                "structure": final_snapshot.structure,
+            },
+            "validation": validation,
+            # Diffs do git para visualização no WebUI
+            "git_diff": get_git_diff(worktree_path),
+        }
+
     @staticmethod
     def _save_snapshot_with_status(worktree_path: str, snapshot: dict, status: str) -> None:
         """
@@ -284,7 +316,7 @@ class JobOrchestrator:
             return Result.ok(None)
 
         # Passo 1: Criar worktree
-        worktree_result = self.worktree_manager.create_worktree(job)
+        worktree_result = await self.worktree_manager.create_worktree(job)
         if worktree_result.is_err:
             # Tenta salvar snapshot com status FAILED (se worktree_path existe)
             if job.worktree_path:
@@ -323,7 +355,8 @@ class JobOrchestrator:
 
         extractor = GitExtractor()
         try:
-            initial_snapshot = extractor.capture(worktree_path)
+            # git status em thread: não bloqueia o event loop do worker
+            initial_snapshot = await asyncio.to_thread(extractor.capture, worktree_path)
             job.initial_snapshot = {
                 "metadata": initial_snapshot.metadata.model_dump(),
                 "stats": initial_snapshot.stats.model_dump(),
@@ -412,28 +445,16 @@ class JobOrchestrator:
         )
 
         # Passo 4: Validar worktree (RF005 - NÃO remove)
-        validation_result = self._validate_worktree(job)
+        validation_result = await asyncio.to_thread(self._validate_worktree, job)
         if validation_result.is_err:
             # Validação falhou - ainda assim marca como completo
             await self.job_queue.complete(job_id)
 
             # Captura snapshot final
             try:
-                final_snapshot = extractor.capture(worktree_path)
-
-                # Captura diffs do git para visualização no WebUI
-                git_diff_data = get_git_diff(worktree_path)
-
-                final_snapshot_data = {
-                    "initial": job.initial_snapshot,
-                    "final": {
-                        "metadata": final_snapshot.metadata.model_dump(),
-                        "stats": final_snapshot.stats.model_dump(),
-                        "structure": final_snapshot.structure,
-                    },
-                    "validation": validation_result.value,
-                    "git_diff": git_diff_data,
-                }
+                final_snapshot_data = await asyncio.to_thread(
+                    self._final_snapshot_data, extractor, worktree_path, job, validation_result.value
+                )
                 # Salva com status COMPLETED mesmo com falha na validação
                 self._save_snapshot_with_status(worktree_path, final_snapshot_data, "COMPLETED")
             except Exception as e:
@@ -468,21 +489,9 @@ class JobOrchestrator:
 
         # Captura snapshot final e salva com status COMPLETED
         try:
-            final_snapshot = extractor.capture(worktree_path)
-
-            # Captura diffs do git para visualização no WebUI
-            git_diff_data = get_git_diff(worktree_path)
-
-            final_snapshot_data = {
-                "initial": job.initial_snapshot,
-                "final": {
-                    "metadata": final_snapshot.metadata.model_dump(),
-                    "stats": final_snapshot.stats.model_dump(),
-                    "structure": final_snapshot.structure,
-                },
-                "validation": validation_info,
-                "git_diff": git_diff_data,
-            }
+            final_snapshot_data = await asyncio.to_thread(
+                self._final_snapshot_data, extractor, worktree_path, job, validation_info
+            )
             self._save_snapshot_with_status(worktree_path, final_snapshot_data, "COMPLETED")
         except Exception as e:
             logging.getLogger(__name__).warning(f"Falha ao capturar snapshot final: {e}")
@@ -820,11 +829,9 @@ class JobOrchestrator:
         """
         try:
             # Tenta determinar branch remoto
-            result = subprocess.run(
+            result = await self.runner.run(
                 ["git", "symbolic-ref", "refs/remotes/origin/HEAD"],
                 cwd=worktree_path,
-                capture_output=True,
-                text=True,
                 timeout=10,
             )
 
@@ -835,11 +842,9 @@ class JobOrchestrator:
                 return Result.ok(branch)
 
             # Fallback: tenta listar branches remotos
-            result = subprocess.run(
+            result = await self.runner.run(
                 ["git", "branch", "-r"],
                 cwd=worktree_path,
-                capture_output=True,
-                text=True,
                 timeout=10,
             )
 
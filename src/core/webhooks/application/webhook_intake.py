@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""
+Webhook Intake — Estágio entre o inbox durável e a fila de jobs.
+
+O endpoint HTTP só faz o append da entrega no inbox e responde 202.
+O intake consome as entregas pendentes em ordem de chegada, delega o
+parsing/enfileiramento (WebhookProcessor.process_delivery) e confirma
+cada entrega no inbox. Entregas não confirmadas (crash, shutdown) são
+retomadas no próximo start().
+
+Só são confirmadas entregas processadas ou rejeitadas de forma definitiva
+(Result.err: JSON inválido, fonte não suportada...). Exceções (fila
+indisponível, disco) são transitórias: a entrega fica pendente e o intake
+tenta de novo com backoff exponencial, sem passar à frente dela.
+
+DOC: core/webhooks/application/webhook_processor.py
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Awaitable, Callable
+
+from kernel.contracts.result import Result
+
+if TYPE_CHECKING:
+    from core.webhooks.domain import WebhookDelivery
+    from core.webhooks.ports.webhook_inbox_port import WebhookInboxPort
+
+logger = logging.getLogger(__name__)
+
+# Backoff entre tentativas após falha transitória (segundos)
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 60.0
+
+
+class WebhookIntake:
+    """
+    Consumidor do inbox de webhooks.
+
+    Roda como uma task no event loop que recebe as entregas; a ordem de
+    chegada é preservada (movimentos de card do Trello dependem dela).
+
+    Attributes:
+        inbox: Inbox durável de entregas
+        process: Corrotina que interpreta e enfileira uma entrega
+    """
+
+    def __init__(
+        self,
+        inbox: "WebhookInboxPort",
+        process: Callable[["WebhookDelivery"], Awaitable[Result]],
+    ):
+        """
+        Inicializa intake (o consumidor é criado em start()/submit()).
+
+        Args:
+            inbox: Inbox durável de entregas
+            process: Corrotina que interpreta e enfileira uma entrega
+        """
+        self.inbox = inbox
+        self.process = process
+        self._task: asyncio.Task | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._retry_delay = 0.0
+
+    async def submit(self, delivery: "WebhookDelivery") -> None:
+        """
+        Persiste a entrega e acorda o consumidor.
+
+        Args:
+            delivery: Entrega recebida
+
+        Raises:
+            OSError: Se falhar ao persistir no inbox
+        """
+        await self.inbox.append(delivery)
+        self.start()
+
+    def start(self) -> None:
+        """Garante o consumidor rodando no loop atual (drena pendentes recuperados)."""
+        loop = asyncio.get_running_loop()
+        if self._task is not None and not self._task.done() and self._task.get_loop() is loop:
+            self._wakeup.set()
+            return
+
+        self._wakeup = asyncio.Event()
+        self._wakeup.set()
+        self._task = loop.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Para o consumidor; entregas em andamento ficam pendentes no inbox."""
+        task, self._task = self._task, None
+        if task is None or task.done():
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _run(self) -> None:
+        """Drena o inbox sempre que acordado (ou quando o backoff expira)."""
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self._retry_delay or None)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+            for delivery in self.inbox.pending():
+                if not await self._handle(delivery):
+                    # Preserva a ordem de chegada: as seguintes esperam esta
+                    self._retry_delay = min(
+                        max(self._retry_delay * 2, RETRY_BASE_DELAY), RETRY_MAX_DELAY
+                    )
+                    break
+            else:
+                self._retry_delay = 0.0
+
+    async def _handle(self, delivery: "WebhookDelivery") -> bool:
+        """
+        Processa uma entrega e a confirma se o resultado é definitivo.
+
+        Returns:
+            False se a falha foi transitória (entrega continua pendente)
+        """
+        try:
+            result = await self.process(delivery)
+        except Exception as e:
+            logger.warning(
+                f"Falha transitória no intake, entrega mantida pendente | "
+                f"delivery={delivery.delivery_id} | source={delivery.source} | error={e}"
+            )
+            return False
+
+        if result.is_err:
+            logger.warning(
+                f"Entrega de webhook descartada | delivery={delivery.delivery_id} | "
+                f"source={delivery.source} | error={result.error}"
+            )
+        else:
+            logger.info(
+                f"Entrega de webhook processada | delivery={delivery.delivery_id} | "
+                f"source={delivery.source} | result={result.value}"
+            )
+
+        await self.inbox.ack(delivery.delivery_id)
+        return True
@@ -6,23 +6,96 @@ Processa eventos de webhook recebidos e cria jobs para processamento assíncrono
 Emite Domain Events para desacoplar integrações (Trello, notificações, etc.).
 
 PRD018 ARCH-07: Migrado para usar Domain Events ao invés de chamadas diretas.
+
+Ingestão: ingest() só persiste a entrega no inbox (o endpoint responde
+202); process_delivery() é chamado pelo WebhookIntake para interpretar e
+enfileirar.
 """
 from __future__ import annotations
 
+import json
 import logging
+import re
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from core.webhooks.application.webhook_intake import WebhookIntake
     from core.webhooks.ports.job_queue_port import JobQueuePort
     from core.domain_events.event_bus import EventBus
 
-from core.webhooks.domain import WebhookEvent, WebhookJob, WebhookSource
+from core.webhooks.domain import WebhookDelivery, WebhookEvent, WebhookJob, WebhookSource
+from core.webhooks.ports.job_queue_port import QueueError
 from core.domain_events.issue_events import IssueReceivedEvent
 from kernel.contracts.result import Result
 
 logger = logging.getLogger(__name__)
 
+# PRD020: Mapeamento listas Trello → AutonomyLevel
+# Usa nomes COM emoji porque o webhook do Trello envia nomes com emoji
+# DOC: core.kanban.domain.kanban_lists_config - FONTE ÚNICA DA VERDADE para emojis
+LIST_TO_AUTONOMY = {
+    "📥 Issues": "analysis",
+    "🧠 Brainstorm": "analysis",
+    "📋 A Fazer": "development",
+    "🚧 Em Andamento": "development",
+    "👁️ Em Revisão": "review",
+    "🚀 Publicar": "publish",
+}
+
+# Eventos do GitHub cujo event_type completo vem de header + action do payload
+GITHUB_ACTION_EVENTS = ("issues", "pull_request", "issue_comment", "discussion", "discussion_comment")
+
+# Headers persistidos com a entrega (o resto é descartado)
+INGEST_HEADERS = (
+    "x-github-event",
+    "x-github-delivery",
+    "x-hub-signature-256",
+    "x-trello-webhook",
+    "trello-webhook-id",
+)
+
+
+def build_github_event_type(event_header: str, payload: dict) -> str:
+    """
+    Constrói event_type completo do GitHub.
+
+    GitHub envia X-GitHub-Event como "issues" e payload tem "action": "opened";
+    o event_type completo é "issues.opened". Eventos sem action (ping, etc)
+    usam o valor do header.
+    """
+    if event_header in GITHUB_ACTION_EVENTS:
+        return f"{event_header}.{payload.get('action', 'opened')}"
+    return event_header
+
+
+def extract_issue_number_from_card(card_name: str, card_desc: str) -> int | None:
+    """Extrai issue number do nome ou descrição do card."""
+    # Tenta extrair do nome (ex: "#123 Issue Title")
+    match = re.search(r"#(\d+)", card_name)
+    if match:
+        return int(match.group(1))
+
+    # Tenta extrair da descrição (ex: "Issue #123")
+    match = re.search(r"#(\d+)", card_desc or "")
+    if match:
+        return int(match.group(1))
+
+    return None
+
+
+def extract_repository_from_card(card_desc: str) -> str | None:
+    """Extrai repositório da descrição do card."""
+    if not card_desc:
+        return None
+
+    # Tenta extrair formato "owner/repo"
+    match = re.search(r"([a-zA-Z0-9_-]+)/([a-zA-Z0-9_-]+)", card_desc)
+    if match:
+        return f"{match.group(1)}/{match.group(2)}"
+
+    return None
+
 
 class WebhookProcessor:
     """
@@ -44,6 +117,8 @@ class WebhookProcessor:
         self,
         job_queue: "JobQueuePort",
         event_bus: "EventBus",
+        intake: "WebhookIntake | None" = None,
+        trello_service: Any = None,
     ):
         """
         Inicializa processor.
@@ -51,9 +126,98 @@ class WebhookProcessor:
         Args:
             job_queue: Fila para enfileirar jobs
             event_bus: Event bus para emitir Domain Events
+            intake: Estágio de intake (necessário para ingest())
+            trello_service: TrelloService (necessário para webhooks do Trello)
         """
         self.job_queue = job_queue
         self.event_bus = event_bus
+        self.intake = intake
+        self.trello_service = trello_service
+
+    async def ingest(
+        self, source: str, body: bytes | str, headers: dict[str, str] | None = None
+    ) -> Result[str, str]:
+        """
+        Aceita uma entrega HTTP de webhook.
+
+        Só persiste a entrega no inbox (um fsync); parsing, deduplicação e
+        enfileiramento acontecem no intake. A assinatura deve ter sido
+        verificada pelo caller.
+
+        Args:
+            source: Fonte do webhook (github, trello, ...)
+            body: Corpo bruto da requisição
+            headers: Headers da requisição (só os relevantes são mantidos)
+
+        Returns:
+            Result com delivery_id da entrega aceita ou mensagem de erro
+        """
+        try:
+            webhook_source = WebhookSource(source)
+        except ValueError:
+            return Result.err(f"Fonte de webhook não suportada: {source}")
+
+        if self.intake is None:
+            return Result.err("Intake de webhooks não configurado")
+        if webhook_source == WebhookSource.TRELLO and self.trello_service is None:
+            return Result.err("TrelloService não configurado")
+
+        relevant = {
+            key.lower(): value
+            for key, value in (headers or {}).items()
+            if key.lower() in INGEST_HEADERS
+        }
+        delivery = WebhookDelivery.create(source, body, relevant)
+
+        try:
+            await self.intake.submit(delivery)
+        except OSError as e:
+            logger.error(f"Falha ao persistir entrega de webhook | source={source} | error={e}")
+            return Result.err(f"Falha ao persistir webhook: {e}")
+
+        return Result.ok(delivery.delivery_id)
+
+    async def process_delivery(self, delivery: WebhookDelivery) -> Result[Any, str]:
+        """
+        Interpreta uma entrega do inbox e cria o job correspondente.
+
+        Args:
+            delivery: Entrega persistida por ingest()
+
+        Returns:
+            Result do processamento específico da fonte; Result.err indica
+            entrega rejeitada de forma definitiva (JSON inválido, fonte ou
+            evento não suportado)
+
+        Raises:
+            QueueError, OSError: Falha transitória ao enfileirar (o intake
+                mantém a entrega pendente e tenta de novo)
+        """
+        try:
+            payload = json.loads(delivery.body) if delivery.body else {}
+        except json.JSONDecodeError as e:
+            return Result.err(f"Payload JSON inválido: {e}")
+        if not isinstance(payload, dict):
+            return Result.err("Payload JSON inválido: esperado objeto")
+
+        headers = delivery.headers
+        if delivery.source == WebhookSource.TRELLO.value:
+            return await self.process_trello_webhook(
+                payload,
+                trello_webhook_id=headers.get("x-trello-webhook") or headers.get("trello-webhook-id", ""),
+            )
+
+        event_type = headers.get("x-github-event", "")
+        if delivery.source == WebhookSource.GITHUB.value:
+            event_type = build_github_event_type(event_type, payload)
+
+        return await self.process_webhook(
+            source=delivery.source,
+            event_type=event_type,
+            payload=payload,
+            signature=headers.get("x-hub-signature-256"),
+            delivery_id=headers.get("x-github-delivery"),
+        )
 
     async def process_github_issue(
         self, payload: dict, event_type: str, signature: str | None = None, delivery_id: str | None = None
@@ -158,6 +322,9 @@ class WebhookProcessor:
 
             return Result.ok(job.job_id)
 
+        except (QueueError, OSError):
+            # Falha de infraestrutura (transitória): o chamador decide se repete
+            raise
         except Exception as e:
             logger.error(
                 f"Erro ao processar webhook | correlation_id={correlation_id} | error={e}"
@@ -202,5 +369,193 @@ class WebhookProcessor:
 
             return Result.err(f"Tipo de evento não suportado: {event_type}")
 
+        except (QueueError, OSError):
+            raise
         except Exception as e:
             return Result.err(f"Erro ao processar webhook: {str(e)}")
+
+    async def process_trello_webhook(
+        self, payload: dict, trello_webhook_id: str = ""
+    ) -> Result[dict, str]:
+        """
+        Processa evento de card do Trello.
+
+        PRD020: Fluxo bidirecional Trello → GitHub.
+        Detecta movimentos de cards entre listas e cria jobs apropriados
+        baseado no autonomy level da lista de destino.
+
+        Args:
+            payload: Payload JSON do webhook do Trello
+            trello_webhook_id: ID do webhook (opcional)
+
+        Returns:
+            Result com status do processamento ou erro
+        """
+        if self.trello_service is None:
+            return Result.err("TrelloService não configurado")
+
+        # Detecta tipo de evento
+        action_type = payload.get("action", {}).get("type", "")
+        action_data = payload.get("action", {}).get("data", {})
+        model = payload.get("model", {})
+
+        todo_list_name = "📋 A Fazer"
+
+        # Timestamp preciso para medição de latência
+        timestamp_ms = datetime.now().isoformat(timespec='milliseconds')
+        logger.info(f"📩 Webhook Trello recebido | action_type={action_type} | timestamp={timestamp_ms}")
+        logger.info(f"   Payload keys: {list(payload.keys())}")
+
+        # Listas/labels alterados no Trello: descarta metadados em cache do board
+        from infra.kanban.adapters.trello_metadata_cache import invalidate_board_metadata
+
+        board_id = action_data.get("board", {}).get("id") or model.get("id")
+        if invalidate_board_metadata(board_id, action_type=action_type):
+            logger.info(f"   Cache de listas/labels invalidado (board={board_id})")
+
+        # Evento: Card atualizado (movido entre listas)
+        if action_type != "updateCard":
+            return Result.ok({"processed": True, "action": "ignored"})
+
+        # IMPORTANTE: action.data.card contém o ID do card, não model.id (que é o board)
+        card_data = action_data.get("card", {})
+        card_id = card_data.get("id")
+        card_name = card_data.get("name", "")
+        card_desc = card_data.get("desc", "")
+
+        # PRD026: Detectar arquivamento/deleção de card
+        # Se card.closed == true, trata como arquivado/deletado
+        card_closed = card_data.get("closed", False)
+
+        # Extrai informações de movimento do payload
+        list_before_name = action_data.get("listBefore", {}).get("name", "Desconhecido")
+        list_after_name = action_data.get("listAfter", {}).get("name", "Desconhecido")
+
+        logger.info(
+            f"📦 Card atualizado: '{card_name}' | "
+            f"listas: {list_before_name} → {list_after_name}"
+        )
+        logger.info(f"   Card ID: {card_id}")
+
+        if card_closed:
+            logger.info(f"📦 Card arquivado/deletado: '{card_name}' (ID: {card_id})")
+
+            # PRD026: Emitir TrelloCardArchivedEvent
+            from core.domain_events.trello_events import TrelloCardArchivedEvent
+            await self.event_bus.publish(
+                TrelloCardArchivedEvent(
+                    aggregate_id=card_id,
+                    card_id=card_id,
+                    card_name=card_name,
+                    reason="archived via webhook"
+                )
+            )
+            logger.info(f"✅ TrelloCardArchivedEvent emitido para card '{card_name}'")
+            return Result.ok({"processed": True, "action": "ignored"})
+
+        # PRD020: Emitir TrelloWebhookReceivedEvent
+        from core.domain_events.trello_events import TrelloWebhookReceivedEvent
+        await self.event_bus.publish(
+            TrelloWebhookReceivedEvent(
+                aggregate_id=card_id,
+                webhook_id=trello_webhook_id,
+                action_type=action_type,
+                card_id=card_id,
+                card_name=card_name,
+                list_before_name=list_before_name,
+                list_after_name=list_after_name,
+            )
+        )
+        logger.info(f"✅ TrelloWebhookReceivedEvent emitido para card '{card_name}'")
+
+        # Determinar autonomy_level baseado na lista de destino
+        from core.webhooks.domain.autonomy_level import AutonomyLevel
+        try:
+            autonomy_level = AutonomyLevel(LIST_TO_AUTONOMY.get(list_after_name, "development"))
+        except ValueError:
+            autonomy_level = AutonomyLevel.DEVELOPMENT
+
+        logger.info(f"   Autonomy Level: {autonomy_level.value} (baseado na lista '{list_after_name}')")
+
+        issue_number = extract_issue_number_from_card(card_name, card_desc)
+
+        if list_after_name == todo_list_name:
+            in_progress_list_name = "🚧 Em Andamento"
+            logger.info(f"✅ Card detectado em '{todo_list_name}' - movendo para '{in_progress_list_name}'...")
+
+            # Card foi movido para "📋 A Fazer" - mover automaticamente para "🚧 Em Andamento"
+            handle_result = await self.trello_service.handle_card_moved_to_todo(card_id=card_id)
+            if handle_result.is_err:
+                logger.error(f"❌ Erro ao processar card movido para '📋 A Fazer': {handle_result.error}")
+                return Result.err(handle_result.error)
+
+            logger.info(f"✅ Card movido automaticamente para '{in_progress_list_name}'")
+
+            if issue_number:
+                job_id = await self._enqueue_trello_job(
+                    payload, trello_webhook_id, card_id, card_name, list_after_name,
+                    autonomy_level, issue_number,
+                )
+                return Result.ok({"processed": True, "action": "moved_to_progress", "job_id": job_id})
+
+            logger.warning(f"⚠️ Card '{card_name}' não possui issue_number - pulando criação de job")
+
+        # PRD020: Para outras listas, também criar job se tiver issue_number
+        elif list_after_name in LIST_TO_AUTONOMY and issue_number:
+            job_id = await self._enqueue_trello_job(
+                payload, trello_webhook_id, card_id, card_name, list_after_name,
+                autonomy_level, issue_number,
+            )
+            return Result.ok({"processed": True, "action": "job_created", "job_id": job_id})
+
+        return Result.ok({"processed": True, "action": "ignored"})
+
+    async def _enqueue_trello_job(
+        self,
+        payload: dict,
+        trello_webhook_id: str,
+        card_id: str,
+        card_name: str,
+        list_name: str,
+        autonomy_level: Any,
+        issue_number: int,
+    ) -> str:
+        """Cria, enfileira e anuncia (JobCreatedEvent) o job de um card do Trello."""
+        from core.domain_events.job_events import JobCreatedEvent
+        from core.webhooks.domain.trigger_mappings import get_trello_list_slug, build_card_moved_event_type
+
+        # Usa slug da lista Trello para event_type (evita problemas com emojis)
+        list_slug = get_trello_list_slug(list_name)
+        event_type = build_card_moved_event_type(list_slug) if list_slug else f"card.moved.{list_name}"
+
+        webhook_event = WebhookEvent(
+            source=WebhookSource.TRELLO,
+            event_type=event_type,
+            event_id=card_id,
+            payload=payload,
+            received_at=datetime.utcnow(),
+            delivery_id=trello_webhook_id,
+        )
+
+        job = WebhookJob.create(webhook_event)
+        job.autonomy_level = autonomy_level
+        job.metadata.update({
+            "trello_card_id": card_id,
+            "trello_card_name": card_name,
+            "trello_list_name": list_name,  # Mantém nome original com emoji
+        })
+
+        job_id = await self.job_queue.enqueue(job)
+        logger.info(
+            f"✅ Job criado: job_id={job_id} | issue=#{issue_number} | "
+            f"autonomy={autonomy_level.value} | lista={list_name}"
+        )
+
+        await self.event_bus.publish(
+            JobCreatedEvent(
+                aggregate_id=job_id,
+                job_id=job_id,
+                issue_number=issue_number,
+            )
+        )
+        return job_id
@@ -11,12 +11,14 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from core.webhooks.application.worktree_pool import WorktreePool
     from core.webhooks.domain import WebhookJob
 
 from core.webhooks.domain import (
     generate_branch_name,
     generate_worktree_name,
 )
+from infra.process import AsyncProcessRunner, default_runner
 from kernel.contracts.result import Result
 
 
@@ -32,23 +34,40 @@ class WorktreeManager:
     Worktrees garantem isolamento completo: cada job trabalha
     em seu próprio diretório sem afetar o repositório principal.
 
+    Criação e remoção são assíncronas (AsyncProcessRunner) para não
+    bloquear o event loop enquanto o git trabalha. Com um WorktreePool,
+    a criação entrega um worktree pré-aquecido. A reciclagem acontece na
+    remoção manual pela WebUI (RF005: jobs não removem o worktree).
+
     Attributes:
         base_path: Caminho base onde worktrees são criados
         base_branch: Branch base para criar worktrees (configurável)
+        runner: Executor assíncrono de processos
+        pool: Pool de worktrees pré-aquecidos (opcional)
     """
 
-    def __init__(self, base_path: str | Path, base_branch: str = "dev"):
+    def __init__(
+        self,
+        base_path: str | Path,
+        base_branch: str = "dev",
+        runner: AsyncProcessRunner | None = None,
+        pool: "WorktreePool | None" = None,
+    ):
         """
         Inicializa manager.
 
         Args:
             base_path: Caminho base para worktrees (ex: "../skybridge-auto")
             base_branch: Branch base para criar worktrees (padrão: "dev")
+            runner: Executor de processos (padrão: runner compartilhado)
+            pool: Pool de worktrees pré-aquecidos (None = sempre cria do zero)
         """
         self.base_path = Path(base_path)
         self.base_branch = base_branch
+        self.runner = runner or default_runner
+        self.pool = pool
 
-    def create_worktree(self, job: "WebhookJob") -> Result[str, str]:
+    async def create_worktree(self, job: "WebhookJob") -> Result[str, str]:
         """
         Cria worktree isolado para o job.
 
@@ -60,7 +79,7 @@ class WorktreeManager:
 
         Example:
             >>> manager = WorktreeManager("../skybridge-auto")
-            >>> result = manager.create_worktree(job)
+            >>> result = await manager.create_worktree(job)
             >>> if result.is_ok:
             ...     worktree_path = result.value
             ...     # Agente trabalha no worktree...
@@ -73,9 +92,15 @@ class WorktreeManager:
             # Cria diretório base se não existe
             self.base_path.mkdir(parents=True, exist_ok=True)
 
+            # Worktree pré-aquecido: apenas move + cria branch
+            if self.pool is not None and await self.pool.acquire(worktree_path, branch_name):
+                job.worktree_path = str(worktree_path)
+                job.branch_name = branch_name
+                return Result.ok(str(worktree_path))
+
             # Executa git worktree add com branch base configurada
             # Isso garante que worktrees sejam criadas a partir da branch correta
-            result = subprocess.run(
+            await self.runner.run(
                 [
                     "git",
                     "worktree",
@@ -85,10 +110,8 @@ class WorktreeManager:
                     branch_name,
                     self.base_branch,  # Branch base configurada (ex: "dev")
                 ],
-                capture_output=True,
-                text=True,
-                check=True,
                 timeout=30,
+                check=True,
             )
 
             # Atualiza job com caminho e branch
@@ -106,7 +129,7 @@ class WorktreeManager:
         except Exception as e:
             return Result.err(f"Erro inesperado ao criar worktree: {str(e)}")
 
-    def remove_worktree(self, worktree_path: str) -> Result[None, str]:
+    async def remove_worktree(self, worktree_path: str) -> Result[None, str]:
         """
         Remove worktree após processamento.
 
@@ -121,12 +144,10 @@ class WorktreeManager:
             para validar que o worktree pode ser removido com segurança.
         """
         try:
-            result = subprocess.run(
+            await self.runner.run(
                 ["git", "worktree", "remove", worktree_path],
-                capture_output=True,
-                text=True,
-                check=True,
                 timeout=30,
+                check=True,
             )
 
             return Result.ok(None)
@@ -0,0 +1,343 @@
+# -*- coding: utf-8 -*-
+"""
+Worktree Pool — Worktrees pré-aquecidos na ponta da branch base.
+
+`git worktree add` faz checkout completo do repositório no início de cada
+job, antes de o agente poder começar. O pool mantém N worktrees já
+checados (HEAD destacado na ponta da branch base) em `<base_path>/.pool`
+e os entrega com operações baratas:
+
+1. `git worktree move` do slot para o caminho do job (rename)
+2. `git checkout -b <branch>` (HEAD já está na ponta: não toca arquivos)
+
+Em segundo plano o pool repõe slots entregues e atualiza os slots quando
+a branch base avança (checkout incremental). Worktrees liberados sem
+mudanças pendentes são reciclados (checkout --force + clean) em vez de
+removidos; worktrees sujos nunca são reciclados.
+
+DOC: core/webhooks/application/worktree_manager.py
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import subprocess
+import threading
+import uuid
+from pathlib import Path
+
+from infra.process import AsyncProcessRunner, default_runner
+
+
+logger = logging.getLogger(__name__)
+
+
+# Diretório dos slots dentro do base_path dos worktrees
+POOL_DIR_NAME = ".pool"
+
+# Intervalo entre verificações da branch base (segundos)
+DEFAULT_REFRESH_INTERVAL = 30.0
+
+# Timeout para checkouts completos (criação de slot)
+CHECKOUT_TIMEOUT = 600
+
+# Timeout para operações baratas (move, branch, rev-parse)
+QUICK_TIMEOUT = 30
+
+_GIT_ERRORS = (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError)
+
+
+class WorktreePool:
+    """
+    Pool de worktrees prontos para jobs.
+
+    O pool é mantido por uma task no loop da API (mesmo loop do worker e
+    das rotas da WebUI); o estado é protegido por threading.Lock para
+    continuar seguro se usado a partir de threads (handlers síncronos).
+
+    Attributes:
+        pool_path: Diretório dos slots
+        base_branch: Branch base dos worktrees
+        size: Quantidade de worktrees mantidos prontos
+        repo_path: Repositório principal (None = diretório atual)
+        refresh_interval: Intervalo entre verificações da branch base
+    """
+
+    def __init__(
+        self,
+        pool_path: str | Path,
+        base_branch: str = "dev",
+        size: int = 2,
+        repo_path: str | Path | None = None,
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+        runner: AsyncProcessRunner | None = None,
+    ):
+        """
+        Inicializa o pool (sem criar worktrees; ver warm()/run()).
+
+        Args:
+            pool_path: Diretório dos slots
+            base_branch: Branch base dos worktrees
+            size: Quantidade de worktrees mantidos prontos
+            repo_path: Repositório principal (None = diretório atual)
+            refresh_interval: Intervalo entre verificações da branch base
+            runner: Executor de processos (padrão: runner compartilhado)
+        """
+        self.pool_path = Path(pool_path)
+        self.base_branch = base_branch
+        self.size = size
+        self.repo_path = str(repo_path) if repo_path is not None else None
+        self.refresh_interval = refresh_interval
+        self.runner = runner or default_runner
+
+        self._ready: dict[Path, str] = {}  # slot -> commit do HEAD
+        self._provisioning = 0
+        self._refilling = False
+        self._warmed = False
+        self._lock = threading.Lock()
+        self._background: set[asyncio.Task] = set()
+
+    @property
+    def ready_count(self) -> int:
+        """Quantidade de worktrees prontos para entrega."""
+        with self._lock:
+            return len(self._ready)
+
+    async def _git(self, *args: str, cwd: str | Path | None = None, timeout: float = QUICK_TIMEOUT) -> str:
+        """Executa git e retorna stdout (levanta em caso de erro)."""
+        result = await self.runner.run(
+            ["git", *args],
+            cwd=str(cwd) if cwd is not None else self.repo_path,
+            timeout=timeout,
+            check=True,
+        )
+        return result.stdout.strip()
+
+    async def _base_tip(self) -> str:
+        """Commit atual da branch base."""
+        return await self._git("rev-parse", "--verify", f"{self.base_branch}^{{commit}}")
+
+    def _new_slot_path(self) -> Path:
+        """Caminho para um novo slot."""
+        return self.pool_path / f"slot-{uuid.uuid4().hex[:8]}"
+
+    async def _reset_slot(self, slot: Path, tip: str) -> None:
+        """Leva o slot para a ponta da branch base, sem mudanças locais."""
+        await self._git("checkout", "--detach", "--force", tip, cwd=slot, timeout=CHECKOUT_TIMEOUT)
+        await self._git("clean", "-ffdx", cwd=slot, timeout=CHECKOUT_TIMEOUT)
+
+    async def _discard(self, path: Path) -> None:
+        """Remove um worktree (best-effort)."""
+        try:
+            await self._git("worktree", "remove", "--force", str(path), timeout=CHECKOUT_TIMEOUT)
+        except _GIT_ERRORS as e:
+            logger.warning(f"Falha ao remover worktree do pool {path}: {e}")
+
+    def _schedule(self, coro) -> None:
+        """Agenda manutenção em segundo plano no loop atual."""
+        task = asyncio.get_running_loop().create_task(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def warm(self) -> None:
+        """Adota slots existentes (de execuções anteriores) e completa o pool."""
+        self.pool_path.mkdir(parents=True, exist_ok=True)
+        tip = await self._base_tip()
+
+        known = {Path(p) for p in list(self._ready)}
+        for slot in sorted(self.pool_path.glob("slot-*")):
+            if slot in known or not (slot / ".git").exists():
+                continue
+            try:
+                await self._reset_slot(slot, tip)
+            except _GIT_ERRORS as e:
+                logger.warning(f"Slot inválido descartado {slot}: {e}")
+                await self._discard(slot)
+                continue
+            with self._lock:
+                adopted = len(self._ready) < self.size
+                if adopted:
+                    self._ready[slot] = tip
+            if not adopted:
+                await self._discard(slot)
+
+        self._warmed = True
+        await self.refill()
+
+    async def refill(self) -> None:
+        """Cria slots até completar o tamanho do pool."""
+        with self._lock:
+            if self._refilling:
+                return
+            self._refilling = True
+
+        try:
+            while True:
+                with self._lock:
+                    if len(self._ready) + self._provisioning >= self.size:
+                        return
+                    self._provisioning += 1
+
+                try:
+                    slot = self._new_slot_path()
+                    tip = await self._base_tip()
+                    self.pool_path.mkdir(parents=True, exist_ok=True)
+                    await self._git("worktree", "add", "--detach", str(slot), tip, timeout=CHECKOUT_TIMEOUT)
+                    with self._lock:
+                        self._ready[slot] = tip
+                    logger.debug(f"Worktree pré-aquecido: {slot}")
+                except _GIT_ERRORS as e:
+                    logger.warning(f"Falha ao pré-aquecer worktree: {e}")
+                    return
+                finally:
+                    with self._lock:
+                        self._provisioning -= 1
+        finally:
+            with self._lock:
+                self._refilling = False
+
+    async def refresh(self) -> None:
+        """Atualiza slots cujo HEAD ficou para trás da branch base."""
+        tip = await self._base_tip()
+        with self._lock:
+            stale = [slot for slot, head in self._ready.items() if head != tip]
+            for slot in stale:
+                del self._ready[slot]
+            self._provisioning += len(stale)
+
+        for slot in stale:
+            try:
+                await self._reset_slot(slot, tip)
+                with self._lock:
+                    self._ready[slot] = tip
+            except _GIT_ERRORS as e:
+                logger.warning(f"Falha ao atualizar worktree do pool {slot}: {e}")
+                await self._discard(slot)
+            finally:
+                with self._lock:
+                    self._provisioning -= 1
+
+        if stale:
+            logger.info(f"Pool de worktrees atualizado para {self.base_branch}@{tip[:8]} ({len(stale)} slots)")
+
+    async def run(self) -> None:
+        """Manutenção contínua: completa o pool e acompanha a branch base."""
+        while True:
+            try:
+                if not self._warmed:
+                    await self.warm()
+                else:
+                    await self.refill()
+                    await self.refresh()
+            except _GIT_ERRORS as e:
+                logger.warning(f"Manutenção do pool de worktrees falhou: {e}")
+            await asyncio.sleep(self.refresh_interval)
+
+    async def acquire(self, target_path: str | Path, branch_name: str) -> bool:
+        """
+        Entrega um worktree pronto em `target_path` na nova branch.
+
+        Args:
+            target_path: Caminho final do worktree do job
+            branch_name: Branch a criar para o job
+
+        Returns:
+            True se um worktree do pool foi entregue; False se o pool está
+            vazio ou a entrega falhou (caller cria o worktree do zero)
+        """
+        with self._lock:
+            if not self._ready:
+                slot = None
+            else:
+                slot, head = self._ready.popitem()
+
+        self._schedule(self.refill())
+        if slot is None:
+            return False
+
+        target = Path(target_path)
+        try:
+            tip = await self._base_tip()
+            if head != tip:
+                await self._reset_slot(slot, tip)
+            await self._git("worktree", "move", str(slot), str(target))
+        except _GIT_ERRORS as e:
+            logger.warning(f"Falha ao entregar worktree do pool {slot}: {e}")
+            await self._discard(slot)
+            return False
+
+        try:
+            await self._git("checkout", "-b", branch_name, cwd=target)
+        except _GIT_ERRORS as e:
+            logger.warning(f"Falha ao criar branch {branch_name} no worktree do pool: {e}")
+            await self._discard(target)
+            return False
+
+        return True
+
+    async def release(self, worktree_path: str | Path) -> bool:
+        """
+        Recicla um worktree liberado de volta para o pool.
+
+        A branch do job é preservada no repositório; apenas o diretório é
+        reaproveitado. Só worktrees limpos (`git status --porcelain` vazio)
+        são reciclados: mudanças pendentes ficam para o `git worktree
+        remove` do caller, que recusa o diretório e reporta o erro.
+
+        Args:
+            worktree_path: Worktree a reciclar
+
+        Returns:
+            True se o worktree deixou o caminho original (reciclado ou
+            descartado); False se o caller deve removê-lo normalmente
+        """
+        try:
+            pending = await self._git("status", "--porcelain", cwd=worktree_path)
+        except _GIT_ERRORS:
+            return False
+        if pending:
+            logger.info(f"Worktree com mudanças pendentes não reciclado: {worktree_path}")
+            return False
+
+        with self._lock:
+            if len(self._ready) + self._provisioning >= self.size:
+                return False
+            self._provisioning += 1
+
+        try:
+            slot = self._new_slot_path()
+            try:
+                self.pool_path.mkdir(parents=True, exist_ok=True)
+                await self._git("worktree", "move", str(worktree_path), str(slot))
+            except _GIT_ERRORS:
+                return False
+
+            try:
+                tip = await self._base_tip()
+                await self._reset_slot(slot, tip)
+            except _GIT_ERRORS as e:
+                logger.warning(f"Falha ao reciclar worktree {worktree_path}: {e}")
+                await self._discard(slot)
+                return True
+
+            with self._lock:
+                self._ready[slot] = tip
+            logger.info(f"Worktree reciclado para o pool: {worktree_path}")
+            return True
+        finally:
+            with self._lock:
+                self._provisioning -= 1
+
+
+_active_pool: WorktreePool | None = None
+
+
+def set_worktree_pool(pool: WorktreePool | None) -> None:
+    """Registra o pool usado pelo processo (None desativa)."""
+    global _active_pool
+    _active_pool = pool
+
+
+def get_worktree_pool() -> WorktreePool | None:
+    """Retorna o pool registrado no processo, se houver."""
+    return _active_pool
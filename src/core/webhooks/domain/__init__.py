@@ -7,6 +7,7 @@ seguindo os princípios de Domain-Driven Design (ADR002).
 
 Linguagem Ubíquita:
 - WebhookEvent: Evento recebido de uma fonte externa (GitHub, Discord, etc)
+- WebhookDelivery: Entrega HTTP bruta persistida no inbox (antes do parsing)
 - WebhookJob: Job em background para processar um WebhookEvent
 - JobStatus: Estado do job (pending, processing, completed, failed)
 """
@@ -14,19 +15,23 @@ Linguagem Ubíquita:
 from core.webhooks.domain.webhook_event import (
     WebhookSource,
     WebhookEvent,
+    WebhookDelivery,
     WebhookJob,
     JobStatus,
     generate_worktree_name,
     generate_branch_name,
+    get_concurrency_keys,
 )
 from .autonomy_level import AutonomyLevel  # noqa: E402
 
 __all__ = [
     "WebhookSource",
     "WebhookEvent",
+    "WebhookDelivery",
     "WebhookJob",
     "JobStatus",
     "generate_worktree_name",
     "generate_branch_name",
+    "get_concurrency_keys",
     "AutonomyLevel",
 ]
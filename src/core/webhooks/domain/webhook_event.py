@@ -102,6 +102,73 @@ class WebhookEvent:
         return None
 
 
+@dataclass
+class WebhookDelivery:
+    """
+    Entrega HTTP de webhook ainda não interpretada.
+
+    É o que o endpoint persiste no inbox antes de responder 202: corpo
+    bruto e headers relevantes. O parsing (JSON, event_type) e a criação
+    de jobs acontecem depois, no estágio de intake.
+
+    Attributes:
+        delivery_id: ID único da entrega no inbox
+        source: Fonte do webhook ("github", "trello", ...)
+        body: Corpo da requisição (texto)
+        headers: Headers relevantes (chaves em minúsculas)
+        received_at: Timestamp de recebimento
+    """
+
+    delivery_id: str
+    source: str
+    body: str
+    headers: dict[str, str] = field(default_factory=dict)
+    received_at: datetime = field(default_factory=datetime.utcnow)
+
+    @classmethod
+    def create(cls, source: str, body: bytes | str, headers: dict[str, str] | None = None) -> "WebhookDelivery":
+        """
+        Cria entrega com ID único.
+
+        Args:
+            source: Fonte do webhook
+            body: Corpo da requisição
+            headers: Headers relevantes
+
+        Returns:
+            Nova instância de WebhookDelivery
+        """
+        if isinstance(body, bytes):
+            body = body.decode("utf-8", errors="replace")
+        return cls(
+            delivery_id=f"{source}-{uuid4().hex}",
+            source=source,
+            body=body,
+            headers={k.lower(): v for k, v in (headers or {}).items()},
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serializa para o inbox (JSON)."""
+        return {
+            "delivery_id": self.delivery_id,
+            "source": self.source,
+            "body": self.body,
+            "headers": self.headers,
+            "received_at": self.received_at.isoformat(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "WebhookDelivery":
+        """Reconstrói a partir do registro do inbox."""
+        return cls(
+            delivery_id=data["delivery_id"],
+            source=data["source"],
+            body=data.get("body", ""),
+            headers=data.get("headers") or {},
+            received_at=datetime.fromisoformat(data["received_at"]),
+        )
+
+
 @dataclass
 class WebhookJob:
     """
@@ -250,3 +317,46 @@ def generate_branch_name(job: WebhookJob) -> str:
     if job.issue_number:
         return f"webhook/{job.event.source.value}/issue/{job.issue_number}/{job_suffix}"
     return f"webhook/{job.event.source.value}/{job.job_id}"
+
+
+def get_concurrency_keys(job: WebhookJob) -> tuple[str | None, str | None]:
+    """
+    Retorna chaves de concorrência de um job (repositório, issue).
+
+    Usadas pelo worker pool para limitar jobs simultâneos por repositório
+    e serializar jobs da mesma issue/card.
+
+    Args:
+        job: Job de webhook
+
+    Returns:
+        Tupla (repository_key, issue_key); cada chave é None quando o
+        payload não identifica o recurso
+
+    Example:
+        ("github:h4mn/skybridge", "github:h4mn/skybridge#225")
+        ("trello:<board_id>", "trello:<board_id>#<card_id>")
+    """
+    source = job.event.source.value
+    payload = job.event.payload or {}
+
+    if job.event.source == WebhookSource.TRELLO:
+        action_data = (payload.get("action") or {}).get("data") or {}
+        board_id = (payload.get("model") or {}).get("id") or (
+            action_data.get("board") or {}
+        ).get("id")
+        card_id = (action_data.get("card") or {}).get("id")
+
+        repo_key = f"{source}:{board_id}" if board_id else None
+        issue_key = f"{source}:{board_id}#{card_id}" if card_id else None
+        return repo_key, issue_key
+
+    repository = job.event.get_repository()
+    repo_key = f"{source}:{repository[0]}/{repository[1]}" if repository else None
+
+    issue_number = job.issue_number or job.event.get_issue_number()
+    issue_key = None
+    if issue_number:
+        issue_key = f"{repo_key or source}#{issue_number}"
+
+    return repo_key, issue_key
@@ -15,6 +15,7 @@ claude-agent-sdk (ADR021).
 """
 from __future__ import annotations
 
+import asyncio
 import re
 import subprocess
 from typing import Any
@@ -189,7 +190,8 @@ if SDK_AVAILABLE and tool is not None:
         command = args.get("command", "")
         cwd = args.get("cwd", "")
 
-        result = safe_git(command, cwd)
+        # subprocess síncrono fora do event loop (o worker roda no loop da API)
+        result = await asyncio.to_thread(safe_git, command, cwd)
 
         if result.is_ok:
             return {
@@ -8,9 +8,11 @@ Seguindo a arquitetura hexagonal/Clean Architecture.
 Ports:
 - JobQueuePort: Interface para fila de jobs (in-memory, Redis, etc)
 - WebhookSignaturePort: Interface para verificação de assinatura HMAC
+- WebhookInboxPort: Interface para inbox durável de entregas de webhook
 """
 
 from core.webhooks.ports.job_queue_port import JobQueuePort
+from core.webhooks.ports.webhook_inbox_port import WebhookInboxPort
 from core.webhooks.ports.webhook_signature_port import (
     WebhookSignaturePort,
 )
@@ -18,4 +20,5 @@ from core.webhooks.ports.webhook_signature_port import (
 __all__ = [
     "JobQueuePort",
     "WebhookSignaturePort",
+    "WebhookInboxPort",
 ]
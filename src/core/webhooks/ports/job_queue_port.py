@@ -8,8 +8,9 @@ o código de domínio.
 """
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable
 
 if TYPE_CHECKING:
     from core.webhooks.domain import WebhookJob
@@ -101,6 +102,18 @@ class JobQueuePort(ABC):
         """
         pass
 
+    async def pending_count(self) -> int:
+        """
+        Versão assíncrona de size() (opcional).
+
+        Adapters com I/O bloqueante sobrescrevem para não consultar o
+        armazenamento no event loop.
+
+        Returns:
+            Número de jobs aguardando processamento
+        """
+        return self.size()
+
     @abstractmethod
     async def exists_by_delivery(self, delivery_id: str) -> bool:
         """
@@ -114,6 +127,91 @@ class JobQueuePort(ABC):
         """
         pass
 
+    async def exists_many_by_delivery(self, delivery_ids: Iterable[str]) -> set[str]:
+        """
+        Versão em lote de exists_by_delivery() (opcional).
+
+        A implementação default consulta um delivery por vez; adapters
+        persistentes sobrescrevem com uma única consulta (IN, MGET, ...).
+
+        Args:
+            delivery_ids: IDs de entrega a verificar
+
+        Returns:
+            Subconjunto dos delivery_ids que já existem
+        """
+        return {
+            delivery_id
+            for delivery_id in set(delivery_ids)
+            if await self.exists_by_delivery(delivery_id)
+        }
+
+    async def enqueue_many(self, jobs: list["WebhookJob"]) -> list[str]:
+        """
+        Enfileira um lote de jobs (opcional, implementação default).
+
+        Jobs cujo delivery_id já existe na fila, ou se repete dentro do
+        próprio lote, são ignorados. Adapters sobrescrevem para gravar o
+        lote em uma única transação/pipeline.
+
+        Args:
+            jobs: Jobs a enfileirar (ordem preservada)
+
+        Returns:
+            job_ids efetivamente enfileirados
+
+        Raises:
+            QueueError: Se falhar ao enfileirar
+        """
+        new_jobs = await self._filter_new_deliveries(jobs)
+        return [await self.enqueue(job) for job in new_jobs]
+
+    async def complete_many(
+        self,
+        job_ids: Iterable[str],
+        results: dict[str, dict] | None = None,
+    ) -> None:
+        """
+        Marca um lote de jobs como completados (opcional).
+
+        Args:
+            job_ids: IDs dos jobs
+            results: Resultado opcional por job_id
+        """
+        results = results or {}
+        for job_id in job_ids:
+            await self.complete(job_id, results.get(job_id))
+
+    async def fail_many(self, errors: dict[str, str]) -> None:
+        """
+        Marca um lote de jobs como falhos (opcional).
+
+        Args:
+            errors: Mensagem de erro por job_id
+        """
+        for job_id, error in errors.items():
+            await self.fail(job_id, error)
+
+    async def _filter_new_deliveries(self, jobs: list["WebhookJob"]) -> list["WebhookJob"]:
+        """
+        Remove do lote jobs com delivery_id já conhecido ou repetido.
+
+        Resolve a deduplicação com uma única chamada a
+        exists_many_by_delivery(); jobs sem delivery_id sempre passam.
+        """
+        delivery_ids = [job.event.delivery_id for job in jobs if job.event.delivery_id]
+        seen = await self.exists_many_by_delivery(delivery_ids) if delivery_ids else set()
+
+        new_jobs = []
+        for job in jobs:
+            delivery_id = job.event.delivery_id
+            if delivery_id:
+                if delivery_id in seen:
+                    continue
+                seen.add(delivery_id)
+            new_jobs.append(job)
+        return new_jobs
+
     async def update_metadata(self, job_id: str, metadata: dict[str, object]) -> None:
         """
         Atualiza metadata de um job (opcional, implementação default).
@@ -128,6 +226,109 @@ class JobQueuePort(ABC):
         # Implementação default não-faz-nada (para filas em memória)
         pass
 
+    async def wait_for_job(self, timeout_seconds: float) -> bool:
+        """
+        Aguarda sinal de novo job disponível (opcional).
+
+        Implementações com canal de notificação (enqueue acorda o worker)
+        sobrescrevem este método. A implementação default apenas espera o
+        timeout, equivalente ao polling com intervalo fixo.
+
+        Args:
+            timeout_seconds: Tempo máximo de espera
+
+        Returns:
+            True se um job pode estar disponível, False se timeout
+        """
+        await asyncio.sleep(timeout_seconds)
+        return False
+
+    async def heartbeat(self, job_id: str, lease_seconds: float | None = None) -> bool:
+        """
+        Renova o lease de um job em processamento (opcional).
+
+        Filas com visibility timeout (ex: SQLiteJobQueue) sobrescrevem para
+        manter o job reservado enquanto o worker está vivo.
+
+        Args:
+            job_id: ID do job
+            lease_seconds: Nova duração do lease (None = padrão da fila)
+
+        Returns:
+            True se o job continua reservado por este worker
+        """
+        # Filas sem lease: job nunca expira
+        return True
+
+    async def requeue_expired_leases(self) -> int:
+        """
+        Devolve à fila jobs com lease expirado (opcional).
+
+        Returns:
+            Número de jobs recuperados
+        """
+        # Filas sem lease: nada a recuperar
+        return 0
+
+    async def archive_finished_jobs(
+        self, older_than_days: int, batch_size: int = 500
+    ) -> int:
+        """
+        Move jobs finalizados antigos para armazenamento frio (opcional).
+
+        Mantém a tabela/estrutura "quente" pequena para que listagens e
+        varreduras por status continuem rápidas. Executado periodicamente
+        pelo JobRetentionService.
+
+        Args:
+            older_than_days: Arquivar jobs finalizados há mais de X dias
+            batch_size: Jobs movidos por transação (limita tempo de lock)
+
+        Returns:
+            Número de jobs arquivados
+        """
+        # Filas sem arquivo: nada a fazer
+        return 0
+
+    async def compact_storage(self, max_pages: int = 1000) -> int:
+        """
+        Devolve ao sistema espaço liberado por remoções (opcional).
+
+        Deve ser incremental (barato o bastante para rodar em background).
+
+        Args:
+            max_pages: Limite de páginas/unidades liberadas por chamada
+
+        Returns:
+            Quantidade liberada (páginas, no caso do SQLite)
+        """
+        return 0
+
+    async def ensure_incremental_compaction(self, convert: bool = True) -> bool:
+        """
+        Garante que compact_storage() consegue liberar espaço (opcional).
+
+        Armazenamentos criados antes da compactação incremental podem
+        exigir uma reescrita única (ex: VACUUM no SQLite).
+
+        Args:
+            convert: Executar a conversão; se False, apenas avisa no log
+
+        Returns:
+            True se compact_storage() está apto a liberar espaço
+        """
+        # Filas sem armazenamento compactável: nada a converter
+        return True
+
+    async def purge_expired_deliveries(self) -> int:
+        """
+        Remove registros de deduplicação expirados (opcional).
+
+        Returns:
+            Número de registros removidos
+        """
+        return 0
+
 
 class QueueError(Exception):
     """Erro na operação da fila."""
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""
+Webhook Inbox Port.
+
+Interface para o inbox durável de entregas de webhook. O endpoint HTTP
+responde 202 assim que a entrega está no inbox; o estágio de intake
+interpreta e enfileira depois, e confirma (ack) ao terminar.
+"""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from core.webhooks.domain import WebhookDelivery
+
+
+class WebhookInboxPort(ABC):
+    """
+    Port para inbox de entregas de webhook.
+
+    Implementações:
+    - JournalWebhookInbox: journal append-only com fsync (group commit)
+    """
+
+    @abstractmethod
+    async def append(self, delivery: "WebhookDelivery") -> None:
+        """
+        Persiste a entrega de forma durável.
+
+        Ao retornar, a entrega sobrevive a um crash do processo.
+
+        Args:
+            delivery: Entrega recebida
+
+        Raises:
+            OSError: Se falhar ao persistir
+        """
+        pass
+
+    @abstractmethod
+    async def ack(self, delivery_id: str) -> None:
+        """
+        Marca a entrega como processada pelo intake.
+
+        Args:
+            delivery_id: ID da entrega
+        """
+        pass
+
+    @abstractmethod
+    def pending(self) -> list["WebhookDelivery"]:
+        """
+        Entregas persistidas e ainda não confirmadas, em ordem de chegada.
+
+        Returns:
+            Lista de entregas pendentes (inclui as recuperadas no startup)
+        """
+        pass
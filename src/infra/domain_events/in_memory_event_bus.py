@@ -2,8 +2,21 @@
 """
 In-Memory Event Bus Implementation.
 
-A simple, synchronous event bus implementation that stores subscriptions
-in memory. Thread-safe using threading.Lock.
+A simple event bus implementation that stores subscriptions in memory.
+Thread-safe using threading.Lock.
+
+Dispatch options (all off by default, preserving sequential delivery):
+- concurrent_dispatch: handlers of the same priority run concurrently
+- handler_timeout: per-handler timeout (a slow listener is abandoned)
+- fire_and_forget: publish() returns after enqueueing; a bounded queue
+  on the bus's long-lived event loop delivers events in order in the
+  background (publishers on other loops hand events off to it)
+- sync handlers run on a dedicated bounded executor, not the loop default
+
+History is a ring buffer of sequence-numbered events. Consumers such as
+the observability SSE stream keep a cursor (last sequence seen) and await
+new events via wait_for_events()/subscribe_events(), woken by publish()
+from any thread or event loop, instead of polling get_history().
 
 This is suitable for development and single-instance deployments.
 For multi-instance deployments, consider a Redis-backed event bus.
@@ -14,8 +27,12 @@ from __future__ import annotations
 import asyncio
 import logging
 import threading
-from collections import defaultdict
-from typing import Any
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, AsyncIterator
 from uuid import uuid4
 
 from core.domain_events.domain_event import DomainEvent
@@ -29,37 +46,99 @@ from core.domain_events.event_bus import (
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class _Subscription:
+    """A registered handler and its delivery options."""
+
+    handler: EventHandler
+    is_async: bool
+    priority: int = 0
+    timeout: float | None = None
+    fire_and_forget: bool | None = None
+
+
 class InMemoryEventBus(EventBus):
     """
     In-memory implementation of the event bus.
 
     This implementation:
     - Stores subscriptions in memory (lost on restart)
-    - Delivers events synchronously
+    - Delivers events in priority order (higher priority first); by default
+      handlers are awaited one after another inside publish()
     - Is thread-safe using threading.Lock (works across event loops)
-    - Supports both sync and async handlers
+    - Supports both sync and async handlers (sync handlers run on a
+      dedicated bounded executor)
+
+    With concurrent_dispatch, handlers of the same priority are fanned out
+    together, so a slow listener only delays lower-priority tiers. With
+    fire_and_forget, publish() only records the event and enqueues it;
+    a background dispatcher on the bus's home loop delivers it, so the
+    publisher's latency no longer includes listener latency. The queue
+    is bounded (max_pending_events): when it is full, publish() waits for
+    room (backpressure) and the wait is reported in get_dispatch_stats().
+
+    The home loop is set with bind_loop() (the API lifespan loop) or,
+    failing that, is the first main-thread loop that publishes in
+    background. Events published from other loops (e.g. asyncio.run() in
+    a worker thread) are handed off to the home loop, or delivered inline
+    when there is none, so closing a short-lived loop never drops them.
     """
 
-    def __init__(self, history_size: int = 100) -> None:
+    def __init__(
+        self,
+        history_size: int = 100,
+        *,
+        concurrent_dispatch: bool = False,
+        handler_timeout: float | None = None,
+        fire_and_forget: bool = False,
+        max_pending_events: int = 1000,
+        sync_workers: int = 4,
+    ) -> None:
         """
         Initialize the in-memory event bus.
 
         Args:
             history_size: Maximum number of events to keep in history (default: 100)
+            concurrent_dispatch: Run handlers of the same priority concurrently
+            handler_timeout: Default per-handler timeout in seconds (None = no limit)
+            fire_and_forget: Default delivery mode; True delivers in background
+            max_pending_events: Bound of each background delivery queue
+            sync_workers: Threads of the executor used by sync handlers
         """
         self._subscriptions: dict[
-            type[DomainEvent], dict[str, tuple[EventHandler, bool]]
+            type[DomainEvent], dict[str, _Subscription]
         ] = defaultdict(dict)
         # threading.Lock works across different event loops (unlike asyncio.Lock)
         self._lock = threading.Lock()
         self._closed = False
-        self._history: list[dict[str, Any]] = []
+        # Ring buffer: each entry carries a monotonically increasing "sequence"
+        self._history: deque[dict[str, Any]] = deque(maxlen=history_size)
         self._history_size = history_size
+        self._sequence = 0
+        # Cursor waiters: (loop, event) woken by publish() from any thread
+        self._waiters: set[tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
+
+        self._concurrent_dispatch = concurrent_dispatch
+        self._handler_timeout = handler_timeout
+        self._fire_and_forget = fire_and_forget
+        self._max_pending_events = max_pending_events
+        self._sync_workers = sync_workers
+        self._executor: ThreadPoolExecutor | None = None
+
+        # Background delivery: bounded queue + dispatcher on the home loop
+        self._home_loop: asyncio.AbstractEventLoop | None = None
+        self._background: dict[
+            asyncio.AbstractEventLoop, tuple[asyncio.Queue, asyncio.Task]
+        ] = {}
+        self._stats: dict[str, float] = defaultdict(float)
 
     async def publish(self, event: DomainEvent) -> None:
         """
         Publish an event to all subscribed listeners.
 
+        Inline subscriptions are delivered before this method returns;
+        fire-and-forget subscriptions are enqueued for background delivery.
+
         Args:
             event: The domain event to publish
 
@@ -72,10 +151,11 @@ class InMemoryEventBus(EventBus):
         event_type = type(event)
 
         # Get handlers for this event type (with lock)
-        handlers_copy: dict[str, tuple[EventHandler, bool]] = self._get_handlers(event_type)
+        handlers_copy: dict[str, _Subscription] = self._get_handlers(event_type)
 
         # Store event in history FIRST (before checking handlers)
         self._add_to_history(event.to_dict())
+        self._stats["published"] += 1
 
         if not handlers_copy:
             logger.debug(f"No handlers subscribed for event type: {event_type.__name__} (event still recorded in history)")
@@ -86,36 +166,268 @@ class InMemoryEventBus(EventBus):
             f"Publishing {event_type.__name__} (id={event.event_id}) to {len(handlers_copy)} handler(s)"
         )
 
-        for subscription_id, (handler, is_async) in handlers_copy.items():
-            try:
-                if is_async:
-                    # Async handler
-                    result = handler(event)
-                    if asyncio.iscoroutine(result):
-                        await result
-                else:
-                    # Sync handler - run in executor to avoid blocking
-                    loop = asyncio.get_event_loop()
-                    await loop.run_in_executor(None, handler, event)
-
-            except Exception as e:
-                logger.exception(
-                    f"Handler {subscription_id} failed for event {event_type.__name__}: {e}"
+        inline: dict[str, _Subscription] = {}
+        background: dict[str, _Subscription] = {}
+        for subscription_id, subscription in handlers_copy.items():
+            fire_and_forget = (
+                self._fire_and_forget
+                if subscription.fire_and_forget is None
+                else subscription.fire_and_forget
+            )
+            (background if fire_and_forget else inline)[subscription_id] = subscription
+
+        if background:
+            await self._enqueue_background(event, background)
+        if inline:
+            await self._dispatch(event, inline)
+
+    async def _dispatch(self, event: DomainEvent, handlers: dict[str, _Subscription]) -> None:
+        """Deliver an event to handlers, tier by tier (higher priority first)."""
+        tiers: dict[int, list[tuple[str, _Subscription]]] = defaultdict(list)
+        for subscription_id, subscription in handlers.items():
+            tiers[subscription.priority].append((subscription_id, subscription))
+
+        for priority in sorted(tiers, reverse=True):
+            tier = tiers[priority]
+            if self._concurrent_dispatch and len(tier) > 1:
+                await asyncio.gather(
+                    *(self._invoke(sub_id, sub, event) for sub_id, sub in tier)
+                )
+            else:
+                for sub_id, sub in tier:
+                    await self._invoke(sub_id, sub, event)
+
+    async def _invoke(
+        self, subscription_id: str, subscription: _Subscription, event: DomainEvent
+    ) -> None:
+        """Run one handler with its timeout; failures are logged, never raised."""
+        event_name = type(event).__name__
+        timeout = (
+            subscription.timeout
+            if subscription.timeout is not None
+            else self._handler_timeout
+        )
+        started = time.perf_counter()
+
+        try:
+            if subscription.is_async:
+                # Async handler
+                result = subscription.handler(event)
+                if asyncio.iscoroutine(result):
+                    await asyncio.wait_for(result, timeout)
+            else:
+                # Sync handler - run in the bus executor to avoid blocking
+                loop = asyncio.get_running_loop()
+                await asyncio.wait_for(
+                    loop.run_in_executor(self._get_executor(), subscription.handler, event),
+                    timeout,
+                )
+
+        except asyncio.TimeoutError:
+            self._stats["handler_timeouts"] += 1
+            logger.warning(
+                f"Handler {subscription_id} timed out after {timeout}s for event {event_name}"
+            )
+        except Exception as e:
+            self._stats["handler_errors"] += 1
+            logger.exception(
+                f"Handler {subscription_id} failed for event {event_name}: {e}"
+            )
+            # Continue notifying other handlers even if one fails
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self._stats["handler_calls"] += 1
+            self._stats["handler_time_ms"] += elapsed_ms
+            self._stats["slowest_handler_ms"] = max(
+                self._stats["slowest_handler_ms"], elapsed_ms
+            )
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the bounded executor for sync handlers (created lazily)."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._sync_workers,
+                    thread_name_prefix="event-bus",
                 )
-                # Continue notifying other handlers even if one fails
+            return self._executor
+
+    def bind_loop(self, loop: asyncio.AbstractEventLoop | None = None) -> None:
+        """
+        Pin background delivery to a long-lived event loop.
+
+        Args:
+            loop: Loop that runs the dispatcher (default: the running loop)
+        """
+        loop = loop or asyncio.get_running_loop()
+        with self._lock:
+            self._home_loop = loop
+
+    def _resolve_home_loop(
+        self, current: asyncio.AbstractEventLoop
+    ) -> asyncio.AbstractEventLoop | None:
+        """Return the home loop, adopting the current one if it is the main thread's."""
+        with self._lock:
+            home = self._home_loop
+            usable = home is not None and not home.is_closed() and home.is_running()
+            if not usable and threading.current_thread() is threading.main_thread():
+                home = self._home_loop = current
+            elif not usable:
+                return None
+            return home
+
+    async def _enqueue_background(
+        self, event: DomainEvent, handlers: dict[str, _Subscription]
+    ) -> None:
+        """Enqueue an event on the home loop (or deliver it inline if there is none)."""
+        loop = asyncio.get_running_loop()
+        home = self._resolve_home_loop(loop)
+
+        if home is loop:
+            await self._enqueue_local(event, handlers)
+        elif home is not None:
+            # This loop may be short-lived (asyncio.run in a thread): hand off
+            self._stats["handed_off"] += 1
+            future = asyncio.run_coroutine_threadsafe(
+                self._enqueue_local(event, handlers), home
+            )
+            await asyncio.wrap_future(future)
+        else:
+            # No long-lived loop to deliver later: deliver now, never drop
+            self._stats["delivered_inline"] += 1
+            await self._dispatch(event, handlers)
+
+    async def _enqueue_local(
+        self, event: DomainEvent, handlers: dict[str, _Subscription]
+    ) -> None:
+        """Enqueue on the running (home) loop's queue, waiting if it is full."""
+        queue = self._get_background_queue()
+
+        if queue.full():
+            # Backpressure: the publisher waits for the dispatcher to catch up
+            self._stats["publish_blocked"] += 1
+            started = time.perf_counter()
+            await queue.put((event, handlers))
+            self._stats["publish_blocked_ms"] += (time.perf_counter() - started) * 1000
+        else:
+            queue.put_nowait((event, handlers))
+
+        self._stats["max_pending"] = max(self._stats["max_pending"], queue.qsize())
+
+    def _get_background_queue(self) -> asyncio.Queue:
+        """Return the delivery queue of the running loop, starting its dispatcher."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            # Drop state of loops that were closed (e.g. a previous home loop)
+            for stale in [known for known in self._background if known.is_closed()]:
+                del self._background[stale]
+
+            state = self._background.get(loop)
+            if state is None:
+                queue: asyncio.Queue = asyncio.Queue(maxsize=self._max_pending_events)
+                task = loop.create_task(self._background_dispatcher(queue))
+                state = (queue, task)
+                self._background[loop] = state
+            return state[0]
+
+    async def _background_dispatcher(self, queue: asyncio.Queue) -> None:
+        """Deliver queued events one at a time (preserves publish order)."""
+        while True:
+            event, handlers = await queue.get()
+            try:
+                await self._dispatch(event, handlers)
+                self._stats["background_delivered"] += 1
+            finally:
+                queue.task_done()
+
+    async def drain(self, timeout: float | None = None) -> bool:
+        """
+        Wait until pending background deliveries finish.
+
+        May be called from any event loop (e.g. before a short-lived loop
+        closes); the home loop's queue is awaited.
+
+        Args:
+            timeout: Maximum time to wait in seconds (None = no limit)
+
+        Returns:
+            True if the queue was drained, False on timeout
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            home = self._home_loop
+            state = self._background.get(home) if home is not None else None
+        if state is None:
+            return True
+
+        queue = state[0]
+        if home is loop:
+            joined = queue.join()
+        elif home.is_running():
+            joined = asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(queue.join(), home)
+            )
+        else:
+            # Home loop stopped: nothing can deliver the remaining events
+            return queue.empty()
+
+        try:
+            await asyncio.wait_for(joined, timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def get_dispatch_stats(self) -> dict[str, float]:
+        """
+        Get dispatch and backpressure metrics.
 
-    def _get_handlers(self, event_type: type[DomainEvent]) -> dict[str, tuple[EventHandler, bool]]:
+        Returns:
+            Dictionary with published events, handler calls/errors/timeouts,
+            handler latency, pending background events, publish waits and
+            events handed off / delivered inline from non-home loops
+        """
+        with self._lock:
+            pending = sum(queue.qsize() for queue, _ in self._background.values())
+
+        stats = dict(self._stats)
+        calls = stats.get("handler_calls", 0)
+        return {
+            "published": stats.get("published", 0),
+            "handler_calls": calls,
+            "handler_errors": stats.get("handler_errors", 0),
+            "handler_timeouts": stats.get("handler_timeouts", 0),
+            "handler_avg_ms": stats.get("handler_time_ms", 0) / calls if calls else 0.0,
+            "slowest_handler_ms": stats.get("slowest_handler_ms", 0),
+            "pending": pending,
+            "max_pending": stats.get("max_pending", 0),
+            "max_pending_events": self._max_pending_events,
+            "background_delivered": stats.get("background_delivered", 0),
+            "handed_off": stats.get("handed_off", 0),
+            "delivered_inline": stats.get("delivered_inline", 0),
+            "publish_blocked": stats.get("publish_blocked", 0),
+            "publish_blocked_ms": stats.get("publish_blocked_ms", 0),
+        }
+
+    def _get_handlers(self, event_type: type[DomainEvent]) -> dict[str, _Subscription]:
         """Get handlers for an event type (thread-safe)."""
         with self._lock:
             return self._subscriptions.get(event_type, {}).copy()
 
     def _add_to_history(self, event_dict: dict[str, Any]) -> None:
-        """Add event to history (thread-safe)."""
+        """Add event to history with the next sequence number (thread-safe)."""
         with self._lock:
-            self._history.append(event_dict)
-            # Keep only the most recent events
-            if len(self._history) > self._history_size:
-                self._history = self._history[-self._history_size:]
+            self._sequence += 1
+            # deque(maxlen) keeps only the most recent events
+            self._history.append({**event_dict, "sequence": self._sequence})
+            waiters = list(self._waiters)
+
+        # Wake cursor consumers (possibly on other event loops)
+        for loop, wakeup in waiters:
+            try:
+                loop.call_soon_threadsafe(wakeup.set)
+            except RuntimeError:
+                # Loop already closed; its waiter is discarded on exit
+                pass
 
     async def publish_batch(self, events: list[DomainEvent]) -> None:
         """
@@ -134,6 +446,10 @@ class InMemoryEventBus(EventBus):
         self,
         event_type: type[DomainEvent],
         handler: EventHandler,
+        *,
+        priority: int = 0,
+        timeout: float | None = None,
+        fire_and_forget: bool | None = None,
     ) -> str:
         """
         Subscribe to events of a specific type.
@@ -141,6 +457,9 @@ class InMemoryEventBus(EventBus):
         Args:
             event_type: The DomainEvent subclass to listen for
             handler: Callable that will be invoked when events occur
+            priority: Higher priorities are delivered first (default: 0)
+            timeout: Per-handler timeout in seconds (None = bus default)
+            fire_and_forget: Delivery mode for this handler (None = bus default)
 
         Returns:
             subscription_id: Unique ID for this subscription
@@ -157,7 +476,13 @@ class InMemoryEventBus(EventBus):
         is_async = asyncio.iscoroutinefunction(handler)
 
         with self._lock:
-            self._subscriptions[event_type][subscription_id] = (handler, is_async)
+            self._subscriptions[event_type][subscription_id] = _Subscription(
+                handler=handler,
+                is_async=is_async,
+                priority=priority,
+                timeout=timeout,
+                fire_and_forget=fire_and_forget,
+            )
 
         logger.info(
             f"Subscribed {subscription_id} to {event_type.__name__} "
@@ -201,7 +526,9 @@ class InMemoryEventBus(EventBus):
         with self._lock:
             for event_type, handlers in self._subscriptions.items():
                 to_remove = [
-                    sub_id for sub_id, (h, _) in handlers.items() if h == handler
+                    sub_id
+                    for sub_id, subscription in handlers.items()
+                    if subscription.handler == handler
                 ]
 
                 for sub_id in to_remove:
@@ -218,10 +545,30 @@ class InMemoryEventBus(EventBus):
         Close the event bus and clear all subscriptions.
 
         After closing, no new subscriptions or publications are allowed.
+        Pending background deliveries of the current event loop are given
+        a short grace period before their dispatchers are cancelled.
         """
+        await self.drain(timeout=5.0)
+
         with self._lock:
             self._subscriptions.clear()
             self._closed = True
+            background = list(self._background.items())
+            self._background.clear()
+            self._home_loop = None
+            executor, self._executor = self._executor, None
+            waiters = list(self._waiters)
+
+        # Wake cursor consumers so subscribe_events() iterators finish
+        for loop, wakeup in waiters:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(wakeup.set)
+
+        for loop, (_queue, task) in background:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(task.cancel)
+        if executor is not None:
+            executor.shutdown(wait=False)
 
         logger.info("InMemoryEventBus closed")
 
@@ -260,8 +607,116 @@ class InMemoryEventBus(EventBus):
         """
         with self._lock:
             if limit:
-                return self._history[-limit:][::-1]
-            return self._history[::-1]
+                return list(islice(reversed(self._history), limit))
+            return list(reversed(self._history))
+
+    @property
+    def last_sequence(self) -> int:
+        """Sequence number of the most recently published event (0 if none)."""
+        return self._sequence
+
+    def can_resume(self, after_sequence: int) -> bool:
+        """
+        Check whether a consumer can resume from a cursor without gaps.
+
+        False when the cursor is ahead of the log (e.g. an id from a previous
+        server run) or when later events already left the ring buffer: the
+        consumer must resync from a fresh snapshot.
+
+        Args:
+            after_sequence: Last sequence number already seen by the consumer
+
+        Returns:
+            True if every event after the cursor is still retained
+        """
+        with self._lock:
+            if after_sequence > self._sequence:
+                return False
+            if after_sequence == self._sequence:
+                return True
+            oldest = self._history[0]["sequence"] if self._history else self._sequence + 1
+            return after_sequence >= oldest - 1
+
+    def get_events_after(self, after_sequence: int) -> list[dict[str, Any]]:
+        """
+        Get retained events published after a cursor.
+
+        Cost is proportional to the number of new events, not to the size
+        of the history.
+
+        Args:
+            after_sequence: Last sequence number already seen by the consumer
+
+        Returns:
+            Events with sequence > after_sequence, in chronological order.
+            If the consumer fell behind the ring buffer, the oldest events
+            are missing (compare the first sequence with after_sequence + 1).
+        """
+        with self._lock:
+            new_count = self._sequence - after_sequence
+            if new_count <= 0:
+                return []
+            if new_count >= len(self._history):
+                return list(self._history)
+            return list(islice(self._history, len(self._history) - new_count, None))
+
+    async def wait_for_events(
+        self, after_sequence: int, timeout: float | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Wait until events newer than a cursor are published.
+
+        An idle consumer costs nothing: it sleeps until publish() wakes it.
+
+        Args:
+            after_sequence: Last sequence number already seen by the consumer
+            timeout: Maximum time to wait in seconds (None = no limit)
+
+        Returns:
+            New events in chronological order (empty list on timeout)
+        """
+        events = self.get_events_after(after_sequence)
+        if events:
+            return events
+
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self._lock:
+            self._waiters.add(waiter)
+        try:
+            # Re-check after registering: a publish in between would be lost
+            events = self.get_events_after(after_sequence)
+            if events:
+                return events
+            try:
+                await asyncio.wait_for(waiter[1].wait(), timeout)
+            except asyncio.TimeoutError:
+                return []
+            return self.get_events_after(after_sequence)
+        finally:
+            with self._lock:
+                self._waiters.discard(waiter)
+
+    async def subscribe_events(
+        self, from_sequence: int | None = None
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Iterate over published events, starting after a cursor.
+
+        Unlike subscribe(), this reads the event log: a consumer can resume
+        from the last sequence it saw (e.g. SSE Last-Event-ID) and bursts are
+        not lost as long as they fit in the ring buffer.
+
+        Args:
+            from_sequence: Last sequence already seen (None = only new events)
+
+        Yields:
+            Event dictionaries (with "sequence") in chronological order
+        """
+        cursor = self._sequence if from_sequence is None else from_sequence
+        while not self._closed:
+            for event_dict in await self.wait_for_events(cursor):
+                cursor = event_dict["sequence"]
+                yield event_dict
 
     def clear_history(self) -> None:
         """
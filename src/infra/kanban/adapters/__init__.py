@@ -8,9 +8,23 @@ from infra.kanban.adapters.trello_adapter import (
     TrelloConfigError,
     create_trello_adapter,
 )
+from infra.kanban.adapters.trello_metadata_cache import (
+    TrelloMetadataCache,
+    board_metadata_cache,
+    invalidate_board_metadata,
+)
+from infra.kanban.adapters.trello_rate_limiter import (
+    TrelloRateLimiter,
+    get_rate_limiter,
+)
 
 __all__ = [
     "TrelloAdapter",
     "TrelloConfigError",
     "create_trello_adapter",
+    "TrelloMetadataCache",
+    "board_metadata_cache",
+    "invalidate_board_metadata",
+    "TrelloRateLimiter",
+    "get_rate_limiter",
 ]
@@ -9,8 +9,12 @@ DOC: ADR024 - kanban.db em workspace/skybridge/
 DOC: core/kanban/domain/schema.sql - Estrutura do banco
 """
 
+import functools
 import json
 import sqlite3
+import threading
+import zlib
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -19,18 +23,73 @@ from core.kanban.domain.database import KanbanBoard, KanbanCard, KanbanList, Car
 from core.kanban.domain.card import CardStatus
 from kernel import Result
 
+# Caminho: src/infra/kanban/adapters/ → src/core/kanban/domain/schema.sql
+# src/infra/kanban/adapters → src/ (4 níveis acima)
+SCHEMA_PATH = Path(__file__).resolve().parent.parent.parent.parent / "core" / "kanban" / "domain" / "schema.sql"
+
+_schema_cache: Optional[tuple[str, int]] = None
+
+
+def _load_schema() -> Optional[tuple[str, int]]:
+    """
+    Lê schema.sql uma vez por processo.
+
+    Returns:
+        (sql, versão) onde a versão é derivada do conteúdo (gravada em
+        PRAGMA user_version), ou None se o arquivo não existe
+    """
+    global _schema_cache
+    if _schema_cache is None and SCHEMA_PATH.exists():
+        schema_sql = SCHEMA_PATH.read_text(encoding="utf-8")
+        # user_version é inteiro 32 bits com sinal; 0 = schema nunca aplicado
+        version = (zlib.crc32(schema_sql.encode("utf-8")) & 0x7FFFFFFF) or 1
+        _schema_cache = (schema_sql, version)
+    return _schema_cache
+
+
+def _serialized(method):
+    """
+    Executa o método com acesso exclusivo à conexão do adapter.
+
+    A conexão é compartilhada entre threads (check_same_thread=False);
+    sqlite3.Connection não suporta uso concorrente. Instâncias aposentadas
+    por shared() reabrem a conexão para a chamada e a fecham em seguida.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            if self._conn is None and self._retired:
+                connected = self.connect()
+                if connected.is_err:
+                    return connected
+            self._in_use += 1
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                self._in_use -= 1
+                self._close_if_retired()
+    return wrapper
+
 
 class SQLiteKanbanAdapter:
     """
     Adapter SQLite para Kanban Database.
 
     Responsável por todas as operações de CRUD no kanban.db.
-    Implementa acesso thread-safe via connection pooling.
+    Uma conexão por instância, usada por uma thread de cada vez (_lock).
+
+    Handlers HTTP devem usar shared(db_path): uma instância conectada por
+    kanban.db, reaproveitada entre requisições, em vez de abrir conexão e
+    reaplicar o schema a cada chamada.
 
     Attributes:
         db_path: Caminho para o arquivo SQLite
     """
 
+    # Registro de adapters compartilhados por caminho do kanban.db
+    _shared: dict[str, "SQLiteKanbanAdapter"] = {}
+    _shared_lock = threading.Lock()
+
     def __init__(self, db_path: str | Path):
         """
         Inicializa o adapter.
@@ -40,6 +99,80 @@ class SQLiteKanbanAdapter:
         """
         self.db_path = Path(db_path)
         self._conn: Optional[sqlite3.Connection] = None
+        self._inode: Optional[int] = None
+        # Serializa o uso da conexão (RLock: métodos chamam uns aos outros e
+        # transaction() o mantém até o commit, isolando a transação)
+        self._lock = threading.RLock()
+        self._in_use = 0
+        self._retired = False
+        self._tx_depth = 0
+
+    @classmethod
+    def shared(cls, db_path: str | Path) -> "SQLiteKanbanAdapter":
+        """
+        Retorna adapter conectado compartilhado para o kanban.db.
+
+        A conexão é aberta na primeira chamada e reaproveitada pelas
+        seguintes (o polling de /kanban/cards não paga conexão nem DDL).
+        Se o arquivo foi removido ou recriado, a instância antiga é
+        aposentada (fecha a conexão assim que ficar ociosa; quem ainda a
+        referencia continua funcionando) e uma nova é registrada.
+
+        Não chame disconnect() na instância compartilhada; use
+        close_shared() no shutdown.
+
+        Args:
+            db_path: Caminho para o arquivo kanban.db
+
+        Returns:
+            Adapter conectado (ou desconectado se a conexão falhou; os
+            métodos então retornam Result.err)
+        """
+        key = str(Path(db_path).resolve())
+        with cls._shared_lock:
+            adapter = cls._shared.get(key)
+            if adapter is not None and adapter._is_current():
+                return adapter
+
+            if adapter is not None:
+                adapter._retire()
+                del cls._shared[key]
+
+            adapter = cls(db_path)
+            if adapter.connect().is_ok:
+                cls._shared[key] = adapter
+            return adapter
+
+    @classmethod
+    def close_shared(cls) -> None:
+        """Fecha todas as conexões compartilhadas (as em uso, ao terminar)."""
+        with cls._shared_lock:
+            for adapter in cls._shared.values():
+                adapter._retire()
+            cls._shared.clear()
+
+    def _retire(self) -> None:
+        """Tira a instância do registro sem fechar a conexão em uso."""
+        self._retired = True
+        if self._lock.acquire(blocking=False):
+            try:
+                self._close_if_retired()
+            finally:
+                self._lock.release()
+
+    def _close_if_retired(self) -> None:
+        """Fecha a conexão de uma instância aposentada que ficou ociosa."""
+        if self._retired and self._in_use == 0 and self._tx_depth == 0:
+            self.disconnect()
+
+    def _is_current(self) -> bool:
+        """Conexão aberta e ainda apontando para o arquivo atual do banco."""
+        if self._conn is None:
+            return False
+        try:
+            return self.db_path.stat().st_ino == self._inode
+        except OSError:
+            return False
 
     def connect(self) -> Result[None, str]:
         """
@@ -60,26 +193,34 @@ class SQLiteKanbanAdapter:
                 isolation_level=None,  # Autocommit mode
             )
             self._conn.row_factory = sqlite3.Row  # Retorna dict-like rows
+            self._inode = self.db_path.stat().st_ino
 
-            # Inicializa schema
-            # Caminho: src/infra/kanban/adapters/ → src/core/kanban/domain/schema.sql
-            # Resolve path baseado no local do módulo
-            # src/infra/kanban/adapters → src/ (4 níveis acima)
-            module_path = Path(__file__).resolve()
-            src_path = module_path.parent.parent.parent.parent  # Vai para src/
-            schema_path = src_path / "core" / "kanban" / "domain" / "schema.sql"
-
-            # Debug: print do schema path
-
-            if schema_path.exists():
-                schema_sql = schema_path.read_text(encoding="utf-8")
-                self._conn.executescript(schema_sql)
+            self._ensure_schema()
 
             return Result.ok(None)
 
         except Exception as e:
             return Result.err(f"Erro ao conectar ao kanban.db: {str(e)}")
 
+    def _ensure_schema(self) -> None:
+        """
+        Aplica schema.sql apenas se o banco está em outra versão.
+
+        A versão aplicada fica em PRAGMA user_version; bancos já no schema
+        atual custam uma leitura de PRAGMA em vez do executescript completo.
+        """
+        schema = _load_schema()
+        if schema is None:
+            return
+
+        schema_sql, version = schema
+        current = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if current == version:
+            return
+
+        self._conn.executescript(schema_sql)
+        self._conn.execute(f"PRAGMA user_version = {version}")
+
     def disconnect(self) -> Result[None, str]:
         """
         Desconecta do banco.
@@ -89,17 +230,62 @@ class SQLiteKanbanAdapter:
             Result.err(str) com mensagem de erro se falhar
         """
         try:
-            if self._conn:
-                self._conn.close()
-                self._conn = None
+            with self._lock:
+                if self._conn:
+                    self._conn.close()
+                    self._conn = None
             return Result.ok(None)
         except Exception as e:
             return Result.err(f"Erro ao desconectar: {str(e)}")
 
+    @contextmanager
+    def transaction(self):
+        """
+        Agrupa várias escritas em uma única transação SQLite.
+
+        Dentro do bloco os commits dos métodos de CRUD são adiados para o
+        final (um único fsync); exceção no bloco faz rollback de tudo.
+        Blocos aninhados participam da transação externa. O lock da
+        conexão fica com a thread dona da transação até o commit/rollback:
+        escritas de outras threads esperam em vez de entrar nela.
+
+        Example:
+            with adapter.transaction():
+                adapter.create_card(card_a)
+                adapter.update_card(card_b.id, list_id="list-2")
+        """
+        with self._lock:
+            if self._conn is None and self._retired:
+                connected = self.connect()
+                if connected.is_err:
+                    raise sqlite3.OperationalError(connected.error)
+            if self._tx_depth == 0:
+                self._conn.execute("BEGIN")
+            self._tx_depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._tx_depth -= 1
+                if self._tx_depth == 0:
+                    self._conn.rollback()
+                raise
+            else:
+                self._tx_depth -= 1
+                if self._tx_depth == 0:
+                    self._conn.commit()
+            finally:
+                self._close_if_retired()
+
+    def _commit(self) -> None:
+        """Commit imediato, exceto dentro de transaction() (commit no final)."""
+        if self._tx_depth == 0:
+            self._conn.commit()
+
     # ==========================================================================
     # BOARDS
     # ==========================================================================
 
+    @_serialized
     def create_board(self, board: KanbanBoard) -> Result[KanbanBoard, str]:
         """
         Cria um novo board.
@@ -120,13 +306,14 @@ class SQLiteKanbanAdapter:
                 """,
                 (board.id, board.name, board.trello_board_id, board.trello_sync_enabled),
             )
-            self._conn.commit()
+            self._commit()
 
             return Result.ok(board)
 
         except Exception as e:
             return Result.err(f"Erro ao criar board: {str(e)}")
 
+    @_serialized
     def get_board(self, board_id: str) -> Result[KanbanBoard, str]:
         """
         Busca um board por ID.
@@ -160,6 +347,7 @@ class SQLiteKanbanAdapter:
         except Exception as e:
             return Result.err(f"Erro ao buscar board: {str(e)}")
 
+    @_serialized
     def list_boards(self) -> Result[list[KanbanBoard], str]:
         """
         Lista todos os boards.
@@ -194,6 +382,7 @@ class SQLiteKanbanAdapter:
     # LISTS
     # ==========================================================================
 
+    @_serialized
     def create_list(self, list_obj: KanbanList) -> Result[KanbanList, str]:
         """Cria uma nova lista."""
         try:
@@ -205,13 +394,14 @@ class SQLiteKanbanAdapter:
                 """,
                 (list_obj.id, list_obj.board_id, list_obj.name, list_obj.position, list_obj.trello_list_id),
             )
-            self._conn.commit()
+            self._commit()
 
             return Result.ok(list_obj)
 
         except Exception as e:
             return Result.err(f"Erro ao criar lista: {str(e)}")
 
+    @_serialized
     def get_list(self, list_id: str) -> Result[KanbanList, str]:
         """Busca uma lista por ID."""
         try:
@@ -235,6 +425,7 @@ class SQLiteKanbanAdapter:
         except Exception as e:
             return Result.err(f"Erro ao buscar lista: {str(e)}")
 
+    @_serialized
     def list_lists(self, board_id: str) -> Result[list[KanbanList], str]:
         """Lista todas as listas de um board."""
         try:
@@ -265,6 +456,7 @@ class SQLiteKanbanAdapter:
     # CARDS (com suporte para Cards Vivos)
     # ==========================================================================
 
+    @_serialized
     def create_card(self, card: KanbanCard) -> Result[KanbanCard, str]:
         """
         Cria um novo card.
@@ -310,7 +502,7 @@ class SQLiteKanbanAdapter:
                     card.updated_at.isoformat() if card.updated_at else None,
                 ),
             )
-            self._conn.commit()
+            self._commit()
 
             # Adiciona entrada no histórico
             self.add_card_history(
@@ -325,6 +517,7 @@ class SQLiteKanbanAdapter:
         except Exception as e:
             return Result.err(f"Erro ao criar card: {str(e)}")
 
+    @_serialized
     def get_card(self, card_id: str) -> Result[KanbanCard, str]:
         """Busca um card por ID."""
         try:
@@ -342,6 +535,7 @@ class SQLiteKanbanAdapter:
         except Exception as e:
             return Result.err(f"Erro ao buscar card: {str(e)}")
 
+    @_serialized
     def update_card(self, card_id: str, **updates) -> Result[KanbanCard, str]:
         """
         Atualiza campos específicos de um card.
@@ -409,7 +603,7 @@ class SQLiteKanbanAdapter:
 
                 cursor = self._conn.cursor()
                 cursor.execute(sql, values)
-                self._conn.commit()
+                self._commit()
 
             # Adiciona histórico para movimentos entre listas
             if to_list_id is not None and to_list_id != from_list_id:
@@ -458,6 +652,7 @@ class SQLiteKanbanAdapter:
         except Exception as e:
             return Result.err(f"Erro ao atualizar card: {str(e)}")
 
+    @_serialized
     def update_card_status(self, card_id: str, new_status: CardStatus) -> Result[KanbanCard, str]:
         """
         Move card para uma nova lista (status).
@@ -484,6 +679,7 @@ class SQLiteKanbanAdapter:
         except Exception as e:
             return Result.err(f"Erro ao atualizar status: {str(e)}")
 
+    @_serialized
     def list_cards(
         self,
         list_id: Optional[str] = None,
@@ -527,6 +723,43 @@ class SQLiteKanbanAdapter:
         except Exception as e:
             return Result.err(f"Erro ao listar cards: {str(e)}")
 
+    @_serialized
+    def list_cards_by_trello_ids(self, trello_card_ids: list[str]) -> Result[dict[str, KanbanCard], str]:
+        """
+        Busca cards locais pelos IDs do Trello.
+
+        Usado pelo sync incremental, que só precisa dos cards que mudaram
+        no Trello em vez de carregar o board inteiro.
+
+        Args:
+            trello_card_ids: IDs dos cards no Trello
+
+        Returns:
+            Result.ok(dict) mapeando trello_card_id → card
+            Result.err(str) com mensagem de erro se falhar
+        """
+        try:
+            cursor = self._conn.cursor()
+            cards: dict[str, KanbanCard] = {}
+            ids = list(dict.fromkeys(trello_card_ids))
+
+            # Limite de parâmetros do SQLite (999 em builds antigos)
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                placeholders = ", ".join("?" * len(chunk))
+                cursor.execute(
+                    f"SELECT * FROM cards WHERE trello_card_id IN ({placeholders})",
+                    chunk,
+                )
+                for row in cursor.fetchall():
+                    cards[row["trello_card_id"]] = self._row_to_card(row)
+
+            return Result.ok(cards)
+
+        except Exception as e:
+            return Result.err(f"Erro ao buscar cards por trello_card_id: {str(e)}")
+
+    @_serialized
     def delete_card(self, card_id: str) -> Result[None, str]:
         """
         Deleta um card.
@@ -539,7 +772,7 @@ class SQLiteKanbanAdapter:
 
             cursor = self._conn.cursor()
             cursor.execute("DELETE FROM cards WHERE id = ?", (card_id,))
-            self._conn.commit()
+            self._commit()
 
             # Adiciona entrada no histórico
             if card_result.is_ok:
@@ -562,6 +795,7 @@ class SQLiteKanbanAdapter:
     # CARD HISTORY
     # ==========================================================================
 
+    @_serialized
     def add_card_history(
         self,
         card_id: str,
@@ -586,7 +820,7 @@ class SQLiteKanbanAdapter:
                     json.dumps(metadata) if metadata else None,
                 ),
             )
-            self._conn.commit()
+            self._commit()
 
             history = CardHistory(
                 id=cursor.lastrowid,
@@ -602,6 +836,7 @@ class SQLiteKanbanAdapter:
         except Exception as e:
             return Result.err(f"Erro ao adicionar histórico: {str(e)}")
 
+    @_serialized
     def get_card_history(self, card_id: str) -> Result[list[CardHistory], str]:
         """
         Busca histórico de mudanças de um card.
@@ -643,6 +878,158 @@ class SQLiteKanbanAdapter:
         except Exception as e:
             return Result.err(f"Erro ao buscar histórico: {str(e)}")
 
+    # ==========================================================================
+    # SYNC STATE
+    # ==========================================================================
+
+    @_serialized
+    def get_sync_watermark(self, source: str) -> Result[Optional[datetime], str]:
+        """
+        Busca a marca d'água do último sync de uma origem.
+
+        Args:
+            source: Chave da origem (ex: "trello:<board_id>")
+
+        Returns:
+            Result.ok(datetime) do último sync, ou Result.ok(None) se nunca sincronizou
+            Result.err(str) com mensagem de erro se falhar
+        """
+        try:
+            cursor = self._conn.cursor()
+            cursor.execute("SELECT watermark FROM sync_state WHERE source = ?", (source,))
+            row = cursor.fetchone()
+
+            if not row or not row["watermark"]:
+                return Result.ok(None)
+
+            return Result.ok(datetime.fromisoformat(row["watermark"]))
+
+        except Exception as e:
+            return Result.err(f"Erro ao buscar watermark: {str(e)}")
+
+    @_serialized
+    def set_sync_watermark(self, source: str, watermark: datetime) -> Result[None, str]:
+        """
+        Grava a marca d'água do último sync de uma origem.
+
+        Args:
+            source: Chave da origem (ex: "trello:<board_id>")
+            watermark: Instante (UTC) até onde as mudanças já foram aplicadas
+
+        Returns:
+            Result.ok(None) se sucesso
+            Result.err(str) com mensagem de erro se falhar
+        """
+        try:
+            cursor = self._conn.cursor()
+            cursor.execute(
+                """
+                INSERT INTO sync_state (source, watermark, updated_at)
+                VALUES (?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(source) DO UPDATE SET
+                    watermark = excluded.watermark,
+                    updated_at = CURRENT_TIMESTAMP
+                """,
+                (source, watermark.isoformat()),
+            )
+            self._commit()
+
+            return Result.ok(None)
+
+        except Exception as e:
+            return Result.err(f"Erro ao gravar watermark: {str(e)}")
+
+    @_serialized
+    def add_sync_dead_letter(
+        self,
+        operation: str,
+        card_id: str,
+        kwargs: Optional[dict] = None,
+        retry_count: int = 0,
+        error: Optional[str] = None,
+    ) -> Result[int, str]:
+        """
+        Persiste operação de sync que esgotou as tentativas (DLQ).
+
+        Args:
+            operation: Tipo de operação ('create', 'update', 'move')
+            card_id: ID do card no kanban.db
+            kwargs: Parâmetros adicionais da operação
+            retry_count: Tentativas realizadas
+            error: Último erro retornado
+
+        Returns:
+            Result.ok(int) com ID da entrada
+            Result.err(str) com mensagem de erro se falhar
+        """
+        try:
+            cursor = self._conn.cursor()
+            cursor.execute(
+                """
+                INSERT INTO sync_dead_letters (operation, card_id, kwargs, retry_count, error)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (operation, card_id, json.dumps(kwargs) if kwargs else None, retry_count, error),
+            )
+            self._commit()
+
+            return Result.ok(cursor.lastrowid)
+
+        except Exception as e:
+            return Result.err(f"Erro ao gravar dead letter: {str(e)}")
+
+    @_serialized
+    def list_sync_dead_letters(self) -> Result[list[dict], str]:
+        """
+        Lista operações na DLQ, mais antigas primeiro.
+
+        Returns:
+            Result.ok(list[dict]) com id, operation, card_id, kwargs, retry_count, error, created_at
+            Result.err(str) com mensagem de erro se falhar
+        """
+        try:
+            cursor = self._conn.cursor()
+            cursor.execute("SELECT * FROM sync_dead_letters ORDER BY id ASC")
+
+            return Result.ok([
+                {
+                    "id": row["id"],
+                    "operation": row["operation"],
+                    "card_id": row["card_id"],
+                    "kwargs": json.loads(row["kwargs"]) if row["kwargs"] else {},
+                    "retry_count": row["retry_count"],
+                    "error": row["error"],
+                    "created_at": row["created_at"],
+                }
+                for row in cursor.fetchall()
+            ])
+
+        except Exception as e:
+            return Result.err(f"Erro ao listar dead letters: {str(e)}")
+
+    @_serialized
+    def count_sync_dead_letters(self) -> Result[int, str]:
+        """Conta operações na DLQ."""
+        try:
+            cursor = self._conn.cursor()
+            cursor.execute("SELECT COUNT(*) FROM sync_dead_letters")
+            return Result.ok(cursor.fetchone()[0])
+
+        except Exception as e:
+            return Result.err(f"Erro ao contar dead letters: {str(e)}")
+
+    @_serialized
+    def delete_sync_dead_letter(self, entry_id: int) -> Result[None, str]:
+        """Remove entrada da DLQ (ex: após reprocessar)."""
+        try:
+            cursor = self._conn.cursor()
+            cursor.execute("DELETE FROM sync_dead_letters WHERE id = ?", (entry_id,))
+            self._commit()
+            return Result.ok(None)
+
+        except Exception as e:
+            return Result.err(f"Erro ao remover dead letter: {str(e)}")
+
     # ==========================================================================
     # HELPER METHODS
     # ==========================================================================
@@ -13,6 +13,8 @@ import httpx
 
 from core.kanban.domain import Board, Card, CardStatus, CardPriority, KanbanList
 from core.kanban.ports import KanbanPort
+from infra.kanban.adapters.trello_metadata_cache import board_metadata_cache
+from infra.kanban.adapters.trello_rate_limiter import get_rate_limiter
 from kernel import Result
 
 
@@ -22,6 +24,13 @@ logger = logging.getLogger(__name__)
 # Trello API base URL
 TRELLO_API_BASE = "https://api.trello.com/1"
 
+# Sync incremental (list_cards_since)
+# Tipos de action que criam, editam ou movem um card no board
+CARD_ACTION_TYPES = "createCard,updateCard,copyCard,moveCardToBoard,convertToCardFromCheckItem,emailCard"
+ACTIONS_PAGE_LIMIT = 1000   # Máximo de actions por request da API
+BATCH_URL_LIMIT = 10        # Máximo de URLs por GET /batch
+INCREMENTAL_MAX_CARDS = 100  # Acima disso, um único GET /boards/{id}/cards sai mais barato
+
 
 class TrelloConfigError(Exception):
     """Erro de configuração do Trello (credenciais ausentes)."""
@@ -53,6 +62,8 @@ class TrelloAdapter(KanbanPort):
         self.api_key = api_key
         self.api_token = api_token
         self.board_id = board_id
+        # Rate limit do Trello é por token: limiter compartilhado entre adapters
+        self._rate_limiter = get_rate_limiter(api_token)
         self._client = httpx.AsyncClient(
             base_url=TRELLO_API_BASE,
             params={
@@ -60,17 +71,51 @@ class TrelloAdapter(KanbanPort):
                 "token": api_token,
             },
             timeout=30.0,
+            event_hooks={
+                "request": [self._rate_limiter.acquire],
+                "response": [self._rate_limiter.observe],
+            },
         )
 
     async def _close(self):
         """Fecha o cliente HTTP."""
         await self._client.aclose()
 
+    async def _get_board_lists(self, board_id: str) -> list[dict]:
+        """
+        Listas do board (GET /1/boards/{id}/lists), via cache de metadados.
+
+        Raises:
+            httpx.HTTPStatusError: Se a API retornar erro
+        """
+        async def fetch() -> list[dict]:
+            response = await self._client.get(f"/boards/{board_id}/lists")
+            response.raise_for_status()
+            return response.json()
+
+        return await board_metadata_cache.get(board_id, "lists", fetch)
+
+    async def _get_board_labels(self, board_id: str) -> list[dict]:
+        """
+        Labels do board (GET /1/boards/{id}/labels), via cache de metadados.
+
+        Raises:
+            httpx.HTTPStatusError: Se a API retornar erro
+        """
+        async def fetch() -> list[dict]:
+            response = await self._client.get(f"/boards/{board_id}/labels")
+            response.raise_for_status()
+            return response.json()
+
+        return await board_metadata_cache.get(board_id, "labels", fetch)
+
     async def _get_list_id(self, list_name: str, board_id: str | None = None) -> Result[str, str]:
         """
         Busca o ID de uma lista pelo nome no board.
 
-        NOTA: Cache removido por não ser necessário - volume de operações não justifica otimização.
+        NOTA: Listas vêm do cache de metadados (TTL + invalidação por
+        escrita/webhook); uma lista recém-criada fora do Skybridge pode
+        levar até o TTL para aparecer se o webhook não chegar.
 
         Args:
             list_name: Nome da lista (ex: "To Do", "In Progress", "Done")
@@ -88,9 +133,7 @@ class TrelloAdapter(KanbanPort):
 
         try:
             # Busca listas do board
-            response = await self._client.get(f"/boards/{target_board}/lists")
-            response.raise_for_status()
-            lists_data = response.json()
+            lists_data = await self._get_board_lists(target_board)
 
             # Procura lista pelo nome
             for lst in lists_data:
@@ -270,13 +313,27 @@ class TrelloAdapter(KanbanPort):
                 json={"idList": list_id}
             )
             response.raise_for_status()
+            data = response.json()
 
             success_msg = f"Card {card_id} movido para lista {list_id} (status={status.value})"
             logger.info(success_msg)
             print(f"[TRELLO_ADAPTER] ✅ {success_msg}")  # Print explícito
 
-            # Buscar card atualizado
-            return await self.get_card(card_id)
+            # O PUT já retorna o card atualizado; nome da lista vem do cache
+            # de metadados (evita um GET /cards/{id} extra por movimento)
+            target_board = data.get("idBoard") or self.board_id
+            if target_board:
+                try:
+                    list_names = {
+                        lst["id"]: lst.get("name", "")
+                        for lst in await self._get_board_lists(target_board)
+                    }
+                    data["list"] = {"name": list_names.get(data.get("idList", ""), "")}
+                except httpx.HTTPError as e:
+                    # Card já foi movido; só o status derivado da lista fica UNKNOWN
+                    logger.warning(f"Não foi possível resolver nome da lista {data.get('idList')}: {e}")
+
+            return Result.ok(self._parse_card(data))
 
         except httpx.HTTPStatusError as e:
             error_msg = f"Erro HTTP {e.response.status_code} ao mover card {card_id}: {e.response.text[:200]}"
@@ -368,9 +425,7 @@ class TrelloAdapter(KanbanPort):
                 cards_data = response.json()
 
                 # Busca listas do board para mapear idList → nome
-                lists_response = await self._client.get(f"/boards/{target_board}/lists")
-                lists_response.raise_for_status()
-                lists_data = lists_response.json()
+                lists_data = await self._get_board_lists(target_board)
 
                 # Cria mapeamento idList → nome da lista
                 list_names = {lst["id"]: lst.get("name", "") for lst in lists_data}
@@ -399,6 +454,86 @@ class TrelloAdapter(KanbanPort):
             logger.error(f"Erro ao listar cards: {e}")
             return Result.err(f"Erro ao listar cards: {str(e)}")
 
+    async def list_cards_since(
+        self,
+        board_id: str,
+        since: datetime,
+    ) -> Result[list[Card], str]:
+        """
+        Lista apenas os cards alterados desde `since` (sync incremental).
+
+        GET /1/boards/{id}/actions?since=... descobre quais cards mudaram;
+        os cards são buscados via GET /1/batch (até 10 por request) com
+        list=true, que já traz o nome da lista (sem GET /boards/{id}/lists).
+
+        Se houver mudanças demais (página de actions cheia ou mais de
+        INCREMENTAL_MAX_CARDS cards), cai para a listagem completa filtrada.
+
+        Args:
+            board_id: ID do board no Trello
+            since: Instante (UTC naive) a partir do qual buscar mudanças
+
+        Returns:
+            Result.ok(list[Card]) com cards alterados (cards arquivados são omitidos)
+            Result.err(str) com mensagem de erro se falhar
+        """
+        try:
+            response = await self._client.get(
+                f"/boards/{board_id}/actions",
+                params={
+                    "filter": CARD_ACTION_TYPES,
+                    "since": since.isoformat(timespec="milliseconds") + "Z",
+                    "limit": ACTIONS_PAGE_LIMIT,
+                    "fields": "data,date",
+                    "memberCreator": "false",
+                },
+            )
+            response.raise_for_status()
+            actions = response.json()
+
+            if len(actions) >= ACTIONS_PAGE_LIMIT:
+                logger.info("Muitas actions desde o último sync, usando listagem completa")
+                return await super().list_cards_since(board_id, since)
+
+            card_ids = list(dict.fromkeys(
+                action["data"]["card"]["id"]
+                for action in actions
+                if action.get("data", {}).get("card", {}).get("id")
+            ))
+
+            if not card_ids:
+                return Result.ok([])
+
+            if len(card_ids) > INCREMENTAL_MAX_CARDS:
+                logger.info(f"{len(card_ids)} cards alterados, usando listagem completa")
+                return await super().list_cards_since(board_id, since)
+
+            cards = []
+            for start in range(0, len(card_ids), BATCH_URL_LIMIT):
+                chunk = card_ids[start:start + BATCH_URL_LIMIT]
+                batch_response = await self._client.get(
+                    "/batch",
+                    params={"urls": ",".join(f"/cards/{card_id}?list=true" for card_id in chunk)},
+                )
+                batch_response.raise_for_status()
+
+                for item in batch_response.json():
+                    # Cada item vem como {"200": {...}} ou {"<status>": erro}
+                    card_data = item.get("200")
+                    if not card_data or card_data.get("closed"):
+                        continue
+                    cards.append(self._parse_card(card_data))
+
+            logger.info(f"Listados {len(cards)} cards alterados desde {since.isoformat()}")
+            return Result.ok(cards)
+
+        except httpx.HTTPStatusError as e:
+            return Result.err(f"Erro HTTP {e.response.status_code}")
+
+        except Exception as e:
+            logger.error(f"Erro ao listar cards alterados: {e}")
+            return Result.err(f"Erro ao listar cards alterados: {str(e)}")
+
     def _parse_card(self, data: dict) -> Card:
         """
         Converte resposta da API Trello para entidade Card.
@@ -526,9 +661,7 @@ class TrelloAdapter(KanbanPort):
 
         # Busca listas existentes
         try:
-            response = await self._client.get(f"/boards/{target_board}/lists")
-            response.raise_for_status()
-            existing_lists = response.json()
+            existing_lists = await self._get_board_lists(target_board)
 
             # Mapeia nome → id das listas existentes
             existing_by_name = {
@@ -622,6 +755,7 @@ class TrelloAdapter(KanbanPort):
             list_data = response.json()
 
             list_id = list_data["id"]
+            board_metadata_cache.invalidate(target_board, "lists")
 
             # Se cor fornecida, tenta aplicar via subscrição
             # (muda cor de fundo da lista no UI)
@@ -704,9 +838,7 @@ class TrelloAdapter(KanbanPort):
 
         try:
             # Busca labels existentes
-            response = await self._client.get(f"/boards/{target_board}/labels")
-            response.raise_for_status()
-            labels = response.json()
+            labels = await self._get_board_labels(target_board)
 
             # Procura label com mesmo nome
             for label in labels:
@@ -724,6 +856,7 @@ class TrelloAdapter(KanbanPort):
             )
             response.raise_for_status()
             label_data = response.json()
+            board_metadata_cache.invalidate(target_board, "labels")
 
             logger.info(f"Label criado: {label_name} ({color})")
             return Result.ok(label_data["id"])
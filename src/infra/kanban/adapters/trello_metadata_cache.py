@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+"""
+Trello Metadata Cache — Cache com TTL para metadados de board (listas, labels).
+
+Listas e labels mudam raramente, mas eram buscados a cada operação
+(_get_list_id, list_cards, auto_configure_lists, get_or_create_label).
+Este cache é compartilhado pelo processo (TrelloAdapter é recriado por
+requisição) e faz coalescing de GETs idênticos concorrentes: uma única
+requisição HTTP atende todos os chamadores que chegam enquanto ela está
+em andamento.
+
+Invalidação:
+- TTL (padrão 60s)
+- Escritas do próprio adapter (criar lista/label)
+- Webhooks do Trello que alteram listas/labels (invalidate_board_metadata)
+
+DOC: infra/kanban/adapters/trello_adapter.py
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+# TTL padrão dos metadados de board (segundos)
+DEFAULT_METADATA_TTL = 60.0
+
+# Actions de webhook do Trello que alteram listas ou labels do board
+METADATA_ACTION_TYPES = frozenset({
+    "createList",
+    "updateList",
+    "moveListToBoard",
+    "moveListFromBoard",
+    "createLabel",
+    "updateLabel",
+    "deleteLabel",
+})
+
+
+class TrelloMetadataCache:
+    """
+    Cache TTL com single-flight para GETs de metadados do Trello.
+
+    Entradas são indexadas por (board_id, tipo), ex: ("abc123", "lists").
+    Intake de webhooks, worker e rotas compartilham o loop da API, onde
+    acontece quase todo o coalescing. Handlers Sky-RPC síncronos
+    (HandlerExecutor) ainda rodam em threads com asyncio.run próprio: o
+    armazenamento é protegido por threading.Lock e o coalescing é feito
+    por event loop (futures não atravessam loops).
+
+    Attributes:
+        ttl: Tempo de vida das entradas em segundos
+    """
+
+    def __init__(self, ttl: float = DEFAULT_METADATA_TTL):
+        """
+        Inicializa o cache.
+
+        Args:
+            ttl: Tempo de vida das entradas em segundos
+        """
+        self.ttl = ttl
+        self._entries: dict[tuple[str, str], tuple[float, Any]] = {}
+        self._inflight: dict[tuple[int, str, str], asyncio.Future] = {}
+        self._generation: dict[str, int] = {}
+        self._global_generation = 0
+        self._lock = threading.Lock()
+
+    async def get(
+        self,
+        board_id: str,
+        kind: str,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Retorna o valor em cache ou busca via `fetch`.
+
+        Chamadas concorrentes para a mesma chave no mesmo event loop
+        aguardam a mesma busca. Exceções de `fetch` são propagadas para
+        todos os chamadores e nada é armazenado.
+
+        Args:
+            board_id: ID do board no Trello
+            kind: Tipo do metadado ("lists", "labels")
+            fetch: Corrotina que busca o valor na API
+
+        Returns:
+            Valor em cache ou recém-buscado
+        """
+        key = (board_id, kind)
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), board_id, kind)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return entry[1]
+
+            pending = self._inflight.get(flight_key)
+            if pending is None:
+                pending = loop.create_future()
+                self._inflight[flight_key] = pending
+                generation = self._current_generation(board_id)
+                owner = True
+            else:
+                owner = False
+
+        if not owner:
+            return await asyncio.shield(pending)
+
+        try:
+            value = await fetch()
+        except Exception as e:
+            with self._lock:
+                self._inflight.pop(flight_key, None)
+            pending.set_exception(e)
+            # Evita "Future exception was never retrieved" sem aguardadores
+            pending.exception()
+            raise
+        except BaseException:
+            with self._lock:
+                self._inflight.pop(flight_key, None)
+            pending.cancel()
+            raise
+
+        with self._lock:
+            self._inflight.pop(flight_key, None)
+            # Invalidação durante a busca: entrega o valor, mas não armazena
+            if self._current_generation(board_id) == generation:
+                self._entries[key] = (time.monotonic() + self.ttl, value)
+
+        pending.set_result(value)
+        return value
+
+    def _current_generation(self, board_id: str) -> tuple[int, int]:
+        """Versão das entradas do board (muda a cada invalidação)."""
+        return self._global_generation, self._generation.get(board_id, 0)
+
+    def invalidate(self, board_id: Optional[str] = None, kind: Optional[str] = None) -> None:
+        """
+        Remove entradas do cache.
+
+        Args:
+            board_id: Board a invalidar (None = todos os boards)
+            kind: Tipo a invalidar (None = todos os tipos do board)
+        """
+        with self._lock:
+            if board_id is None:
+                self._entries.clear()
+                self._global_generation += 1
+                return
+
+            for key in [k for k in self._entries if k[0] == board_id and kind in (None, k[1])]:
+                del self._entries[key]
+            self._generation[board_id] = self._generation.get(board_id, 0) + 1
+
+        logger.debug(f"Metadados do Trello invalidados: board={board_id} kind={kind or '*'}")
+
+
+# Cache compartilhado pelo processo
+board_metadata_cache = TrelloMetadataCache()
+
+
+def invalidate_board_metadata(board_id: Optional[str] = None, action_type: Optional[str] = None) -> bool:
+    """
+    Invalida metadados em cache a partir de um evento do Trello.
+
+    Args:
+        board_id: Board afetado (None = todos)
+        action_type: Tipo da action do webhook; se informado, só invalida
+                     quando a action altera listas ou labels
+
+    Returns:
+        True se o cache foi invalidado
+    """
+    if action_type is not None and action_type not in METADATA_ACTION_TYPES:
+        return False
+
+    board_metadata_cache.invalidate(board_id)
+    return True
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""
+Trello Rate Limiter — Token bucket por token da API do Trello.
+
+O Trello limita requisições por token (100 a cada 10s por padrão) e
+informa o estado do limite nos headers de resposta:
+
+- x-rate-limit-api-token-max: capacidade da janela
+- x-rate-limit-api-token-interval-ms: tamanho da janela
+- x-rate-limit-api-token-remaining: requisições restantes na janela
+- Retry-After (em respostas 429): segundos até liberar
+
+O limiter é instalado como event hook do httpx.AsyncClient do
+TrelloAdapter: toda requisição reserva uma ficha antes de sair (esperando
+se o bucket estiver vazio) e toda resposta ajusta o bucket pelos headers.
+É compartilhado por token porque o adapter é recriado por requisição.
+
+DOC: infra/kanban/adapters/trello_adapter.py
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Optional
+
+import httpx
+
+
+logger = logging.getLogger(__name__)
+
+
+# Limite padrão do Trello por token (antes de qualquer header ser lido)
+DEFAULT_TOKEN_LIMIT = 100
+DEFAULT_TOKEN_INTERVAL = 10.0
+
+
+class TrelloRateLimiter:
+    """
+    Token bucket alimentado pelos headers de rate limit do Trello.
+
+    Reservas podem deixar o saldo negativo: cada chamador espera o tempo
+    necessário para a sua ficha ser reposta, o que serializa as
+    requisições em ordem de chegada sem depender de um event loop
+    específico. Intake de webhooks, worker e rotas rodam no loop da API,
+    mas handlers Sky-RPC síncronos (HandlerExecutor) chamam o Trello de
+    threads próprias via asyncio.run; por isso o estado usa
+    threading.Lock e não asyncio.Lock.
+
+    Attributes:
+        capacity: Requisições permitidas por janela
+        interval: Tamanho da janela em segundos
+    """
+
+    def __init__(self, capacity: int = DEFAULT_TOKEN_LIMIT, interval: float = DEFAULT_TOKEN_INTERVAL):
+        """
+        Inicializa o bucket cheio.
+
+        Args:
+            capacity: Requisições permitidas por janela
+            interval: Tamanho da janela em segundos
+        """
+        self.capacity = capacity
+        self.interval = interval
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def refill_rate(self) -> float:
+        """Fichas repostas por segundo."""
+        return self.capacity / self.interval
+
+    def _refill(self, now: float) -> None:
+        """Repõe fichas pelo tempo decorrido (chamar com lock)."""
+        elapsed = now - self._updated_at
+        self._tokens = min(float(self.capacity), self._tokens + elapsed * self.refill_rate)
+        self._updated_at = now
+
+    def reserve(self) -> float:
+        """
+        Reserva uma ficha.
+
+        Returns:
+            Segundos a esperar antes de enviar a requisição
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+
+            wait = max(0.0, self._paused_until - now)
+            if self._tokens < 0:
+                wait = max(wait, -self._tokens / self.refill_rate)
+            return wait
+
+    async def acquire(self, request: Optional[httpx.Request] = None) -> None:
+        """Event hook de request: espera uma ficha disponível."""
+        wait = self.reserve()
+        if wait > 0:
+            logger.debug(f"[TRELLO_RATE_LIMIT] Aguardando {wait:.2f}s por ficha")
+            await asyncio.sleep(wait)
+
+    async def observe(self, response: httpx.Response) -> None:
+        """Event hook de response: ajusta o bucket pelos headers do Trello."""
+        self.update_from_headers(response.status_code, response.headers)
+
+    def update_from_headers(self, status_code: int, headers: httpx.Headers | dict) -> None:
+        """
+        Ajusta capacidade, janela e saldo a partir dos headers de resposta.
+
+        Args:
+            status_code: Status HTTP da resposta
+            headers: Headers da resposta
+        """
+        headers = httpx.Headers(headers)  # Busca case-insensitive
+
+        def header_number(name: str) -> Optional[float]:
+            value = headers.get(name)
+            try:
+                return float(value) if value is not None else None
+            except ValueError:
+                return None
+
+        limit = header_number("x-rate-limit-api-token-max")
+        interval_ms = header_number("x-rate-limit-api-token-interval-ms")
+        remaining = header_number("x-rate-limit-api-token-remaining")
+
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+
+            if limit and limit > 0:
+                self.capacity = int(limit)
+            if interval_ms and interval_ms > 0:
+                self.interval = interval_ms / 1000.0
+
+            # O servidor é a fonte da verdade quando está mais restritivo
+            if remaining is not None and remaining < self._tokens:
+                self._tokens = remaining
+
+            if status_code == 429:
+                retry_after = header_number("retry-after") or self.interval
+                self._paused_until = max(self._paused_until, now + retry_after)
+                self._tokens = min(self._tokens, 0.0)
+                logger.warning(f"[TRELLO_RATE_LIMIT] 429 recebido, pausando por {retry_after:.1f}s")
+
+
+_limiters: dict[str, TrelloRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(api_token: str) -> TrelloRateLimiter:
+    """
+    Retorna o limiter compartilhado de um token da API.
+
+    Args:
+        api_token: Token de autenticação do Trello
+
+    Returns:
+        TrelloRateLimiter único por token no processo
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(api_token)
+        if limiter is None:
+            limiter = TrelloRateLimiter()
+            _limiters[api_token] = limiter
+        return limiter
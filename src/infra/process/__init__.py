@@ -0,0 +1,16 @@
+# -*- coding: utf-8 -*-
+"""
+Execução assíncrona de processos externos (git, pytest).
+"""
+
+from infra.process.async_process_runner import (
+    AsyncProcessRunner,
+    ProcessResult,
+    default_runner,
+)
+
+__all__ = [
+    "AsyncProcessRunner",
+    "ProcessResult",
+    "default_runner",
+]
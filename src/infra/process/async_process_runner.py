@@ -0,0 +1,296 @@
+# -*- coding: utf-8 -*-
+"""
+Async Process Runner — Execução de subprocessos sem bloquear o event loop.
+
+GitService, WorktreeManager e JobGuardrails são chamados de corrotinas
+do servidor FastAPI. Com subprocess.run, um `git push` lento ou um pytest
+de 120s congelava o loop inteiro (intake de webhooks, SSE). Este runner
+usa asyncio.create_subprocess_exec e oferece:
+
+- Timeout: o processo (e seus filhos, em POSIX) é morto ao expirar
+- Cancelamento: cancelar a task que aguarda também mata o processo
+- Limite de saída: stdout/stderr são lidos em streaming e truncados
+- Limite de concorrência: no máximo N processos simultâneos por event loop
+
+Erros seguem a API do módulo subprocess (CalledProcessError,
+TimeoutExpired, FileNotFoundError) para que os serviços mantenham o
+mesmo tratamento de erro.
+
+DOC: core/webhooks/application/git_service.py
+"""
+
+import asyncio
+import logging
+import os
+import signal
+import subprocess
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+
+logger = logging.getLogger(__name__)
+
+
+# Processos simultâneos por event loop (git, pytest)
+DEFAULT_MAX_CONCURRENCY = 4
+
+# Bytes mantidos de cada stream (stdout/stderr); o excedente é descartado
+DEFAULT_MAX_OUTPUT_BYTES = 1024 * 1024
+
+_READ_CHUNK = 64 * 1024
+
+
+@dataclass
+class ProcessResult:
+    """
+    Resultado de um processo finalizado.
+
+    Attributes:
+        args: Comando executado
+        returncode: Código de saída
+        stdout: Saída padrão decodificada (UTF-8)
+        stderr: Saída de erro decodificada (UTF-8)
+        duration: Tempo de execução em segundos
+        stdout_truncated: Se stdout excedeu o limite de bytes
+        stderr_truncated: Se stderr excedeu o limite de bytes
+    """
+    args: list[str]
+    returncode: int
+    stdout: str = ""
+    stderr: str = ""
+    duration: float = 0.0
+    stdout_truncated: bool = False
+    stderr_truncated: bool = False
+
+    @property
+    def ok(self) -> bool:
+        """True se o processo terminou com código 0."""
+        return self.returncode == 0
+
+
+class AsyncProcessRunner:
+    """
+    Executa comandos externos de forma assíncrona.
+
+    O limite de concorrência é um asyncio.Semaphore por event loop, pois
+    handlers Sky-RPC síncronos rodam corrotinas com asyncio.run nas threads
+    do HandlerExecutor.
+
+    Attributes:
+        max_concurrency: Processos simultâneos por event loop
+        max_output_bytes: Bytes mantidos de cada stream por padrão
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_output_bytes: int = DEFAULT_MAX_OUTPUT_BYTES,
+    ):
+        """
+        Inicializa o runner.
+
+        Args:
+            max_concurrency: Processos simultâneos por event loop
+            max_output_bytes: Bytes mantidos de cada stream por padrão
+        """
+        self.max_concurrency = max_concurrency
+        self.max_output_bytes = max_output_bytes
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        """Retorna o semáforo do event loop atual."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            semaphore = self._semaphores.get(loop)
+            if semaphore is None:
+                semaphore = asyncio.Semaphore(self.max_concurrency)
+                self._semaphores[loop] = semaphore
+            return semaphore
+
+    async def run(
+        self,
+        args: Sequence[str],
+        cwd: Optional[str] = None,
+        timeout: Optional[float] = None,
+        check: bool = False,
+        env: Optional[dict[str, str]] = None,
+        max_output_bytes: Optional[int] = None,
+    ) -> ProcessResult:
+        """
+        Executa um comando e aguarda seu término.
+
+        Args:
+            args: Comando e argumentos (sem shell)
+            cwd: Diretório de trabalho
+            timeout: Timeout em segundos (None = sem limite)
+            check: Se True, levanta CalledProcessError quando returncode != 0
+            env: Variáveis de ambiente (None = herda do processo)
+            max_output_bytes: Limite de bytes por stream (None = padrão do runner)
+
+        Returns:
+            ProcessResult com código de saída e saídas capturadas
+
+        Raises:
+            subprocess.CalledProcessError: check=True e returncode != 0
+            subprocess.TimeoutExpired: Processo excedeu o timeout (já foi morto)
+            FileNotFoundError: Executável ou cwd não encontrado
+        """
+        args = [str(a) for a in args]
+        limit = self.max_output_bytes if max_output_bytes is None else max_output_bytes
+
+        async with self._semaphore():
+            started = time.monotonic()
+            try:
+                result = await self._run_async(args, cwd, timeout, env, limit, started)
+            except NotImplementedError:
+                # Event loop sem suporte a subprocessos (ex: SelectorEventLoop
+                # no Windows): executa em thread para não bloquear o loop
+                result = await asyncio.to_thread(self._run_blocking, args, cwd, timeout, env, limit, started)
+
+        if check and result.returncode != 0:
+            raise subprocess.CalledProcessError(
+                result.returncode, args, output=result.stdout, stderr=result.stderr
+            )
+        return result
+
+    async def _run_async(
+        self,
+        args: list[str],
+        cwd: Optional[str],
+        timeout: Optional[float],
+        env: Optional[dict[str, str]],
+        limit: int,
+        started: float,
+    ) -> ProcessResult:
+        """Executa via asyncio.create_subprocess_exec."""
+        proc = await asyncio.create_subprocess_exec(
+            *args,
+            cwd=cwd,
+            env=env,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            # Grupo próprio permite matar também os filhos (ex: pytest-xdist)
+            start_new_session=os.name == "posix",
+        )
+
+        stdout_buf = bytearray()
+        stderr_buf = bytearray()
+        readers = asyncio.gather(
+            _read_capped(proc.stdout, stdout_buf, limit),
+            _read_capped(proc.stderr, stderr_buf, limit),
+        )
+
+        try:
+            truncated = await asyncio.wait_for(asyncio.shield(readers), timeout=timeout)
+            returncode = await proc.wait()
+        except asyncio.TimeoutError:
+            await _kill(proc, readers)
+            logger.warning(f"Processo excedeu timeout de {timeout}s: {' '.join(args[:3])}")
+            raise subprocess.TimeoutExpired(
+                args, timeout, output=_decode(stdout_buf), stderr=_decode(stderr_buf)
+            )
+        except BaseException:
+            # Cancelamento da task chamadora: não deixa processo órfão
+            await _kill(proc, readers)
+            raise
+
+        return ProcessResult(
+            args=args,
+            returncode=returncode,
+            stdout=_decode(stdout_buf),
+            stderr=_decode(stderr_buf),
+            duration=time.monotonic() - started,
+            stdout_truncated=truncated[0],
+            stderr_truncated=truncated[1],
+        )
+
+    @staticmethod
+    def _run_blocking(
+        args: list[str],
+        cwd: Optional[str],
+        timeout: Optional[float],
+        env: Optional[dict[str, str]],
+        limit: int,
+        started: float,
+    ) -> ProcessResult:
+        """Fallback síncrono (executado em thread)."""
+        completed = subprocess.run(
+            args,
+            cwd=cwd,
+            env=env,
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            timeout=timeout,
+        )
+        return ProcessResult(
+            args=args,
+            returncode=completed.returncode,
+            stdout=_decode(completed.stdout[:limit]),
+            stderr=_decode(completed.stderr[:limit]),
+            duration=time.monotonic() - started,
+            stdout_truncated=len(completed.stdout) > limit,
+            stderr_truncated=len(completed.stderr) > limit,
+        )
+
+
+async def _read_capped(stream: Optional[asyncio.StreamReader], buffer: bytearray, limit: int) -> bool:
+    """
+    Lê o stream até EOF mantendo no máximo `limit` bytes.
+
+    O restante continua sendo drenado para o processo não travar com o
+    pipe cheio.
+
+    Returns:
+        True se a saída foi truncada
+    """
+    truncated = False
+    if stream is None:
+        return truncated
+
+    while True:
+        chunk = await stream.read(_READ_CHUNK)
+        if not chunk:
+            return truncated
+        room = limit - len(buffer)
+        if room > 0:
+            buffer.extend(chunk[:room])
+        if len(chunk) > room:
+            truncated = True
+
+
+async def _kill(proc: asyncio.subprocess.Process, readers: asyncio.Future) -> None:
+    """Mata o processo (e seu grupo, em POSIX) e aguarda o término."""
+    if proc.returncode is None:
+        try:
+            if os.name == "posix":
+                os.killpg(proc.pid, signal.SIGKILL)
+            else:
+                proc.kill()
+        except (ProcessLookupError, PermissionError):
+            pass
+
+    readers.cancel()
+    try:
+        await asyncio.shield(proc.wait())
+    except asyncio.CancelledError:
+        pass
+    try:
+        await readers
+    except BaseException:
+        pass
+
+
+def _decode(data: bytes | bytearray) -> str:
+    """Decodifica saída de processo como UTF-8 tolerante."""
+    return bytes(data).decode("utf-8", errors="replace")
+
+
+# Runner compartilhado pelo processo
+default_runner = AsyncProcessRunner()
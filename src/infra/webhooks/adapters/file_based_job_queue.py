@@ -24,13 +24,21 @@ import json
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Iterable
 
 if TYPE_CHECKING:
     from core.webhooks.domain import WebhookJob
     from core.webhooks.ports.job_queue_port import JobQueuePort
 
 from core.webhooks.ports.job_queue_port import JobQueuePort, QueueError
+from infra.webhooks.adapters.job_notifier import JobNotifier
+from infra.webhooks.adapters.queue_metrics import LatencyHistogram, SnapshotCache
+
+# Janela de throughput de jobs_per_hour (horas)
+THROUGHPUT_WINDOW_HOURS = 24
+
+# Validade do cálculo de uso de disco (varre o diretório inteiro)
+DISK_USAGE_TTL_SECONDS = 30.0
 
 
 class FileBasedJobQueue(JobQueuePort):
@@ -91,15 +99,29 @@ class FileBasedJobQueue(JobQueuePort):
         # Lock para evitar race conditions
         self._lock = asyncio.Lock()
 
-        # Métricas embutidas
+        # Wakeup push: compartilhado por instâncias do mesmo diretório;
+        # enqueues de outros processos são detectados pelo mtime de queue.json
+        self._notifier = JobNotifier.for_key(self.queue_dir.resolve())
+        self._dequeue_version = self._notifier.version
+        self._queue_mtime_ns = self._get_queue_mtime_ns()
+
+        # Métricas embutidas (contadores incrementais; latências em
+        # histogramas streaming; conclusões agregadas por hora)
         self._metrics = {
             "enqueue_count": 0,
             "dequeue_count": 0,
             "complete_count": 0,
             "fail_count": 0,
-            "enqueue_latency_ms": [],  # Últimos 1000
-            "dequeue_latency_ms": [],  # Últimos 1000
+            "completed_per_hour": {},  # hora (epoch/3600) -> jobs completados
         }
+        self._enqueue_latency = LatencyHistogram()
+        self._dequeue_latency = LatencyHistogram()
+
+        # get_metrics() barato para polling: snapshot invalidado por escritas
+        # locais e uso de disco recalculado no máximo a cada TTL
+        self._snapshot = SnapshotCache()
+        self._disk_usage_mb = 0.0
+        self._disk_usage_expires_at = 0.0
 
         # Carregar métricas persistidas
         self._load_metrics()
@@ -132,22 +154,65 @@ class FileBasedJobQueue(JobQueuePort):
 
                 # 3. Atualizar métricas
                 self._metrics["enqueue_count"] += 1
-                latency_ms = (time.time() - start) * 1000
-                self._metrics["enqueue_latency_ms"].append(latency_ms)
-                if len(self._metrics["enqueue_latency_ms"]) > 1000:
-                    self._metrics["enqueue_latency_ms"] = self._metrics["enqueue_latency_ms"][
-                        -1000:
-                    ]
+                self._enqueue_latency.record((time.time() - start) * 1000)
+                self._snapshot.invalidate()
 
                 # 4. Persistir métricas periodicamente
                 if self._metrics["enqueue_count"] % 10 == 0:
                     self._save_metrics()
 
+                # 5. Acordar workers aguardando em wait_for_job()
+                self._notifier.notify()
+
                 return job.job_id
 
             except Exception as e:
                 raise QueueError(f"Falha ao enfileirar job {job.job_id}: {e}") from e
 
+    async def enqueue_many(self, jobs: list["WebhookJob"]) -> list[str]:
+        """
+        Enfileira lote de jobs reescrevendo queue.json uma única vez.
+
+        Jobs com delivery já conhecido (ou repetido no lote) são ignorados.
+
+        Args:
+            jobs: Jobs a enfileirar (ordem preservada)
+
+        Returns:
+            job_ids efetivamente enfileirados
+
+        Raises:
+            QueueError: Se falhar ao persistir
+        """
+        start = time.time()
+
+        # Filtro sob o lock: lotes concorrentes não aceitam o mesmo delivery
+        async with self._lock:
+            new_jobs = await self._filter_new_deliveries(jobs)
+            if not new_jobs:
+                return []
+
+            try:
+                for job in new_jobs:
+                    job_file = self.jobs_dir / f"{job.job_id}.json"
+                    job_file.write_text(self._job_to_json(job), encoding="utf-8")
+
+                queue = self._load_queue()
+                queue.extend(job.job_id for job in new_jobs)
+                self._save_queue(queue)
+
+                self._metrics["enqueue_count"] += len(new_jobs)
+                self._enqueue_latency.record((time.time() - start) * 1000)
+                self._snapshot.invalidate()
+                self._save_metrics()
+
+                self._notifier.notify()
+
+                return [job.job_id for job in new_jobs]
+
+            except Exception as e:
+                raise QueueError(f"Falha ao enfileirar lote de {len(new_jobs)} jobs: {e}") from e
+
     async def dequeue(self) -> "WebhookJob | None":
         """
         Remove próximo job da fila com persistência.
@@ -156,6 +221,7 @@ class FileBasedJobQueue(JobQueuePort):
             Próximo job ou None se fila vazia
         """
         start = time.time()
+        self._dequeue_version = self._notifier.version
 
         async with self._lock:
             try:
@@ -189,12 +255,8 @@ class FileBasedJobQueue(JobQueuePort):
 
                 # 5. Atualizar métricas
                 self._metrics["dequeue_count"] += 1
-                latency_ms = (time.time() - start) * 1000
-                self._metrics["dequeue_latency_ms"].append(latency_ms)
-                if len(self._metrics["dequeue_latency_ms"]) > 1000:
-                    self._metrics["dequeue_latency_ms"] = self._metrics["dequeue_latency_ms"][
-                        -1000:
-                    ]
+                self._dequeue_latency.record((time.time() - start) * 1000)
+                self._snapshot.invalidate()
 
                 # 6. Persistir métricas periodicamente
                 if self._metrics["dequeue_count"] % 10 == 0:
@@ -236,32 +298,60 @@ class FileBasedJobQueue(JobQueuePort):
         """
         async with self._lock:
             try:
-                # Mover arquivo de processing/ para completed/
-                processing_file = self.processing_dir / f"{job_id}.json"
-                completed_file = self.completed_dir / f"{job_id}.json"
+                self._move_to_completed(job_id, result)
+                self._save_metrics()
 
-                if processing_file.exists():
-                    # Adicionar resultado ao arquivo
-                    job_data = json.loads(processing_file.read_text(encoding="utf-8"))
-                    if result:
-                        job_data["result"] = result
-                    job_data["status"] = "completed"
-                    job_data["completed_at"] = datetime.utcnow().isoformat()
+            except Exception as e:
+                raise QueueError(f"Falha ao completar job {job_id}: {e}") from e
 
-                    completed_file.write_text(json.dumps(job_data, indent=2), encoding="utf-8")
-                    processing_file.unlink()
+    async def complete_many(
+        self,
+        job_ids: Iterable[str],
+        results: dict[str, dict] | None = None,
+    ) -> None:
+        """
+        Marca lote de jobs como completos (um lock, métricas salvas uma vez).
 
-                self._metrics["complete_count"] += 1
+        Args:
+            job_ids: IDs dos jobs
+            results: Resultado opcional por job_id
+        """
+        results = results or {}
+        async with self._lock:
+            try:
+                for job_id in job_ids:
+                    self._move_to_completed(job_id, results.get(job_id))
                 self._save_metrics()
 
             except Exception as e:
-                raise QueueError(f"Falha ao completar job {job_id}: {e}") from e
+                raise QueueError(f"Falha ao completar lote de jobs: {e}") from e
+
+    def _move_to_completed(self, job_id: str, result: dict | None) -> None:
+        """Move job de processing/ para completed/ (chamado com lock)."""
+        processing_file = self.processing_dir / f"{job_id}.json"
+        completed_file = self.completed_dir / f"{job_id}.json"
+
+        if processing_file.exists():
+            # Adicionar resultado ao arquivo
+            job_data = json.loads(processing_file.read_text(encoding="utf-8"))
+            if result:
+                job_data["result"] = result
+            job_data["status"] = "completed"
+            job_data["completed_at"] = datetime.utcnow().isoformat()
+
+            completed_file.write_text(json.dumps(job_data, indent=2), encoding="utf-8")
+            processing_file.unlink()
+
+        self._metrics["complete_count"] += 1
+        self._record_completion()
+        self._snapshot.invalidate()
 
     async def wait_for_dequeue(self, timeout: float | None = None) -> "WebhookJob | None":
         """
         Aguarda até que haja um job disponível e o remove.
 
-        Implementa polling da fila para compatibilidade com worker.
+        Usa o canal de notificação (enqueue acorda o waiter) em vez de
+        polling com intervalo fixo.
 
         Args:
             timeout: Tempo máximo de espera em segundos
@@ -279,15 +369,48 @@ class FileBasedJobQueue(JobQueuePort):
 
             # Verifica timeout
             if timeout is not None:
-                elapsed = time.time() - start
-                if elapsed >= timeout:
+                remaining = timeout - (time.time() - start)
+                if remaining <= 0:
                     return None
-                remaining = timeout - elapsed
             else:
-                remaining = 0.1  # Poll interval sem timeout
+                remaining = 1.0  # Fatia de espera sem timeout
 
-            # Aguarda antes de tentar novamente
-            await asyncio.sleep(remaining if timeout else 0.1)
+            # Aguarda notificação de enqueue
+            await self.wait_for_job(remaining)
+
+    async def wait_for_job(self, timeout_seconds: float) -> bool:
+        """
+        Aguarda notificação de novo job.
+
+        Enqueues deste processo acordam imediatamente; enqueues de outros
+        processos são detectados via mtime de queue.json (um stat, sem
+        reler a fila).
+
+        Args:
+            timeout_seconds: Tempo máximo de espera
+
+        Returns:
+            True se um job pode estar disponível, False se timeout
+        """
+        return await self._notifier.wait(
+            timeout_seconds,
+            since=self._dequeue_version,
+            probe=self._queue_file_changed,
+        )
+
+    def _get_queue_mtime_ns(self) -> int:
+        """Retorna mtime de queue.json (0 se não existe)."""
+        try:
+            return self.queue_file.stat().st_mtime_ns
+        except OSError:
+            return 0
+
+    def _queue_file_changed(self) -> bool:
+        """Probe barato: queue.json alterado por outro processo."""
+        mtime_ns = self._get_queue_mtime_ns()
+        changed = mtime_ns != self._queue_mtime_ns
+        self._queue_mtime_ns = mtime_ns
+        return changed
 
     async def fail(self, job_id: str, error: str) -> None:
         """
@@ -299,23 +422,44 @@ class FileBasedJobQueue(JobQueuePort):
         """
         async with self._lock:
             try:
-                processing_file = self.processing_dir / f"{job_id}.json"
-                failed_file = self.failed_dir / f"{job_id}.json"
+                self._move_to_failed(job_id, error)
+                self._save_metrics()
 
-                if processing_file.exists():
-                    job_data = json.loads(processing_file.read_text(encoding="utf-8"))
-                    job_data["error"] = error
-                    job_data["status"] = "failed"
-                    job_data["failed_at"] = datetime.utcnow().isoformat()
+            except Exception as e:
+                raise QueueError(f"Falha ao marcar job {job_id} como falhou: {e}") from e
 
-                    failed_file.write_text(json.dumps(job_data, indent=2), encoding="utf-8")
-                    processing_file.unlink()
+    async def fail_many(self, errors: dict[str, str]) -> None:
+        """
+        Marca lote de jobs como falhos (um lock, métricas salvas uma vez).
 
-                self._metrics["fail_count"] += 1
+        Args:
+            errors: Mensagem de erro por job_id
+        """
+        async with self._lock:
+            try:
+                for job_id, error in errors.items():
+                    self._move_to_failed(job_id, error)
                 self._save_metrics()
 
             except Exception as e:
-                raise QueueError(f"Falha ao marcar job {job_id} como falhou: {e}") from e
+                raise QueueError(f"Falha ao marcar lote de jobs como falhos: {e}") from e
+
+    def _move_to_failed(self, job_id: str, error: str) -> None:
+        """Move job de processing/ para failed/ (chamado com lock)."""
+        processing_file = self.processing_dir / f"{job_id}.json"
+        failed_file = self.failed_dir / f"{job_id}.json"
+
+        if processing_file.exists():
+            job_data = json.loads(processing_file.read_text(encoding="utf-8"))
+            job_data["error"] = error
+            job_data["status"] = "failed"
+            job_data["failed_at"] = datetime.utcnow().isoformat()
+
+            failed_file.write_text(json.dumps(job_data, indent=2), encoding="utf-8")
+            processing_file.unlink()
+
+        self._metrics["fail_count"] += 1
+        self._snapshot.invalidate()
 
     def size(self) -> int:
         """
@@ -347,12 +491,42 @@ class FileBasedJobQueue(JobQueuePort):
                 try:
                     job_data = json.loads(job_file.read_text(encoding="utf-8"))
                     event_data = job_data.get("event", {})
-                    if event_data.get("event_id") == delivery_id:
+                    if event_data.get("delivery_id") == delivery_id:
                         return True
                 except Exception:
                     continue
         return False
 
+    async def exists_many_by_delivery(self, delivery_ids: Iterable[str]) -> set[str]:
+        """
+        Versão em lote de exists_by_delivery() (uma única varredura).
+
+        Args:
+            delivery_ids: IDs de entrega a verificar
+
+        Returns:
+            Subconjunto dos delivery_ids que já existem
+        """
+        wanted = set(delivery_ids)
+        found: set[str] = set()
+        if not wanted:
+            return found
+
+        for dir_path in [self.jobs_dir, self.processing_dir, self.completed_dir, self.failed_dir]:
+            if not dir_path.exists():
+                continue
+            for job_file in dir_path.glob("*.json"):
+                try:
+                    job_data = json.loads(job_file.read_text(encoding="utf-8"))
+                    job_delivery = job_data.get("event", {}).get("delivery_id")
+                    if job_delivery in wanted:
+                        found.add(job_delivery)
+                        if found == wanted:
+                            return found
+                except Exception:
+                    continue
+        return found
+
     def get_metrics(self) -> dict[str, Any]:
         """
         Retorna métricas da fila para tomada de decisão.
@@ -364,26 +538,35 @@ class FileBasedJobQueue(JobQueuePort):
         - backlog_age_seconds: Idade do job mais antigo
         - disk_usage_mb: Uso de disco em MB
 
+        Nenhuma métrica varre completed/ ou ordena latências: contadores e
+        conclusões por hora são incrementais, latências vêm de histogramas
+        e o uso de disco é recalculado no máximo a cada
+        DISK_USAGE_TTL_SECONDS. O snapshot fica em cache até a próxima
+        escrita desta instância (ou TTL, para escritas de outros processos).
+
         Returns:
             Dicionário com métricas calculadas
         """
-        enqueue_latencies = self._metrics["enqueue_latency_ms"]
-        dequeue_latencies = self._metrics["dequeue_latency_ms"]
+        cached = self._snapshot.get()
+        if cached is not None:
+            return cached
 
-        return {
+        metrics = {
             "queue_size": self.size(),
             "enqueue_count": self._metrics["enqueue_count"],
             "dequeue_count": self._metrics["dequeue_count"],
             "complete_count": self._metrics["complete_count"],
             "fail_count": self._metrics["fail_count"],
-            "enqueue_latency_avg_ms": self._avg(enqueue_latencies),
-            "enqueue_latency_p95_ms": self._percentile(enqueue_latencies, 95),
-            "dequeue_latency_avg_ms": self._avg(dequeue_latencies),
-            "dequeue_latency_p95_ms": self._percentile(dequeue_latencies, 95),
+            "enqueue_latency_avg_ms": self._enqueue_latency.mean(),
+            "enqueue_latency_p95_ms": self._enqueue_latency.percentile(95),
+            "dequeue_latency_avg_ms": self._dequeue_latency.mean(),
+            "dequeue_latency_p95_ms": self._dequeue_latency.percentile(95),
             "jobs_per_hour": self._calculate_jobs_per_hour(),
             "backlog_age_seconds": self._calculate_backlog_age(),
             "disk_usage_mb": self._calculate_disk_usage(),
         }
+        self._snapshot.put(metrics)
+        return metrics
 
     def _load_queue(self) -> list[str]:
         """Carrega fila do arquivo."""
@@ -401,108 +584,92 @@ class FileBasedJobQueue(JobQueuePort):
         temp_file.replace(self.queue_file)
 
     def _load_metrics(self) -> None:
-        """Carrega métricas persistidas."""
+        """
+        Carrega métricas persistidas.
+
+        Aceita o formato antigo (listas enqueue_latency_ms/dequeue_latency_ms
+        e sem completed_per_hour): as listas viram histogramas e as
+        conclusões por hora são reconstruídas uma única vez de completed/.
+        """
+        data: dict[str, Any] = {}
         if self.metrics_file.exists():
             try:
-                self._metrics = json.loads(self.metrics_file.read_text(encoding="utf-8"))
+                data = json.loads(self.metrics_file.read_text(encoding="utf-8"))
             except Exception:
-                pass
+                data = {}
+
+        for key in ("enqueue_count", "dequeue_count", "complete_count", "fail_count"):
+            self._metrics[key] = data.get(key, 0)
+
+        self._enqueue_latency = LatencyHistogram.from_dict(
+            data.get("enqueue_latency", data.get("enqueue_latency_ms"))
+        )
+        self._dequeue_latency = LatencyHistogram.from_dict(
+            data.get("dequeue_latency", data.get("dequeue_latency_ms"))
+        )
+
+        if "completed_per_hour" in data:
+            self._metrics["completed_per_hour"] = data["completed_per_hour"]
+        else:
+            self._metrics["completed_per_hour"] = self._scan_completed_per_hour()
 
     def _save_metrics(self) -> None:
         """Salva métricas em arquivo."""
+        data = dict(self._metrics)
+        data["enqueue_latency"] = self._enqueue_latency.to_dict()
+        data["dequeue_latency"] = self._dequeue_latency.to_dict()
+
         temp_file = self.metrics_file.with_suffix(".tmp")
-        temp_file.write_text(json.dumps(self._metrics, indent=2), encoding="utf-8")
+        temp_file.write_text(json.dumps(data, indent=2), encoding="utf-8")
         temp_file.replace(self.metrics_file)
 
     def _job_to_json(self, job: "WebhookJob") -> str:
         """Converte WebhookJob para JSON."""
-        job_dict = {
-            "job_id": job.job_id,
-            "event": {
-                "source": job.event.source.value,
-                "event_type": job.event.event_type,
-                "event_id": job.event.event_id,
-                "payload": job.event.payload,
-                "received_at": job.event.received_at.isoformat(),
-                "signature": job.event.signature,
-            },
-            "status": job.status.value,
-            "worktree_path": job.worktree_path,
-            "branch_name": job.branch_name,
-            "issue_number": job.issue_number,
-            "initial_snapshot": job.initial_snapshot,
-            "final_snapshot": job.final_snapshot,
-            "metadata": job.metadata,
-            "created_at": job.created_at.isoformat(),
-            "started_at": job.started_at.isoformat() if job.started_at else None,
-            "completed_at": job.completed_at.isoformat() if job.completed_at else None,
-            "error_message": job.error_message,
-        }
-        return json.dumps(job_dict, indent=2)
+        return json.dumps(job_to_dict(job), indent=2)
 
     def _job_from_dict(self, data: dict[str, Any]) -> "WebhookJob":
         """Converte dict para WebhookJob."""
-        from core.webhooks.domain import WebhookEvent, WebhookJob, JobStatus, WebhookSource
-
-        event_data = data["event"]
-        event = WebhookEvent(
-            source=WebhookSource(event_data["source"]),
-            event_type=event_data["event_type"],
-            event_id=event_data["event_id"],
-            payload=event_data["payload"],
-            received_at=datetime.fromisoformat(event_data["received_at"]),
-            signature=event_data.get("signature"),
-        )
+        return job_from_dict(data)
 
-        return WebhookJob(
-            job_id=data["job_id"],
-            event=event,
-            status=JobStatus(data["status"]),
-            worktree_path=data.get("worktree_path"),
-            branch_name=data.get("branch_name"),
-            issue_number=data.get("issue_number"),
-            initial_snapshot=data.get("initial_snapshot"),
-            final_snapshot=data.get("final_snapshot"),
-            metadata=data.get("metadata", {}),
-            created_at=datetime.fromisoformat(data["created_at"]),
-            started_at=datetime.fromisoformat(data["started_at"]) if data.get("started_at") else None,
-            completed_at=datetime.fromisoformat(data["completed_at"]) if data.get("completed_at") else None,
-            error_message=data.get("error_message"),
-        )
+    def _record_completion(self) -> None:
+        """Incrementa o bucket da hora atual e descarta horas fora da janela."""
+        buckets = self._metrics["completed_per_hour"]
+        current_hour = int(time.time() // 3600)
+        key = str(current_hour)
+        buckets[key] = buckets.get(key, 0) + 1
 
-    def _avg(self, values: list[float]) -> float:
-        """Calcula média."""
-        return sum(values) / len(values) if values else 0.0
+        oldest = current_hour - THROUGHPUT_WINDOW_HOURS
+        for hour in [hour for hour in buckets if int(hour) <= oldest]:
+            del buckets[hour]
 
-    def _percentile(self, values: list[float], p: int) -> float:
-        """Calcula percentil."""
-        if not values:
-            return 0.0
-        values_sorted = sorted(values)
-        index = int(len(values_sorted) * p / 100)
-        return values_sorted[min(index, len(values_sorted) - 1)]
+    def _scan_completed_per_hour(self) -> dict[str, int]:
+        """Reconstrói conclusões por hora a partir de completed/ (migração)."""
+        buckets: dict[str, int] = {}
+        oldest = time.time() - THROUGHPUT_WINDOW_HOURS * 3600
 
-    def _calculate_jobs_per_hour(self) -> float:
-        """Calcula throughput médio (jobs/hora) nas últimas 24h."""
-        if not self.completed_dir.exists():
-            return 0.0
-
-        now = time.time()
-        last_24h = now - 86400
-
-        count = 0
         for job_file in self.completed_dir.glob("*.json"):
             try:
                 job_data = json.loads(job_file.read_text(encoding="utf-8"))
                 completed_at = job_data.get("completed_at")
                 if completed_at:
                     completed_time = datetime.fromisoformat(completed_at).timestamp()
-                    if completed_time > last_24h:
-                        count += 1
+                    if completed_time > oldest:
+                        key = str(int(completed_time // 3600))
+                        buckets[key] = buckets.get(key, 0) + 1
             except Exception:
                 continue
 
-        return count / 24  # jobs por hora (média)
+        return buckets
+
+    def _calculate_jobs_per_hour(self) -> float:
+        """Calcula throughput médio (jobs/hora) nas últimas 24h."""
+        oldest = int(time.time() // 3600) - THROUGHPUT_WINDOW_HOURS
+        count = sum(
+            completed
+            for hour, completed in self._metrics["completed_per_hour"].items()
+            if int(hour) > oldest
+        )
+        return count / THROUGHPUT_WINDOW_HOURS  # jobs por hora (média)
 
     def _calculate_backlog_age(self) -> float:
         """Calcula idade do job mais antigo na fila (segundos)."""
@@ -527,14 +694,21 @@ class FileBasedJobQueue(JobQueuePort):
         return 0.0
 
     def _calculate_disk_usage(self) -> float:
-        """Calcula uso de disco em MB."""
+        """Calcula uso de disco em MB (em cache por DISK_USAGE_TTL_SECONDS)."""
+        now = time.monotonic()
+        if now < self._disk_usage_expires_at:
+            return self._disk_usage_mb
+
         total_size = 0
         for file_path in self.queue_dir.rglob("*.json"):
             try:
                 total_size += file_path.stat().st_size
             except Exception:
                 continue
-        return total_size / (1024 * 1024)
+
+        self._disk_usage_mb = total_size / (1024 * 1024)
+        self._disk_usage_expires_at = now + DISK_USAGE_TTL_SECONDS
+        return self._disk_usage_mb
 
     async def list_jobs(
         self,
@@ -639,5 +813,70 @@ class FileBasedJobQueue(JobQueuePort):
                     continue
 
 
+def job_to_dict(job: "WebhookJob") -> dict[str, Any]:
+    """
+    Serializa WebhookJob para dict JSON-compatível.
+
+    Formato compartilhado pelos adapters baseados em arquivo
+    (FileBasedJobQueue, LogStructuredJobQueue).
+    """
+    job_dict = {
+        "job_id": job.job_id,
+        "event": {
+            "source": job.event.source.value,
+            "event_type": job.event.event_type,
+            "event_id": job.event.event_id,
+            "payload": job.event.payload,
+            "received_at": job.event.received_at.isoformat(),
+            "signature": job.event.signature,
+            "delivery_id": job.event.delivery_id,
+        },
+        "status": job.status.value,
+        "worktree_path": job.worktree_path,
+        "branch_name": job.branch_name,
+        "issue_number": job.issue_number,
+        "initial_snapshot": job.initial_snapshot,
+        "final_snapshot": job.final_snapshot,
+        "metadata": job.metadata,
+        "created_at": job.created_at.isoformat(),
+        "started_at": job.started_at.isoformat() if job.started_at else None,
+        "completed_at": job.completed_at.isoformat() if job.completed_at else None,
+        "error_message": job.error_message,
+    }
+    return job_dict
+
+
+def job_from_dict(data: dict[str, Any]) -> "WebhookJob":
+    """Reconstrói WebhookJob a partir do dict gerado por job_to_dict()."""
+    from core.webhooks.domain import WebhookEvent, WebhookJob, JobStatus, WebhookSource
+
+    event_data = data["event"]
+    event = WebhookEvent(
+        source=WebhookSource(event_data["source"]),
+        event_type=event_data["event_type"],
+        event_id=event_data["event_id"],
+        payload=event_data["payload"],
+        received_at=datetime.fromisoformat(event_data["received_at"]),
+        signature=event_data.get("signature"),
+        delivery_id=event_data.get("delivery_id"),
+    )
+
+    return WebhookJob(
+        job_id=data["job_id"],
+        event=event,
+        status=JobStatus(data["status"]),
+        worktree_path=data.get("worktree_path"),
+        branch_name=data.get("branch_name"),
+        issue_number=data.get("issue_number"),
+        initial_snapshot=data.get("initial_snapshot"),
+        final_snapshot=data.get("final_snapshot"),
+        metadata=data.get("metadata", {}),
+        created_at=datetime.fromisoformat(data["created_at"]),
+        started_at=datetime.fromisoformat(data["started_at"]) if data.get("started_at") else None,
+        completed_at=datetime.fromisoformat(data["completed_at"]) if data.get("completed_at") else None,
+        error_message=data.get("error_message"),
+    )
+
+
 # Import para manter compatibilidade
 InMemoryJobQueue = FileBasedJobQueue
@@ -13,16 +13,16 @@ Para produção (Phase 3), migrar para RedisJobQueue.
 """
 from __future__ import annotations
 
-import asyncio
 from collections import deque
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable
 
 if TYPE_CHECKING:
     from core.webhooks.domain import WebhookJob
     from core.webhooks.ports.job_queue_port import JobQueuePort
 
 from core.webhooks.ports.job_queue_port import QueueError, JobQueuePort
+from infra.webhooks.adapters.job_notifier import JobNotifier
 
 
 class InMemoryJobQueue(JobQueuePort):
@@ -34,7 +34,7 @@ class InMemoryJobQueue(JobQueuePort):
     Attributes:
         _queue: Fila de jobs aguardando processamento
         _jobs: Dicionário de todos os jobs por ID
-        _queue_event: Evento para sinalizar novos jobs
+        _notifier: Canal para sinalizar novos jobs (seguro entre loops)
         _delivery_ids: Dict de delivery_id → timestamp (para TTL)
     """
 
@@ -47,7 +47,8 @@ class InMemoryJobQueue(JobQueuePort):
         """
         self._queue: deque[WebhookJob] = deque()
         self._jobs: dict[str, WebhookJob] = {}
-        self._queue_event = asyncio.Event()
+        self._notifier = JobNotifier()
+        self._dequeue_version = self._notifier.version
         self._delivery_ids: dict[str, datetime] = {}  # delivery_id → timestamp
         self._ttl = timedelta(hours=ttl_hours)
 
@@ -70,6 +71,40 @@ class InMemoryJobQueue(JobQueuePort):
         # Cleanup de deliveries expirados antes de processar
         self._cleanup_expired_deliveries()
 
+        self._add(job)
+        self._notifier.notify()  # Acorda workers aguardando
+
+        return job.job_id
+
+    async def enqueue_many(self, jobs: list["WebhookJob"]) -> list[str]:
+        """
+        Adiciona lote de jobs à fila (uma única notificação aos workers).
+
+        Jobs com delivery_id já registrado (ou repetido no lote) são ignorados.
+
+        Args:
+            jobs: Jobs a enfileirar (ordem preservada)
+
+        Returns:
+            job_ids efetivamente enfileirados
+
+        Raises:
+            QueueError: Se algum job_id já existe (nenhum job é adicionado)
+        """
+        new_jobs = await self._filter_new_deliveries(jobs)
+        for job in new_jobs:
+            if job.job_id in self._jobs:
+                raise QueueError(f"Job {job.job_id} já existe na fila")
+
+        for job in new_jobs:
+            self._add(job)
+        if new_jobs:
+            self._notifier.notify()
+
+        return [job.job_id for job in new_jobs]
+
+    def _add(self, job: "WebhookJob") -> None:
+        """Insere job na fila e registra seu delivery_id."""
         self._queue.append(job)
         self._jobs[job.job_id] = job
 
@@ -77,11 +112,6 @@ class InMemoryJobQueue(JobQueuePort):
         if job.event.delivery_id:
             self._delivery_ids[job.event.delivery_id] = datetime.utcnow()
 
-        self._queue_event.set()  # Sinaliza que há jobs
-        self._queue_event.clear()
-
-        return job.job_id
-
     async def dequeue(self) -> "WebhookJob | None":
         """
         Remove próximo job da fila.
@@ -93,6 +123,7 @@ class InMemoryJobQueue(JobQueuePort):
             Este método não bloqueia. Para wait com timeout,
             use wait_for_dequeue().
         """
+        self._dequeue_version = self._notifier.version
         if not self._queue:
             return None
         return self._queue.popleft()
@@ -107,13 +138,26 @@ class InMemoryJobQueue(JobQueuePort):
         Returns:
             Próximo job ou None se timeout
         """
-        try:
-            if not self._queue:
-                # Aguarda sinal de novo job
-                await asyncio.wait_for(self._queue_event.wait(), timeout)
-            return await self.dequeue()
-        except asyncio.TimeoutError:
+        job = await self.dequeue()
+        if job is not None:
+            return job
+
+        # Aguarda sinal de novo job
+        if not await self._notifier.wait(timeout, since=self._dequeue_version):
             return None
+        return await self.dequeue()
+
+    async def wait_for_job(self, timeout_seconds: float) -> bool:
+        """
+        Aguarda notificação de novo job.
+
+        Args:
+            timeout_seconds: Tempo máximo de espera
+
+        Returns:
+            True se houve enqueue, False se timeout
+        """
+        return await self._notifier.wait(timeout_seconds, since=self._dequeue_version)
 
     async def get_job(self, job_id: str) -> "WebhookJob | None":
         """
@@ -214,6 +258,19 @@ class InMemoryJobQueue(JobQueuePort):
 
         return delivery_id in self._delivery_ids
 
+    async def exists_many_by_delivery(self, delivery_ids: Iterable[str]) -> set[str]:
+        """
+        Versão em lote de exists_by_delivery().
+
+        Args:
+            delivery_ids: IDs de entrega a verificar
+
+        Returns:
+            Subconjunto dos delivery_ids que já existem
+        """
+        self._cleanup_expired_deliveries()
+        return {delivery_id for delivery_id in delivery_ids if delivery_id in self._delivery_ids}
+
     async def list_jobs(
         self,
         limit: int = 100,
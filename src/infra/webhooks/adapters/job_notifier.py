@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+"""
+Job Notifier - canal de notificação push para filas de jobs.
+
+Substitui o polling do worker: enqueue() chama notify() e qualquer
+worker aguardando em wait() acorda imediatamente.
+
+O worker roda no event loop da API (runtime/bootstrap/app.py), mas
+handlers Sky-RPC síncronos enfileiram a partir de threads com loop
+próprio (asyncio.run), por isso o notifier não usa asyncio.Condition
+(presa a um único loop): cada waiter registra um Future do seu próprio
+loop e é acordado via call_soon_threadsafe.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from pathlib import Path
+from threading import Lock
+from typing import Callable
+
+
+class JobNotifier:
+    """
+    Sinal de "novo job disponível" seguro entre threads e event loops.
+
+    Usa um contador de versão para evitar wakeups perdidos: o consumidor
+    lê `version` ANTES de tentar o dequeue e passa o valor para wait();
+    se houve notify() no meio tempo, wait() retorna imediatamente.
+
+    Para enqueues feitos por outros processos (sem notify() local),
+    wait() aceita um `probe` barato (ex: PRAGMA data_version, mtime de
+    arquivo) executado a cada probe_interval segundos.
+
+    Uso:
+        version = notifier.version
+        job = try_dequeue()
+        if job is None:
+            await notifier.wait(timeout=1.0, since=version)
+    """
+
+    # Registro por chave (ex: diretório da fila) para compartilhar entre instâncias
+    _registry: dict[str, "JobNotifier"] = {}
+    _registry_lock = Lock()
+
+    def __init__(self) -> None:
+        """Inicializa notifier sem waiters."""
+        self._lock = Lock()
+        self._version = 0
+        self._waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+
+    @classmethod
+    def for_key(cls, key: str | Path) -> "JobNotifier":
+        """
+        Retorna notifier compartilhado para a chave, criando se necessário.
+
+        Args:
+            key: Identificador do recurso da fila (caminho, nome, ...)
+
+        Returns:
+            JobNotifier compartilhado
+        """
+        key = str(key)
+        with cls._registry_lock:
+            notifier = cls._registry.get(key)
+            if notifier is None:
+                notifier = cls()
+                cls._registry[key] = notifier
+            return notifier
+
+    @property
+    def version(self) -> int:
+        """Número de notificações emitidas até agora."""
+        return self._version
+
+    def notify(self) -> None:
+        """
+        Sinaliza novo job e acorda todos os waiters.
+
+        Pode ser chamado de qualquer thread ou event loop.
+        """
+        with self._lock:
+            self._version += 1
+            waiters, self._waiters = self._waiters, []
+
+        for loop, future in waiters:
+            try:
+                loop.call_soon_threadsafe(_resolve, future)
+            except RuntimeError:
+                # Loop do waiter já foi fechado
+                continue
+
+    async def wait(
+        self,
+        timeout: float | None,
+        since: int | None = None,
+        probe: Callable[[], bool] | None = None,
+        probe_interval: float = 0.25,
+    ) -> bool:
+        """
+        Aguarda notificação de novo job.
+
+        Args:
+            timeout: Tempo máximo de espera em segundos (None = sem limite)
+            since: Versão lida antes do último dequeue vazio (evita wakeup perdido)
+            probe: Checagem barata de mudanças externas (outros processos)
+            probe_interval: Intervalo entre execuções do probe
+
+        Returns:
+            True se houve notificação (ou probe detectou mudança),
+            False se atingiu o timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        loop = asyncio.get_running_loop()
+
+        while True:
+            future = loop.create_future()
+            with self._lock:
+                if since is not None and self._version != since:
+                    return True
+                self._waiters.append((loop, future))
+
+            slice_timeout = probe_interval if probe is not None else None
+            if deadline is not None:
+                remaining = max(deadline - time.monotonic(), 0)
+                slice_timeout = remaining if slice_timeout is None else min(remaining, slice_timeout)
+
+            try:
+                await asyncio.wait_for(future, timeout=slice_timeout)
+                return True
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                self._discard(loop, future)
+
+            if probe is not None and probe():
+                return True
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+
+    def _discard(self, loop: asyncio.AbstractEventLoop, future: asyncio.Future) -> None:
+        """Remove waiter (timeout/cancelamento)."""
+        with self._lock:
+            try:
+                self._waiters.remove((loop, future))
+            except ValueError:
+                pass
+
+
+def _resolve(future: asyncio.Future) -> None:
+    """Resolve future no loop dono (ignora se já cancelado)."""
+    if not future.done():
+        future.set_result(True)
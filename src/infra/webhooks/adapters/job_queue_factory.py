@@ -17,7 +17,7 @@ from core.webhooks.ports.job_queue_port import JobQueuePort
 logger = logging.getLogger(__name__)
 
 # Type alias para os providers disponíveis
-JobQueueProvider = Literal["dragonfly", "redis", "sqlite", "file"]
+JobQueueProvider = Literal["dragonfly", "redis", "sqlite", "file", "journal"]
 
 
 class JobQueueFactory:
@@ -29,6 +29,7 @@ class JobQueueFactory:
     - dragonfly: RedisJobQueue (DragonflyDB)
     - redis: RedisJobQueue (tradicional)
     - file: FileBasedJobQueue (fallback local)
+    - journal: LogStructuredJobQueue (arquivos, journal append-only)
     """
 
     @staticmethod
@@ -40,7 +41,7 @@ class JobQueueFactory:
         Cria instância de JobQueue baseada no provider.
 
         Args:
-            provider: Tipo de provider ("sqlite", "dragonfly", "redis", "file")
+            provider: Tipo de provider ("sqlite", "dragonfly", "redis", "file", "journal")
             **kwargs: Argumentos específicos do provider
 
         Returns:
@@ -58,6 +59,8 @@ class JobQueueFactory:
             return JobQueueFactory._create_redis(**kwargs)
         elif provider == "file":
             return JobQueueFactory._create_file(**kwargs)
+        elif provider == "journal":
+            return JobQueueFactory._create_journal(**kwargs)
         else:
             raise ValueError(f"Provider inválido: {provider}")
 
@@ -99,6 +102,16 @@ class JobQueueFactory:
             logger.error(f"FileBasedJobQueue não disponível: {e}")
             raise
 
+    @staticmethod
+    def _create_journal(**kwargs) -> JobQueuePort:
+        """Cria LogStructuredJobQueue (arquivos com journal append-only)."""
+        from infra.webhooks.adapters.log_structured_job_queue import (
+            LogStructuredJobQueue,
+        )
+
+        logger.info("Usando LogStructuredJobQueue como Job Queue provider")
+        return LogStructuredJobQueue(**kwargs)
+
     @staticmethod
     def create_from_env() -> JobQueuePort:
         """
@@ -145,6 +158,8 @@ class JobQueueFactory:
                     os.getenv("SQLITE_TIMEOUT", "5.0")
                 ),
             }
+        elif provider == "journal":
+            kwargs = {"queue_dir": os.getenv("SKYBRIDGE_QUEUE_DIR")}
         elif provider in ("dragonfly", "redis"):
             kwargs = {
                 "host": os.getenv("DRAGONFLY_HOST", "localhost"),
@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+"""
+Journal Webhook Inbox Adapter.
+
+Inbox de entregas de webhook em journal append-only (JSON lines):
+
+    {"op": "delivery", "delivery": {...}}   # entrega aceita (fsync)
+    {"op": "ack", "delivery_id": "..."}     # intake terminou
+
+Appends concorrentes são agrupados (group commit): enquanto um fsync
+está em andamento, novas entregas se acumulam e vão juntas no próximo
+write+fsync. A latência do endpoint fica limitada a ~1 fsync.
+
+Uma entrega só aparece em pending() depois do fsync do seu lote: o
+intake nunca processa (e confirma) algo que um crash ainda pode apagar.
+
+Acks não fazem fsync: perder um ack só faz a entrega ser reprocessada
+no próximo startup (GitHub deduplica por X-GitHub-Delivery).
+
+Quando o journal passa de compact_threshold registros, é reescrito só
+com as entregas pendentes (write em arquivo temporário + os.replace).
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from core.webhooks.domain import WebhookDelivery
+from core.webhooks.ports.webhook_inbox_port import WebhookInboxPort
+
+logger = logging.getLogger(__name__)
+
+
+class JournalWebhookInbox(WebhookInboxPort):
+    """
+    Inbox durável em arquivo de journal.
+
+    O índice de pendentes fica em memória (reconstruído do journal no
+    construtor). Escritas acontecem em thread (asyncio.to_thread) para não
+    bloquear o event loop durante o fsync.
+
+    Attributes:
+        path: Arquivo do journal
+        compact_threshold: Registros no journal antes de compactar
+    """
+
+    def __init__(self, path: str | Path, compact_threshold: int = 1000) -> None:
+        """
+        Inicializa inbox e recupera entregas pendentes do journal.
+
+        Args:
+            path: Arquivo do journal
+            compact_threshold: Registros no journal antes de compactar
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.compact_threshold = compact_threshold
+
+        self._pending: OrderedDict[str, WebhookDelivery] = OrderedDict()
+        self._records = 0
+        # (linha, future do append, entrega) — acks não têm future nem entrega
+        self._batch: list[tuple[str, asyncio.Future | None, WebhookDelivery | None]] = []
+        self._flusher: asyncio.Task | None = None
+        self._lock = threading.Lock()  # Serializa escritas no arquivo
+
+        self._replay()
+
+    # ------------------------------------------------------------------
+    # WebhookInboxPort
+    # ------------------------------------------------------------------
+
+    async def append(self, delivery: WebhookDelivery) -> None:
+        """
+        Persiste a entrega (retorna após write+fsync do lote).
+
+        Args:
+            delivery: Entrega recebida
+
+        Raises:
+            OSError: Se falhar ao persistir
+        """
+        line = json.dumps({"op": "delivery", "delivery": delivery.to_dict()}, ensure_ascii=False)
+        future = asyncio.get_running_loop().create_future()
+        # Entra no índice de pendentes só após o fsync (em _flush)
+        self._submit(line, future, delivery)
+        await future
+
+    async def ack(self, delivery_id: str) -> None:
+        """
+        Marca a entrega como processada (sem aguardar fsync).
+
+        Args:
+            delivery_id: ID da entrega
+        """
+        if self._pending.pop(delivery_id, None) is None:
+            return
+        self._submit(json.dumps({"op": "ack", "delivery_id": delivery_id}), None, None)
+
+    def pending(self) -> list[WebhookDelivery]:
+        """Entregas já duráveis e ainda não confirmadas, em ordem de chegada."""
+        return list(self._pending.values())
+
+    # ------------------------------------------------------------------
+    # Group commit
+    # ------------------------------------------------------------------
+
+    def _submit(
+        self,
+        line: str,
+        future: asyncio.Future | None,
+        delivery: WebhookDelivery | None,
+    ) -> None:
+        """Adiciona registro ao próximo lote e garante um flusher ativo."""
+        loop = asyncio.get_running_loop()
+        self._batch.append((line, future, delivery))
+        if self._flusher is None or self._flusher.done() or self._flusher.get_loop() is not loop:
+            self._flusher = loop.create_task(self._flush())
+
+    async def _flush(self) -> None:
+        """Grava lotes até esvaziar (um write+fsync por lote)."""
+        while self._batch:
+            batch, self._batch = self._batch, []
+            durable = any(future is not None for _, future, _ in batch)
+            try:
+                await asyncio.to_thread(self._write, [line for line, _, _ in batch], durable)
+            except OSError as e:
+                logger.error(f"Falha ao gravar inbox de webhooks {self.path}: {e}")
+                for _, future, _ in batch:
+                    if future is not None and not future.done():
+                        future.set_exception(e)
+                continue
+
+            # Lote durável: entregas passam a ser visíveis ao intake (mesmo
+            # que o caller do append tenha sido cancelado durante o fsync)
+            for _, future, delivery in batch:
+                if delivery is not None:
+                    self._pending[delivery.delivery_id] = delivery
+                if future is not None and not future.done():
+                    future.set_result(None)
+
+            # O snapshot contém só entregas já duráveis; linhas em voo (lotes
+            # submetidos durante a reescrita) são anexadas depois dela
+            if self._records >= self.compact_threshold and not self._batch:
+                snapshot = [
+                    json.dumps({"op": "delivery", "delivery": d.to_dict()}, ensure_ascii=False)
+                    for d in self._pending.values()
+                ]
+                try:
+                    await asyncio.to_thread(self._rewrite, snapshot)
+                except OSError as e:
+                    logger.warning(f"Falha ao compactar inbox de webhooks {self.path}: {e}")
+
+    def _write(self, lines: list[str], durable: bool) -> None:
+        """Append de um lote (em thread)."""
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write("".join(line + "\n" for line in lines))
+                f.flush()
+                if durable:
+                    os.fsync(f.fileno())
+            self._records += len(lines)
+
+    def _rewrite(self, lines: list[str]) -> None:
+        """Substitui o journal pelas entregas pendentes (em thread)."""
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        with self._lock:
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write("".join(line + "\n" for line in lines))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.path)
+            self._records = len(lines)
+        logger.debug(f"Inbox de webhooks compactado: {len(lines)} entregas pendentes")
+
+    # ------------------------------------------------------------------
+    # Recuperação
+    # ------------------------------------------------------------------
+
+    def _replay(self) -> None:
+        """Reconstrói pendentes a partir do journal (ignora linha final truncada)."""
+        if not self.path.exists():
+            return
+
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Registro inválido ignorado no inbox de webhooks {self.path}")
+                    continue
+                self._records += 1
+                if record.get("op") == "delivery":
+                    delivery = WebhookDelivery.from_dict(record["delivery"])
+                    self._pending[delivery.delivery_id] = delivery
+                elif record.get("op") == "ack":
+                    self._pending.pop(record.get("delivery_id"), None)
+
+        if self._pending:
+            logger.info(f"Inbox de webhooks: {len(self._pending)} entregas pendentes recuperadas")
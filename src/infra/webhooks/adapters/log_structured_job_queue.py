@@ -0,0 +1,1015 @@
+# -*- coding: utf-8 -*-
+"""
+Log-Structured Job Queue Adapter.
+
+Variante journal do FileBasedJobQueue: em vez de reescrever queue.json a
+cada enqueue/dequeue (O(n) de I/O) e varrer completed/ para métricas, cada
+operação vira um registro JSON appendado ao segmento ativo do journal.
+
+Esta implementação:
+- Enqueue/dequeue/complete em O(1) (um append + atualização do índice)
+- Índice em memória reconstruído no startup (replay do journal)
+- Compactação periódica: segmento novo contém apenas jobs vivos
+- Contadores mantidos incrementalmente (métricas sem varrer disco)
+- Múltiplos processos: lock de arquivo + tail incremental do journal
+- I/O do journal (append, fsync, flock) roda em thread (asyncio.to_thread),
+  fora do event loop
+
+Estrutura de diretórios:
+    workspace/skybridge/fila/
+    ├── journal/
+    │   └── segment-000042.log   # enqueue/claim/ack/... (JSON lines)
+    ├── done.log                 # Registro completo de jobs finalizados
+    └── journal.lock             # Lock entre processos (fcntl)
+
+Limitações:
+- done.log cresce indefinidamente (arquivo de histórico, como completed/)
+- Lock entre processos só em POSIX; no Windows apenas entre threads
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import re
+import time
+from collections import Counter, OrderedDict, deque
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+if TYPE_CHECKING:
+    from core.webhooks.domain import WebhookJob
+
+from core.webhooks.domain import JobStatus
+from core.webhooks.ports.job_queue_port import JobQueuePort, QueueError
+from infra.webhooks.adapters.file_based_job_queue import job_from_dict, job_to_dict
+from infra.webhooks.adapters.job_notifier import JobNotifier
+from infra.webhooks.adapters.queue_metrics import LatencyHistogram
+
+_SEGMENT_RE = re.compile(r"^segment-(\d{6})\.log$")
+
+
+class LogStructuredJobQueue(JobQueuePort):
+    """
+    Fila de jobs persistida em journal append-only.
+
+    Tipos de registro do journal:
+    - enqueue:   job completo entra na fila
+    - claim:     job reservado por um worker (lease)
+    - heartbeat: lease renovado
+    - requeue:   job devolvido à fila (lease expirado)
+    - metadata:  merge de metadata de job vivo
+    - ack:       job finalizado (dados completos vão para done.log)
+    - counters:  base dos contadores (primeiro registro de um segmento compactado)
+    - snapshot:  estado de job vivo copiado pela compactação
+
+    Attributes:
+        queue_dir: Diretório base da fila
+        compact_threshold: Registros no segmento antes de compactar
+        lease_seconds: Duração do lease de um job reservado
+        max_attempts: Tentativas antes de falhar job com lease expirado
+    """
+
+    def __init__(
+        self,
+        queue_dir: str | None = None,
+        compact_threshold: int = 1000,
+        lease_seconds: float = 600.0,
+        max_attempts: int = 3,
+        fsync: bool = False,
+    ) -> None:
+        """
+        Inicializa fila e reconstrói o índice a partir do journal.
+
+        Args:
+            queue_dir: Diretório da fila (None = usa workspace atual do contexto)
+            compact_threshold: Registros no segmento ativo antes de compactar
+            lease_seconds: Duração padrão do lease de jobs reservados
+            max_attempts: Máximo de claims antes de falhar job abandonado
+            fsync: Força fsync a cada append (mais durável, mais lento)
+        """
+        if queue_dir is None:
+            from runtime.config.config import get_workspace_queue_dir
+            queue_dir = str(get_workspace_queue_dir())
+        self.queue_dir = Path(queue_dir)
+        self.journal_dir = self.queue_dir / "journal"
+        self.done_file = self.queue_dir / "done.log"
+        self.lock_file = self.queue_dir / "journal.lock"
+        self.journal_dir.mkdir(parents=True, exist_ok=True)
+
+        self.compact_threshold = compact_threshold
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self._fsync = fsync
+
+        # Serializa threads do processo; fcntl serializa processos
+        self._lock = Lock()
+
+        # Wakeup push compartilhado por instâncias do mesmo diretório;
+        # enqueues de outros processos são detectados pelo tamanho do segmento
+        self._notifier = JobNotifier.for_key(self.queue_dir.resolve())
+        self._dequeue_version = self._notifier.version
+        self._journal_signature: tuple[int, int] = (0, 0)
+
+        # Latências são voláteis (histogramas streaming deste processo)
+        self._enqueue_latency = LatencyHistogram()
+        self._dequeue_latency = LatencyHistogram()
+
+        self._reset_index()
+        self._done: dict[str, int] = {}  # job_id → offset em done.log
+        self._done_delivery_ids: set[str] = set()
+        self._done_offset = 0
+        self._completions: deque[float] = deque()  # timestamps (últimas 24h)
+
+        with self._exclusive():
+            self._load_latest_segment()
+
+    # ------------------------------------------------------------------
+    # JobQueuePort
+    # ------------------------------------------------------------------
+
+    async def enqueue(self, job: "WebhookJob") -> str:
+        """
+        Enfileira job (um append no journal).
+
+        Args:
+            job: Job a ser enfileirado
+
+        Returns:
+            job_id do job enfileirado
+
+        Raises:
+            QueueError: Se job_id já existe ou falhar ao persistir
+        """
+        start = time.time()
+        await asyncio.to_thread(self._enqueue_sync, job)
+        self._enqueue_latency.record((time.time() - start) * 1000)
+        self._notifier.notify()  # Acorda workers aguardando
+        return job.job_id
+
+    def _enqueue_sync(self, job: "WebhookJob") -> None:
+        """Corpo síncrono de enqueue() (executado em thread)."""
+        try:
+            with self._exclusive():
+                if job.job_id in self._jobs or job.job_id in self._done:
+                    raise QueueError(f"Job {job.job_id} já existe na fila")
+                self._append({"op": "enqueue", "job": job_to_dict(job)})
+        except QueueError:
+            raise
+        except Exception as e:
+            raise QueueError(f"Falha ao enfileirar job {job.job_id}: {e}") from e
+
+    async def dequeue(self) -> "WebhookJob | None":
+        """
+        Reserva próximo job da fila (FIFO) com lease.
+
+        Returns:
+            Próximo job ou None se fila vazia
+        """
+        start = time.time()
+        self._dequeue_version = self._notifier.version
+
+        data = await asyncio.to_thread(self._claim_sync)
+        if data is None:
+            return None
+
+        self._dequeue_latency.record((time.time() - start) * 1000)
+        return job_from_dict(data)
+
+    def _claim_sync(self) -> dict[str, Any] | None:
+        """Reserva o próximo job pendente (executado em thread)."""
+        try:
+            with self._exclusive():
+                if not self._pending:
+                    return None
+
+                job_id = next(iter(self._pending))
+                self._append({
+                    "op": "claim",
+                    "job_id": job_id,
+                    "at": datetime.utcnow().isoformat(),
+                    "lease_expires_at": time.time() + self.lease_seconds,
+                })
+                return dict(self._jobs[job_id])
+        except Exception as e:
+            raise QueueError(f"Falha ao desenfileirar: {e}") from e
+
+    async def get_job(self, job_id: str) -> "WebhookJob | None":
+        """
+        Busca job por ID em qualquer estado.
+
+        Jobs vivos vêm do índice; finalizados são lidos de done.log por
+        offset (um seek, sem varrer o arquivo).
+
+        Args:
+            job_id: ID do job
+
+        Returns:
+            Job encontrado ou None
+        """
+        data = await asyncio.to_thread(self._find_job_data, job_id)
+        return job_from_dict(data) if data else None
+
+    async def complete(self, job_id: str, result: dict | None = None) -> None:
+        """
+        Marca job como completo.
+
+        Args:
+            job_id: ID do job
+            result: Resultado opcional do processamento
+        """
+        try:
+            await asyncio.to_thread(self._finish_locked, {job_id: (result, None)}, JobStatus.COMPLETED)
+        except Exception as e:
+            raise QueueError(f"Falha ao completar job {job_id}: {e}") from e
+
+    async def fail(self, job_id: str, error: str) -> None:
+        """
+        Marca job como falhou.
+
+        Args:
+            job_id: ID do job
+            error: Mensagem de erro
+        """
+        try:
+            await asyncio.to_thread(self._finish_locked, {job_id: (None, error)}, JobStatus.FAILED)
+        except Exception as e:
+            raise QueueError(f"Falha ao marcar job {job_id} como falhou: {e}") from e
+
+    async def enqueue_many(self, jobs: list["WebhookJob"]) -> list[str]:
+        """
+        Enfileira lote de jobs com um único append no journal.
+
+        Jobs com delivery já conhecido (ou repetido no lote) são ignorados.
+
+        Args:
+            jobs: Jobs a enfileirar (ordem preservada)
+
+        Returns:
+            job_ids efetivamente enfileirados
+
+        Raises:
+            QueueError: Se algum job_id já existe ou falhar ao persistir
+        """
+        start = time.time()
+        new_jobs = await asyncio.to_thread(self._enqueue_many_sync, jobs)
+        if new_jobs:
+            self._enqueue_latency.record((time.time() - start) * 1000)
+            self._notifier.notify()
+        return [job.job_id for job in new_jobs]
+
+    def _enqueue_many_sync(self, jobs: list["WebhookJob"]) -> list["WebhookJob"]:
+        """Corpo síncrono de enqueue_many() (executado em thread)."""
+        try:
+            with self._exclusive():
+                new_jobs = self._filter_known(jobs)
+                for job in new_jobs:
+                    if job.job_id in self._jobs or job.job_id in self._done:
+                        raise QueueError(f"Job {job.job_id} já existe na fila")
+                if new_jobs:
+                    self._append_many([
+                        {"op": "enqueue", "job": job_to_dict(job)} for job in new_jobs
+                    ])
+                return new_jobs
+        except QueueError:
+            raise
+        except Exception as e:
+            raise QueueError(f"Falha ao enfileirar lote de {len(jobs)} jobs: {e}") from e
+
+    async def complete_many(
+        self,
+        job_ids: Iterable[str],
+        results: dict[str, dict] | None = None,
+    ) -> None:
+        """
+        Marca lote de jobs como completos (um append por arquivo).
+
+        Args:
+            job_ids: IDs dos jobs
+            results: Resultado opcional por job_id
+        """
+        results = results or {}
+        outcomes = {job_id: (results.get(job_id), None) for job_id in job_ids}
+        try:
+            await asyncio.to_thread(self._finish_locked, outcomes, JobStatus.COMPLETED)
+        except Exception as e:
+            raise QueueError(f"Falha ao completar lote de jobs: {e}") from e
+
+    async def fail_many(self, errors: dict[str, str]) -> None:
+        """
+        Marca lote de jobs como falhos (um append por arquivo).
+
+        Args:
+            errors: Mensagem de erro por job_id
+        """
+        outcomes = {job_id: (None, error) for job_id, error in errors.items()}
+        try:
+            await asyncio.to_thread(self._finish_locked, outcomes, JobStatus.FAILED)
+        except Exception as e:
+            raise QueueError(f"Falha ao marcar lote de jobs como falhos: {e}") from e
+
+    def size(self) -> int:
+        """
+        Retorna tamanho atual da fila (jobs aguardando).
+
+        Returns:
+            Número de jobs aguardando processamento
+        """
+        with self._exclusive():
+            return len(self._pending)
+
+    async def exists_by_delivery(self, delivery_id: str) -> bool:
+        """
+        Verifica se já existe job com este delivery ID (lookup no índice).
+
+        Args:
+            delivery_id: ID único da entrega do webhook
+
+        Returns:
+            True se job com este delivery_id já existe, False caso contrário
+        """
+        known = await asyncio.to_thread(self._known_deliveries, [delivery_id])
+        return delivery_id in known
+
+    async def exists_many_by_delivery(self, delivery_ids: Iterable[str]) -> set[str]:
+        """
+        Versão em lote de exists_by_delivery() (lookups no índice).
+
+        Args:
+            delivery_ids: IDs de entrega a verificar
+
+        Returns:
+            Subconjunto dos delivery_ids que já existem
+        """
+        return await asyncio.to_thread(self._known_deliveries, list(delivery_ids))
+
+    def _known_deliveries(self, delivery_ids: list[str]) -> set[str]:
+        """delivery_ids já indexados (executado em thread)."""
+        with self._exclusive():
+            return {
+                delivery_id
+                for delivery_id in delivery_ids
+                if delivery_id in self._delivery_ids
+                or delivery_id in self._done_delivery_ids
+            }
+
+    async def update_metadata(self, job_id: str, metadata: dict[str, object]) -> None:
+        """
+        Atualiza metadata de um job.
+
+        Args:
+            job_id: ID do job
+            metadata: Novo metadata (será mesclado com o existente)
+        """
+        await asyncio.to_thread(self._update_metadata_sync, job_id, metadata)
+
+    def _update_metadata_sync(self, job_id: str, metadata: dict[str, object]) -> None:
+        """Corpo síncrono de update_metadata() (executado em thread)."""
+        with self._exclusive():
+            if job_id in self._jobs:
+                self._append({"op": "metadata", "job_id": job_id, "metadata": metadata})
+            elif job_id in self._done:
+                # Job finalizado: nova versão do registro supera a anterior
+                data = self._read_done(self._done[job_id])
+                _merge_metadata(data, metadata)
+                self._append_done(data)
+
+    async def wait_for_job(self, timeout_seconds: float) -> bool:
+        """
+        Aguarda notificação de novo job.
+
+        Enqueues deste processo acordam imediatamente; enqueues de outros
+        processos são detectados via stat do segmento ativo.
+
+        Args:
+            timeout_seconds: Tempo máximo de espera
+
+        Returns:
+            True se um job pode estar disponível, False se timeout
+        """
+        return await self._notifier.wait(
+            timeout_seconds,
+            since=self._dequeue_version,
+            probe=self._journal_changed,
+        )
+
+    async def wait_for_dequeue(self, timeout: float | None = None) -> "WebhookJob | None":
+        """
+        Aguarda até que haja um job disponível e o remove.
+
+        Args:
+            timeout: Tempo máximo de espera em segundos
+
+        Returns:
+            Próximo job ou None se timeout
+        """
+        start = time.time()
+
+        while True:
+            job = await self.dequeue()
+            if job:
+                return job
+
+            if timeout is not None:
+                remaining = timeout - (time.time() - start)
+                if remaining <= 0:
+                    return None
+            else:
+                remaining = 1.0  # Fatia de espera sem timeout
+
+            await self.wait_for_job(remaining)
+
+    async def heartbeat(self, job_id: str, lease_seconds: float | None = None) -> bool:
+        """
+        Renova o lease de um job em processamento.
+
+        Args:
+            job_id: ID do job
+            lease_seconds: Nova duração do lease (None = padrão da fila)
+
+        Returns:
+            True se o job continua reservado
+        """
+        return await asyncio.to_thread(self._heartbeat_sync, job_id, lease_seconds)
+
+    def _heartbeat_sync(self, job_id: str, lease_seconds: float | None) -> bool:
+        """Corpo síncrono de heartbeat() (executado em thread)."""
+        with self._exclusive():
+            data = self._jobs.get(job_id)
+            if not data or data["status"] != JobStatus.PROCESSING.value:
+                return False
+            self._append({
+                "op": "heartbeat",
+                "job_id": job_id,
+                "lease_expires_at": time.time() + (lease_seconds or self.lease_seconds),
+            })
+            return True
+
+    async def requeue_expired_leases(self) -> int:
+        """
+        Devolve à fila jobs com lease expirado.
+
+        Jobs que já atingiram max_attempts são marcados como falhos.
+
+        Returns:
+            Número de jobs recuperados (re-enfileirados ou falhos)
+        """
+        recovered = await asyncio.to_thread(self._requeue_expired_sync)
+        if recovered:
+            self._notifier.notify()
+        return recovered
+
+    def _requeue_expired_sync(self) -> int:
+        """Corpo síncrono de requeue_expired_leases() (executado em thread)."""
+        now = time.time()
+        recovered = 0
+
+        with self._exclusive():
+            expired = [
+                job_id
+                for job_id, data in self._jobs.items()
+                if data["status"] == JobStatus.PROCESSING.value
+                and data.get("_lease_expires_at", now) < now
+            ]
+            for job_id in expired:
+                if self._jobs[job_id].get("_attempts", 0) >= self.max_attempts:
+                    self._finish(
+                        job_id,
+                        JobStatus.FAILED,
+                        error=f"Lease expirado após {self.max_attempts} tentativas",
+                    )
+                else:
+                    self._append({"op": "requeue", "job_id": job_id})
+                recovered += 1
+
+        return recovered
+
+    # ------------------------------------------------------------------
+    # Métricas e listagem
+    # ------------------------------------------------------------------
+
+    def get_metrics(self) -> dict[str, Any]:
+        """
+        Retorna métricas da fila (mesmo formato do FileBasedJobQueue).
+
+        Todos os valores vêm de contadores e do índice em memória; disco
+        só é consultado via stat de dois arquivos.
+
+        Returns:
+            Dicionário com métricas calculadas
+        """
+        with self._exclusive():
+            queue_size = len(self._pending)
+            counters = dict(self._counters)
+            backlog_age = self._backlog_age()
+            jobs_per_hour = self._jobs_per_hour()
+
+        return {
+            "queue_size": queue_size,
+            "enqueue_count": counters.get("enqueue_count", 0),
+            "dequeue_count": counters.get("dequeue_count", 0),
+            "complete_count": counters.get("complete_count", 0),
+            "fail_count": counters.get("fail_count", 0),
+            "enqueue_latency_avg_ms": self._enqueue_latency.mean(),
+            "enqueue_latency_p95_ms": self._enqueue_latency.percentile(95),
+            "dequeue_latency_avg_ms": self._dequeue_latency.mean(),
+            "dequeue_latency_p95_ms": self._dequeue_latency.percentile(95),
+            "jobs_per_hour": jobs_per_hour,
+            "backlog_age_seconds": backlog_age,
+            "disk_usage_mb": self._disk_usage() / (1024 * 1024),
+        }
+
+    async def list_jobs(
+        self,
+        limit: int = 100,
+        status_filter: str | None = None,
+    ) -> list[dict[str, object]]:
+        """
+        Lista jobs da fila para o WebUI.
+
+        Ordem: em processamento, aguardando e depois finalizados (mais
+        recentes primeiro). Finalizados são lidos por offset, então o
+        custo é proporcional a `limit`, não ao histórico.
+
+        Args:
+            limit: Número máximo de jobs a retornar
+            status_filter: Filtrar por status (opcional)
+
+        Returns:
+            Lista de dicionários com dados dos jobs no formato esperado pelo frontend
+        """
+        return await asyncio.to_thread(self._list_jobs_sync, limit, status_filter)
+
+    def _list_jobs_sync(
+        self, limit: int, status_filter: str | None
+    ) -> list[dict[str, object]]:
+        """Corpo síncrono de list_jobs() (executado em thread)."""
+        wanted = status_filter.lower() if status_filter else None
+
+        with self._exclusive():
+            live = sorted(
+                self._jobs.values(),
+                key=lambda data: data["status"] != JobStatus.PROCESSING.value,
+            )
+            done_offsets = list(self._done.items())
+
+        def candidates() -> Iterator[dict[str, Any]]:
+            yield from live
+            for job_id, offset in reversed(done_offsets):
+                yield self._read_done(offset)
+
+        jobs_list: list[dict[str, object]] = []
+        for data in candidates():
+            if len(jobs_list) >= limit:
+                break
+            if wanted and data.get("status") != wanted:
+                continue
+
+            event_data = data.get("event", {})
+            jobs_list.append({
+                "job_id": data.get("job_id", ""),
+                "source": event_data.get("source", "unknown"),
+                "event_type": event_data.get("event_type", "unknown"),
+                "status": data.get("status", "pending").upper(),
+                "created_at": data.get("created_at", ""),
+                "worktree_path": data.get("worktree_path"),
+            })
+
+        return jobs_list
+
+    def compact(self) -> None:
+        """Força compactação do journal (útil para manutenção/testes)."""
+        with self._exclusive():
+            self._compact()
+
+    # ------------------------------------------------------------------
+    # Journal
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def _exclusive(self) -> Iterator[None]:
+        """
+        Acesso exclusivo ao journal, já sincronizado com outros processos.
+
+        Dentro do bloco o índice reflete todos os registros já gravados
+        (inclusive por outros processos).
+        """
+        with self._lock:
+            with open(self.lock_file, "a+b") as lock_fd:
+                if fcntl is not None:
+                    fcntl.flock(lock_fd.fileno(), fcntl.LOCK_EX)
+                try:
+                    self._tail_done()
+                    self._tail_journal()
+                    yield
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(lock_fd.fileno(), fcntl.LOCK_UN)
+
+    def _reset_index(self) -> None:
+        """Zera o estado derivado do journal (jobs vivos e contadores)."""
+        self._jobs: dict[str, dict[str, Any]] = {}
+        self._pending: OrderedDict[str, None] = OrderedDict()
+        self._delivery_ids: set[str] = set()
+        self._counters: Counter[str] = Counter()
+        self._segment = 0
+        self._journal_offset = 0
+        self._segment_records = 0
+
+    def _segment_path(self, segment: int) -> Path:
+        """Caminho do arquivo de um segmento."""
+        return self.journal_dir / f"segment-{segment:06d}.log"
+
+    def _latest_segment(self) -> int:
+        """Número do segmento mais recente (0 se não existe nenhum)."""
+        segments = [
+            int(match.group(1))
+            for match in (_SEGMENT_RE.match(p.name) for p in self.journal_dir.iterdir())
+            if match
+        ]
+        return max(segments, default=0)
+
+    def _load_latest_segment(self) -> None:
+        """Reconstrói jobs vivos e contadores a partir do segmento mais recente."""
+        latest = self._latest_segment()
+        if latest == 0:
+            latest = 1
+            self._segment_path(latest).touch()
+
+        self._reset_index()
+        self._segment = latest
+        self._tail_journal()
+
+        # Crash entre o append em done.log e o ack: o job já está finalizado
+        for job_id in self._done.keys() & self._jobs.keys():
+            self._jobs.pop(job_id, None)
+            self._pending.pop(job_id, None)
+
+    def _tail_journal(self) -> None:
+        """Aplica registros appendados desde a última leitura (por qualquer processo)."""
+        path = self._segment_path(self._segment)
+        if self._segment and (
+            not path.exists() or self._segment_path(self._segment + 1).exists()
+        ):
+            # Outro processo compactou: recarrega do segmento novo
+            self._load_latest_segment()
+            return
+
+        for record, end in _read_records(path, self._journal_offset):
+            self._apply(record)
+            self._journal_offset = end
+            self._segment_records += 1
+
+    def _tail_done(self) -> None:
+        """Indexa registros de done.log appendados desde a última leitura."""
+        for data, start, end in _read_records_with_start(self.done_file, self._done_offset):
+            self._index_done(data, start)
+            self._done_offset = end
+
+    def _append(self, record: dict[str, Any]) -> None:
+        """Appenda registro ao segmento ativo e aplica ao índice."""
+        self._append_many([record])
+
+    def _append_many(self, records: list[dict[str, Any]]) -> None:
+        """Appenda registros com uma única escrita e aplica ao índice."""
+        path = self._segment_path(self._segment)
+        _starts, self._journal_offset = self._write_lines(path, records)
+        for record in records:
+            self._apply(record)
+        self._segment_records += len(records)
+        self._maybe_compact()
+
+    def _append_done(self, data: dict[str, Any]) -> None:
+        """Appenda registro completo de job finalizado em done.log."""
+        self._append_done_many([data])
+
+    def _append_done_many(self, records: list[dict[str, Any]]) -> None:
+        """Appenda jobs finalizados em done.log com uma única escrita."""
+        starts, self._done_offset = self._write_lines(self.done_file, records)
+        for data, start in zip(records, starts):
+            self._index_done(data, start)
+
+    def _write_lines(
+        self, path: Path, records: list[dict[str, Any]]
+    ) -> tuple[list[int], int]:
+        """
+        Grava registros JSON-lines em um único write.
+
+        Returns:
+            (offset inicial de cada registro, offset final do arquivo)
+        """
+        lines = [
+            json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n"
+            for record in records
+        ]
+        with open(path, "ab") as f:
+            position = f.tell()
+            starts = []
+            for line in lines:
+                starts.append(position)
+                position += len(line)
+            f.write(b"".join(lines))
+            f.flush()
+            if self._fsync:
+                os.fsync(f.fileno())
+            return starts, f.tell()
+
+    def _apply(self, record: dict[str, Any]) -> None:
+        """Aplica um registro do journal ao índice em memória."""
+        op = record.get("op")
+        job_id = record.get("job_id")
+
+        if op == "enqueue":
+            data = record["job"]
+            self._jobs[data["job_id"]] = data
+            self._pending[data["job_id"]] = None
+            self._index_delivery(self._delivery_ids, data)
+            self._counters["enqueue_count"] += 1
+
+        elif op == "snapshot":
+            data = record["job"]
+            self._jobs[data["job_id"]] = data
+            if data["status"] == JobStatus.PENDING.value:
+                self._pending[data["job_id"]] = None
+            self._index_delivery(self._delivery_ids, data)
+
+        elif op == "counters":
+            self._counters = Counter(record["values"])
+
+        elif op == "claim" and job_id in self._jobs:
+            data = self._jobs[job_id]
+            self._pending.pop(job_id, None)
+            data["status"] = JobStatus.PROCESSING.value
+            data["started_at"] = record["at"]
+            data["_lease_expires_at"] = record["lease_expires_at"]
+            data["_attempts"] = data.get("_attempts", 0) + 1
+            self._counters["dequeue_count"] += 1
+
+        elif op == "heartbeat" and job_id in self._jobs:
+            self._jobs[job_id]["_lease_expires_at"] = record["lease_expires_at"]
+
+        elif op == "requeue" and job_id in self._jobs:
+            data = self._jobs[job_id]
+            data["status"] = JobStatus.PENDING.value
+            data.pop("_lease_expires_at", None)
+            self._pending[job_id] = None
+
+        elif op == "metadata" and job_id in self._jobs:
+            _merge_metadata(self._jobs[job_id], record["metadata"])
+
+        elif op == "ack":
+            self._jobs.pop(job_id, None)
+            self._pending.pop(job_id, None)
+            if record["status"] == JobStatus.COMPLETED.value:
+                self._counters["complete_count"] += 1
+            else:
+                self._counters["fail_count"] += 1
+
+    @staticmethod
+    def _index_delivery(index: set[str], data: dict[str, Any]) -> None:
+        """Indexa o delivery_id do job (registros antigos não têm o campo)."""
+        delivery_id = data["event"].get("delivery_id")
+        if delivery_id:
+            index.add(delivery_id)
+
+    def _index_done(self, data: dict[str, Any], offset: int) -> None:
+        """Indexa job finalizado (offset, dedup e throughput)."""
+        job_id = data["job_id"]
+        is_new = job_id not in self._done
+        self._done[job_id] = offset
+        self._index_delivery(self._done_delivery_ids, data)
+
+        if is_new and data.get("status") == JobStatus.COMPLETED.value:
+            completed_at = data.get("completed_at")
+            if completed_at:
+                timestamp = datetime.fromisoformat(completed_at).timestamp()
+                if timestamp > time.time() - 86400:
+                    self._completions.append(timestamp)
+
+    def _finish_locked(
+        self,
+        outcomes: dict[str, tuple[dict | None, str | None]],
+        status: JobStatus,
+    ) -> None:
+        """_finish_many() com acesso exclusivo (executado em thread)."""
+        with self._exclusive():
+            self._finish_many(outcomes, status)
+
+    def _finish(
+        self,
+        job_id: str,
+        status: JobStatus,
+        result: dict | None = None,
+        error: str | None = None,
+    ) -> None:
+        """Grava job finalizado em done.log e o ack no journal."""
+        self._finish_many({job_id: (result, error)}, status)
+
+    def _finish_many(
+        self,
+        outcomes: dict[str, tuple[dict | None, str | None]],
+        status: JobStatus,
+    ) -> None:
+        """Finaliza lote de jobs: um append em done.log e um no journal."""
+        finals = [
+            self._final_record(job_id, status, result, error)
+            for job_id, (result, error) in outcomes.items()
+            if job_id in self._jobs
+        ]
+        if not finals:
+            return
+
+        # done.log primeiro: nunca existe ack sem os dados do job; crash
+        # entre os dois appends é resolvido no replay (done.log prevalece)
+        self._append_done_many(finals)
+        self._append_many([
+            {"op": "ack", "job_id": final["job_id"], "status": status.value}
+            for final in finals
+        ])
+
+    def _final_record(
+        self,
+        job_id: str,
+        status: JobStatus,
+        result: dict | None,
+        error: str | None,
+    ) -> dict[str, Any]:
+        """Registro completo do job finalizado (formato de done.log)."""
+        data = self._jobs[job_id]
+        final = {k: v for k, v in data.items() if not k.startswith("_")}
+        final["status"] = status.value
+        if result:
+            final["result"] = result
+        if error is not None:
+            final["error"] = error
+            final["error_message"] = error
+            final["failed_at"] = datetime.utcnow().isoformat()
+        if status == JobStatus.COMPLETED:
+            final["completed_at"] = datetime.utcnow().isoformat()
+        return final
+
+    def _maybe_compact(self) -> None:
+        """Compacta quando o segmento tem muitos registros mortos."""
+        if (
+            self._segment_records >= self.compact_threshold
+            and self._segment_records > 2 * len(self._jobs)
+        ):
+            self._compact()
+
+    def _compact(self) -> None:
+        """
+        Escreve segmento novo só com jobs vivos e remove o anterior.
+
+        O segmento novo é escrito em arquivo temporário e renomeado
+        (atômico); leitores de outros processos detectam o segmento
+        novo e recarregam o índice a partir dele.
+        """
+        new_segment = self._segment + 1
+        new_path = self._segment_path(new_segment)
+        temp_path = new_path.with_suffix(".tmp")
+
+        # Deliveries de jobs finalizados continuam indexadas via done.log
+        records: list[dict[str, Any]] = [
+            {"op": "counters", "values": dict(self._counters)}
+        ]
+        # Ordem: processando, depois fila (FIFO preservado)
+        for job_id, data in self._jobs.items():
+            if job_id not in self._pending:
+                records.append({"op": "snapshot", "job": data})
+        for job_id in self._pending:
+            records.append({"op": "snapshot", "job": self._jobs[job_id]})
+
+        with open(temp_path, "wb") as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+        temp_path.replace(new_path)
+
+        old_path = self._segment_path(self._segment)
+        self._segment = new_segment
+        self._journal_offset = new_path.stat().st_size
+        self._segment_records = len(records)
+        try:
+            old_path.unlink()
+        except OSError:
+            pass
+
+    def _read_done(self, offset: int) -> dict[str, Any]:
+        """Lê registro de done.log a partir do offset."""
+        with open(self.done_file, "rb") as f:
+            f.seek(offset)
+            return json.loads(f.readline())
+
+    def _filter_known(self, jobs: list["WebhookJob"]) -> list["WebhookJob"]:
+        """Remove jobs com delivery já indexado ou repetido no lote (com lock)."""
+        in_batch: set[str] = set()
+        new_jobs = []
+        for job in jobs:
+            delivery_id = job.event.delivery_id
+            if delivery_id:
+                if (
+                    delivery_id in in_batch
+                    or delivery_id in self._delivery_ids
+                    or delivery_id in self._done_delivery_ids
+                ):
+                    continue
+                in_batch.add(delivery_id)
+            new_jobs.append(job)
+        return new_jobs
+
+    def _find_job_data(self, job_id: str) -> dict[str, Any] | None:
+        """Retorna dados do job vivo ou finalizado."""
+        with self._exclusive():
+            data = self._jobs.get(job_id)
+            if data is not None:
+                return dict(data)
+            offset = self._done.get(job_id)
+        return self._read_done(offset) if offset is not None else None
+
+    def _journal_changed(self) -> bool:
+        """Probe barato: segmento ativo alterado por outro processo."""
+        try:
+            stat = self._segment_path(self._segment).stat()
+            signature = (stat.st_size, stat.st_mtime_ns)
+        except OSError:
+            signature = (0, 0)
+        changed = signature != self._journal_signature
+        self._journal_signature = signature
+        return changed
+
+    def _backlog_age(self) -> float:
+        """Idade do job mais antigo aguardando (segundos)."""
+        if not self._pending:
+            return 0.0
+        oldest = self._jobs[next(iter(self._pending))]
+        created_at = datetime.fromisoformat(oldest["created_at"])
+        return (datetime.utcnow() - created_at) / timedelta(seconds=1)
+
+    def _jobs_per_hour(self) -> float:
+        """Throughput médio (jobs/hora) nas últimas 24h."""
+        cutoff = time.time() - 86400
+        while self._completions and self._completions[0] < cutoff:
+            self._completions.popleft()
+        return len(self._completions) / 24
+
+    def _disk_usage(self) -> int:
+        """Bytes ocupados pelo segmento ativo e done.log."""
+        total = 0
+        for path in (self._segment_path(self._segment), self.done_file):
+            try:
+                total += path.stat().st_size
+            except OSError:
+                continue
+        return total
+
+
+def _read_records(path: Path, offset: int) -> Iterator[tuple[dict[str, Any], int]]:
+    """Lê registros completos a partir do offset; retorna (registro, offset final)."""
+    for record, _start, end in _read_records_with_start(path, offset):
+        yield record, end
+
+
+def _read_records_with_start(
+    path: Path, offset: int
+) -> Iterator[tuple[dict[str, Any], int, int]]:
+    """
+    Lê registros JSON-lines a partir do offset.
+
+    Linha final sem newline (append interrompido por crash) é ignorada
+    e truncada, para que o próximo append comece em linha nova.
+    """
+    try:
+        with open(path, "rb") as f:
+            f.seek(offset)
+            chunk = f.read()
+    except FileNotFoundError:
+        return
+
+    position = offset
+    for line in chunk.splitlines(keepends=True):
+        if not line.endswith(b"\n"):
+            # Só é chamado com o lock exclusivo: ninguém está escrevendo
+            with open(path, "r+b") as f:
+                f.truncate(position)
+            return
+        start, position = position, position + len(line)
+        if line.strip():
+            yield json.loads(line), start, position
+
+
+def _merge_metadata(data: dict[str, Any], metadata: dict[str, object]) -> None:
+    """Mescla metadata no dict do job (mesma regra do FileBasedJobQueue)."""
+    if "worktree_path" in metadata:
+        data["worktree_path"] = str(metadata["worktree_path"])
+    if "branch_name" in metadata:
+        data["branch_name"] = str(metadata["branch_name"])
+    data.setdefault("metadata", {}).update(metadata)
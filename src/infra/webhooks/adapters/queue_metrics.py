@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+"""
+Queue Metrics - primitivas de métricas baratas para filas de jobs.
+
+Usadas pelos adapters para que /metrics não custe varredura de tabela
+ou de diretório:
+
+- LatencyHistogram: histograma streaming (buckets log-lineares, estilo
+  HDR) no lugar de listas com as últimas 1000 latências ordenadas a cada
+  leitura
+- SnapshotCache: snapshot de métricas com TTL, invalidado por escritas
+  locais
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from threading import Lock
+from typing import Any
+
+
+class LatencyHistogram:
+    """
+    Histograma streaming de latências (ms) com erro relativo limitado.
+
+    Cada amostra cai no bucket floor(log(valor) / log(1 + precision));
+    record() é O(1) e percentile() é O(buckets ocupados), independente
+    do número de amostras. Com precision=0.05 o percentil reportado fica
+    a no máximo 5% do valor exato.
+
+    Janela: mantém duas gerações de `window` amostras (atual e anterior);
+    percentis refletem entre `window` e 2x`window` amostras mais recentes,
+    equivalente à antiga lista "últimas 1000".
+    """
+
+    # Valores abaixo disso (ms) caem no bucket zero
+    MIN_VALUE = 0.001
+
+    def __init__(self, precision: float = 0.05, window: int = 1000) -> None:
+        """
+        Inicializa histograma vazio.
+
+        Args:
+            precision: Erro relativo máximo dos percentis
+            window: Amostras por geração (0 = sem janela, acumula tudo)
+        """
+        self.precision = precision
+        self.window = window
+        self._log_base = math.log1p(precision)
+        self._lock = Lock()
+        self._current: dict[int, int] = {}
+        self._previous: dict[int, int] = {}
+        self._current_count = 0
+        self._count = 0
+        self._total = 0.0
+
+    def record(self, value_ms: float) -> None:
+        """Registra uma amostra."""
+        bucket = self._bucket(value_ms)
+        with self._lock:
+            if self.window and self._current_count >= self.window:
+                self._previous, self._current = self._current, {}
+                self._current_count = 0
+            self._current[bucket] = self._current.get(bucket, 0) + 1
+            self._current_count += 1
+            self._count += 1
+            self._total += value_ms
+
+    @property
+    def count(self) -> int:
+        """Total de amostras registradas (desde a criação)."""
+        return self._count
+
+    def mean(self) -> float:
+        """Média de todas as amostras registradas."""
+        return self._total / self._count if self._count else 0.0
+
+    def percentile(self, p: float) -> float:
+        """
+        Retorna o percentil p (0-100) das amostras da janela.
+
+        Args:
+            p: Percentil desejado
+
+        Returns:
+            Limite superior do bucket que contém o percentil (0.0 se vazio)
+        """
+        with self._lock:
+            merged = dict(self._previous)
+            for bucket, count in self._current.items():
+                merged[bucket] = merged.get(bucket, 0) + count
+
+        total = sum(merged.values())
+        if not total:
+            return 0.0
+
+        # Mesmo critério de índice do cálculo antigo sobre a lista ordenada
+        rank = min(int(total * p / 100), total - 1)
+        seen = 0
+        for bucket in sorted(merged):
+            seen += merged[bucket]
+            if seen > rank:
+                return self._bucket_value(bucket)
+        return self._bucket_value(max(merged))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serializa estado (JSON-compatível) para persistência."""
+        with self._lock:
+            return {
+                "precision": self.precision,
+                "window": self.window,
+                "current": {str(k): v for k, v in self._current.items()},
+                "previous": {str(k): v for k, v in self._previous.items()},
+                "count": self._count,
+                "total": self._total,
+            }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | list[float] | None) -> "LatencyHistogram":
+        """
+        Restaura histograma serializado.
+
+        Aceita também o formato legado (lista de latências em ms).
+        """
+        if isinstance(data, list):
+            histogram = cls()
+            for value in data:
+                histogram.record(float(value))
+            return histogram
+
+        data = data or {}
+        histogram = cls(
+            precision=data.get("precision", 0.05),
+            window=data.get("window", 1000),
+        )
+        histogram._current = {int(k): v for k, v in data.get("current", {}).items()}
+        histogram._previous = {int(k): v for k, v in data.get("previous", {}).items()}
+        histogram._current_count = sum(histogram._current.values())
+        histogram._count = data.get("count", 0)
+        histogram._total = data.get("total", 0.0)
+        return histogram
+
+    def _bucket(self, value_ms: float) -> int:
+        """Índice do bucket de um valor."""
+        if value_ms <= self.MIN_VALUE:
+            return 0
+        return max(1, math.ceil(math.log(value_ms / self.MIN_VALUE) / self._log_base))
+
+    def _bucket_value(self, bucket: int) -> float:
+        """Valor representativo (limite superior) de um bucket."""
+        if bucket <= 0:
+            return 0.0
+        return self.MIN_VALUE * math.exp(bucket * self._log_base)
+
+
+class SnapshotCache:
+    """
+    Cache de um snapshot de métricas com TTL.
+
+    Dashboards que fazem polling de /metrics a cada poucos segundos
+    recebem o snapshot em cache; escritas locais chamam invalidate()
+    para que leituras logo após uma operação vejam o valor atualizado.
+    Escritas de outros processos aparecem em no máximo ttl_seconds.
+    """
+
+    def __init__(self, ttl_seconds: float = 2.0) -> None:
+        """
+        Inicializa cache vazio.
+
+        Args:
+            ttl_seconds: Validade do snapshot (0 desativa o cache)
+        """
+        self.ttl_seconds = ttl_seconds
+        self._snapshot: dict[str, Any] | None = None
+        self._expires_at = 0.0
+        self._generation = 0
+
+    def get(self) -> dict[str, Any] | None:
+        """Retorna cópia do snapshot válido ou None."""
+        if self._snapshot is None or time.monotonic() >= self._expires_at:
+            return None
+        return dict(self._snapshot)
+
+    @property
+    def generation(self) -> int:
+        """Contador de invalidações (capturar antes de calcular o snapshot)."""
+        return self._generation
+
+    def put(self, snapshot: dict[str, Any], generation: int | None = None) -> None:
+        """
+        Armazena snapshot recém-calculado.
+
+        Args:
+            snapshot: Métricas calculadas
+            generation: Valor de `generation` lido antes do cálculo; se
+                houve invalidate() no meio tempo, o snapshot é descartado
+        """
+        if generation is not None and generation != self._generation:
+            return
+        self._snapshot = dict(snapshot)
+        self._expires_at = time.monotonic() + self.ttl_seconds
+
+    def invalidate(self) -> None:
+        """Descarta snapshot (chamado após escritas locais)."""
+        self._generation += 1
+        self._snapshot = None
+
+
+class QueueMetrics:
+    """
+    Métricas em memória de uma fila, compartilhadas por instâncias.
+
+    Handlers e worker costumam ter instâncias distintas do adapter para
+    o mesmo recurso (jobs.db, diretório da fila); o registro por chave
+    garante que /metrics veja as latências medidas pelo worker e que
+    escritas de qualquer instância invalidem o snapshot.
+    """
+
+    _registry: dict[str, "QueueMetrics"] = {}
+    _registry_lock = Lock()
+
+    def __init__(self, cache_ttl_seconds: float = 2.0) -> None:
+        """
+        Inicializa histogramas e cache vazios.
+
+        Args:
+            cache_ttl_seconds: Validade do snapshot de get_metrics()
+        """
+        self.enqueue_latency = LatencyHistogram()
+        self.dequeue_latency = LatencyHistogram()
+        self.snapshot = SnapshotCache(cache_ttl_seconds)
+
+    @classmethod
+    def for_key(cls, key: object) -> "QueueMetrics":
+        """
+        Retorna métricas compartilhadas para a chave, criando se necessário.
+
+        Args:
+            key: Identificador do recurso da fila (caminho, nome, ...)
+
+        Returns:
+            QueueMetrics compartilhado
+        """
+        key = str(key)
+        with cls._registry_lock:
+            metrics = cls._registry.get(key)
+            if metrics is None:
+                metrics = cls()
+                cls._registry[key] = metrics
+            return metrics
+
+    def latency_metrics(self) -> dict[str, float]:
+        """Média e p95 de enqueue/dequeue (mesmas chaves do FileBasedJobQueue)."""
+        return {
+            "enqueue_latency_avg_ms": self.enqueue_latency.mean(),
+            "enqueue_latency_p95_ms": self.enqueue_latency.percentile(95),
+            "dequeue_latency_avg_ms": self.dequeue_latency.mean(),
+            "dequeue_latency_p95_ms": self.dequeue_latency.percentile(95),
+        }
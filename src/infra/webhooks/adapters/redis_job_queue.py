@@ -9,10 +9,12 @@ Implements JobQueuePort using redis-py with DragonflyDB.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import math
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable
 
 if TYPE_CHECKING:
     from core.webhooks.domain import WebhookJob
@@ -33,6 +35,9 @@ class RedisJobQueue(JobQueuePort):
     - skybridge:jobs:processing → Set (jobs in progress)
     - skybridge:jobs:completed → Set (completed jobs)
     - skybridge:jobs:failed → Set (failed jobs)
+
+    Wakeup: dequeue() bloqueia no servidor via BRPOP (executado em thread
+    para não travar o event loop), então enqueue acorda o worker na hora.
     """
 
     # Key prefixes
@@ -99,17 +104,7 @@ class RedisJobQueue(JobQueuePort):
 
         # Armazenar dados do job (Hash)
         job_key = f"{self.JOB_DATA_PREFIX}{job.job_id}"
-        self._redis_client.hset(
-            job_key,
-            mapping={
-                "job_id": job.job_id,
-                "correlation_id": job.correlation_id,
-                "created_at": job.created_at.isoformat(),
-                "status": job.status.value,
-                "payload": json.dumps(job.event.payload),
-                "metadata": json.dumps(job.metadata),
-            },
-        )
+        self._redis_client.hset(job_key, mapping=self._job_mapping(job))
 
         # Adicionar à fila (Lista)
         self._redis_client.lpush(self.QUEUE_KEY, job.job_id)
@@ -119,6 +114,46 @@ class RedisJobQueue(JobQueuePort):
 
         logger.info(f"Job {job.job_id} enfileirado no Redis")
 
+    async def enqueue_many(self, jobs: list["WebhookJob"]) -> list[str]:
+        """
+        Enfileira lote de jobs em um único pipeline (MULTI/EXEC).
+
+        Jobs com delivery_id já processado (ou repetido no lote) são ignorados.
+
+        Args:
+            jobs: Jobs a enfileirar (ordem preservada)
+
+        Returns:
+            job_ids efetivamente enfileirados
+        """
+        new_jobs = await self._filter_new_deliveries(jobs)
+        if not new_jobs:
+            return []
+
+        pipe = self._redis_client.pipeline(transaction=True)
+        for job in new_jobs:
+            pipe.hset(
+                f"{self.JOB_DATA_PREFIX}{job.job_id}", mapping=self._job_mapping(job)
+            )
+        # LPUSH + BRPOP: o primeiro job do lote é o primeiro a sair
+        pipe.lpush(self.QUEUE_KEY, *[job.job_id for job in new_jobs])
+        pipe.incrby(f"{self.METRICS_PREFIX}jobs_enqueued", len(new_jobs))
+        pipe.execute()
+
+        logger.info(f"{len(new_jobs)} jobs enfileirados no Redis (lote)")
+        return [job.job_id for job in new_jobs]
+
+    def _job_mapping(self, job: "WebhookJob") -> dict[str, str]:
+        """Campos do Hash de um job."""
+        return {
+            "job_id": job.job_id,
+            "correlation_id": job.correlation_id,
+            "created_at": job.created_at.isoformat(),
+            "status": job.status.value,
+            "payload": json.dumps(job.event.payload),
+            "metadata": json.dumps(job.metadata),
+        }
+
     async def dequeue(
         self, timeout_seconds: float = 1.0
     ) -> "WebhookJob | None":
@@ -131,9 +166,12 @@ class RedisJobQueue(JobQueuePort):
         Returns:
             WebhookJob ou None se timeout
         """
-        # BRPOP bloqueia até timeout ou item disponível
-        result = self._redis_client.brpop(
-            self.QUEUE_KEY, timeout=int(timeout_seconds)
+        # BRPOP bloqueia até timeout ou item disponível (timeout=0 bloquearia
+        # para sempre, por isso no mínimo 1s); roda fora do event loop
+        result = await asyncio.to_thread(
+            self._redis_client.brpop,
+            self.QUEUE_KEY,
+            timeout=max(1, math.ceil(timeout_seconds)),
         )
 
         if not result:
@@ -173,6 +211,18 @@ class RedisJobQueue(JobQueuePort):
         logger.info(f"Job {job_id} desenfileirado do Redis")
         return job
 
+    async def wait_for_job(self, timeout_seconds: float) -> bool:
+        """
+        Retorna imediatamente: a espera bloqueante acontece no BRPOP do dequeue().
+
+        Args:
+            timeout_seconds: Ignorado (o timeout é o do dequeue)
+
+        Returns:
+            Sempre True (o próximo dequeue decide se há job)
+        """
+        return True
+
     async def get_job(self, job_id: str) -> "WebhookJob | None":
         """
         Busca job por ID.
@@ -260,6 +310,64 @@ class RedisJobQueue(JobQueuePort):
             result={"error": error, "failed_at": datetime.utcnow().isoformat()},
         )
 
+    async def complete_many(
+        self,
+        job_ids: Iterable[str],
+        results: dict[str, dict] | None = None,
+    ) -> None:
+        """
+        Marca lote de jobs como completados em um único pipeline.
+
+        Args:
+            job_ids: IDs dos jobs
+            results: Resultado opcional por job_id
+        """
+        results = results or {}
+        self._finish_many(
+            "completed", self.COMPLETED_KEY, "jobs_completed",
+            {job_id: results.get(job_id) for job_id in job_ids},
+        )
+
+    async def fail_many(self, errors: dict[str, str]) -> None:
+        """
+        Marca lote de jobs como falhos em um único pipeline.
+
+        Args:
+            errors: Mensagem de erro por job_id
+        """
+        failed_at = datetime.utcnow().isoformat()
+        self._finish_many(
+            "failed", self.FAILED_KEY, "jobs_failed",
+            {
+                job_id: {"error": error, "failed_at": failed_at}
+                for job_id, error in errors.items()
+            },
+        )
+
+    def _finish_many(
+        self,
+        status: str,
+        status_key: str,
+        metric_name: str,
+        results: dict[str, dict | None],
+    ) -> None:
+        """Atualiza status, sets e métrica de um lote (mesma regra de update_status)."""
+        if not results:
+            return
+
+        pipe = self._redis_client.pipeline(transaction=True)
+        for job_id, result in results.items():
+            job_key = f"{self.JOB_DATA_PREFIX}{job_id}"
+            pipe.hset(job_key, "status", status)
+            if result:
+                pipe.hset(job_key, "result", json.dumps(result))
+        pipe.srem(self.PROCESSING_KEY, *results)
+        pipe.sadd(status_key, *results)
+        pipe.incrby(f"{self.METRICS_PREFIX}{metric_name}", len(results))
+        pipe.execute()
+
+        logger.info(f"{len(results)} jobs com status atualizado para {status} (lote)")
+
     async def exists_by_delivery(self, delivery_id: str) -> bool:
         """
         Verifica se job com delivery_id já foi processado.
@@ -273,6 +381,29 @@ class RedisJobQueue(JobQueuePort):
         key = f"{self.METRICS_PREFIX}delivery:{delivery_id}"
         return self._redis_client.exists(key) == 1
 
+    async def exists_many_by_delivery(self, delivery_ids: Iterable[str]) -> set[str]:
+        """
+        Versão em lote de exists_by_delivery() (um único MGET).
+
+        Args:
+            delivery_ids: IDs de entrega a verificar
+
+        Returns:
+            Subconjunto dos delivery_ids já processados
+        """
+        delivery_ids = list(set(delivery_ids))
+        if not delivery_ids:
+            return set()
+
+        values = self._redis_client.mget(
+            [f"{self.METRICS_PREFIX}delivery:{delivery_id}" for delivery_id in delivery_ids]
+        )
+        return {
+            delivery_id
+            for delivery_id, value in zip(delivery_ids, values)
+            if value is not None
+        }
+
     async def mark_delivery_processed(self, delivery_id: str, job_id: str) -> None:
         """
         Marca delivery como processado.
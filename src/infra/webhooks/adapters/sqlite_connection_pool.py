@@ -0,0 +1,279 @@
+# -*- coding: utf-8 -*-
+"""
+SQLite Connection Pool for Skybridge.
+
+Pool de conexões de longa duração por arquivo de banco.
+
+Em vez de abrir/fechar uma conexão por operação, cada arquivo SQLite
+(ex: workspace/<id>/data/jobs.db) tem um único pool compartilhado
+entre todas as instâncias que apontam para o mesmo caminho:
+
+- 1 conexão de escrita (serializada por lock, SQLite só aceita 1 writer)
+- N conexões de leitura (WAL permite leituras concorrentes)
+- PRAGMAs aplicados uma única vez, na criação de cada conexão
+- Executor de threads próprio para tirar o I/O do event loop
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from threading import Lock
+from typing import Iterator
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteConnectionPool:
+    """
+    Pool de conexões SQLite compartilhado por caminho de banco.
+
+    Características:
+    - Writer único protegido por Lock (evita SQLITE_BUSY entre threads)
+    - Readers reutilizáveis em fila bounded
+    - PRAGMAs: WAL, synchronous=NORMAL, mmap_size, temp_store=MEMORY
+    - Flag de schema para evitar re-executar DDL a cada instância
+    - ThreadPoolExecutor dedicado (max_readers + 1 threads) para que
+      adapters async executem fsync/busy_timeout fora do event loop
+
+    Uso:
+        pool = SQLiteConnectionPool.for_path("data/jobs.db")
+        with pool.writer() as conn:
+            conn.execute("INSERT ...")
+            conn.commit()
+        with pool.reader() as conn:
+            conn.execute("SELECT ...").fetchall()
+    """
+
+    # Registro global: caminho resolvido → pool
+    _pools: dict[Path, "SQLiteConnectionPool"] = {}
+    _pools_lock = Lock()
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        timeout_seconds: float = 5.0,
+        max_readers: int = 4,
+        mmap_size: int = 64 * 1024 * 1024,
+    ):
+        """
+        Inicializa pool (conexões são criadas sob demanda).
+
+        Args:
+            db_path: Caminho para arquivo SQLite
+            timeout_seconds: busy_timeout das conexões
+            max_readers: Número máximo de conexões de leitura mantidas
+            mmap_size: Tamanho do memory-map em bytes (0 desativa)
+        """
+        self._db_path = Path(db_path)
+        self._timeout = timeout_seconds
+        self._max_readers = max_readers
+        self._mmap_size = mmap_size
+
+        self._writer_conn: sqlite3.Connection | None = None
+        self._writer_lock = Lock()
+        self._readers: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue(
+            maxsize=max_readers
+        )
+        self._watch_conn: sqlite3.Connection | None = None
+        self._watch_lock = Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = Lock()
+        self._closed = False
+
+        # Marcado pelo dono do schema (ex: SQLiteJobQueue) após o DDL
+        self.schema_ready = False
+        self.schema_lock = Lock()
+
+    @classmethod
+    def for_path(
+        cls,
+        db_path: str | Path,
+        timeout_seconds: float = 5.0,
+        max_readers: int = 4,
+    ) -> "SQLiteConnectionPool":
+        """
+        Retorna o pool compartilhado para o caminho, criando se necessário.
+
+        Args:
+            db_path: Caminho para arquivo SQLite
+            timeout_seconds: busy_timeout (usado apenas na criação)
+            max_readers: Número de readers (usado apenas na criação)
+
+        Returns:
+            SQLiteConnectionPool compartilhado
+        """
+        key = Path(db_path).resolve()
+
+        with cls._pools_lock:
+            pool = cls._pools.get(key)
+            if pool is None or pool._closed:
+                pool = cls(
+                    key, timeout_seconds=timeout_seconds, max_readers=max_readers
+                )
+                cls._pools[key] = pool
+                logger.debug(f"Pool SQLite criado: {key}")
+            return pool
+
+    @classmethod
+    def close_all(cls) -> None:
+        """Fecha todos os pools registrados (shutdown/testes)."""
+        with cls._pools_lock:
+            pools = list(cls._pools.values())
+            cls._pools.clear()
+
+        for pool in pools:
+            pool.close()
+
+    @property
+    def db_path(self) -> Path:
+        """Caminho do banco gerenciado por este pool."""
+        return self._db_path
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """
+        Executor dedicado ao banco (criado sob demanda).
+
+        Dimensionado para 1 writer + max_readers leituras simultâneas; o
+        executor default do loop não é usado para não competir com
+        handlers síncronos do resto da aplicação.
+        """
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self._max_readers + 1,
+                        thread_name_prefix=f"sqlite-{self._db_path.stem}",
+                    )
+        return self._executor
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Cria conexão configurada.
+
+        PRAGMAs por conexão (synchronous, mmap_size, temp_store) são
+        aplicados aqui uma única vez; journal_mode=WAL é persistente no
+        arquivo e só precisa ser definido pelo writer.
+        """
+        conn = sqlite3.connect(
+            str(self._db_path),
+            timeout=self._timeout,
+            check_same_thread=False,  # Conexões circulam entre threads
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute(f"PRAGMA busy_timeout={int(self._timeout * 1000)}")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        if self._mmap_size:
+            conn.execute(f"PRAGMA mmap_size={int(self._mmap_size)}")
+        return conn
+
+    def _get_writer(self) -> sqlite3.Connection:
+        """Retorna conexão de escrita (cria e ativa WAL na primeira vez)."""
+        if self._writer_conn is None:
+            conn = self._connect()
+            try:
+                conn.execute("PRAGMA journal_mode=WAL")
+            except sqlite3.Error:
+                # WAL não é crítico, continua sem ele
+                logger.warning(f"WAL indisponível para {self._db_path}")
+            self._writer_conn = conn
+        return self._writer_conn
+
+    def data_version(self) -> int:
+        """
+        Retorna PRAGMA data_version de uma conexão dedicada.
+
+        O valor muda sempre que outra conexão (inclusive de outro processo)
+        comita no banco; serve como sinal barato de mudança sem consultar
+        tabelas.
+        """
+        with self._watch_lock:
+            if self._closed:
+                raise sqlite3.ProgrammingError("Pool SQLite fechado")
+            if self._watch_conn is None:
+                self._watch_conn = self._connect()
+            return self._watch_conn.execute("PRAGMA data_version").fetchone()[0]
+
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        """
+        Empresta a conexão de escrita com acesso exclusivo.
+
+        O chamador é responsável por commit/rollback. Transações deixadas
+        abertas por exceção são revertidas antes de liberar o lock.
+        """
+        with self._writer_lock:
+            if self._closed:
+                raise sqlite3.ProgrammingError("Pool SQLite fechado")
+            conn = self._get_writer()
+            try:
+                yield conn
+            finally:
+                if conn.in_transaction:
+                    conn.rollback()
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """
+        Empresta uma conexão de leitura do pool.
+
+        Se o pool estiver vazio, cria uma nova; ao devolver, descarta
+        excedentes acima de max_readers.
+        """
+        if self._closed:
+            raise sqlite3.ProgrammingError("Pool SQLite fechado")
+
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
+
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            if self._closed:
+                conn.close()
+            else:
+                try:
+                    self._readers.put_nowait(conn)
+                except queue.Full:
+                    conn.close()
+
+    def close(self) -> None:
+        """Fecha todas as conexões do pool."""
+        self._closed = True
+
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
+        with self._writer_lock:
+            if self._writer_conn is not None:
+                self._writer_conn.close()
+                self._writer_conn = None
+
+        with self._watch_lock:
+            if self._watch_conn is not None:
+                self._watch_conn.close()
+                self._watch_conn = None
+
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
+
+        with self._pools_lock:
+            if self._pools.get(self._db_path) is self:
+                del self._pools[self._db_path]
+
+        logger.debug(f"Pool SQLite fechado: {self._db_path}")
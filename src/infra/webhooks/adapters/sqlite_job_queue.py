@@ -5,46 +5,74 @@ SQLite Job Queue Adapter for Skybridge.
 PRD018 Fase 2 - Plano B: SQLite como fila de jobs.
 
 Implements JobQueuePort usando SQLite3 com:
-- Concorrência via SELECT FOR UPDATE SKIP LOCKED
+- Concorrência via claim atômico (UPDATE ... RETURNING)
+- Ordenação FIFO por prioridade (índice status, priority, created_at)
+- Leases com heartbeat e reaper (jobs de workers mortos voltam à fila)
+- Wakeup push: enqueue() acorda workers ociosos (sem polling de 100ms)
 - Persistência ACID nativa
 - Zero dependências externas (stdlib)
+- Conexões de longa duração via SQLiteConnectionPool (1 writer + N readers)
+- I/O fora do event loop (executor dedicado do pool), sem bloquear o FastAPI
+- Retenção: jobs finalizados antigos vão para jobs_archive (payload
+  comprimido) e o espaço é devolvido via incremental_vacuum
 - Performance: ~400-500 ops/sec (suficiente para 20 agentes)
 """
 
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import logging
 import sqlite3
+import time
+import zlib
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from threading import Lock
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, TypeVar
 
 if TYPE_CHECKING:
     from core.webhooks.domain import WebhookJob
 
 from core.webhooks.domain import JobStatus
 from core.webhooks.ports.job_queue_port import JobQueuePort, QueueError
+from infra.webhooks.adapters.job_notifier import JobNotifier
+from infra.webhooks.adapters.queue_metrics import QueueMetrics
+from infra.webhooks.adapters.sqlite_connection_pool import SQLiteConnectionPool
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class SQLiteJobQueue(JobQueuePort):
     """
     SQLite-based job queue para Skybridge.
 
     Características:
-    - Concorrência: SELECT FOR UPDATE (row-level locking)
+    - Concorrência: claim atômico em um único UPDATE ... RETURNING
+    - Ordenação: maior prioridade primeiro, FIFO dentro da mesma prioridade
+      (prioridade lida de job.metadata["priority"], padrão 0)
+    - Leases: job em 'processing' tem lease_expires_at; o worker renova via
+      heartbeat() e requeue_expired_leases() devolve jobs de workers mortos
+    - Notificação: enqueue() sinaliza o JobNotifier do pool; enqueues de
+      outros processos são detectados via PRAGMA data_version
     - Persistência: ACID (commit automático)
     - Performance: ~400-500 ops/sec
     - Overhead: ~5MB RAM
+    - Conexões: pool compartilhado por caminho de banco (sem open/close
+      por operação, PRAGMAs e schema aplicados uma vez por processo)
+    - Non-blocking: todo acesso ao sqlite3 roda no executor do pool; um
+      fsync lento ou espera de busy_timeout não congela o event loop
 
     Estrutura do banco:
     - jobs: tabela principal de jobs
     - job_metrics: métricas agregadas
     - delivery_tracking: deduplicação de webhooks
+    - job_status_counts: contadores por status (triggers)
+    - jobs_archive: jobs finalizados arquivados (payload/result em zlib)
 
     Uso:
         queue = SQLiteJobQueue("data/jobs.db")
@@ -56,6 +84,8 @@ class SQLiteJobQueue(JobQueuePort):
         self,
         db_path: str | Path = "data/jobs.db",
         timeout_seconds: float = 5.0,
+        lease_seconds: float = 600.0,
+        max_attempts: int = 3,
     ):
         """
         Inicializa SQLite job queue.
@@ -63,16 +93,38 @@ class SQLiteJobQueue(JobQueuePort):
         Args:
             db_path: Caminho para arquivo SQLite
             timeout_seconds: Timeout para operações de banco
+            lease_seconds: Duração do lease (visibility timeout) de um job
+                em processamento sem heartbeat
+            max_attempts: Tentativas antes de um job com lease expirado
+                ser marcado como falho
         """
         self._db_path = Path(db_path)
         self._timeout = timeout_seconds
+        self.lease_seconds = lease_seconds
+        self._max_attempts = max_attempts
         self._lock = Lock()  # Para operações que precisam de serialização
 
         # Criar diretório se não existe
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Inicializar schema
-        self._init_schema()
+        # Pool compartilhado entre instâncias do mesmo jobs.db
+        self._pool = SQLiteConnectionPool.for_path(
+            self._db_path, timeout_seconds=timeout_seconds
+        )
+
+        # Canal de notificação compartilhado por todas as instâncias do jobs.db
+        self._notifier = JobNotifier.for_key(self._pool.db_path)
+        self._claim_version = self._notifier.version
+        self._external_version: int | None = None
+
+        # Latências e snapshot de get_metrics() compartilhados por jobs.db
+        self._metrics = QueueMetrics.for_key(self._pool.db_path)
+
+        # Inicializar schema (apenas uma vez por pool)
+        with self._pool.schema_lock:
+            if not self._pool.schema_ready:
+                self._init_schema()
+                self._pool.schema_ready = True
 
         logger.info(f"SQLiteJobQueue inicializado: {self._db_path}")
 
@@ -101,21 +153,39 @@ class SQLiteJobQueue(JobQueuePort):
         db_path = base_path / "workspace" / workspace / "data" / "jobs.db"
         return cls(db_path=db_path, timeout_seconds=timeout_seconds)
 
-    def _get_connection(self) -> sqlite3.Connection:
+    @contextmanager
+    def _write_connection(self) -> Iterator[sqlite3.Connection]:
         """
-        Retorna conexão com SQLite configurada.
+        Empresta a conexão de escrita do pool.
 
-        Configurações:
-        - isolation_level=None (autocommit manual)
-        - WAL mode (melhor concorrência leitura/escrita)
+        Acesso exclusivo (lock); o chamador faz commit/rollback.
         """
-        conn = sqlite3.connect(
-            str(self._db_path),
-            timeout=self._timeout,
-            check_same_thread=False,  # Permite conexões entre threads
+        with self._pool.writer() as conn:
+            yield conn
+        # Qualquer escrita torna o snapshot de métricas obsoleto
+        self._metrics.snapshot.invalidate()
+
+    @contextmanager
+    def _read_connection(self) -> Iterator[sqlite3.Connection]:
+        """Empresta uma conexão de leitura do pool (WAL: leituras concorrentes)."""
+        with self._pool.reader() as conn:
+            yield conn
+
+    async def _run(self, fn: Callable[..., T], *args: object) -> T:
+        """
+        Executa operação síncrona de banco no executor do pool.
+
+        Args:
+            fn: Função síncrona (ex: _enqueue_sync)
+            *args: Argumentos posicionais
+
+        Returns:
+            Resultado de fn
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._pool.executor, functools.partial(fn, *args)
         )
-        conn.row_factory = sqlite3.Row
-        return conn
 
     def _init_schema(self) -> None:
         """
@@ -125,106 +195,322 @@ class SQLiteJobQueue(JobQueuePort):
         - jobs: fila principal
         - job_metrics: métricas agregadas
         - delivery_tracking: controle de duplicação
+        - jobs_archive: jobs finalizados arquivados
         """
-        # Primeiro, ativar WAL mode (precisa ser fora de transação)
-        conn_wal = self._get_connection()
-        try:
-            conn_wal.execute("PRAGMA journal_mode=WAL")
-            conn_wal.close()
-        except Exception:
-            conn_wal.close()
-            # WAL não é crítico, continua sem ele
+        # WAL mode e demais PRAGMAs são aplicados pelo pool
+        self._enable_incremental_vacuum()
 
-        conn = self._get_connection()
+        with self._write_connection() as conn:
+            try:
+                cursor = conn.cursor()
 
-        try:
-            cursor = conn.cursor()
+                # Tabela principal de jobs
+                cursor.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS jobs (
+                        id TEXT PRIMARY KEY,
+                        correlation_id TEXT NOT NULL,
+                        created_at TEXT NOT NULL,
+                        status TEXT NOT NULL DEFAULT 'pending',
+                        event_source TEXT NOT NULL,
+                        event_type TEXT NOT NULL,
+                        event_id TEXT NOT NULL,
+                        payload TEXT NOT NULL,
+                        metadata TEXT NOT NULL DEFAULT '{}',
+                        result TEXT,
+                        error_message TEXT,
+                        locked_at TEXT,
+                        processing_started_at TEXT,
+                        completed_at TEXT,
+                        failed_at TEXT,
+                        priority INTEGER NOT NULL DEFAULT 0,
+                        attempts INTEGER NOT NULL DEFAULT 0,
+                        lease_expires_at TEXT
+                    )
+                    """
+                )
 
-            # Tabela principal de jobs
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS jobs (
-                    id TEXT PRIMARY KEY,
-                    correlation_id TEXT NOT NULL,
-                    created_at TEXT NOT NULL,
-                    status TEXT NOT NULL DEFAULT 'pending',
-                    event_source TEXT NOT NULL,
-                    event_type TEXT NOT NULL,
-                    event_id TEXT NOT NULL,
-                    payload TEXT NOT NULL,
-                    metadata TEXT NOT NULL DEFAULT '{}',
-                    result TEXT,
-                    error_message TEXT,
-                    locked_at TEXT,
-                    processing_started_at TEXT,
-                    completed_at TEXT,
-                    failed_at TEXT
+                # Bancos criados antes dos leases não têm as novas colunas
+                self._migrate_schema(cursor)
+
+                # Índices para performance
+                cursor.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS idx_jobs_status
+                    ON jobs(status)
+                    """
+                )
+                cursor.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS idx_jobs_created_at
+                    ON jobs(created_at)
+                    """
+                )
+                # Claim: status='pending' ORDER BY priority DESC, created_at
+                cursor.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS idx_jobs_claim
+                    ON jobs(status, priority DESC, created_at)
+                    """
+                )
+                # Reaper: status='processing' AND lease_expires_at < now
+                cursor.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS idx_jobs_lease
+                    ON jobs(status, lease_expires_at)
+                    """
+                )
+                # WebUI: status = ? ORDER BY created_at DESC
+                cursor.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS idx_jobs_status_created_at
+                    ON jobs(status, created_at)
+                    """
                 )
-                """
-            )
 
-            # Índices para performance
-            cursor.execute(
-                """
-                CREATE INDEX IF NOT EXISTS idx_jobs_status
-                ON jobs(status)
-                """
-            )
-            cursor.execute(
-                """
-                CREATE INDEX IF NOT EXISTS idx_jobs_created_at
-                ON jobs(created_at)
-                """
-            )
+                # Arquivo de jobs finalizados (fora da tabela quente)
+                cursor.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS jobs_archive (
+                        id TEXT PRIMARY KEY,
+                        correlation_id TEXT NOT NULL,
+                        created_at TEXT NOT NULL,
+                        status TEXT NOT NULL,
+                        event_source TEXT NOT NULL,
+                        event_type TEXT NOT NULL,
+                        event_id TEXT NOT NULL,
+                        metadata TEXT NOT NULL DEFAULT '{}',
+                        error_message TEXT,
+                        finished_at TEXT,
+                        archived_at TEXT NOT NULL,
+                        payload BLOB NOT NULL,
+                        result BLOB
+                    )
+                    """
+                )
+                cursor.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS idx_jobs_archive_created_at
+                    ON jobs_archive(created_at)
+                    """
+                )
 
-            # Tabela de métricas
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS job_metrics (
-                    metric_name TEXT PRIMARY KEY,
-                    value INTEGER NOT NULL DEFAULT 0
+                # Tabela de métricas
+                cursor.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS job_metrics (
+                        metric_name TEXT PRIMARY KEY,
+                        value INTEGER NOT NULL DEFAULT 0
+                    )
+                    """
                 )
-                """
-            )
 
-            # Inicializar métricas se não existirem
-            for metric in ["jobs_enqueued", "jobs_completed", "jobs_failed"]:
+                # Inicializar métricas se não existirem
+                for metric in ["jobs_enqueued", "jobs_completed", "jobs_failed"]:
+                    cursor.execute(
+                        """
+                        INSERT OR IGNORE INTO job_metrics (metric_name, value)
+                        VALUES (?, 0)
+                        """,
+                        (metric,),
+                    )
+
+                # Tabela de tracking de delivery (deduplicação)
                 cursor.execute(
                     """
-                    INSERT OR IGNORE INTO job_metrics (metric_name, value)
-                    VALUES (?, 0)
-                    """,
-                    (metric,),
+                    CREATE TABLE IF NOT EXISTS delivery_tracking (
+                        delivery_id TEXT PRIMARY KEY,
+                        job_id TEXT NOT NULL,
+                        created_at TEXT NOT NULL,
+                        expires_at TEXT NOT NULL
+                    )
+                    """
                 )
 
-            # Tabela de tracking de delivery (deduplicação)
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS delivery_tracking (
-                    delivery_id TEXT PRIMARY KEY,
-                    job_id TEXT NOT NULL,
-                    created_at TEXT NOT NULL,
-                    expires_at TEXT NOT NULL
+                # Limpar deliveries expirados
+                cursor.execute(
+                    """
+                    DELETE FROM delivery_tracking
+                    WHERE expires_at < datetime('now')
+                    """
                 )
-                """
-            )
 
-            # Limpar deliveries expirados
+                # Contadores por status (mantidos por triggers)
+                self._init_status_counters(cursor)
+
+                conn.commit()
+                logger.info("Schema SQLite inicializado")
+
+            except Exception as e:
+                conn.rollback()
+                raise QueueError(f"Falha ao inicializar schema: {e}")
+
+    def _enable_incremental_vacuum(self) -> None:
+        """
+        Ativa auto_vacuum=INCREMENTAL em bancos recém-criados.
+
+        O modo só pode mudar antes da primeira tabela ou via VACUUM
+        completo; como o pool já ativou WAL, o VACUUM aqui roda sobre um
+        banco vazio (instantâneo). Bancos existentes são convertidos por
+        ensure_incremental_compaction() (primeiro ciclo de retenção).
+        """
+        with self._write_connection() as conn:
+            mode = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+            if mode == 2:
+                return
+            has_tables = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' LIMIT 1"
+            ).fetchone()
+            if has_tables:
+                return
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            conn.execute("VACUUM")
+
+    @staticmethod
+    def _migrate_schema(cursor: sqlite3.Cursor) -> None:
+        """
+        Adiciona colunas de prioridade/lease em bancos existentes.
+
+        Args:
+            cursor: Cursor da conexão de escrita (dentro da transação do schema)
+        """
+        cursor.execute("PRAGMA table_info(jobs)")
+        columns = {row["name"] for row in cursor.fetchall()}
+
+        migrations = {
+            "priority": "ALTER TABLE jobs ADD COLUMN priority INTEGER NOT NULL DEFAULT 0",
+            "attempts": "ALTER TABLE jobs ADD COLUMN attempts INTEGER NOT NULL DEFAULT 0",
+            "lease_expires_at": "ALTER TABLE jobs ADD COLUMN lease_expires_at TEXT",
+        }
+        for column, ddl in migrations.items():
+            if column not in columns:
+                cursor.execute(ddl)
+                logger.info(f"Schema SQLite migrado: coluna jobs.{column} adicionada")
+
+    @staticmethod
+    def _init_status_counters(cursor: sqlite3.Cursor) -> None:
+        """
+        Cria contadores por status mantidos por triggers.
+
+        Todo INSERT, mudança de status e DELETE em jobs atualiza
+        job_status_counts na mesma transação, então get_metrics() lê
+        poucas linhas em vez de um GROUP BY na tabela inteira. Bancos
+        existentes são populados uma única vez a partir da contagem atual.
+
+        Args:
+            cursor: Cursor da conexão de escrita (dentro da transação do schema)
+        """
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'job_status_counts'"
+        )
+        exists = cursor.fetchone() is not None
+
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS job_status_counts (
+                status TEXT PRIMARY KEY,
+                count INTEGER NOT NULL DEFAULT 0
+            )
+            """
+        )
+        if not exists:
             cursor.execute(
                 """
-                DELETE FROM delivery_tracking
-                WHERE expires_at < datetime('now')
+                INSERT INTO job_status_counts (status, count)
+                SELECT status, COUNT(*) FROM jobs GROUP BY status
                 """
             )
+            logger.info("Schema SQLite migrado: contadores por status populados")
 
-            conn.commit()
-            logger.info("Schema SQLite inicializado")
+        cursor.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_jobs_count_insert
+            AFTER INSERT ON jobs
+            BEGIN
+                INSERT OR IGNORE INTO job_status_counts (status, count) VALUES (NEW.status, 0);
+                UPDATE job_status_counts SET count = count + 1 WHERE status = NEW.status;
+            END
+            """
+        )
+        cursor.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_jobs_count_update
+            AFTER UPDATE OF status ON jobs
+            WHEN OLD.status IS NOT NEW.status
+            BEGIN
+                UPDATE job_status_counts SET count = count - 1 WHERE status = OLD.status;
+                INSERT OR IGNORE INTO job_status_counts (status, count) VALUES (NEW.status, 0);
+                UPDATE job_status_counts SET count = count + 1 WHERE status = NEW.status;
+            END
+            """
+        )
+        cursor.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_jobs_count_delete
+            AFTER DELETE ON jobs
+            BEGIN
+                UPDATE job_status_counts SET count = count - 1 WHERE status = OLD.status;
+            END
+            """
+        )
 
-        except Exception as e:
-            conn.rollback()
-            raise QueueError(f"Falha ao inicializar schema: {e}")
-        finally:
-            conn.close()
+    _INSERT_JOB_SQL = """
+        INSERT INTO jobs (
+            id, correlation_id, created_at, status,
+            event_source, event_type, event_id,
+            payload, metadata, priority
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    # Máximo de parâmetros por consulta IN (limite do SQLite: 999)
+    _IN_CHUNK_SIZE = 500
+
+    def _claim_delivery(self, cursor: sqlite3.Cursor, job: "WebhookJob") -> bool:
+        """
+        Registra o delivery_id do job em delivery_tracking.
+
+        Roda dentro da transação do enqueue: a PK de delivery_tracking
+        garante que um delivery só é aceito uma vez, mesmo com processos
+        concorrentes. Registros expirados são substituídos.
+
+        Returns:
+            True se o delivery é novo (ou o job não tem delivery_id)
+        """
+        delivery_id = job.event.delivery_id
+        if not delivery_id:
+            return True
+        cursor.execute(
+            """
+            DELETE FROM delivery_tracking
+            WHERE delivery_id = ? AND expires_at <= datetime('now')
+            """,
+            (delivery_id,),
+        )
+        cursor.execute(
+            """
+            INSERT OR IGNORE INTO delivery_tracking
+            (delivery_id, job_id, created_at, expires_at)
+            VALUES (?, ?, datetime('now'), datetime('now', '+24 hours'))
+            """,
+            (delivery_id, job.job_id),
+        )
+        return cursor.rowcount > 0
+
+    @staticmethod
+    def _job_row(job: "WebhookJob") -> tuple:
+        """Parâmetros do INSERT de um job (ordem de _INSERT_JOB_SQL)."""
+        return (
+            job.job_id,
+            job.correlation_id,
+            job.created_at.isoformat(),
+            "pending",
+            str(job.event.source),  # Converter Enum para string
+            job.event.event_type,
+            job.event.event_id,
+            json.dumps(job.event.payload),
+            json.dumps(job.metadata),
+            int(job.metadata.get("priority", 0)),
+        )
 
     async def enqueue(self, job: "WebhookJob") -> str:
         """
@@ -239,52 +525,98 @@ class SQLiteJobQueue(JobQueuePort):
         Raises:
             QueueError: Se falhar ao enfileirar
         """
-        conn = self._get_connection()
+        started = time.perf_counter()
+        job_id = await self._run(self._enqueue_sync, job)
+        self._metrics.enqueue_latency.record((time.perf_counter() - started) * 1000)
+        self._notifier.notify()
+        return job_id
+
+    def _enqueue_sync(self, job: "WebhookJob") -> str:
+        """Corpo síncrono de enqueue() (executado no executor do pool)."""
+        with self._write_connection() as conn:
+            try:
+                cursor = conn.cursor()
 
-        try:
-            cursor = conn.cursor()
+                # Inserir job (e registrar o delivery na mesma transação)
+                cursor.execute(self._INSERT_JOB_SQL, self._job_row(job))
+                self._claim_delivery(cursor, job)
 
-            # Inserir job
-            cursor.execute(
-                """
-                INSERT INTO jobs (
-                    id, correlation_id, created_at, status,
-                    event_source, event_type, event_id,
-                    payload, metadata
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    job.job_id,
-                    job.correlation_id,
-                    job.created_at.isoformat(),
-                    "pending",
-                    str(job.event.source),  # Converter Enum para string
-                    job.event.event_type,
-                    job.event.event_id,
-                    json.dumps(job.event.payload),
-                    json.dumps(job.metadata),
-                ),
-            )
+                # Incrementar métrica
+                cursor.execute(
+                    """
+                    UPDATE job_metrics
+                    SET value = value + 1
+                    WHERE metric_name = 'jobs_enqueued'
+                    """
+                )
 
-            # Incrementar métrica
-            cursor.execute(
-                """
-                UPDATE job_metrics
-                SET value = value + 1
-                WHERE metric_name = 'jobs_enqueued'
-                """
-            )
+                conn.commit()
+                logger.info(f"Job {job.job_id} enfileirado no SQLite")
 
-            conn.commit()
-            logger.info(f"Job {job.job_id} enfileirado no SQLite")
+                return job.job_id
 
-            return job.job_id
+            except Exception as e:
+                conn.rollback()
+                raise QueueError(f"Falha ao enfileirar job {job.job_id}: {e}")
 
-        except Exception as e:
-            conn.rollback()
-            raise QueueError(f"Falha ao enfileirar job {job.job_id}: {e}")
-        finally:
-            conn.close()
+    async def enqueue_many(self, jobs: list["WebhookJob"]) -> list[str]:
+        """
+        Enfileira lote de jobs em uma única transação.
+
+        Jobs com delivery_id já registrado (ou repetido no lote) são
+        ignorados. Uma consulta IN descarta os duplicados conhecidos e o
+        registro em delivery_tracking, na mesma transação dos INSERTs,
+        resolve corridas entre lotes concorrentes.
+
+        Args:
+            jobs: Jobs a enfileirar (ordem preservada)
+
+        Returns:
+            job_ids efetivamente enfileirados
+
+        Raises:
+            QueueError: Se falhar (nenhum job do lote é gravado)
+        """
+        new_jobs = await self._filter_new_deliveries(jobs)
+        if not new_jobs:
+            return []
+
+        started = time.perf_counter()
+        job_ids = await self._run(self._enqueue_many_sync, new_jobs)
+        if job_ids:
+            self._metrics.enqueue_latency.record((time.perf_counter() - started) * 1000)
+            self._notifier.notify()
+        return job_ids
+
+    def _enqueue_many_sync(self, jobs: list["WebhookJob"]) -> list[str]:
+        """Corpo síncrono de enqueue_many() (executado no executor do pool)."""
+        with self._write_connection() as conn:
+            try:
+                cursor = conn.cursor()
+                jobs = [job for job in jobs if self._claim_delivery(cursor, job)]
+                if not jobs:
+                    conn.commit()
+                    return []
+                cursor.executemany(
+                    self._INSERT_JOB_SQL, [self._job_row(job) for job in jobs]
+                )
+                cursor.execute(
+                    """
+                    UPDATE job_metrics
+                    SET value = value + ?
+                    WHERE metric_name = 'jobs_enqueued'
+                    """,
+                    (len(jobs),),
+                )
+
+                conn.commit()
+                logger.info(f"{len(jobs)} jobs enfileirados no SQLite (lote)")
+
+                return [job.job_id for job in jobs]
+
+            except Exception as e:
+                conn.rollback()
+                raise QueueError(f"Falha ao enfileirar lote de {len(jobs)} jobs: {e}")
 
     async def dequeue(
         self, timeout_seconds: float = 1.0
@@ -292,8 +624,11 @@ class SQLiteJobQueue(JobQueuePort):
         """
         Remove job da fila (blocking com timeout).
 
-        Usa SELECT FOR UPDATE SKIP LOCKED para concorrência:
-        - Pula jobs já locked por outros workers
+        Usa claim atômico (UPDATE ... RETURNING) para concorrência:
+        - Um único statement escolhe e reserva o job, sem race entre
+          workers/processos compartilhando o mesmo jobs.db
+        - Maior prioridade primeiro, FIFO por created_at
+        - O job recebe um lease de lease_seconds (renovar via heartbeat)
         - Retorna None se nenhum job disponível
 
         Args:
@@ -303,7 +638,6 @@ class SQLiteJobQueue(JobQueuePort):
             WebhookJob ou None se timeout/fila vazia
         """
         start_time = datetime.utcnow()
-        conn = self._get_connection()
 
         try:
             while True:
@@ -312,44 +646,19 @@ class SQLiteJobQueue(JobQueuePort):
                 if elapsed >= timeout_seconds:
                     return None
 
-                cursor = conn.cursor()
-
-                # Tentar pegar job com locking
-                # SKIP LOCKED = pula jobs já locked por outros
-                cursor.execute(
-                    """
-                    SELECT id, correlation_id, created_at,
-                           event_source, event_type, event_id,
-                           payload, metadata
-                    FROM jobs
-                    WHERE status = 'pending'
-                    LIMIT 1
-                    """
-                )
-
-                row = cursor.fetchone()
+                # Versão lida antes do claim: notify() no meio acorda o wait
+                self._claim_version = self._notifier.version
 
+                # Claim roda no executor; o writer é liberado antes do wait
+                claim_started = time.perf_counter()
+                row = await self._run(self._try_claim_pending)
                 if row:
-                    # Marcar como locked
-                    job_id = row["id"]
-                    cursor.execute(
-                        """
-                        UPDATE jobs
-                        SET status = 'processing',
-                            processing_started_at = datetime('now'),
-                            locked_at = datetime('now')
-                        WHERE id = ? AND status = 'pending'
-                        """,
-                        (job_id,),
+                    self._metrics.dequeue_latency.record(
+                        (time.perf_counter() - claim_started) * 1000
                     )
 
-                    # Verificar se conseguiu lock (race condition)
-                    if cursor.rowcount == 0:
-                        # Outro worker pegou este job, tentar novamente
-                        await asyncio.sleep(0.1)
-                        continue
-
-                    conn.commit()
+                if row:
+                    job_id = row["id"]
 
                     # Carregar dependências
                     from core.webhooks.domain import WebhookJob, WebhookEvent, WebhookSource
@@ -385,85 +694,279 @@ class SQLiteJobQueue(JobQueuePort):
                     logger.info(f"Job {job_id} desenfileirado do SQLite")
                     return job
 
-                # Nenhum job disponível, aguardar um pouco
-                await asyncio.sleep(0.1)
+                # Nenhum job disponível, aguardar enqueue (push)
+                await self.wait_for_job(timeout_seconds - elapsed)
 
+        except QueueError:
+            raise
         except Exception as e:
-            conn.rollback()
             raise QueueError(f"Falha ao desenfileirar: {e}")
-        finally:
-            conn.close()
 
-    async def get_job(self, job_id: str) -> "WebhookJob | None":
+    async def wait_for_job(self, timeout_seconds: float) -> bool:
         """
-        Busca job por ID.
+        Aguarda notificação de novo job.
+
+        Enqueues deste processo acordam imediatamente; enqueues de outros
+        processos são detectados via PRAGMA data_version (sem query de claim).
 
         Args:
-            job_id: ID do job
+            timeout_seconds: Tempo máximo de espera
 
         Returns:
-            WebhookJob ou None se não encontrado
+            True se um job pode estar disponível, False se timeout
         """
-        conn = self._get_connection()
+        return await self._notifier.wait(
+            timeout_seconds,
+            since=self._claim_version,
+            probe=self._external_change_detected,
+        )
 
+    def _external_change_detected(self) -> bool:
+        """Probe barato: banco alterado por outra conexão/processo."""
         try:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                SELECT id, correlation_id, created_at, status,
-                       event_source, event_type, event_id,
-                       payload, metadata
-                FROM jobs
-                WHERE id = ?
-                """,
-                (job_id,),
-            )
+            version = self._pool.data_version()
+        except sqlite3.Error:
+            return False
 
-            row = cursor.fetchone()
+        changed = self._external_version is not None and version != self._external_version
+        self._external_version = version
+        return changed
+
+    def _try_claim_pending(self) -> sqlite3.Row | None:
+        """
+        Reserva atomicamente o próximo job pendente.
+
+        Returns:
+            Linha do job reservado ou None se não há job pendente
+        """
+        with self._write_connection() as conn:
+            try:
+                cursor = conn.cursor()
+
+                # Seleção + reserva no mesmo statement (idx_jobs_claim)
+                cursor.execute(
+                    """
+                    UPDATE jobs
+                    SET status = 'processing',
+                        processing_started_at = datetime('now'),
+                        locked_at = datetime('now'),
+                        lease_expires_at = datetime('now', '+' || ? || ' seconds'),
+                        attempts = attempts + 1
+                    WHERE id = (
+                        SELECT id FROM jobs
+                        WHERE status = 'pending'
+                        ORDER BY priority DESC, created_at ASC
+                        LIMIT 1
+                    )
+                    RETURNING id, correlation_id, created_at,
+                              event_source, event_type, event_id,
+                              payload, metadata
+                    """,
+                    (int(self.lease_seconds),),
+                )
+
+                row = cursor.fetchone()
+                conn.commit()
+                return row
+
+            except Exception:
+                conn.rollback()
+                raise
+
+    async def heartbeat(self, job_id: str, lease_seconds: float | None = None) -> bool:
+        """
+        Renova o lease de um job em processamento.
 
-            if not row:
-                return None
+        Args:
+            job_id: ID do job
+            lease_seconds: Nova duração do lease (padrão: lease_seconds da fila)
 
-            # Carregar dependências
-            from core.webhooks.domain import WebhookJob, WebhookEvent, WebhookSource
+        Returns:
+            True se o lease foi renovado, False se o job não está mais
+            em 'processing' (ex: reaper já o devolveu à fila)
+        """
+        return await self._run(self._heartbeat_sync, job_id, lease_seconds)
 
-            # Converter string de status para enum
-            status_str = row["status"]
-            status = JobStatus[status_str.upper()] if status_str else JobStatus.PENDING
+    def _heartbeat_sync(self, job_id: str, lease_seconds: float | None = None) -> bool:
+        """Corpo síncrono de heartbeat() (executado no executor do pool)."""
+        lease = int(lease_seconds if lease_seconds is not None else self.lease_seconds)
 
-            # Converter string de volta para WebhookSource Enum
-            source_str = row["event_source"]
+        with self._write_connection() as conn:
             try:
-                source = WebhookSource(source_str)
-            except ValueError:
-                # Se falhar, usa GITHUB como fallback
-                source = WebhookSource.GITHUB
-
-            # Reconstruir evento primeiro para poder extrair issue_number
-            event = WebhookEvent(
-                source=source,  # ✅ Enum em vez de string
-                event_type=row["event_type"],
-                event_id=row["event_id"],
-                payload=json.loads(row["payload"]),
-                received_at=datetime.fromisoformat(row["created_at"]),
-            )
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                    UPDATE jobs
+                    SET lease_expires_at = datetime('now', '+' || ? || ' seconds')
+                    WHERE id = ? AND status = 'processing'
+                    """,
+                    (lease, job_id),
+                )
+                renewed = cursor.rowcount > 0
+                conn.commit()
+                return renewed
+
+            except Exception as e:
+                conn.rollback()
+                raise QueueError(f"Falha ao renovar lease do job {job_id}: {e}")
+
+    async def requeue_expired_leases(self) -> int:
+        """
+        Reaper: devolve à fila jobs cujo lease expirou.
+
+        Jobs de workers que morreram ficam em 'processing' sem heartbeat;
+        após o lease expirar, voltam para 'pending'. Jobs que já esgotaram
+        max_attempts são marcados como 'failed' para não entrar em loop.
+
+        Returns:
+            Número de jobs recuperados (re-enfileirados + falhos)
+        """
+        return await self._run(self._requeue_expired_leases_sync)
+
+    def _requeue_expired_leases_sync(self) -> int:
+        """Corpo síncrono de requeue_expired_leases() (executado no executor do pool)."""
+        with self._write_connection() as conn:
+            try:
+                cursor = conn.cursor()
+
+                cursor.execute(
+                    """
+                    UPDATE jobs
+                    SET status = 'failed',
+                        failed_at = datetime('now'),
+                        error_message = 'Lease expirado após ' || attempts || ' tentativas',
+                        lease_expires_at = NULL
+                    WHERE status = 'processing'
+                    AND lease_expires_at < datetime('now')
+                    AND attempts >= ?
+                    """,
+                    (self._max_attempts,),
+                )
+                failed = cursor.rowcount
+
+                if failed:
+                    cursor.execute(
+                        """
+                        UPDATE job_metrics
+                        SET value = value + ?
+                        WHERE metric_name = 'jobs_failed'
+                        """,
+                        (failed,),
+                    )
+
+                cursor.execute(
+                    """
+                    UPDATE jobs
+                    SET status = 'pending',
+                        locked_at = NULL,
+                        processing_started_at = NULL,
+                        lease_expires_at = NULL
+                    WHERE status = 'processing'
+                    AND lease_expires_at < datetime('now')
+                    """
+                )
+                requeued = cursor.rowcount
+
+                conn.commit()
+
+                if requeued or failed:
+                    logger.warning(
+                        f"Reaper: {requeued} jobs re-enfileirados, "
+                        f"{failed} marcados como falhos (lease expirado)"
+                    )
+                return requeued + failed
+
+            except Exception as e:
+                conn.rollback()
+                raise QueueError(f"Falha ao recuperar leases expirados: {e}")
+
+    async def get_job(self, job_id: str) -> "WebhookJob | None":
+        """
+        Busca job por ID.
+
+        Args:
+            job_id: ID do job
+
+        Returns:
+            WebhookJob ou None se não encontrado
+        """
+        return await self._run(self._get_job_sync, job_id)
+
+    def _get_job_sync(self, job_id: str) -> "WebhookJob | None":
+        """Corpo síncrono de get_job() (executado no executor do pool)."""
+        with self._read_connection() as conn:
+            try:
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                    SELECT id, correlation_id, created_at, status,
+                           event_source, event_type, event_id,
+                           payload, metadata
+                    FROM jobs
+                    WHERE id = ?
+                    """,
+                    (job_id,),
+                )
+
+                row = cursor.fetchone()
+
+                if row:
+                    payload = row["payload"]
+                else:
+                    # Job finalizado pode ter sido movido pela retenção
+                    cursor.execute(
+                        """
+                        SELECT id, correlation_id, created_at, status,
+                               event_source, event_type, event_id,
+                               payload, metadata
+                        FROM jobs_archive
+                        WHERE id = ?
+                        """,
+                        (job_id,),
+                    )
+                    row = cursor.fetchone()
+                    if not row:
+                        return None
+                    payload = zlib.decompress(row["payload"]).decode("utf-8")
+
+                # Carregar dependências
+                from core.webhooks.domain import WebhookJob, WebhookEvent, WebhookSource
+
+                # Converter string de status para enum
+                status_str = row["status"]
+                status = JobStatus[status_str.upper()] if status_str else JobStatus.PENDING
+
+                # Converter string de volta para WebhookSource Enum
+                source_str = row["event_source"]
+                try:
+                    source = WebhookSource(source_str)
+                except ValueError:
+                    # Se falhar, usa GITHUB como fallback
+                    source = WebhookSource.GITHUB
+
+                # Reconstruir evento primeiro para poder extrair issue_number
+                event = WebhookEvent(
+                    source=source,  # ✅ Enum em vez de string
+                    event_type=row["event_type"],
+                    event_id=row["event_id"],
+                    payload=json.loads(payload),
+                    received_at=datetime.fromisoformat(row["created_at"]),
+                )
 
-            job = WebhookJob(
-                job_id=row["id"],
-                correlation_id=row["correlation_id"],
-                created_at=datetime.fromisoformat(row["created_at"]),
-                status=status,
-                event=event,
-                issue_number=event.get_issue_number(),  # ✅ Extrair issue_number do evento
-                metadata=json.loads(row["metadata"]),
-            )
+                job = WebhookJob(
+                    job_id=row["id"],
+                    correlation_id=row["correlation_id"],
+                    created_at=datetime.fromisoformat(row["created_at"]),
+                    status=status,
+                    event=event,
+                    issue_number=event.get_issue_number(),  # ✅ Extrair issue_number do evento
+                    metadata=json.loads(row["metadata"]),
+                )
 
-            return job
+                return job
 
-        except Exception as e:
-            raise QueueError(f"Falha ao buscar job {job_id}: {e}")
-        finally:
-            conn.close()
+            except Exception as e:
+                raise QueueError(f"Falha ao buscar job {job_id}: {e}")
 
     async def complete(self, job_id: str, result: dict | None = None) -> None:
         """
@@ -473,40 +976,42 @@ class SQLiteJobQueue(JobQueuePort):
             job_id: ID do job
             result: Resultado opcional do processamento
         """
-        conn = self._get_connection()
+        return await self._run(self._complete_sync, job_id, result)
 
-        try:
-            cursor = conn.cursor()
+    def _complete_sync(self, job_id: str, result: dict | None = None) -> None:
+        """Corpo síncrono de complete() (executado no executor do pool)."""
+        with self._write_connection() as conn:
+            try:
+                cursor = conn.cursor()
 
-            # Atualizar status
-            cursor.execute(
-                """
-                UPDATE jobs
-                SET status = 'completed',
-                    completed_at = datetime('now'),
-                    result = ?
-                WHERE id = ?
-                """,
-                (json.dumps(result) if result else None, job_id),
-            )
+                # Atualizar status
+                cursor.execute(
+                    """
+                    UPDATE jobs
+                    SET status = 'completed',
+                        completed_at = datetime('now'),
+                        lease_expires_at = NULL,
+                        result = ?
+                    WHERE id = ?
+                    """,
+                    (json.dumps(result) if result else None, job_id),
+                )
 
-            # Incrementar métrica
-            cursor.execute(
-                """
-                UPDATE job_metrics
-                SET value = value + 1
-                WHERE metric_name = 'jobs_completed'
-                """
-            )
+                # Incrementar métrica
+                cursor.execute(
+                    """
+                    UPDATE job_metrics
+                    SET value = value + 1
+                    WHERE metric_name = 'jobs_completed'
+                    """
+                )
 
-            conn.commit()
-            logger.info(f"Job {job_id} marcado como completado")
+                conn.commit()
+                logger.info(f"Job {job_id} marcado como completado")
 
-        except Exception as e:
-            conn.rollback()
-            raise QueueError(f"Falha ao completar job {job_id}: {e}")
-        finally:
-            conn.close()
+            except Exception as e:
+                conn.rollback()
+                raise QueueError(f"Falha ao completar job {job_id}: {e}")
 
     async def fail(self, job_id: str, error: str) -> None:
         """
@@ -516,65 +1021,164 @@ class SQLiteJobQueue(JobQueuePort):
             job_id: ID do job
             error: Mensagem de erro
         """
-        conn = self._get_connection()
+        return await self._run(self._fail_sync, job_id, error)
 
-        try:
-            cursor = conn.cursor()
+    def _fail_sync(self, job_id: str, error: str) -> None:
+        """Corpo síncrono de fail() (executado no executor do pool)."""
+        with self._write_connection() as conn:
+            try:
+                cursor = conn.cursor()
 
-            # Atualizar status
-            cursor.execute(
-                """
-                UPDATE jobs
-                SET status = 'failed',
-                    failed_at = datetime('now'),
-                    error_message = ?
-                WHERE id = ?
-                """,
-                (error, job_id),
-            )
+                # Atualizar status
+                cursor.execute(
+                    """
+                    UPDATE jobs
+                    SET status = 'failed',
+                        failed_at = datetime('now'),
+                        lease_expires_at = NULL,
+                        error_message = ?
+                    WHERE id = ?
+                    """,
+                    (error, job_id),
+                )
 
-            # Incrementar métrica
-            cursor.execute(
-                """
-                UPDATE job_metrics
-                SET value = value + 1
-                WHERE metric_name = 'jobs_failed'
-                """
-            )
+                # Incrementar métrica
+                cursor.execute(
+                    """
+                    UPDATE job_metrics
+                    SET value = value + 1
+                    WHERE metric_name = 'jobs_failed'
+                    """
+                )
 
-            conn.commit()
-            logger.warning(f"Job {job_id} marcado como falhou: {error}")
+                conn.commit()
+                logger.warning(f"Job {job_id} marcado como falhou: {error}")
 
-        except Exception as e:
-            conn.rollback()
-            raise QueueError(f"Falha ao marcar falha do job {job_id}: {e}")
-        finally:
-            conn.close()
+            except Exception as e:
+                conn.rollback()
+                raise QueueError(f"Falha ao marcar falha do job {job_id}: {e}")
+
+    async def complete_many(
+        self,
+        job_ids: Iterable[str],
+        results: dict[str, dict] | None = None,
+    ) -> None:
+        """
+        Marca lote de jobs como completados em uma única transação.
+
+        Args:
+            job_ids: IDs dos jobs
+            results: Resultado opcional por job_id
+        """
+        job_ids = list(job_ids)
+        if job_ids:
+            await self._run(self._complete_many_sync, job_ids, results or {})
+
+    def _complete_many_sync(self, job_ids: list[str], results: dict[str, dict]) -> None:
+        """Corpo síncrono de complete_many() (executado no executor do pool)."""
+        with self._write_connection() as conn:
+            try:
+                cursor = conn.cursor()
+                cursor.executemany(
+                    """
+                    UPDATE jobs
+                    SET status = 'completed',
+                        completed_at = datetime('now'),
+                        lease_expires_at = NULL,
+                        result = ?
+                    WHERE id = ?
+                    """,
+                    [
+                        (json.dumps(results[job_id]) if results.get(job_id) else None, job_id)
+                        for job_id in job_ids
+                    ],
+                )
+                cursor.execute(
+                    """
+                    UPDATE job_metrics
+                    SET value = value + ?
+                    WHERE metric_name = 'jobs_completed'
+                    """,
+                    (len(job_ids),),
+                )
+
+                conn.commit()
+                logger.info(f"{len(job_ids)} jobs marcados como completados (lote)")
+
+            except Exception as e:
+                conn.rollback()
+                raise QueueError(f"Falha ao completar lote de {len(job_ids)} jobs: {e}")
+
+    async def fail_many(self, errors: dict[str, str]) -> None:
+        """
+        Marca lote de jobs como falhos em uma única transação.
+
+        Args:
+            errors: Mensagem de erro por job_id
+        """
+        if errors:
+            await self._run(self._fail_many_sync, dict(errors))
+
+    def _fail_many_sync(self, errors: dict[str, str]) -> None:
+        """Corpo síncrono de fail_many() (executado no executor do pool)."""
+        with self._write_connection() as conn:
+            try:
+                cursor = conn.cursor()
+                cursor.executemany(
+                    """
+                    UPDATE jobs
+                    SET status = 'failed',
+                        failed_at = datetime('now'),
+                        lease_expires_at = NULL,
+                        error_message = ?
+                    WHERE id = ?
+                    """,
+                    [(error, job_id) for job_id, error in errors.items()],
+                )
+                cursor.execute(
+                    """
+                    UPDATE job_metrics
+                    SET value = value + ?
+                    WHERE metric_name = 'jobs_failed'
+                    """,
+                    (len(errors),),
+                )
+
+                conn.commit()
+                logger.warning(f"{len(errors)} jobs marcados como falhos (lote)")
+
+            except Exception as e:
+                conn.rollback()
+                raise QueueError(f"Falha ao marcar falha de lote de {len(errors)} jobs: {e}")
 
     def size(self) -> int:
         """
         Retorna tamanho atual da fila.
 
+        Síncrono (contrato do port): em código async prefira
+        pending_count(), que roda no executor do pool.
+
         Returns:
             Número de jobs aguardando processamento (status='pending')
         """
-        conn = self._get_connection()
+        return self._size_sync()
 
-        try:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                SELECT COUNT(*) as count
-                FROM jobs
-                WHERE status = 'pending'
-                """
-            )
+    async def pending_count(self) -> int:
+        """
+        Retorna tamanho atual da fila sem bloquear o event loop.
 
-            row = cursor.fetchone()
-            return row["count"]
+        Returns:
+            Número de jobs aguardando processamento (status='pending')
+        """
+        return await self._run(self._size_sync)
 
-        finally:
-            conn.close()
+    def _size_sync(self) -> int:
+        """Lê o contador de pendentes em job_status_counts (O(1), sem COUNT(*))."""
+        with self._read_connection() as conn:
+            row = conn.execute(
+                "SELECT count FROM job_status_counts WHERE status = 'pending'"
+            ).fetchone()
+            return row["count"] if row else 0
 
     async def exists_by_delivery(self, delivery_id: str) -> bool:
         """
@@ -588,9 +1192,11 @@ class SQLiteJobQueue(JobQueuePort):
         Returns:
             True se já processado, False caso contrário
         """
-        conn = self._get_connection()
+        return await self._run(self._exists_by_delivery_sync, delivery_id)
 
-        try:
+    def _exists_by_delivery_sync(self, delivery_id: str) -> bool:
+        """Corpo síncrono de exists_by_delivery() (executado no executor do pool)."""
+        with self._read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 """
@@ -604,8 +1210,41 @@ class SQLiteJobQueue(JobQueuePort):
             row = cursor.fetchone()
             return row["count"] > 0
 
-        finally:
-            conn.close()
+    async def exists_many_by_delivery(self, delivery_ids: Iterable[str]) -> set[str]:
+        """
+        Versão em lote de exists_by_delivery() (consulta IN única por bloco).
+
+        Args:
+            delivery_ids: IDs de entrega a verificar
+
+        Returns:
+            Subconjunto dos delivery_ids já processados
+        """
+        delivery_ids = list(set(delivery_ids))
+        if not delivery_ids:
+            return set()
+        return await self._run(self._exists_many_by_delivery_sync, delivery_ids)
+
+    def _exists_many_by_delivery_sync(self, delivery_ids: list[str]) -> set[str]:
+        """Corpo síncrono de exists_many_by_delivery() (executado no executor do pool)."""
+        found: set[str] = set()
+        with self._read_connection() as conn:
+            cursor = conn.cursor()
+            # Blocos abaixo do limite de parâmetros do SQLite
+            for start in range(0, len(delivery_ids), self._IN_CHUNK_SIZE):
+                chunk = delivery_ids[start:start + self._IN_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                cursor.execute(
+                    f"""
+                    SELECT delivery_id
+                    FROM delivery_tracking
+                    WHERE delivery_id IN ({placeholders})
+                      AND expires_at > datetime('now')
+                    """,
+                    chunk,
+                )
+                found.update(row["delivery_id"] for row in cursor.fetchall())
+        return found
 
     async def mark_delivery_processed(
         self, delivery_id: str, job_id: str
@@ -617,9 +1256,13 @@ class SQLiteJobQueue(JobQueuePort):
             delivery_id: ID de entrega
             job_id: ID do job processado
         """
-        conn = self._get_connection()
+        return await self._run(self._mark_delivery_processed_sync, delivery_id, job_id)
 
-        try:
+    def _mark_delivery_processed_sync(
+        self, delivery_id: str, job_id: str
+    ) -> None:
+        """Corpo síncrono de mark_delivery_processed() (executado no executor do pool)."""
+        with self._write_connection() as conn:
             cursor = conn.cursor()
 
             # Expira em 24 horas
@@ -634,29 +1277,33 @@ class SQLiteJobQueue(JobQueuePort):
 
             conn.commit()
 
-        finally:
-            conn.close()
-
     async def get_metrics(self) -> dict[str, object]:
         """
         Retorna métricas da fila.
 
+        Contagens por status vêm de job_status_counts (O(1)) e o resultado
+        fica em cache por alguns segundos, invalidado por escritas de
+        qualquer instância deste processo.
+
         Returns:
             Dicionário com métricas
         """
-        conn = self._get_connection()
-
-        try:
+        cached = self._metrics.snapshot.get()
+        if cached is not None:
+            return cached
+
+        generation = self._metrics.snapshot.generation
+        metrics = await self._run(self._get_metrics_sync)
+        self._metrics.snapshot.put(metrics, generation)
+        return metrics
+
+    def _get_metrics_sync(self) -> dict[str, object]:
+        """Corpo síncrono de get_metrics() (executado no executor do pool)."""
+        with self._read_connection() as conn:
             cursor = conn.cursor()
 
-            # Buscar contagem por status
-            cursor.execute(
-                """
-                SELECT status, COUNT(*) as count
-                FROM jobs
-                GROUP BY status
-                """
-            )
+            # Contadores por status (mantidos por triggers, sem varrer jobs)
+            cursor.execute("SELECT status, count FROM job_status_counts")
 
             status_counts = {row["status"]: row["count"] for row in cursor.fetchall()}
 
@@ -676,15 +1323,17 @@ class SQLiteJobQueue(JobQueuePort):
                     metrics.get("jobs_completed", 0)
                     / max(metrics.get("jobs_enqueued", 0), 1)
                 ),
+                **self._metrics.latency_metrics(),
             }
 
-        finally:
-            conn.close()
-
     async def close(self) -> None:
-        """Fecha conexões e libera recursos."""
-        # SQLite não requer close explícito (connection-based)
-        # Mas podemos fazer cleanup aqui se necessário
+        """
+        Libera recursos da instância.
+
+        O pool de conexões é compartilhado com outras instâncias do mesmo
+        jobs.db e permanece aberto; use SQLiteConnectionPool.close_all()
+        no shutdown do processo.
+        """
         logger.info("SQLiteJobQueue fechado")
 
     async def cleanup_old_jobs(
@@ -700,9 +1349,13 @@ class SQLiteJobQueue(JobQueuePort):
         Returns:
             Número de jobs removidos
         """
-        conn = self._get_connection()
+        return await self._run(self._cleanup_old_jobs_sync, older_than_days, keep_failed)
 
-        try:
+    def _cleanup_old_jobs_sync(
+        self, older_than_days: int = 7, keep_failed: bool = True
+    ) -> int:
+        """Corpo síncrono de cleanup_old_jobs() (executado no executor do pool)."""
+        with self._write_connection() as conn:
             cursor = conn.cursor()
 
             if keep_failed:
@@ -735,61 +1388,240 @@ class SQLiteJobQueue(JobQueuePort):
             logger.info(f"Cleanup: {deleted_count} jobs antigos removidos")
             return deleted_count
 
-        finally:
-            conn.close()
-
     async def vacuum(self) -> None:
         """
         Executa VACUUM para compactar o banco.
 
         Reduz tamanho do arquivo após deletes.
         """
-        conn = self._get_connection()
+        return await self._run(self._vacuum_sync)
 
-        try:
+    def _vacuum_sync(self) -> None:
+        """Corpo síncrono de vacuum() (executado no executor do pool)."""
+        with self._write_connection() as conn:
+            # Converte bancos antigos para incremental_vacuum (compact_storage)
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
             conn.execute("VACUUM")
             conn.commit()
             logger.info("VACUUM executado no banco SQLite")
 
-        finally:
-            conn.close()
-
-    async def clear(self) -> None:
+    async def archive_finished_jobs(
+        self, older_than_days: int, batch_size: int = 500
+    ) -> int:
         """
-        Limpa todos os jobs da fila.
+        Move jobs completed/failed antigos para jobs_archive.
 
-        Método auxiliar para testes - remove todos os registros.
-        """
-        conn = self._get_connection()
+        Payload e result são gravados comprimidos (zlib); get_job() continua
+        encontrando jobs arquivados. Cada lote roda em uma transação curta,
+        liberando o writer entre lotes para não atrasar enqueue/claim.
 
-        try:
-            cursor = conn.cursor()
+        Args:
+            older_than_days: Arquivar jobs finalizados há mais de X dias
+            batch_size: Jobs movidos por transação
+
+        Returns:
+            Número de jobs arquivados
+        """
+        archived = 0
+        while True:
+            moved = await self._run(
+                self._archive_batch_sync, older_than_days, batch_size
+            )
+            archived += moved
+            if moved < batch_size:
+                break
 
-            # Deletar todos os jobs
-            cursor.execute("DELETE FROM jobs")
+        if archived:
+            logger.info(f"Retenção: {archived} jobs finalizados arquivados")
+        return archived
 
-            # Resetar métricas
-            for metric in ["jobs_enqueued", "jobs_completed", "jobs_failed"]:
+    def _archive_batch_sync(self, older_than_days: int, batch_size: int) -> int:
+        """Corpo síncrono de um lote de archive_finished_jobs() (executor do pool)."""
+        with self._write_connection() as conn:
+            try:
+                cursor = conn.cursor()
                 cursor.execute(
                     """
-                    UPDATE job_metrics
-                    SET value = 0
-                    WHERE metric_name = ?
+                    SELECT id, correlation_id, created_at, status,
+                           event_source, event_type, event_id, metadata,
+                           error_message, payload, result,
+                           COALESCE(completed_at, failed_at) AS finished_at
+                    FROM jobs
+                    WHERE status IN ('completed', 'failed')
+                    AND COALESCE(completed_at, failed_at)
+                        < datetime('now', '-' || ? || ' days')
+                    LIMIT ?
+                    """,
+                    (older_than_days, batch_size),
+                )
+                rows = cursor.fetchall()
+                if not rows:
+                    return 0
+
+                cursor.executemany(
+                    """
+                    INSERT OR REPLACE INTO jobs_archive (
+                        id, correlation_id, created_at, status,
+                        event_source, event_type, event_id, metadata,
+                        error_message, finished_at, archived_at, payload, result
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, datetime('now'), ?, ?)
                     """,
-                    (metric,),
+                    [
+                        (
+                            row["id"],
+                            row["correlation_id"],
+                            row["created_at"],
+                            row["status"],
+                            row["event_source"],
+                            row["event_type"],
+                            row["event_id"],
+                            row["metadata"],
+                            row["error_message"],
+                            row["finished_at"],
+                            zlib.compress(row["payload"].encode("utf-8")),
+                            zlib.compress(row["result"].encode("utf-8"))
+                            if row["result"]
+                            else None,
+                        )
+                        for row in rows
+                    ],
+                )
+                cursor.executemany(
+                    "DELETE FROM jobs WHERE id = ?", [(row["id"],) for row in rows]
                 )
 
-            # Deletar tracking
-            cursor.execute("DELETE FROM delivery_tracking")
+                conn.commit()
+                return len(rows)
+
+            except Exception as e:
+                conn.rollback()
+                raise QueueError(f"Falha ao arquivar jobs: {e}")
+
+    async def compact_storage(self, max_pages: int = 1000) -> int:
+        """
+        Devolve até max_pages páginas livres ao sistema (incremental_vacuum).
+
+        Ao contrário de vacuum(), não reescreve o banco inteiro: segura o
+        writer apenas pelo tempo de truncar as páginas liberadas. Bancos
+        ainda sem auto_vacuum=INCREMENTAL precisam de
+        ensure_incremental_compaction() antes.
+
+        Args:
+            max_pages: Máximo de páginas liberadas nesta chamada
 
+        Returns:
+            Número de páginas liberadas
+        """
+        return await self._run(self._compact_storage_sync, max_pages)
+
+    def _compact_storage_sync(self, max_pages: int = 1000) -> int:
+        """Corpo síncrono de compact_storage() (executado no executor do pool)."""
+        with self._write_connection() as conn:
+            if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+                logger.debug("incremental_vacuum indisponível (execute vacuum() uma vez)")
+                return 0
+
+            before = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            if not before:
+                return 0
+            conn.execute(f"PRAGMA incremental_vacuum({int(max_pages)})").fetchall()
             conn.commit()
-            logger.info("SQLiteJobQueue limpo (todos os jobs removidos)")
+            after = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            return before - after
 
-        except Exception as e:
-            conn.rollback()
-            raise QueueError(f"Falha ao limpar fila: {e}")
-        finally:
-            conn.close()
+    async def ensure_incremental_compaction(self, convert: bool = True) -> bool:
+        """
+        Converte bancos antigos para auto_vacuum=INCREMENTAL.
+
+        Bancos criados antes da retenção ficam em auto_vacuum=NONE e
+        compact_storage() nunca libera espaço neles. A conversão exige um
+        VACUUM completo (único), que segura o writer enquanto reescreve o
+        arquivo.
+
+        Args:
+            convert: Executar o VACUUM; se False, apenas avisa no log
+
+        Returns:
+            True se o banco está (ou ficou) em modo incremental
+        """
+        return await self._run(self._ensure_incremental_compaction_sync, convert)
+
+    def _ensure_incremental_compaction_sync(self, convert: bool = True) -> bool:
+        """Corpo síncrono de ensure_incremental_compaction() (executor do pool)."""
+        with self._write_connection() as conn:
+            if conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2:
+                return True
+            if not convert:
+                logger.warning(
+                    f"{self._db_path} sem auto_vacuum=INCREMENTAL: compactação "
+                    "desativada até um vacuum()"
+                )
+                return False
+
+        logger.warning(
+            f"Convertendo {self._db_path} para auto_vacuum=INCREMENTAL (VACUUM único)"
+        )
+        self._vacuum_sync()
+        return True
+
+    async def purge_expired_deliveries(self) -> int:
+        """
+        Remove deliveries expirados de delivery_tracking.
+
+        Returns:
+            Número de registros removidos
+        """
+        return await self._run(self._purge_expired_deliveries_sync)
+
+    def _purge_expired_deliveries_sync(self) -> int:
+        """Corpo síncrono de purge_expired_deliveries() (executor do pool)."""
+        with self._write_connection() as conn:
+            cursor = conn.execute(
+                """
+                DELETE FROM delivery_tracking
+                WHERE expires_at <= datetime('now')
+                """
+            )
+            conn.commit()
+            return cursor.rowcount
+
+    async def clear(self) -> None:
+        """
+        Limpa todos os jobs da fila.
+
+        Método auxiliar para testes - remove todos os registros.
+        """
+        return await self._run(self._clear_sync)
+
+    def _clear_sync(self) -> None:
+        """Corpo síncrono de clear() (executado no executor do pool)."""
+        with self._write_connection() as conn:
+            try:
+                cursor = conn.cursor()
+
+                # Deletar todos os jobs
+                cursor.execute("DELETE FROM jobs")
+
+                # Resetar métricas
+                for metric in ["jobs_enqueued", "jobs_completed", "jobs_failed"]:
+                    cursor.execute(
+                        """
+                        UPDATE job_metrics
+                        SET value = 0
+                        WHERE metric_name = ?
+                        """,
+                        (metric,),
+                    )
+
+                # Deletar tracking
+                cursor.execute("DELETE FROM delivery_tracking")
+
+                conn.commit()
+                logger.info("SQLiteJobQueue limpo (todos os jobs removidos)")
+
+            except Exception as e:
+                conn.rollback()
+                raise QueueError(f"Falha ao limpar fila: {e}")
 
     async def list_jobs(
         self,
@@ -812,51 +1644,56 @@ class SQLiteJobQueue(JobQueuePort):
             - created_at: Data de criação (ISO string)
             - worktree_path: Caminho do worktree (se disponível, obtido do metadata)
         """
-        conn = self._get_connection()
+        return await self._run(self._list_jobs_sync, limit, status_filter)
 
-        try:
-            cursor = conn.cursor()
+    def _list_jobs_sync(
+        self,
+        limit: int = 100,
+        status_filter: str | None = None,
+    ) -> list[dict[str, object]]:
+        """Corpo síncrono de list_jobs() (executado no executor do pool)."""
+        with self._read_connection() as conn:
+            try:
+                cursor = conn.cursor()
 
-            # Query base
-            query = """
-                SELECT id, event_source, event_type, status, created_at, metadata
-                FROM jobs
-            """
-            params: list[str] = []
+                # Query base
+                query = """
+                    SELECT id, event_source, event_type, status, created_at, metadata
+                    FROM jobs
+                """
+                params: list[str] = []
 
-            # Adiciona filtro de status se especificado
-            if status_filter:
-                query += " WHERE status = ?"
-                params.append(status_filter.lower())
+                # Adiciona filtro de status se especificado
+                if status_filter:
+                    query += " WHERE status = ?"
+                    params.append(status_filter.lower())
 
-            # Ordena por data de criação (mais recentes primeiro)
-            query += " ORDER BY created_at DESC LIMIT ?"
-            params.append(str(limit))
+                # Ordena por data de criação (mais recentes primeiro)
+                query += " ORDER BY created_at DESC LIMIT ?"
+                params.append(str(limit))
 
-            cursor.execute(query, params)
+                cursor.execute(query, params)
 
-            jobs_list = []
-            for row in cursor.fetchall():
-                # Extrai worktree_path do metadata se disponível
-                metadata = json.loads(row["metadata"]) if row["metadata"] else {}
-                worktree_path = metadata.get("worktree_path")
+                jobs_list = []
+                for row in cursor.fetchall():
+                    # Extrai worktree_path do metadata se disponível
+                    metadata = json.loads(row["metadata"]) if row["metadata"] else {}
+                    worktree_path = metadata.get("worktree_path")
 
-                jobs_list.append({
-                    "job_id": row["id"],
-                    "source": row["event_source"],
-                    "event_type": row["event_type"],
-                    "status": row["status"].upper() if row["status"] else "PENDING",
-                    "created_at": row["created_at"],
-                    "worktree_path": worktree_path,
-                })
+                    jobs_list.append({
+                        "job_id": row["id"],
+                        "source": row["event_source"],
+                        "event_type": row["event_type"],
+                        "status": row["status"].upper() if row["status"] else "PENDING",
+                        "created_at": row["created_at"],
+                        "worktree_path": worktree_path,
+                    })
 
-            return jobs_list
+                return jobs_list
 
-        except Exception as e:
-            logger.error(f"Erro ao listar jobs: {e}")
-            raise QueueError(f"Falha ao listar jobs: {e}")
-        finally:
-            conn.close()
+            except Exception as e:
+                logger.error(f"Erro ao listar jobs: {e}")
+                raise QueueError(f"Falha ao listar jobs: {e}")
 
     async def update_metadata(self, job_id: str, metadata: dict[str, object]) -> None:
         """
@@ -868,35 +1705,36 @@ class SQLiteJobQueue(JobQueuePort):
             job_id: ID do job
             metadata: Novo metadata (será mesclado com o existente)
         """
-        conn = self._get_connection()
+        return await self._run(self._update_metadata_sync, job_id, metadata)
 
-        try:
-            cursor = conn.cursor()
+    def _update_metadata_sync(self, job_id: str, metadata: dict[str, object]) -> None:
+        """Corpo síncrono de update_metadata() (executado no executor do pool)."""
+        with self._write_connection() as conn:
+            try:
+                cursor = conn.cursor()
 
-            # Primeiro, obtém o metadata atual
-            cursor.execute("SELECT metadata FROM jobs WHERE id = ?", (job_id,))
-            row = cursor.fetchone()
+                # Primeiro, obtém o metadata atual
+                cursor.execute("SELECT metadata FROM jobs WHERE id = ?", (job_id,))
+                row = cursor.fetchone()
 
-            if row:
-                # Mescla metadata existente com o novo
-                existing_metadata = json.loads(row["metadata"]) if row["metadata"] else {}
-                existing_metadata.update(metadata)
+                if row:
+                    # Mescla metadata existente com o novo
+                    existing_metadata = json.loads(row["metadata"]) if row["metadata"] else {}
+                    existing_metadata.update(metadata)
 
-                # Atualiza
-                cursor.execute(
-                    """
-                    UPDATE jobs
-                    SET metadata = ?
-                    WHERE id = ?
-                    """,
-                    (json.dumps(existing_metadata), job_id),
-                )
+                    # Atualiza
+                    cursor.execute(
+                        """
+                        UPDATE jobs
+                        SET metadata = ?
+                        WHERE id = ?
+                        """,
+                        (json.dumps(existing_metadata), job_id),
+                    )
 
-                conn.commit()
-                logger.info(f"Metadata do job {job_id} atualizado")
+                    conn.commit()
+                    logger.info(f"Metadata do job {job_id} atualizado")
 
-        except Exception as e:
-            conn.rollback()
-            raise QueueError(f"Falha ao atualizar metadata do job {job_id}: {e}")
-        finally:
-            conn.close()
+            except Exception as e:
+                conn.rollback()
+                raise QueueError(f"Falha ao atualizar metadata do job {job_id}: {e}")
@@ -21,8 +21,16 @@ def query(
     input_schema: dict[str, Any] | None = None,
     output_schema: dict[str, Any] | None = None,
     notification_allowed: bool = False,
+    execution: str | None = None,
+    max_concurrency: int | None = None,
+    timeout: float | None = None,
 ) -> Callable[[Callable[P, Result[Any, str]]], Callable[P, Result[Any, str]]]:
-    """Decorador para registrar query handler automaticamente."""
+    """
+    Decorador para registrar query handler automaticamente.
+
+    execution/max_concurrency/timeout controlam como as rotas executam o
+    handler (ver kernel.registry.handler_executor).
+    """
     def decorator(func: Callable[P, Result[Any, str]]) -> Callable[P, Result[Any, str]]:
         get_query_registry().register(
             name=name,
@@ -34,6 +42,9 @@ def query(
             auth=auth,
             input_schema=input_schema,
             output_schema=output_schema,
+            execution=execution,
+            max_concurrency=max_concurrency,
+            timeout=timeout,
         )
         return func
 
@@ -49,8 +60,16 @@ def command(
     input_schema: dict[str, Any] | None = None,
     output_schema: dict[str, Any] | None = None,
     notification_allowed: bool = False,
+    execution: str | None = None,
+    max_concurrency: int | None = None,
+    timeout: float | None = None,
 ) -> Callable[[Callable[P, Result[Any, str]]], Callable[P, Result[Any, str]]]:
-    """Decorador para registrar command handler automaticamente."""
+    """
+    Decorador para registrar command handler automaticamente.
+
+    execution/max_concurrency/timeout controlam como as rotas executam o
+    handler (ver kernel.registry.handler_executor).
+    """
     def decorator(func: Callable[P, Result[Any, str]]) -> Callable[P, Result[Any, str]]:
         get_query_registry().register(
             name=name,
@@ -62,6 +81,9 @@ def command(
             auth=auth,
             input_schema=input_schema,
             output_schema=output_schema,
+            execution=execution,
+            max_concurrency=max_concurrency,
+            timeout=timeout,
         )
         return func
 
@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+"""
+Handler Executor — Execução de handlers Sky-RPC fora do event loop.
+
+As rotas /envelope e /webhooks chamavam `handler.handler(args)` direto
+dentro da rota async: um handler pesado (ex: snapshot.capture, que
+percorre diretórios e chama git) bloqueava o event loop para todos os
+clientes. Cada QueryHandler agora declara como deve rodar:
+
+- "async":   corrotina aguardada no próprio loop
+- "thread":  função síncrona (I/O, subprocessos) em pool de threads
+- "process": função CPU-bound em pool de processos (handler e args
+             precisam ser picklable)
+
+Com limite de concorrência por método (max_concurrency) e timeout.
+"""
+
+import asyncio
+import concurrent.futures
+import functools
+import inspect
+import logging
+import threading
+import weakref
+from typing import Any, Callable, Optional
+
+from ..contracts.result import Result
+
+
+logger = logging.getLogger(__name__)
+
+
+EXECUTION_ASYNC = "async"
+EXECUTION_THREAD = "thread"
+EXECUTION_PROCESS = "process"
+EXECUTION_MODES = frozenset({EXECUTION_ASYNC, EXECUTION_THREAD, EXECUTION_PROCESS})
+
+# Threads dedicadas a handlers (não disputa o executor padrão do loop)
+DEFAULT_MAX_THREADS = 32
+
+
+def detect_execution(handler: Callable[..., Any]) -> str:
+    """Modo de execução padrão: corrotinas no loop, o resto em thread."""
+    if inspect.iscoroutinefunction(handler):
+        return EXECUTION_ASYNC
+    return EXECUTION_THREAD
+
+
+def validate_execution(execution: str) -> str:
+    """Valida o modo de execução declarado no registro."""
+    if execution not in EXECUTION_MODES:
+        raise ValueError(
+            f"Invalid execution mode: {execution} (expected one of {sorted(EXECUTION_MODES)})"
+        )
+    return execution
+
+
+class HandlerTimeoutError(TimeoutError):
+    """Handler excedeu o timeout configurado."""
+
+    def __init__(self, method: str, timeout: float):
+        super().__init__(f"Handler {method} timed out after {timeout}s")
+        self.method = method
+        self.timeout = timeout
+
+
+def _invoke(func: Callable[..., Any], args: Optional[dict[str, Any]]) -> Any:
+    """Chama o handler com a mesma convenção das rotas (args opcionais)."""
+    return func(args) if args else func()
+
+
+def _invoke_blocking(func: Callable[..., Any], args: Optional[dict[str, Any]]) -> Any:
+    """Chama o handler em thread/processo, rodando corrotinas num loop próprio."""
+    result = _invoke(func, args)
+    if inspect.isawaitable(result):
+        async def _await():
+            return await result
+        return asyncio.run(_await())
+    return result
+
+
+class HandlerExecutor:
+    """
+    Executa QueryHandlers conforme o modo declarado.
+
+    Semáforos por método são criados por event loop (asyncio.Semaphore
+    não atravessa loops; handlers síncronos rodam corrotinas com
+    asyncio.run nas threads do executor).
+    """
+
+    def __init__(
+        self,
+        max_threads: int = DEFAULT_MAX_THREADS,
+        max_processes: Optional[int] = None,
+    ):
+        """
+        Inicializa o executor (pools criados sob demanda).
+
+        Args:
+            max_threads: Threads para handlers "thread"
+            max_processes: Processos para handlers "process" (None = CPUs)
+        """
+        self.max_threads = max_threads
+        self.max_processes = max_processes
+        self._threads: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._processes: Optional[concurrent.futures.ProcessPoolExecutor] = None
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def _thread_pool(self) -> concurrent.futures.ThreadPoolExecutor:
+        with self._lock:
+            if self._threads is None:
+                self._threads = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_threads,
+                    thread_name_prefix="skyrpc-handler",
+                )
+            return self._threads
+
+    def _process_pool(self) -> concurrent.futures.ProcessPoolExecutor:
+        with self._lock:
+            if self._processes is None:
+                self._processes = concurrent.futures.ProcessPoolExecutor(max_workers=self.max_processes)
+            return self._processes
+
+    def _semaphore(self, method: str, limit: Optional[int]) -> Optional[asyncio.Semaphore]:
+        """Semáforo do método no loop atual (None = sem limite)."""
+        if not limit:
+            return None
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            per_loop = self._semaphores.setdefault(loop, {})
+            semaphore = per_loop.get(method)
+            if semaphore is None:
+                semaphore = asyncio.Semaphore(limit)
+                per_loop[method] = semaphore
+            return semaphore
+
+    async def execute(self, handler: Any, args: Optional[dict[str, Any]] = None) -> Result:
+        """
+        Executa um QueryHandler.
+
+        Args:
+            handler: QueryHandler registrado
+            args: Argumentos do handler (None/vazio = chamada sem argumentos)
+
+        Returns:
+            Result retornado pelo handler
+
+        Raises:
+            HandlerTimeoutError: Handler (incluindo espera na fila) excedeu o timeout
+            Exception: Exceções do handler são propagadas
+        """
+        timeout = getattr(handler, "timeout", None)
+        call = self._run(handler, args)
+        if not timeout:
+            return await call
+        try:
+            return await asyncio.wait_for(call, timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Handler {handler.name} excedeu timeout de {timeout}s")
+            raise HandlerTimeoutError(handler.name, timeout) from None
+
+    async def _run(self, handler: Any, args: Optional[dict[str, Any]]) -> Result:
+        """Aplica o limite do método e despacha conforme o modo."""
+        semaphore = self._semaphore(handler.name, getattr(handler, "max_concurrency", None))
+        if semaphore is None:
+            return await self._dispatch(handler, args)
+        async with semaphore:
+            return await self._dispatch(handler, args)
+
+    async def _dispatch(self, handler: Any, args: Optional[dict[str, Any]]) -> Result:
+        execution = getattr(handler, "execution", None) or detect_execution(handler.handler)
+        loop = asyncio.get_running_loop()
+
+        if execution == EXECUTION_ASYNC:
+            result = _invoke(handler.handler, args)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+
+        if execution == EXECUTION_PROCESS:
+            try:
+                return await loop.run_in_executor(
+                    self._process_pool(),
+                    functools.partial(_invoke_blocking, handler.handler, args),
+                )
+            except concurrent.futures.process.BrokenProcessPool:
+                with self._lock:
+                    self._processes = None
+                return Result.err(f"Handler {handler.name}: pool de processos interrompido")
+
+        return await loop.run_in_executor(
+            self._thread_pool(),
+            functools.partial(_invoke_blocking, handler.handler, args),
+        )
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Encerra os pools (tarefas em andamento seguem até o fim)."""
+        with self._lock:
+            threads, processes = self._threads, self._processes
+            self._threads = None
+            self._processes = None
+        if threads is not None:
+            threads.shutdown(wait=wait, cancel_futures=True)
+        if processes is not None:
+            processes.shutdown(wait=wait, cancel_futures=True)
+
+
+# Singleton global
+_handler_executor = HandlerExecutor()
+
+
+def get_handler_executor() -> HandlerExecutor:
+    """Retorna o executor global de handlers."""
+    return _handler_executor
@@ -10,6 +10,7 @@ from dataclasses import dataclass
 
 from ..contracts.result import Result
 from ..envelope.envelope import Envelope
+from .handler_executor import detect_execution, validate_execution
 
 Q = TypeVar("Q")  # Query type
 R = TypeVar("R")  # Result type
@@ -17,7 +18,13 @@ R = TypeVar("R")  # Result type
 
 @dataclass
 class QueryHandler:
-    """Wrapper para query handler."""
+    """
+    Wrapper para query handler.
+
+    execution define onde o handler roda (ver handler_executor):
+    "async" (no event loop), "thread" ou "process". None = detecta pela
+    assinatura do handler.
+    """
     name: str
     handler: Callable[..., Result[Any, str]]
     description: str | None = None
@@ -27,6 +34,15 @@ class QueryHandler:
     auth: str | None = None
     input_schema: dict[str, Any] | None = None
     output_schema: dict[str, Any] | None = None
+    execution: str | None = None
+    max_concurrency: int | None = None
+    timeout: float | None = None
+
+    def __post_init__(self) -> None:
+        if self.execution is None:
+            self.execution = detect_execution(self.handler)
+        else:
+            validate_execution(self.execution)
 
 
 class QueryRegistry:
@@ -54,8 +70,18 @@ class QueryRegistry:
         auth: str | None = None,
         input_schema: dict[str, Any] | None = None,
         output_schema: dict[str, Any] | None = None,
+        execution: str | None = None,
+        max_concurrency: int | None = None,
+        timeout: float | None = None,
     ) -> None:
-        """Registra um query handler."""
+        """
+        Registra um query handler.
+
+        Args:
+            execution: "async", "thread" ou "process" (None = detecta)
+            max_concurrency: Execuções simultâneas do método (None = sem limite)
+            timeout: Timeout de execução em segundos (None = sem limite)
+        """
         if "_" in name:
             raise ValueError(
                 f"Query handler name must use context.action (no underscores): {name}"
@@ -72,6 +98,9 @@ class QueryRegistry:
             auth=auth,
             input_schema=input_schema,
             output_schema=output_schema,
+            execution=execution,
+            max_concurrency=max_concurrency,
+            timeout=timeout,
         )
 
     def get(self, name: str) -> QueryHandler | None:
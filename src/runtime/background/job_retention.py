@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""
+Job Retention Background Service.
+
+Serviço periódico que mantém a fila de jobs enxuta: arquiva jobs
+finalizados antigos (JobQueuePort.archive_finished_jobs) e devolve o
+espaço liberado de forma incremental (JobQueuePort.compact_storage).
+
+Sem ele, payloads completos de GitHub/Trello se acumulam na tabela quente
+e listagens/varreduras por status degradam com o crescimento do banco.
+
+Iniciado pelo lifespan da API (bootstrap/app.py) junto com o worker.
+"""
+from __future__ import annotations
+
+import asyncio
+
+from core.webhooks.ports.job_queue_port import JobQueuePort
+from runtime.observability.logger import get_logger
+
+logger = get_logger()
+
+
+class JobRetentionService:
+    """
+    Executa retenção da fila de jobs em intervalos fixos.
+
+    Cada ciclo:
+    1. Arquiva jobs completed/failed finalizados há mais de retention_days
+    2. Remove registros de deduplicação (delivery_id) expirados
+    3. Libera até vacuum_pages páginas livres (incremental, sem VACUUM completo)
+
+    No primeiro ciclo o armazenamento é verificado: bancos antigos sem
+    compactação incremental são convertidos uma única vez (convert_storage)
+    ou apenas geram aviso no log.
+
+    Filas que não implementam arquivamento (defaults do port) tornam o
+    ciclo um no-op.
+
+    Attributes:
+        job_queue: Fila de jobs
+        retention_days: Idade mínima (dias) de jobs finalizados a arquivar
+        interval: Intervalo entre ciclos (segundos)
+        batch_size: Jobs arquivados por transação
+        vacuum_pages: Páginas liberadas por ciclo
+        convert_storage: Converter armazenamento antigo (VACUUM único)
+    """
+
+    def __init__(
+        self,
+        job_queue: JobQueuePort,
+        retention_days: int = 7,
+        interval: float = 3600.0,
+        batch_size: int = 500,
+        vacuum_pages: int = 1000,
+        convert_storage: bool = True,
+    ):
+        """
+        Inicializa serviço de retenção.
+
+        Args:
+            job_queue: Fila de jobs
+            retention_days: Arquivar jobs finalizados há mais de X dias
+            interval: Intervalo entre ciclos em segundos
+            batch_size: Jobs arquivados por transação
+            vacuum_pages: Máximo de páginas liberadas por ciclo
+            convert_storage: Converter bancos antigos para compactação incremental
+        """
+        self.job_queue = job_queue
+        self.retention_days = retention_days
+        self.interval = interval
+        self.batch_size = batch_size
+        self.vacuum_pages = vacuum_pages
+        self.convert_storage = convert_storage
+        self._compaction_ready: bool | None = None
+        self._running = False
+        self._shutdown_event = asyncio.Event()
+
+    async def start(self) -> None:
+        """Inicia loop de retenção (primeiro ciclo imediato)."""
+        self._running = True
+        logger.info(
+            f"Retenção de jobs iniciada (>{self.retention_days} dias, "
+            f"a cada {self.interval:.0f}s)"
+        )
+
+        while self._running:
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.warning(f"Falha no ciclo de retenção de jobs: {e}")
+
+            try:
+                await asyncio.wait_for(self._shutdown_event.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+            except asyncio.CancelledError:
+                break
+
+        logger.info("Retenção de jobs parada")
+
+    async def run_once(self) -> dict[str, int]:
+        """
+        Executa um ciclo de retenção.
+
+        Returns:
+            Dicionário com jobs arquivados, deliveries expirados removidos
+            e páginas liberadas
+        """
+        archived = await self.job_queue.archive_finished_jobs(
+            self.retention_days, batch_size=self.batch_size
+        )
+        purged = await self.job_queue.purge_expired_deliveries()
+
+        # Verificação única: bancos antigos não liberam páginas sem conversão
+        if self._compaction_ready is None:
+            self._compaction_ready = await self.job_queue.ensure_incremental_compaction(
+                convert=self.convert_storage
+            )
+        reclaimed = (
+            await self.job_queue.compact_storage(self.vacuum_pages)
+            if self._compaction_ready
+            else 0
+        )
+
+        if archived or purged or reclaimed:
+            logger.info(
+                f"Retenção: {archived} jobs arquivados, {purged} deliveries "
+                f"expirados, {reclaimed} páginas liberadas"
+            )
+        return {
+            "archived": archived,
+            "purged_deliveries": purged,
+            "reclaimed_pages": reclaimed,
+        }
+
+    def stop(self) -> None:
+        """Sinaliza shutdown do serviço."""
+        self._running = False
+        self._shutdown_event.set()
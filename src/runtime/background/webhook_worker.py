@@ -5,13 +5,17 @@ Webhook Background Worker.
 Worker assíncrono que processa jobs de webhook em background.
 
 O worker é iniciado automaticamente pelo bootstrap da API (bootstrap/app.py)
-e compartilha a mesma fila de jobs (JobQueuePort) configurada via JobQueueFactory.
+como task no event loop da API e compartilha a mesma fila de jobs
+(JobQueuePort) configurada via JobQueueFactory. Por rodar no loop da API,
+nada no caminho de um job pode bloquear: subprocessos usam
+AsyncProcessRunner e I/O síncrono pesado vai para asyncio.to_thread.
 """
 from __future__ import annotations
 
 import asyncio
 import signal
 import sys
+from collections import Counter, deque
 
 from core.webhooks.application.job_orchestrator import (
     JobOrchestrator,
@@ -19,6 +23,7 @@ from core.webhooks.application.job_orchestrator import (
 from core.webhooks.application.worktree_manager import (
     WorktreeManager,
 )
+from core.webhooks.domain import WebhookJob, get_concurrency_keys
 from core.webhooks.ports.job_queue_port import JobQueuePort
 from runtime.config.config import get_webhook_config, get_trello_config
 from runtime.observability.logger import get_logger
@@ -31,15 +36,28 @@ class WebhookWorker:
     Worker para processamento de webhooks em background.
 
     Responsabilidades:
-    - Poll job queue continuamente
-    - Executar jobs via JobOrchestrator
+    - Aguardar jobs (wakeup push via wait_for_job, poll_interval como teto)
+    - Executar até max_concurrent_jobs jobs simultâneos via JobOrchestrator
+    - Serializar jobs da mesma issue/card e limitar jobs por repositório
+    - Renovar lease dos jobs reservados (heartbeat)
+    - Recuperar jobs de workers mortos (reaper de leases expirados)
     - Handle erros gracefully
     - Shutdown gracefully
 
+    Backpressure: o worker só desenfileira quando há slot livre; jobs cuja
+    chave de concorrência está ocupada ficam em um buffer local limitado
+    (max_deferred_jobs). Com o buffer cheio, nada mais sai da fila e o
+    excedente permanece persistido nela.
+
     Attributes:
         job_queue: Fila de jobs
         orchestrator: Orquestrador de jobs
         poll_interval: Intervalo entre polls (segundos)
+        max_concurrent_jobs: Número de jobs executados simultaneamente
+        max_jobs_per_repository: Limite por repositório (0 = sem limite próprio)
+        max_deferred_jobs: Tamanho do buffer de jobs aguardando chave livre
+        heartbeat_interval: Intervalo entre renovações de lease (segundos)
+        reap_interval: Intervalo entre execuções do reaper (segundos)
     """
 
     def __init__(
@@ -47,6 +65,11 @@ class WebhookWorker:
         job_queue: JobQueuePort,
         orchestrator: JobOrchestrator,
         poll_interval: float = 1.0,
+        max_concurrent_jobs: int = 1,
+        max_jobs_per_repository: int = 0,
+        max_deferred_jobs: int | None = None,
+        heartbeat_interval: float = 60.0,
+        reap_interval: float = 30.0,
     ):
         """
         Inicializa worker.
@@ -55,53 +78,88 @@ class WebhookWorker:
             job_queue: Fila de jobs
             orchestrator: Orquestrador de jobs
             poll_interval: Intervalo entre polls em segundos
+            max_concurrent_jobs: Slots de execução (1 = comportamento sequencial)
+            max_jobs_per_repository: Máximo de jobs simultâneos no mesmo
+                repositório/board (0 = limitado apenas por max_concurrent_jobs)
+            max_deferred_jobs: Jobs reservados aguardando chave livre
+                (None = 2 x max_concurrent_jobs)
+            heartbeat_interval: Intervalo entre heartbeats do job em execução
+                (deve ser bem menor que o lease da fila)
+            reap_interval: Intervalo mínimo entre execuções do reaper
         """
         self.job_queue = job_queue
         self.orchestrator = orchestrator
         self.poll_interval = poll_interval
+        self.max_concurrent_jobs = max(1, max_concurrent_jobs)
+        self.max_jobs_per_repository = max(0, max_jobs_per_repository)
+        self.max_deferred_jobs = (
+            max_deferred_jobs
+            if max_deferred_jobs is not None
+            else 2 * self.max_concurrent_jobs
+        )
+        self.heartbeat_interval = heartbeat_interval
+        self.reap_interval = reap_interval
+        self._last_reap = 0.0
         self._running = False
         self._shutdown_event = asyncio.Event()
 
+        # Estado do pool (criado em start(), no loop do worker)
+        self._in_flight: dict[str, asyncio.Task] = {}
+        self._heartbeats: dict[str, asyncio.Task] = {}
+        self._deferred: deque[WebhookJob] = deque()
+        self._active_issues: set[str] = set()
+        self._active_repos: Counter[str] = Counter()
+        self._slot_freed: asyncio.Event | None = None
+
     async def start(self) -> None:
         """Inicia loop de processamento."""
         self._running = True
-        logger.info("Worker de webhook iniciado")
+        self._slot_freed = asyncio.Event()
+        logger.info(
+            f"Worker de webhook iniciado (concorrência: {self.max_concurrent_jobs})"
+        )
         print(f"\033[2m{'═' * 60}\033[0m")
 
 
         while self._running:
             try:
-                # Tenta desenfileir job
-                job = await self.job_queue.dequeue()
+                # Recupera jobs de workers que morreram (lease expirado)
+                await self._maybe_reap_expired_leases()
 
-                if job:
-                    logger.info(
-                        f"Processando job {job.job_id}",
-                        extra={
-                            "job_id": job.job_id,
-                            "source": str(job.event.source),  # Conversão para string (SQLite salva como string)
-                            "event_type": job.event.event_type,
-                        },
-                    )
+                # Backpressure: sem slot livre, aguarda algum job terminar
+                if len(self._in_flight) >= self.max_concurrent_jobs:
+                    await self._wait_slot_freed()
+                    continue
+
+                job = self._pop_runnable_deferred()
 
-                    # Executa job
-                    result = await self.orchestrator.execute_job(job.job_id)
+                if job is None and len(self._deferred) < self.max_deferred_jobs:
+                    # Tenta desenfileir job
+                    job = await self.job_queue.dequeue()
 
-                    if result.is_ok:
+                    if job and not self._can_start(job):
+                        # Mesma issue em execução ou repositório no limite
+                        self._hold(job)
+                        self._deferred.append(job)
                         logger.info(
-                            f"Job {job.job_id} completado",
-                            extra={"job_id": job.job_id},
-                        )
-                    else:
-                        logger.error(
-                            f"Job {job.job_id} falhou: {result.error}",
+                            f"Job {job.job_id} aguardando chave de concorrência livre",
                             extra={"job_id": job.job_id},
                         )
+                        continue
+
+                if job:
+                    self._launch(job)
+                elif self._deferred or self._in_flight:
+                    # Jobs adiados/em execução: acorda no fim de um job ou em novo enqueue
+                    if self._shutdown_event.is_set():
+                        break
+                    await self._wait_for_work()
                 else:
-                    # Sem jobs por enquanto, aguarda antes de tentar novamente
+                    # Sem jobs: aguarda notificação de enqueue (push) ou
+                    # poll_interval, o que vier primeiro
                     if self._shutdown_event.is_set():
                         break
-                    await asyncio.sleep(self.poll_interval)
+                    await self.job_queue.wait_for_job(self.poll_interval)
                     continue
 
             except asyncio.CancelledError:
@@ -114,8 +172,209 @@ class WebhookWorker:
                 )
                 # Continua processando após erro
 
+        await self._drain()
         logger.info("Worker de webhook parado")
 
+    async def get_stats(self) -> dict[str, object]:
+        """
+        Retorna estado do pool (observabilidade/backpressure).
+
+        Returns:
+            Dicionário com jobs em execução, adiados e tamanho da fila
+        """
+        return {
+            "max_concurrent_jobs": self.max_concurrent_jobs,
+            "in_flight": len(self._in_flight),
+            "deferred": len(self._deferred),
+            "queue_depth": await self.job_queue.pending_count(),
+            "active_repositories": dict(self._active_repos),
+        }
+
+    def _can_start(self, job: WebhookJob) -> bool:
+        """Verifica se as chaves de concorrência do job estão livres."""
+        repo_key, issue_key = get_concurrency_keys(job)
+
+        if issue_key and issue_key in self._active_issues:
+            return False
+        if (
+            repo_key
+            and self.max_jobs_per_repository
+            and self._active_repos[repo_key] >= self.max_jobs_per_repository
+        ):
+            return False
+        return True
+
+    def _pop_runnable_deferred(self) -> WebhookJob | None:
+        """Retira do buffer o job adiado mais antigo que já pode rodar (FIFO)."""
+        for job in self._deferred:
+            if self._can_start(job):
+                self._deferred.remove(job)
+                return job
+        return None
+
+    def _hold(self, job: WebhookJob) -> None:
+        """Mantém o lease de um job reservado (em execução ou adiado)."""
+        if job.job_id not in self._heartbeats:
+            self._heartbeats[job.job_id] = asyncio.create_task(
+                self._heartbeat_loop(job.job_id)
+            )
+
+    def _launch(self, job: WebhookJob) -> None:
+        """Ocupa as chaves de concorrência e executa o job em uma task."""
+        repo_key, issue_key = get_concurrency_keys(job)
+        if issue_key:
+            self._active_issues.add(issue_key)
+        if repo_key:
+            self._active_repos[repo_key] += 1
+
+        self._hold(job)
+        task = asyncio.create_task(self._run_job(job))
+        self._in_flight[job.job_id] = task
+        task.add_done_callback(
+            lambda _task, job=job: self._release(job, repo_key, issue_key)
+        )
+
+    def _release(self, job: WebhookJob, repo_key: str | None, issue_key: str | None) -> None:
+        """Libera chaves e slot quando o job termina."""
+        self._in_flight.pop(job.job_id, None)
+
+        heartbeat = self._heartbeats.pop(job.job_id, None)
+        if heartbeat:
+            heartbeat.cancel()
+
+        if issue_key:
+            self._active_issues.discard(issue_key)
+        if repo_key:
+            self._active_repos[repo_key] -= 1
+            if self._active_repos[repo_key] <= 0:
+                del self._active_repos[repo_key]
+
+        if self._slot_freed:
+            self._slot_freed.set()
+
+    async def _run_job(self, job: WebhookJob) -> None:
+        """Executa um job via orquestrador (erros são logados, nunca propagados)."""
+        logger.info(
+            f"Processando job {job.job_id}",
+            extra={
+                "job_id": job.job_id,
+                "source": str(job.event.source),  # Conversão para string (SQLite salva como string)
+                "event_type": job.event.event_type,
+            },
+        )
+
+        try:
+            result = await self.orchestrator.execute_job(job.job_id)
+        except Exception as e:
+            import traceback
+            logger.error(
+                f"Erro ao executar job {job.job_id}: {str(e)}\n{traceback.format_exc()}",
+                extra={"job_id": job.job_id},
+            )
+            return
+
+        if result.is_ok:
+            logger.info(
+                f"Job {job.job_id} completado",
+                extra={"job_id": job.job_id},
+            )
+        else:
+            logger.error(
+                f"Job {job.job_id} falhou: {result.error}",
+                extra={"job_id": job.job_id},
+            )
+
+    async def _wait_slot_freed(self) -> None:
+        """Aguarda algum job em execução terminar (ou poll_interval)."""
+        self._slot_freed.clear()
+        try:
+            await asyncio.wait_for(self._slot_freed.wait(), timeout=self.poll_interval)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _wait_for_work(self) -> None:
+        """Aguarda fim de um job ou novo enqueue, o que vier primeiro."""
+        self._slot_freed.clear()
+        waiters = [asyncio.create_task(self._slot_freed.wait())]
+        if len(self._deferred) < self.max_deferred_jobs:
+            waiters.append(
+                asyncio.create_task(self.job_queue.wait_for_job(self.poll_interval))
+            )
+
+        try:
+            await asyncio.wait(
+                waiters,
+                timeout=self.poll_interval,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+
+    async def _drain(self) -> None:
+        """Aguarda jobs em execução no shutdown; adiados voltam via lease."""
+        if self._in_flight:
+            logger.info(f"Aguardando {len(self._in_flight)} jobs em execução...")
+            await asyncio.gather(*self._in_flight.values(), return_exceptions=True)
+
+        for heartbeat in self._heartbeats.values():
+            heartbeat.cancel()
+        self._heartbeats.clear()
+
+        if self._deferred:
+            logger.warning(
+                f"{len(self._deferred)} jobs adiados não executados; "
+                "serão re-enfileirados quando o lease expirar"
+            )
+            self._deferred.clear()
+
+    async def _heartbeat_loop(self, job_id: str) -> None:
+        """
+        Renova periodicamente o lease de um job reservado.
+
+        Args:
+            job_id: ID do job reservado
+        """
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                if not await self.job_queue.heartbeat(job_id):
+                    logger.warning(
+                        f"Lease do job {job_id} perdido (job não está mais em processamento)",
+                        extra={"job_id": job_id},
+                    )
+                    return
+            except Exception as e:
+                logger.warning(f"Falha no heartbeat do job {job_id}: {e}")
+
+    async def _maybe_reap_expired_leases(self) -> None:
+        """Executa o reaper da fila no máximo a cada reap_interval segundos."""
+        now = asyncio.get_running_loop().time()
+        if now - self._last_reap < self.reap_interval:
+            return
+        self._last_reap = now
+
+        try:
+            recovered = await self.job_queue.requeue_expired_leases()
+            if recovered:
+                logger.info(f"Reaper recuperou {recovered} jobs com lease expirado")
+        except Exception as e:
+            logger.warning(f"Falha no reaper de leases: {e}")
+
+    def cancel_jobs(self) -> int:
+        """
+        Cancela jobs em execução (shutdown forçado).
+
+        Os jobs voltam à fila quando o lease expirar (reaper).
+
+        Returns:
+            Quantidade de jobs cancelados
+        """
+        tasks = list(self._in_flight.values())
+        for task in tasks:
+            task.cancel()
+        return len(tasks)
+
     def stop(self) -> None:
         """Sinaliza shutdown do worker."""
         self._running = False
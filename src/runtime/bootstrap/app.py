@@ -10,7 +10,6 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
 from contextlib import asynccontextmanager
-import threading
 import uuid
 import yaml
 import asyncio
@@ -30,9 +29,17 @@ from infra.fileops.filesystem_adapter import create_filesystem_adapter
 from core.fileops.application.queries.read_file import ReadFileQuery, set_read_file_query
 
 # Webhook worker (PRD013) - Variáveis globais para gerenciamento no lifespan
-_webhook_worker_thread = None
+# O worker roda como tasks no event loop da API (mesmo loop do EventBus,
+# WebSocketConsoleManager e rotas): nada é compartilhado entre loops.
+_webhook_worker_task = None
 _webhook_worker_instance = None
+_worktree_pool_task = None
+
+# Tempo máximo para jobs em execução terminarem no shutdown (segundos)
+WORKER_SHUTDOWN_TIMEOUT = 5.0
 _trello_listener = None
+_job_retention_service = None
+_job_retention_task = None
 
 
 @asynccontextmanager
@@ -44,7 +51,8 @@ async def lifespan(app: FastAPI):
     - Iniciar o webhook worker no startup
     - Encerrar graciosamente o worker no shutdown
     """
-    global _webhook_worker_thread, _webhook_worker_instance, _trello_listener
+    global _webhook_worker_task, _webhook_worker_instance, _worktree_pool_task, _trello_listener
+    global _job_retention_service, _job_retention_task
 
     from runtime.config.config import get_webhook_config
     from runtime.observability.logger import get_logger, Colors
@@ -97,11 +105,38 @@ async def lifespan(app: FastAPI):
         workspaces_repo.save(core_workspace)
         logger.info(f"{Colors.INFO}Workspace core registrado{Colors.RESET} no workspaces.db")
 
+    # ========== EVENT BUS ==========
+    # Entregas em background rodam no loop da API: eventos publicados em
+    # loops efêmeros (asyncio.run em threads) são repassados a ele
+    from infra.domain_events.in_memory_event_bus import InMemoryEventBus
+    from kernel import get_event_bus
+
+    try:
+        lifespan_bus = get_event_bus()
+    except RuntimeError:
+        lifespan_bus = None
+    if isinstance(lifespan_bus, InMemoryEventBus):
+        lifespan_bus.bind_loop()
+
+    # ========== INTAKE DE WEBHOOKS ==========
+    # Retoma entregas aceitas (202) e não processadas antes do último shutdown
+    from core.webhooks.application.handlers import get_webhook_intake
+
+    for inbox_file in workspace_base.glob("*/data/webhook_inbox.log"):
+        intake = get_webhook_intake(inbox_file.parent.parent.name)
+        if intake.inbox.pending():
+            intake.start()
+
     # ========== STARTUP ==========
     if "github" in webhook_config.enabled_sources:
         from kernel import get_event_bus
         from core.webhooks.application.job_orchestrator import JobOrchestrator
         from core.webhooks.application.worktree_manager import WorktreeManager
+        from core.webhooks.application.worktree_pool import (
+            POOL_DIR_NAME,
+            WorktreePool,
+            set_worktree_pool,
+        )
         from core.webhooks.application.handlers import get_job_queue
         from core.webhooks.application.guardrails import JobGuardrails
         from core.webhooks.application.commit_message_generator import CommitMessageGenerator
@@ -112,7 +147,21 @@ async def lifespan(app: FastAPI):
         logger.info(f"Iniciando worker de {Colors.WHITE}Webhook{Colors.RESET} (lifespan)")
 
         job_queue = get_job_queue()
-        worktree_manager = WorktreeManager(webhook_config.worktree_base_path, webhook_config.base_branch)
+        # Worktrees pré-aquecidos (mantidos por uma task no loop da API)
+        worktree_pool = None
+        if webhook_config.worktree_pool_size > 0:
+            worktree_pool = WorktreePool(
+                Path(webhook_config.worktree_base_path) / POOL_DIR_NAME,
+                webhook_config.base_branch,
+                size=webhook_config.worktree_pool_size,
+            )
+            set_worktree_pool(worktree_pool)
+
+        worktree_manager = WorktreeManager(
+            webhook_config.worktree_base_path,
+            webhook_config.base_branch,
+            pool=worktree_pool,
+        )
         event_bus = get_event_bus()
 
         # TrelloEventListener (PRD018 ARCH-08)
@@ -172,40 +221,34 @@ async def lifespan(app: FastAPI):
             enable_auto_commit=True,
             enable_auto_pr=github_client is not None,
         )
-        _webhook_worker_instance = WebhookWorker(job_queue, orchestrator)
+        _webhook_worker_instance = WebhookWorker(
+            job_queue,
+            orchestrator,
+            max_concurrent_jobs=webhook_config.worker_concurrency,
+            max_jobs_per_repository=webhook_config.worker_max_jobs_per_repo,
+        )
 
         # Inicia TrelloEventListener
         if _trello_listener:
             await _trello_listener.start()
             logger.info("TrelloEventListener iniciado e inscrito no EventBus")
 
-        # Inicia worker em thread separada
-        async def run_worker():
-            """Corrotina para rodar o worker."""
-            await _webhook_worker_instance.start()
+        # Inicia worker como tasks no event loop da API
+        if worktree_pool is not None:
+            _worktree_pool_task = asyncio.create_task(worktree_pool.run())
+        _webhook_worker_task = asyncio.create_task(_webhook_worker_instance.start())
+        logger.info(f"Worker de {Colors.WHITE}Webhook{Colors.RESET} iniciado no event loop da API")
 
-        # Cria e inicia thread com event loop próprio
-        def run_worker_in_thread():
-            """Executa worker em thread com event loop separado."""
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                loop.run_until_complete(run_worker())
-            finally:
-                # Cancela todas as tasks pendentes antes de fechar
-                pending = asyncio.all_tasks(loop)
-                for task in pending:
-                    task.cancel()
-                loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
-                loop.close()
-
-        _webhook_worker_thread = threading.Thread(
-            target=run_worker_in_thread,
-            daemon=True,
-            name="webhook-worker"
-        )
-        _webhook_worker_thread.start()
-        logger.info(f"Thread do worker de {Colors.WHITE}Webhook{Colors.RESET} iniciada")
+        # Retenção: arquiva jobs finalizados e libera espaço (I/O fora do loop)
+        if webhook_config.job_retention_days > 0:
+            from runtime.background.job_retention import JobRetentionService
+
+            _job_retention_service = JobRetentionService(
+                job_queue,
+                retention_days=webhook_config.job_retention_days,
+                interval=webhook_config.job_retention_interval,
+            )
+            _job_retention_task = asyncio.create_task(_job_retention_service.start())
 
     # Yield para permitir que a aplicação rode
     yield
@@ -213,19 +256,36 @@ async def lifespan(app: FastAPI):
     # ========== SHUTDOWN ==========
     logger.info("Iniciando shutdown graciosos dos recursos...")
 
-    # Para o webhook worker
+    # Para o webhook worker (aguarda jobs em execução até WORKER_SHUTDOWN_TIMEOUT)
     if _webhook_worker_instance:
         logger.info("Enviando sinal de shutdown para o webhook worker...")
         _webhook_worker_instance.stop()
 
-    # Aguarda a thread do worker terminar (com timeout)
-    if _webhook_worker_thread and _webhook_worker_thread.is_alive():
-        logger.info("Aguardando thread do worker terminar...")
-        _webhook_worker_thread.join(timeout=5.0)
-        if _webhook_worker_thread.is_alive():
-            logger.warning("Thread do worker não terminou em 5 segundos (daemon thread será encerrada)")
+    if _webhook_worker_task:
+        done, _ = await asyncio.wait({_webhook_worker_task}, timeout=WORKER_SHUTDOWN_TIMEOUT)
+        if done:
+            logger.info("Worker de webhook encerrado graciosamente")
         else:
-            logger.info("Thread do worker encerrada graciosamente")
+            cancelled = _webhook_worker_instance.cancel_jobs()
+            logger.warning(
+                f"Worker não terminou em {WORKER_SHUTDOWN_TIMEOUT:g} segundos: {cancelled} jobs cancelados "
+                "(voltam à fila quando o lease expirar)"
+            )
+            _webhook_worker_task.cancel()
+            await asyncio.gather(_webhook_worker_task, return_exceptions=True)
+
+    if _worktree_pool_task:
+        _worktree_pool_task.cancel()
+        await asyncio.gather(_worktree_pool_task, return_exceptions=True)
+
+    # Para a retenção de jobs
+    if _job_retention_service:
+        _job_retention_service.stop()
+        if _job_retention_task:
+            try:
+                await asyncio.wait_for(_job_retention_task, timeout=5.0)
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                logger.warning("Retenção de jobs não terminou em 5 segundos")
 
     # Para o TrelloEventListener
     if _trello_listener:
@@ -235,6 +295,18 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.warning(f"Erro ao parar TrelloEventListener: {e}")
 
+    # Fecha conexões compartilhadas dos kanban.db (kanban_routes)
+    from infra.kanban.adapters.sqlite_kanban_adapter import SQLiteKanbanAdapter
+    SQLiteKanbanAdapter.close_shared()
+
+    # Para o intake de webhooks (entregas em andamento ficam pendentes no inbox)
+    from core.webhooks.application.handlers import stop_webhook_intakes
+    await stop_webhook_intakes()
+
+    # Encerra pools de execução dos handlers Sky-RPC
+    from kernel.registry.handler_executor import get_handler_executor
+    get_handler_executor().shutdown()
+
     logger.info("Shutdown concluído")
 
 
@@ -278,8 +350,16 @@ class SkybridgeApp(BaseApp):
             event_bus = get_event_bus()
             self.logger.info(f"EventBus já existe: {type(event_bus).__name__}")
         except RuntimeError:
-            # EventBus ainda não foi criado, criar agora
-            event_bus = InMemoryEventBus()
+            # EventBus ainda não foi criado, criar agora.
+            # Listeners (Trello, métricas, kanban) são entregues em background
+            # e em paralelo: a latência do job não inclui a dos listeners
+            # history_size: log de eventos lido por cursor no SSE (absorve rajadas)
+            event_bus = InMemoryEventBus(
+                history_size=1000,
+                concurrent_dispatch=True,
+                handler_timeout=30.0,
+                fire_and_forget=True,
+            )
             set_event_bus(event_bus)
             self.logger.info("EventBus criado e registrado globalmente (startup)")
 
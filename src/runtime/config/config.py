@@ -92,6 +92,11 @@ class WebhookConfig:
     enabled_sources: list[str]
     base_branch: str = "auto"  # Branch base para criar worktrees de agentes
     delete_password: str | None = None  # Senha para deleção de worktrees no WebUI
+    worker_concurrency: int = 1  # Jobs executados simultaneamente pelo worker
+    worktree_pool_size: int = 0  # Worktrees pré-aquecidos na branch base (0 = desativado, opt-in)
+    worker_max_jobs_per_repo: int = 0  # Limite por repositório (0 = sem limite próprio)
+    job_retention_days: int = 7  # Arquiva jobs finalizados há mais de X dias (0 = desativado)
+    job_retention_interval: float = 3600.0  # Intervalo entre ciclos de retenção (segundos)
 
 
 @dataclass(frozen=True)
@@ -460,6 +465,11 @@ def load_webhook_config() -> WebhookConfig:
         enabled_sources=_env_list("WEBHOOK_ENABLED_SOURCES", ["github"]),
         base_branch=os.getenv("WEBHOOK_BASE_BRANCH", "dev"),  # Branch base para worktrees
         delete_password=os.getenv("WEBUI_DELETE_PASSWORD"),  # Senha para deleção de worktrees
+        worker_concurrency=max(1, int(os.getenv("WEBHOOK_WORKER_CONCURRENCY", "1"))),
+        worktree_pool_size=max(0, int(os.getenv("WEBHOOK_WORKTREE_POOL_SIZE", "0"))),
+        worker_max_jobs_per_repo=max(0, int(os.getenv("WEBHOOK_WORKER_MAX_PER_REPO", "0"))),
+        job_retention_days=max(0, int(os.getenv("WEBHOOK_JOB_RETENTION_DAYS", "7"))),
+        job_retention_interval=float(os.getenv("WEBHOOK_JOB_RETENTION_INTERVAL", "3600")),
     )
 
 
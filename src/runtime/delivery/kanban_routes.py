@@ -31,7 +31,7 @@ import logging
 from pathlib import Path
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException, Request, status, Query
+from fastapi import APIRouter, Header, HTTPException, Request, status, Query
 from pydantic import BaseModel, Field
 
 from core.kanban.domain.database import KanbanBoard, KanbanCard, KanbanList, CardHistory
@@ -48,6 +48,9 @@ logger = logging.getLogger(__name__)
 
 _event_bus = KanbanEventBus.get_instance()
 
+# Intervalo sem eventos após o qual o stream SSE envia heartbeat
+SSE_HEARTBEAT_SECONDS = 15.0
+
 # ============================================================================
 # TrelloSyncService Singleton (BUGFIX: evitar múltiplos workers)
 # ============================================================================
@@ -90,9 +93,8 @@ def _get_trello_sync_service(db_path: Path, workspace_id: str):
             logger.debug(f"[TRELLO_SYNC] TRELLO_BOARD_ID não configurado para workspace {workspace_id}")
             return None, None
 
-        # Cria adapters e CONECTA o db_adapter
-        db_adapter = SQLiteKanbanAdapter(db_path)
-        db_adapter.connect()
+        # Adapter compartilhado do kanban.db (já conectado)
+        db_adapter = SQLiteKanbanAdapter.shared(db_path)
         trello_adapter = TrelloAdapter(
             trello_config.api_key,
             trello_config.api_token,
@@ -141,11 +143,6 @@ async def _sync_card_move_to_trello(card_id: str, db_path: Path, workspace_id: s
     except Exception as e:
         logger.error(f"[TRELLO_SYNC] Exceção ao sync card {card_id}: {e}")
         print(f"[SYNC_TRELLO] ❌ EXCEÇÃO: {e}")
-    finally:
-        # Sempre desconecta o adapter
-        if db_adapter:
-            db_adapter.disconnect()
-            print(f"[SYNC_TRELLO] Adapter desconectado")
 
 
 async def _emit_card_event(event_type: str, card: KanbanCard, workspace_id: str) -> None:
@@ -392,20 +389,16 @@ def create_kanban_router() -> APIRouter:
         """
         workspace_id = request.headers.get("X-Workspace", "core")
         db_path = _get_kanban_db_path(workspace_id)
-        adapter = SQLiteKanbanAdapter(db_path)
-        adapter.connect()
+        adapter = SQLiteKanbanAdapter.shared(db_path)
 
-        try:
-            result = adapter.list_boards()
-            if result.is_err:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=result.error
-                )
+        result = adapter.list_boards()
+        if result.is_err:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=result.error
+            )
 
-            return [BoardSchema.from_domain(board) for board in result.value]
-        finally:
-            adapter.disconnect()
+        return [BoardSchema.from_domain(board) for board in result.value]
 
     @router.get("/boards/{board_id}", response_model=BoardSchema)
     async def get_board(request: Request, board_id: str) -> BoardSchema:
@@ -424,20 +417,16 @@ def create_kanban_router() -> APIRouter:
         """
         workspace_id = request.headers.get("X-Workspace", "core")
         db_path = _get_kanban_db_path(workspace_id)
-        adapter = SQLiteKanbanAdapter(db_path)
-        adapter.connect()
+        adapter = SQLiteKanbanAdapter.shared(db_path)
 
-        try:
-            result = adapter.get_board(board_id)
-            if result.is_err:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=result.error
-                )
+        result = adapter.get_board(board_id)
+        if result.is_err:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=result.error
+            )
 
-            return BoardSchema.from_domain(result.value)
-        finally:
-            adapter.disconnect()
+        return BoardSchema.from_domain(result.value)
 
     @router.post("/boards", response_model=BoardSchema, status_code=status.HTTP_201_CREATED)
     async def create_board(request: Request, data: CreateBoardSchema) -> BoardSchema:
@@ -453,26 +442,22 @@ def create_kanban_router() -> APIRouter:
         """
         workspace_id = request.headers.get("X-Workspace", "core")
         db_path = _get_kanban_db_path(workspace_id)
-        adapter = SQLiteKanbanAdapter(db_path)
-        adapter.connect()
-
-        try:
-            board = KanbanBoard(
-                id=data.id,
-                name=data.name,
-                trello_board_id=data.trello_board_id,
-                trello_sync_enabled=data.trello_sync_enabled,
+        adapter = SQLiteKanbanAdapter.shared(db_path)
+
+        board = KanbanBoard(
+            id=data.id,
+            name=data.name,
+            trello_board_id=data.trello_board_id,
+            trello_sync_enabled=data.trello_sync_enabled,
+        )
+        result = adapter.create_board(board)
+        if result.is_err:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=result.error
             )
-            result = adapter.create_board(board)
-            if result.is_err:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=result.error
-                )
 
-            return BoardSchema.from_domain(result.value)
-        finally:
-            adapter.disconnect()
+        return BoardSchema.from_domain(result.value)
 
     # ==========================================================================
     # ENDPOINTS: LISTS
@@ -495,30 +480,26 @@ def create_kanban_router() -> APIRouter:
         """
         workspace_id = request.headers.get("X-Workspace", "core")
         db_path = _get_kanban_db_path(workspace_id)
-        adapter = SQLiteKanbanAdapter(db_path)
-        adapter.connect()
+        adapter = SQLiteKanbanAdapter.shared(db_path)
 
-        try:
-            if board_id:
-                result = adapter.list_lists(board_id)
+        if board_id:
+            result = adapter.list_lists(board_id)
+        else:
+            # Busca o primeiro board disponível
+            boards_result = adapter.list_boards()
+            if boards_result.is_ok and boards_result.value:
+                first_board_id = boards_result.value[0].id
+                result = adapter.list_lists(first_board_id)
             else:
-                # Busca o primeiro board disponível
-                boards_result = adapter.list_boards()
-                if boards_result.is_ok and boards_result.value:
-                    first_board_id = boards_result.value[0].id
-                    result = adapter.list_lists(first_board_id)
-                else:
-                    result = boards_result  # Propaga erro se não houver boards
-
-            if result.is_err:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=result.error
-                )
-
-            return [ListSchema.from_domain(lst) for lst in result.value]
-        finally:
-            adapter.disconnect()
+                result = boards_result  # Propaga erro se não houver boards
+
+        if result.is_err:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=result.error
+            )
+
+        return [ListSchema.from_domain(lst) for lst in result.value]
 
     @router.post("/lists", response_model=ListSchema, status_code=status.HTTP_201_CREATED)
     async def create_list(request: Request, data: CreateListSchema) -> ListSchema:
@@ -534,27 +515,23 @@ def create_kanban_router() -> APIRouter:
         """
         workspace_id = request.headers.get("X-Workspace", "core")
         db_path = _get_kanban_db_path(workspace_id)
-        adapter = SQLiteKanbanAdapter(db_path)
-        adapter.connect()
-
-        try:
-            list_obj = KanbanList(
-                id=data.id,
-                board_id=data.board_id,
-                name=data.name,
-                position=data.position,
-                trello_list_id=data.trello_list_id,
+        adapter = SQLiteKanbanAdapter.shared(db_path)
+
+        list_obj = KanbanList(
+            id=data.id,
+            board_id=data.board_id,
+            name=data.name,
+            position=data.position,
+            trello_list_id=data.trello_list_id,
+        )
+        result = adapter.create_list(list_obj)
+        if result.is_err:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=result.error
             )
-            result = adapter.create_list(list_obj)
-            if result.is_err:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=result.error
-                )
 
-            return ListSchema.from_domain(result.value)
-        finally:
-            adapter.disconnect()
+        return ListSchema.from_domain(result.value)
 
     # ==========================================================================
     # ENDPOINTS: CARDS
@@ -581,20 +558,16 @@ def create_kanban_router() -> APIRouter:
         """
         workspace_id = request.headers.get("X-Workspace", "core")
         db_path = _get_kanban_db_path(workspace_id)
-        adapter = SQLiteKanbanAdapter(db_path)
-        adapter.connect()
+        adapter = SQLiteKanbanAdapter.shared(db_path)
 
-        try:
-            result = adapter.list_cards(list_id=list_id, being_processed=being_processed)
-            if result.is_err:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=result.error
-                )
+        result = adapter.list_cards(list_id=list_id, being_processed=being_processed)
+        if result.is_err:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=result.error
+            )
 
-            return [CardSchema.from_domain(card) for card in result.value]
-        finally:
-            adapter.disconnect()
+        return [CardSchema.from_domain(card) for card in result.value]
 
     @router.get("/cards/{card_id}", response_model=CardSchema)
     async def get_card(request: Request, card_id: str) -> CardSchema:
@@ -613,20 +586,16 @@ def create_kanban_router() -> APIRouter:
         """
         workspace_id = request.headers.get("X-Workspace", "core")
         db_path = _get_kanban_db_path(workspace_id)
-        adapter = SQLiteKanbanAdapter(db_path)
-        adapter.connect()
+        adapter = SQLiteKanbanAdapter.shared(db_path)
 
-        try:
-            result = adapter.get_card(card_id)
-            if result.is_err:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=result.error
-                )
+        result = adapter.get_card(card_id)
+        if result.is_err:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=result.error
+            )
 
-            return CardSchema.from_domain(result.value)
-        finally:
-            adapter.disconnect()
+        return CardSchema.from_domain(result.value)
 
     @router.post("/cards", response_model=CardSchema, status_code=status.HTTP_201_CREATED)
     async def create_card(request: Request, data: CreateCardSchema) -> CardSchema:
@@ -642,41 +611,37 @@ def create_kanban_router() -> APIRouter:
         """
         workspace_id = request.headers.get("X-Workspace", "core")
         db_path = _get_kanban_db_path(workspace_id)
-        adapter = SQLiteKanbanAdapter(db_path)
-        adapter.connect()
-
-        try:
-            card = KanbanCard(
-                id=data.title.lower().replace(" ", "-"),  # ID simples por enquanto
-                list_id=data.list_id,
-                title=data.title,
-                description=data.description,
-                position=data.position or 0,
-                labels=data.labels,
-                due_date=data.due_date,
-                issue_number=data.issue_number,
-                issue_url=data.issue_url,
-                # Cards Vivos
-                being_processed=data.being_processed or False,
-                processing_job_id=data.processing_job_id,
-                processing_step=data.processing_step or 0,
-                processing_total_steps=data.processing_total_steps or 0,
+        adapter = SQLiteKanbanAdapter.shared(db_path)
+
+        card = KanbanCard(
+            id=data.title.lower().replace(" ", "-"),  # ID simples por enquanto
+            list_id=data.list_id,
+            title=data.title,
+            description=data.description,
+            position=data.position or 0,
+            labels=data.labels,
+            due_date=data.due_date,
+            issue_number=data.issue_number,
+            issue_url=data.issue_url,
+            # Cards Vivos
+            being_processed=data.being_processed or False,
+            processing_job_id=data.processing_job_id,
+            processing_step=data.processing_step or 0,
+            processing_total_steps=data.processing_total_steps or 0,
+        )
+        result = adapter.create_card(card)
+        if result.is_err:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=result.error
             )
-            result = adapter.create_card(card)
-            if result.is_err:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=result.error
-                )
 
-            created_card = result.value
+        created_card = result.value
 
-            # Emite evento SSE para clientes conectados
-            await _emit_card_event("card_created", created_card, workspace_id)
+        # Emite evento SSE para clientes conectados
+        await _emit_card_event("card_created", created_card, workspace_id)
 
-            return CardSchema.from_domain(created_card)
-        finally:
-            adapter.disconnect()
+        return CardSchema.from_domain(created_card)
 
     @router.patch("/cards/{card_id}", response_model=CardSchema)
     async def update_card(request: Request, card_id: str, data: UpdateCardSchema) -> CardSchema:
@@ -698,65 +663,61 @@ def create_kanban_router() -> APIRouter:
         """
         workspace_id = request.headers.get("X-Workspace", "core")
         db_path = _get_kanban_db_path(workspace_id)
-        adapter = SQLiteKanbanAdapter(db_path)
-        adapter.connect()
-
-        try:
-            # Busca card atual para detectar mudança de lista
-            old_card_result = adapter.get_card(card_id)
-            old_list_id = None
-            if old_card_result.is_ok:
-                old_list_id = old_card_result.value.list_id
-
-            # Monta dicionário de updates (apenas campos não-None)
-            updates = {}
-            if data.title is not None:
-                updates["title"] = data.title
-            if data.description is not None:
-                updates["description"] = data.description
-            if data.list_id is not None:
-                updates["list_id"] = data.list_id
-            if data.position is not None:
-                updates["position"] = data.position
-            if data.labels is not None:
-                updates["labels"] = data.labels
-            if data.due_date is not None:
-                updates["due_date"] = data.due_date
-            if data.being_processed is not None:
-                updates["being_processed"] = data.being_processed
-            if data.processing_job_id is not None:
-                updates["processing_job_id"] = data.processing_job_id
-            if data.processing_step is not None:
-                updates["processing_step"] = data.processing_step
-            if data.processing_total_steps is not None:
-                updates["processing_total_steps"] = data.processing_total_steps
-
-            result = adapter.update_card(card_id, **updates)
-            if result.is_err:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=result.error
-                )
-
-            updated_card = result.value
-
-            # Emite evento SSE para clientes conectados
-            await _emit_card_event("card_updated", updated_card, workspace_id)
-
-            # Sincroniza movimento com Trello (fire-and-forget)
-            new_list_id = updated_card.list_id
-            if old_list_id and old_list_id != new_list_id:
-                # DEBUG: Print antes de sync
-                print(f"[DEBUG] Card movido: {card_id} | {old_list_id} → {new_list_id} | sync para Trello iniciado")
-                # Não espera o sync completar (fire-and-forget)
-                import asyncio
-                asyncio.create_task(
-                    _sync_card_move_to_trello(card_id, db_path, workspace_id, old_list_id, new_list_id)
-                )
-
-            return CardSchema.from_domain(updated_card)
-        finally:
-            adapter.disconnect()
+        adapter = SQLiteKanbanAdapter.shared(db_path)
+
+        # Busca card atual para detectar mudança de lista
+        old_card_result = adapter.get_card(card_id)
+        old_list_id = None
+        if old_card_result.is_ok:
+            old_list_id = old_card_result.value.list_id
+
+        # Monta dicionário de updates (apenas campos não-None)
+        updates = {}
+        if data.title is not None:
+            updates["title"] = data.title
+        if data.description is not None:
+            updates["description"] = data.description
+        if data.list_id is not None:
+            updates["list_id"] = data.list_id
+        if data.position is not None:
+            updates["position"] = data.position
+        if data.labels is not None:
+            updates["labels"] = data.labels
+        if data.due_date is not None:
+            updates["due_date"] = data.due_date
+        if data.being_processed is not None:
+            updates["being_processed"] = data.being_processed
+        if data.processing_job_id is not None:
+            updates["processing_job_id"] = data.processing_job_id
+        if data.processing_step is not None:
+            updates["processing_step"] = data.processing_step
+        if data.processing_total_steps is not None:
+            updates["processing_total_steps"] = data.processing_total_steps
+
+        result = adapter.update_card(card_id, **updates)
+        if result.is_err:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=result.error
+            )
+
+        updated_card = result.value
+
+        # Emite evento SSE para clientes conectados
+        await _emit_card_event("card_updated", updated_card, workspace_id)
+
+        # Sincroniza movimento com Trello (fire-and-forget)
+        new_list_id = updated_card.list_id
+        if old_list_id and old_list_id != new_list_id:
+            # DEBUG: Print antes de sync
+            print(f"[DEBUG] Card movido: {card_id} | {old_list_id} → {new_list_id} | sync para Trello iniciado")
+            # Não espera o sync completar (fire-and-forget)
+            import asyncio
+            asyncio.create_task(
+                _sync_card_move_to_trello(card_id, db_path, workspace_id, old_list_id, new_list_id)
+            )
+
+        return CardSchema.from_domain(updated_card)
 
     @router.delete("/cards/{card_id}", status_code=status.HTTP_204_NO_CONTENT)
     async def delete_card(request: Request, card_id: str) -> None:
@@ -772,25 +733,21 @@ def create_kanban_router() -> APIRouter:
         """
         workspace_id = request.headers.get("X-Workspace", "core")
         db_path = _get_kanban_db_path(workspace_id)
-        adapter = SQLiteKanbanAdapter(db_path)
-        adapter.connect()
-
-        try:
-            # Primeiro busca o card para poder enviar os dados no evento
-            card_result = adapter.get_card(card_id)
-            if card_result.is_ok:
-                card_to_delete = card_result.value
-                # Emite evento SSE antes de deletar
-                await _emit_card_event("card_deleted", card_to_delete, workspace_id)
-
-            result = adapter.delete_card(card_id)
-            if result.is_err:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=result.error
-                )
-        finally:
-            adapter.disconnect()
+        adapter = SQLiteKanbanAdapter.shared(db_path)
+
+        # Primeiro busca o card para poder enviar os dados no evento
+        card_result = adapter.get_card(card_id)
+        if card_result.is_ok:
+            card_to_delete = card_result.value
+            # Emite evento SSE antes de deletar
+            await _emit_card_event("card_deleted", card_to_delete, workspace_id)
+
+        result = adapter.delete_card(card_id)
+        if result.is_err:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=result.error
+            )
 
     # ==========================================================================
     # ENDPOINTS: CARD HISTORY
@@ -810,20 +767,16 @@ def create_kanban_router() -> APIRouter:
         """
         workspace_id = request.headers.get("X-Workspace", "core")
         db_path = _get_kanban_db_path(workspace_id)
-        adapter = SQLiteKanbanAdapter(db_path)
-        adapter.connect()
+        adapter = SQLiteKanbanAdapter.shared(db_path)
 
-        try:
-            result = adapter.get_card_history(card_id)
-            if result.is_err:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=result.error
-                )
+        result = adapter.get_card_history(card_id)
+        if result.is_err:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=result.error
+            )
 
-            return [CardHistorySchema.from_domain(h) for h in result.value]
-        finally:
-            adapter.disconnect()
+        return [CardHistorySchema.from_domain(h) for h in result.value]
 
     # ==========================================================================
     # ENDPOINTS: SYNC
@@ -833,6 +786,7 @@ def create_kanban_router() -> APIRouter:
         """Request para sync manual do Trello."""
         board_id: str = Field(..., description="ID do board no Trello")
         force: bool = Field(False, description="Força sync ignorando timestamps (útil quando local está desatualizado)")
+        incremental: bool = Field(True, description="Busca apenas cards alterados desde o último sync")
 
     class SyncFromTrelloResponse(BaseModel):
         """Response de sync manual do Trello."""
@@ -864,71 +818,68 @@ def create_kanban_router() -> APIRouter:
         workspace_id = request.headers.get("X-Workspace", "core")
         db_path = _get_kanban_db_path(workspace_id)
 
-        # Cria adapter do kanban.db
-        db_adapter = SQLiteKanbanAdapter(db_path)
-        db_adapter.connect()
-
-        try:
-            # Cria TrelloAdapter com configuração real
-            trello_config = get_trello_config()
-            trello_adapter = None
-
-            if trello_config.api_key and trello_config.api_token and trello_config.board_id:
-                trello_adapter = TrelloAdapter(
-                    trello_config.api_key,
-                    trello_config.api_token,
-                    trello_config.board_id
-                )
-
-            if not trello_adapter:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="Credenciais do Trello não configuradas"
-                )
-
-            # Cria TrelloSyncService e executa sync
-            # BUGFIX: Usa singleton para evitar múltiplos workers deletando o mesmo card
-            # Quando múltiplas requisições sync ocorrem, cada uma criava um worker
-            # que tentava deletar cards, causando "iterações 10 vezes"
-
-            # Usa singleton global se já existe
-            global _sync_service_singleton
-            if _sync_service_singleton is None:
-                logger.info("Criando TrelloSyncService (singleton)")
-                _sync_service_singleton = TrelloSyncService(db_adapter, trello_adapter)
-                await _sync_service_singleton.start_queue_worker()
-            elif _sync_service_singleton.db != db_adapter:
-                logger.info("Workspace mudou, recriando TrelloSyncService (singleton)")
-                await _sync_service_singleton.stop_queue_worker()
-                _sync_service_singleton = TrelloSyncService(db_adapter, trello_adapter)
-                await _sync_service_singleton.start_queue_worker()
-            else:
-                logger.debug("Reutilizando TrelloSyncService existente (singleton)")
+        # Adapter compartilhado do kanban.db (mesma instância entre requisições)
+        db_adapter = SQLiteKanbanAdapter.shared(db_path)
+
+        # Cria TrelloAdapter com configuração real
+        trello_config = get_trello_config()
+        trello_adapter = None
 
-            sync_service = _sync_service_singleton
-            logger.info(f"🔄 [SYNC START] Iniciando sync_from_trello (force={data.force})")
-            result = await sync_service.sync_from_trello(data.board_id, force=data.force)
-            logger.info(f"🔄 [SYNC END] Sync finalizado - result: {result.is_ok}")
+        if trello_config.api_key and trello_config.api_token and trello_config.board_id:
+            trello_adapter = TrelloAdapter(
+                trello_config.api_key,
+                trello_config.api_token,
+                trello_config.board_id
+            )
 
-            if result.is_err:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=result.error
-                )
+        if not trello_adapter:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Credenciais do Trello não configuradas"
+            )
 
-            synced_count = result.value
+        # Cria TrelloSyncService e executa sync
+        # BUGFIX: Usa singleton para evitar múltiplos workers deletando o mesmo card
+        # Quando múltiplas requisições sync ocorrem, cada uma criava um worker
+        # que tentava deletar cards, causando "iterações 10 vezes"
+
+        # Usa singleton global se já existe
+        global _sync_service_singleton
+        if _sync_service_singleton is None:
+            logger.info("Criando TrelloSyncService (singleton)")
+            _sync_service_singleton = TrelloSyncService(db_adapter, trello_adapter)
+            await _sync_service_singleton.start_queue_worker()
+        elif _sync_service_singleton.db != db_adapter:
+            logger.info("Workspace mudou, recriando TrelloSyncService (singleton)")
+            await _sync_service_singleton.stop_queue_worker()
+            _sync_service_singleton = TrelloSyncService(db_adapter, trello_adapter)
+            await _sync_service_singleton.start_queue_worker()
+        else:
+            logger.debug("Reutilizando TrelloSyncService existente (singleton)")
 
-            # TODO: Emitir eventos SSE para cada card atualizado
-            # Por ora, apenas retorna a contagem
+        sync_service = _sync_service_singleton
+        logger.info(f"🔄 [SYNC START] Iniciando sync_from_trello (force={data.force})")
+        result = await sync_service.sync_from_trello(
+            data.board_id, force=data.force, incremental=data.incremental
+        )
+        logger.info(f"🔄 [SYNC END] Sync finalizado - result: {result.is_ok}")
 
-            return SyncFromTrelloResponse(
-                synced_count=synced_count,
-                status="success",
-                message=f"{synced_count} cards sincronizados do Trello"
+        if result.is_err:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=result.error
             )
 
-        finally:
-            db_adapter.disconnect()
+        synced_count = result.value
+
+        # TODO: Emitir eventos SSE para cada card atualizado
+        # Por ora, apenas retorna a contagem
+
+        return SyncFromTrelloResponse(
+            synced_count=synced_count,
+            status="success",
+            message=f"{synced_count} cards sincronizados do Trello"
+        )
 
     @router.post("/initialize")
     async def initialize_kanban(request: Request) -> dict:
@@ -956,7 +907,8 @@ def create_kanban_router() -> APIRouter:
     @router.get("/events")
     async def stream_kanban_events(
         request: Request,
-        workspace: Optional[str] = Query(None, description="Workspace ID (query parameter para SSE)")
+        workspace: Optional[str] = Query(None, description="Workspace ID (query parameter para SSE)"),
+        last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
     ):
         """
         Stream eventos de Kanban em tempo real via SSE.
@@ -972,8 +924,10 @@ def create_kanban_router() -> APIRouter:
         - card_processing_completed: Card terminou processamento
         - card_processing_failed: Processamento do card falhou
 
-        NOTA: Por enquanto envia heartbeat. Implementação completa requer
-        EventBus Kanban específico ou polling do kanban.db.
+        Reconexão: o EventSource reenvia o último id recebido no header
+        Last-Event-ID. Se os eventos seguintes ainda estão na janela de
+        replay do KanbanEventBus, o cliente recebe só o que perdeu, sem
+        baixar de novo o snapshot do board.
         """
         from fastapi.responses import StreamingResponse
         import asyncio
@@ -984,11 +938,29 @@ def create_kanban_router() -> APIRouter:
 
         logger.info(f"[KanbanSSE] Cliente conectado (workspace={workspace_id})")
 
+        resume_from: Optional[int] = None
+        if last_event_id and last_event_id.isdigit():
+            if _event_bus.can_resume(workspace_id, int(last_event_id)):
+                resume_from = int(last_event_id)
+
+        async def resume_generator():
+            """Gerador de reconexão: replay dos eventos perdidos, sem snapshot."""
+            logger.info(f"[KanbanSSE] Retomando a partir do evento {resume_from}")
+            try:
+                async for event in _event_bus.subscribe(
+                    workspace_id, after_sequence=resume_from, heartbeat=SSE_HEARTBEAT_SECONDS
+                ):
+                    yield event.to_sse_format() if event else ": heartbeat\n\n"
+            finally:
+                logger.info(f"[KanbanSSE] Cliente desconectado (workspace={workspace_id})")
+
         async def kanban_event_generator():
             """Gerador que entrega eventos de Kanban em tempo real."""
+            # Cursor capturado antes do snapshot: eventos publicados enquanto
+            # o snapshot é montado são entregues pelo replay do subscribe
+            cursor = _event_bus.last_sequence(workspace_id)
             db_path = _get_kanban_db_path(workspace_id)
-            adapter = SQLiteKanbanAdapter(db_path)
-            adapter.connect()
+            adapter = SQLiteKanbanAdapter.shared(db_path)
 
             try:
                 # Primeiro busca o board padrão para obter board_id
@@ -1015,7 +987,7 @@ def create_kanban_router() -> APIRouter:
                 if lists_result.is_ok and cards_result.is_ok:
                     # Envia lists como evento
                     lists_data = [ListSchema.from_domain(lst) for lst in lists_result.value]
-                    yield f"event: lists_snapshot\ndata: {json.dumps([lst.model_dump() for lst in lists_data])}\n\n"
+                    yield f"event: lists_snapshot\ndata: {json.dumps([lst.model_dump() for lst in lists_data])}\nid: {cursor}\n\n"
 
                     # Envia cards como eventos individuais
                     for card in cards_result.value:
@@ -1027,12 +999,14 @@ def create_kanban_router() -> APIRouter:
                 # Consome eventos do EventBus e envia via SSE
                 # Usa async for com timeout para heartbeat contínuo
                 try:
-                    event_subscription = _event_bus.subscribe(workspace_id)
+                    event_subscription = _event_bus.subscribe(
+                        workspace_id, after_sequence=cursor, heartbeat=SSE_HEARTBEAT_SECONDS
+                    )
 
                     # O subscribe já é um async generator que yields KanbanEvent
+                    # (None = intervalo sem eventos)
                     async for event in event_subscription:
-                        # Envia evento real
-                        yield event.to_sse_format()
+                        yield event.to_sse_format() if event else ": heartbeat\n\n"
 
                 except StopAsyncIteration:
                     # EventBus encerrou
@@ -1042,11 +1016,10 @@ def create_kanban_router() -> APIRouter:
                 logger.error(f"[KanbanSSE] Erro no generator: {e}")
                 yield f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n"
             finally:
-                adapter.disconnect()
                 logger.info(f"[KanbanSSE] Cliente desconectado (workspace={workspace_id})")
 
         return StreamingResponse(
-            kanban_event_generator(),
+            resume_generator() if resume_from is not None else kanban_event_generator(),
             media_type="text/event-stream",
             headers={
                 "Cache-Control": "no-cache",
@@ -1070,61 +1043,57 @@ def create_kanban_router() -> APIRouter:
         """
         workspace_id = request.headers.get("X-Workspace", "core")
         db_path = _get_kanban_db_path(workspace_id)
-        adapter = SQLiteKanbanAdapter(db_path)
-        adapter.connect()
-
-        try:
-            # Busca board padrão
-            boards_result = adapter.list_boards()
-            if boards_result.is_err or not boards_result.value:
-                return {"ok": True, "board": None, "cards": [], "lists": []}
-
-            board = boards_result.value[0]
-
-            # Busca listas
-            lists_result = adapter.list_lists(board.id)
-            lists_data = lists_result.value if lists_result.is_ok else []
-
-            # Busca cards
-            cards_result = adapter.list_cards()
-            cards_data = cards_result.value if cards_result.is_ok else []
-
-            # Converte para formato legado
-            from core.kanban.domain.database import KanbanCard
-            from datetime import datetime
-
-            return {
-                "ok": True,
-                "board": {
-                    "id": board.id,
-                    "name": board.name,
-                    "url": ""
-                },
-                "lists": [
-                    {
-                        "id": lst.id,
-                        "name": lst.name,
-                        "position": lst.position
-                    }
-                    for lst in lists_data
-                ],
-                "cards": [
-                    {
-                        "id": card.id,
-                        "title": card.title,
-                        "description": card.description,
-                        "status": "todo",  # TODO: mapear status corretamente
-                        "labels": card.labels or [],
-                        "due_date": card.due_date.isoformat() if card.due_date else None,
-                        "url": "",
-                        "list_name": "",  # TODO: buscar nome da lista
-                        "created_at": card.created_at.isoformat() if isinstance(card.created_at, datetime) else str(card.created_at)
-                    }
-                    for card in cards_data
-                ]
-            }
-        finally:
-            adapter.disconnect()
+        adapter = SQLiteKanbanAdapter.shared(db_path)
+
+        # Busca board padrão
+        boards_result = adapter.list_boards()
+        if boards_result.is_err or not boards_result.value:
+            return {"ok": True, "board": None, "cards": [], "lists": []}
+
+        board = boards_result.value[0]
+
+        # Busca listas
+        lists_result = adapter.list_lists(board.id)
+        lists_data = lists_result.value if lists_result.is_ok else []
+
+        # Busca cards
+        cards_result = adapter.list_cards()
+        cards_data = cards_result.value if cards_result.is_ok else []
+
+        # Converte para formato legado
+        from core.kanban.domain.database import KanbanCard
+        from datetime import datetime
+
+        return {
+            "ok": True,
+            "board": {
+                "id": board.id,
+                "name": board.name,
+                "url": ""
+            },
+            "lists": [
+                {
+                    "id": lst.id,
+                    "name": lst.name,
+                    "position": lst.position
+                }
+                for lst in lists_data
+            ],
+            "cards": [
+                {
+                    "id": card.id,
+                    "title": card.title,
+                    "description": card.description,
+                    "status": "todo",  # TODO: mapear status corretamente
+                    "labels": card.labels or [],
+                    "due_date": card.due_date.isoformat() if card.due_date else None,
+                    "url": "",
+                    "list_name": "",  # TODO: buscar nome da lista
+                    "created_at": card.created_at.isoformat() if isinstance(card.created_at, datetime) else str(card.created_at)
+                }
+                for card in cards_data
+            ]
+        }
 
     return router
 
@@ -11,12 +11,13 @@ import time
 import uuid
 import yaml
 
-from fastapi import APIRouter, Request, Response, Body, Query
+from fastapi import APIRouter, Request, Response, Body, Header, Query
 from fastapi.openapi.utils import get_openapi
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from kernel import get_query_registry
+from kernel.registry.handler_executor import HandlerTimeoutError, get_handler_executor
 from kernel.registry.skyrpc_registry import get_skyrpc_registry
 from kernel.schemas.schemas import (
     SkyRpcDiscovery,
@@ -589,10 +590,29 @@ def create_rpc_router() -> APIRouter:
                 correlation_id=correlation_id,
             )
 
-        if args:
-            result = handler.handler(args)
-        else:
-            result = handler.handler()
+        # Handler roda conforme o modo registrado (loop, threads ou processos)
+        try:
+            result = await get_handler_executor().execute(handler, args)
+        except HandlerTimeoutError as e:
+            _ticket_store.pop(payload.ticket_id, None)
+            logger.debug(
+                "POST /envelope falhou por timeout do handler",
+                extra={
+                    "correlation_id": correlation_id,
+                    "ticket_id": payload.ticket_id,
+                    "method": method,
+                    "timeout": e.timeout,
+                    **context_log,
+                },
+            )
+            return _sky_rpc_error_response(
+                code=5040,
+                message="Handler timeout",
+                ticket_id=payload.ticket_id,
+                method=method,
+                correlation_id=correlation_id,
+                data={"timeout": e.timeout},
+            )
         _ticket_store.pop(payload.ticket_id, None)
         if result.is_ok:
             logger.debug(
@@ -1040,12 +1060,20 @@ def create_rpc_router() -> APIRouter:
                 extra={"worktree": worktree_name, "status": status, "timestamp": datetime.utcnow().isoformat()},
             )
 
-            # 6. Remove worktree usando git worktree remove
-            import subprocess
-            result = subprocess.run(
+            # 6. Recicla no pool (se limpo e houver vaga) ou remove sem --force:
+            #    mudanças pendentes fazem o git recusar e o erro é devolvido
+            from core.webhooks.application.worktree_pool import get_worktree_pool
+
+            worktree_pool = get_worktree_pool()
+            if worktree_pool is not None and await worktree_pool.release(worktree_path):
+                return JSONResponse(
+                    status_code=200,
+                    content={"ok": True, "message": f"Worktree {worktree_name} recycled"},
+                )
+
+            from infra.process import default_runner
+            result = await default_runner.run(
                 ["git", "worktree", "remove", str(worktree_path)],
-                capture_output=True,
-                text=True,
             )
 
             if result.returncode != 0:
@@ -1148,7 +1176,10 @@ def create_rpc_router() -> APIRouter:
         return StreamingResponse(log_generator(), media_type="text/event-stream")
 
     @router.get("/observability/events/stream")
-    async def stream_events(workspace: str | None = Query(None, description="Workspace ID (query parameter para SSE)")):
+    async def stream_events(
+        workspace: str | None = Query(None, description="Workspace ID (query parameter para SSE)"),
+        last_event_id: str | None = Header(None, alias="Last-Event-ID"),
+    ):
         """
         Stream eventos de domínio em tempo real via SSE para o WebUI.
 
@@ -1156,11 +1187,17 @@ def create_rpc_router() -> APIRouter:
         Permite monitorar JobStartedEvent, JobCompletedEvent, etc.
         DOC: ADR024 - Aceita workspace via query parameter (EventSource não suporta headers).
 
+        Cada mensagem leva `id: <sequence>` do log de eventos; ao reconectar,
+        o EventSource envia Last-Event-ID e o stream continua de onde parou
+        (sem reenviar o histórico). Se o id não pode ser retomado (inválido,
+        de outra execução do servidor ou já fora do buffer), o stream envia
+        `event: resync` seguido do histórico atual. Clientes ociosos aguardam
+        o publish() (sem polling) e recebem um comentário keepalive a cada 15s.
+
         NOTA: Cria InMemoryEventBus local se global não disponível,
         pois o worker roda em thread separada.
         """
         from fastapi.responses import StreamingResponse
-        import asyncio
         import json
         from runtime.workspace.workspace_context import set_current_workspace
 
@@ -1172,8 +1209,7 @@ def create_rpc_router() -> APIRouter:
         async def event_generator():
             """Gerador que entrega novos eventos do EventBus."""
             from infra.domain_events.in_memory_event_bus import InMemoryEventBus
-            from core.domain_events.domain_event import DomainEvent
-            from kernel import get_event_bus, clear_event_bus, set_event_bus
+            from kernel import get_event_bus, set_event_bus
 
             logger.info(f"[SSE] Cliente conectado ao stream de eventos (workspace={workspace or 'default'})")
 
@@ -1193,33 +1229,53 @@ def create_rpc_router() -> APIRouter:
                 event_bus = InMemoryEventBus()
                 set_event_bus(event_bus)
 
-            # Envia histórico inicial
-            history = event_bus.get_history(limit=50)
-            logger.info(f"[SSE] Enviando histórico: {len(history)} eventos")
-            for event_dict in history:
-                yield f"event: history\ndata: {json.dumps(event_dict)}\n\n"
-
-            # Contador para novos eventos
-            last_count = len(event_bus.get_history())
-            logger.info(f"[SSE] Histórico enviado, last_count={last_count}")
-
-            # Poll por novos eventos
-            iteration = 0
-            while True:
-                current_history = event_bus.get_history()
-                current_count = len(current_history)
-
-                # Se houver novos eventos, envia
-                if current_count > last_count:
-                    new_events = current_history[:current_count - last_count]
-                    logger.info(f"[SSE] Enviando {len(new_events)} novos eventos (iteração {iteration})")
-                    for event_dict in new_events:
-                        logger.debug(f"[SSE] Evento: {event_dict.get('event_type')}")
-                        yield f"event: domain_event\ndata: {json.dumps(event_dict)}\n\n"
-                    last_count = current_count
-
-                iteration += 1
-                await asyncio.sleep(0.5)  # Poll a cada 500ms
+            def sse_message(kind: str, event_dict: dict, with_id: bool = True) -> str:
+                event_id = f"id: {event_dict['sequence']}\n" if with_id else ""
+                return f"{event_id}event: {kind}\ndata: {json.dumps(event_dict)}\n\n"
+
+            cursor: int | None = None
+            if (
+                last_event_id
+                and last_event_id.isdigit()
+                and event_bus.can_resume(int(last_event_id))
+            ):
+                # Reconexão: retoma após o último evento entregue
+                cursor = int(last_event_id)
+                logger.info(f"[SSE] Retomando stream após sequence={cursor}")
+            else:
+                if last_event_id:
+                    # Cursor irrecuperável: cliente descarta o estado e recebe snapshot
+                    logger.warning(
+                        f"[SSE] Last-Event-ID={last_event_id!r} não retomável "
+                        f"(last_sequence={event_bus.last_sequence}), ressincronizando"
+                    )
+                    # id reposiciona o Last-Event-ID do EventSource no log atual
+                    resync = {"sequence": event_bus.last_sequence}
+                    yield sse_message("resync", resync)
+                # Envia histórico inicial (mais recente primeiro, como o WebUI
+                # espera); só o primeiro leva id, fixando o Last-Event-ID no
+                # evento mais novo já entregue
+                history = event_bus.get_history(limit=50)
+                logger.info(f"[SSE] Enviando histórico: {len(history)} eventos")
+                for index, event_dict in enumerate(history):
+                    yield sse_message("history", event_dict, with_id=index == 0)
+                cursor = history[0]["sequence"] if history else event_bus.last_sequence
+
+            while not event_bus.is_closed:
+                new_events = await event_bus.wait_for_events(cursor, timeout=15.0)
+                if not new_events:
+                    yield ": keepalive\n\n"
+                    continue
+
+                if new_events[0]["sequence"] > cursor + 1:
+                    logger.warning(
+                        f"[SSE] Cliente atrasado: {new_events[0]['sequence'] - cursor - 1} "
+                        "eventos saíram do buffer"
+                    )
+                for event_dict in new_events:
+                    logger.debug(f"[SSE] Evento: {event_dict.get('event_type')}")
+                    yield sse_message("domain_event", event_dict)
+                cursor = new_events[-1]["sequence"]
 
         return StreamingResponse(event_generator(), media_type="text/event-stream")
 
@@ -1556,8 +1612,6 @@ def create_rpc_router() -> APIRouter:
 
     # TRELLO: Rota específica que deve vir ANTES da rota genérica
     # para que FastAPI faça match correto (/webhooks/trello antes de /webhooks/{source})
-    # NOTA: Rota é SÍNCRONA (não usa async def) porque receive_trello_webhook()
-    #       usa asyncio.run() internamente, o que conflitaria com event loop existente
     @router.head("/webhooks/trello")
     @router.post("/webhooks/trello")
     async def receive_webhook_trello(http_request: Request):
@@ -1565,12 +1619,10 @@ def create_rpc_router() -> APIRouter:
         Recebe webhook do Trello.
 
         PRD020: Fluxo bidirecional Trello ↔ GitHub.
-        Diferencia da rota genérica porque não verifica assinatura e usa handler específico.
-
-        NOTA: receive_trello_webhook() cria seu próprio event loop em thread separada,
-        então esta rota pode ser async sem conflitos.
+        Diferencia da rota genérica porque não verifica assinatura.
+        Fluxo: Append no inbox → Return 202 (intake processa o card depois)
         """
-        from core.webhooks.application.handlers import receive_trello_webhook
+        from core.webhooks.application.handlers import get_webhook_processor
 
         correlation_id = getattr(http_request.state, "correlation_id", str(uuid.uuid4()))
 
@@ -1582,40 +1634,40 @@ def create_rpc_router() -> APIRouter:
             )
             return Response(status_code=200)
 
-        # Parseia payload JSON - request.body() é um coroutine, precisa de await
-        import json
         try:
             body_bytes = await http_request.body()
-            payload_data = json.loads(body_bytes.decode())
         except Exception as e:
             logger.error(
-                f"Erro ao fazer parse do JSON: {e}",
-                extra={"correlation_id": correlation_id},
+                f"Failed to read request body: {str(e)}",
+                extra={"correlation_id": correlation_id, "source": "trello"},
             )
             return JSONResponse(
                 status_code=400,
-                content={"ok": False, "error": "Invalid JSON"},
+                content={"ok": False, "error": "Failed to read body"},
             )
 
-        logger.info(
-            f"Webhook Trello recebido",
-            extra={"correlation_id": correlation_id, "action_type": payload_data.get("action", {}).get("type", "unknown")},
+        result = await get_webhook_processor("trello").ingest(
+            "trello", body_bytes, dict(http_request.headers)
         )
-
-        # Processa webhook
-        result = receive_trello_webhook({"payload": payload_data})
-        if result.is_ok:
-            return JSONResponse(status_code=200, content={"ok": True, "result": result.value})
-        else:
+        if result.is_err:
             logger.error(
-                f"Erro ao processar webhook Trello: {result.error}",
+                f"Erro ao aceitar webhook Trello: {result.error}",
                 extra={"correlation_id": correlation_id},
             )
             return JSONResponse(
-                status_code=500,
+                status_code=503,
                 content={"ok": False, "error": result.error},
             )
 
+        logger.info(
+            "Webhook Trello aceito",
+            extra={"correlation_id": correlation_id, "delivery_id": result.value},
+        )
+        return JSONResponse(
+            status_code=202,  # Accepted
+            content={"ok": True, "delivery_id": result.value, "status": "accepted"},
+        )
+
     @router.head("/webhooks/{source}")
     @router.post("/webhooks/{source}")
     async def receive_webhook(source: str, http_request: Request):
@@ -1623,8 +1675,12 @@ def create_rpc_router() -> APIRouter:
         Recebe webhook de fonte externa (GitHub, Discord, etc).
 
         PRD013: Endpoint para webhooks que acionam agentes autônomos.
-        Fluxo: Verify signature → Parse event → Create job → Return 202
+        Fluxo: Verify signature → Append no inbox → Return 202
+        (parsing e criação do job ficam com o intake)
         """
+        from core.webhooks.application.handlers import get_webhook_processor
+        from core.webhooks.domain import WebhookSource
+
         correlation_id = getattr(http_request.state, "correlation_id", str(uuid.uuid4()))
 
         # Extrai headers relevantes PRIMEIRO (antes de consumir body)
@@ -1651,36 +1707,9 @@ def create_rpc_router() -> APIRouter:
         if error_response:
             return error_response
 
-        # Parse payload JSON
-        try:
-            payload = __import__("json").loads(body_bytes.decode())
-        except Exception as e:
-            logger.error(
-                f"Failed to parse webhook payload: {str(e)}",
-                extra={"correlation_id": correlation_id, "source": source},
-            )
-            return JSONResponse(
-                status_code=400,
-                content={"ok": False, "error": "Invalid JSON payload"},
-            )
-
-        # Constrói event_type completo combinando header + action do payload
-        # GitHub envia X-GitHub-Event como "issues" e payload tem "action": "opened"
-        # Precisamos combinar para obter "issues.opened"
-        if source == "github" and event_type_header in ("issues", "pull_request", "issue_comment", "discussion", "discussion_comment"):
-            action = payload.get("action", "opened")
-            event_type = f"{event_type_header}.{action}"
-        else:
-            # Para eventos sem action (ping, etc) ou outras fontes, usa o valor do header
-            event_type = event_type_header
-
-        # Busca handler registrado
-        handler_name = f"webhooks.{source}.receive"
-        handler = registry.get(handler_name)
-
-        if not handler:
+        if source not in {s.value for s in WebhookSource}:
             logger.error(
-                f"Handler not found: {handler_name}",
+                f"Unsupported webhook source: {source}",
                 extra={"correlation_id": correlation_id, "source": source},
             )
             return JSONResponse(
@@ -1688,62 +1717,48 @@ def create_rpc_router() -> APIRouter:
                 content={"ok": False, "error": "Handler not implemented"},
             )
 
-        # Executa handler
-        try:
-            result = handler.handler({
-                "payload": payload,
-                "signature": signature,
-                "event_type": event_type,
-            })
-        except Exception as e:
-            logger.error(
-                f"Handler execution failed: {str(e)}",
-                extra={"correlation_id": correlation_id, "source": source, "handler": handler_name},
-            )
-            return JSONResponse(
-                status_code=500,
-                content={"ok": False, "error": "Handler execution failed"},
-            )
-
-        if result.is_ok:
-            # Trata ping como caso especial (200 OK)
-            if result.value == "ping":
-                logger.info(
-                    f"Ping event acknowledged",
-                    extra={"correlation_id": correlation_id, "source": source},
-                )
-                return JSONResponse(
-                    status_code=200,  # OK
-                    content={"ok": True, "message": "pong"},
-                )
-
+        # Ping do GitHub (configuração do webhook) não gera job
+        if source == "github" and event_type_header == "ping":
             logger.info(
-                f"Webhook enqueued successfully",
-                extra={
-                    "correlation_id": correlation_id,
-                    "source": source,
-                    "event_type": event_type,
-                    "job_id": result.value,
-                },
+                f"Ping event acknowledged",
+                extra={"correlation_id": correlation_id, "source": source},
             )
             return JSONResponse(
-                status_code=202,  # Accepted
-                content={
-                    "ok": True,
-                    "job_id": result.value,
-                    "status": "queued",
-                },
+                status_code=200,  # OK
+                content={"ok": True, "message": "pong"},
             )
-        else:
+
+        result = await get_webhook_processor(source).ingest(
+            source, body_bytes, dict(http_request.headers)
+        )
+        if result.is_err:
             logger.error(
-                f"Handler returned error: {result.error}",
+                f"Failed to accept webhook: {result.error}",
                 extra={"correlation_id": correlation_id, "source": source},
             )
             return JSONResponse(
-                status_code=422,
+                status_code=503,
                 content={"ok": False, "error": result.error},
             )
 
+        logger.info(
+            f"Webhook accepted",
+            extra={
+                "correlation_id": correlation_id,
+                "source": source,
+                "event_type": event_type_header,
+                "delivery_id": result.value,
+            },
+        )
+        return JSONResponse(
+            status_code=202,  # Accepted
+            content={
+                "ok": True,
+                "delivery_id": result.value,
+                "status": "accepted",
+            },
+        )
+
     # ========== Agents Endpoints (Página de Agents) ==========
 
     @router.get("/agents/executions")
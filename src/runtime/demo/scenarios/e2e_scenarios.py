@@ -309,7 +309,7 @@ class FinalDemo(BaseDemo):
 
         # Mock WorktreeManager
         class MockWorktreeManager:
-            def create_worktree(self, job):
+            async def create_worktree(self, job):
                 from runtime.observability.logger import Colors
                 print(f"  {Colors.INFO}🌳{Colors.RESET} Worktree mock criada para job {job.job_id}")
                 from kernel.contracts.result import Result
@@ -47,8 +47,13 @@ if not hasattr(register_default_extractors, "_registered"):
 
 def _get_snapshot_capture_handler():
     """Retorna o handler snapshot.capture, registrando apenas uma vez."""
-    async def _snapshot_capture_impl(request: dict[str, Any]) -> Result[dict[str, Any], str]:
-        """Handler RPC para captura de snapshot."""
+    def _snapshot_capture_impl(request: dict[str, Any]) -> Result[dict[str, Any], str]:
+        """
+        Handler RPC para captura de snapshot.
+
+        Síncrono (percorre diretórios e chama git): registrado com
+        execution="thread" para rodar fora do event loop.
+        """
         if not request:
             return Result.err("Request vazio")
 
@@ -80,23 +85,29 @@ def _get_snapshot_capture_handler():
         elif isinstance(exclude_patterns, list):
             exclude_patterns = list(exclude_patterns)
 
-        metadata = request.get("metadata") or {}
         tags = request.get("tags") or {}
 
         try:
-            from runtime.observability.snapshot.capture import capture_snapshot
-
-            snapshot_result = await capture_snapshot(
+            snapshot = capture_snapshot(
                 subject=subject,
                 target=target,
                 depth=depth,
                 include_extensions=include_extensions,
                 exclude_patterns=exclude_patterns,
-                metadata=metadata,
                 tags=tags,
             )
-
-            return snapshot_result
+            storage_path = save_snapshot(snapshot)
+            data = snapshot.to_dict()
+
+            return Result.ok({
+                "snapshot_id": snapshot.metadata.snapshot_id,
+                "timestamp": data["metadata"]["timestamp"],
+                "subject": snapshot.metadata.subject.value,
+                "metadata": data["metadata"],
+                "stats": data["stats"],
+                "structure": data["structure"],
+                "storage_path": str(storage_path),
+            })
 
         except Exception as e:
             return Result.err(f"Erro ao capturar snapshot: {e}")
@@ -107,6 +118,9 @@ def _get_snapshot_capture_handler():
             name="snapshot.capture",
             description="Captura snapshot estrutural de um dominio",
             tags=["snapshot", "observability"],
+            execution="thread",
+            max_concurrency=2,
+            timeout=120,
             input_schema={
                 "type": "object",
                 "properties": {
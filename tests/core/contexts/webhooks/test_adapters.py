@@ -329,3 +329,28 @@ class TestInMemoryJobQueueDeduplication:
 
         # Não existe em delivery_ids
         assert await job_queue.exists_by_delivery("any-delivery") is False
+
+    @pytest.mark.asyncio
+    async def test_enqueue_many_skips_known_and_repeated_deliveries(self, job_queue, sample_job):
+        """enqueue_many deve ignorar deliveries já registrados ou repetidos no lote."""
+        await job_queue.enqueue(sample_job)
+
+        def make(delivery_id):
+            event = WebhookEvent(
+                source=WebhookSource.GITHUB,
+                event_type="issues.opened",
+                event_id="1",
+                payload={"issue": {"number": 1}},
+                received_at=datetime.utcnow(),
+                delivery_id=delivery_id,
+            )
+            return WebhookJob.create(event)
+
+        batch = [make("test-delivery-123"), make("batch-1"), make("batch-1"), make(None)]
+        job_ids = await job_queue.enqueue_many(batch)
+
+        assert job_ids == [batch[1].job_id, batch[3].job_id]
+        assert job_queue.size() == 3
+        assert await job_queue.exists_many_by_delivery(
+            ["batch-1", "test-delivery-123", "unknown"]
+        ) == {"batch-1", "test-delivery-123"}
@@ -57,7 +57,7 @@ class TestJobOrchestratorAgentIntegration:
     def mock_worktree_manager(self):
         """Mock do WorktreeManager."""
         manager = Mock()
-        manager.create_worktree = Mock(return_value=Result.ok("/tmp/worktree-test"))
+        manager.create_worktree = AsyncMock(return_value=Result.ok("/tmp/worktree-test"))
         return manager
 
     @pytest.fixture
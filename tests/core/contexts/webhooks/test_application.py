@@ -21,6 +21,7 @@ from core.webhooks.domain import (
     WebhookJob,
     WebhookSource,
 )
+from infra.process import AsyncProcessRunner, ProcessResult
 from kernel.contracts.result import Result
 
 
@@ -116,7 +117,9 @@ class TestWorktreeManager:
     def manager(self, temp_path):
         """Retorna manager com path temporário."""
         temp_path.mkdir(exist_ok=True)
-        return WorktreeManager(str(temp_path), base_branch="main")  # Test usa main por padrão
+        return WorktreeManager(
+            str(temp_path), base_branch="main", runner=AsyncProcessRunner()
+        )  # Test usa main por padrão
 
     @pytest.fixture
     def sample_job(self):
@@ -145,68 +148,75 @@ class TestWorktreeManager:
         branch = generate_branch_name(sample_job)
         assert branch.startswith("webhook/github/issue/225/")
 
-    @patch("subprocess.run")
-    def test_create_worktree_success(self, mock_run, manager, sample_job):
+    @pytest.mark.asyncio
+    async def test_create_worktree_success(self, manager, sample_job):
         """Deve criar worktree com sucesso."""
-        mock_run.return_value = Mock(
-            returncode=0,
-            stdout="",
-            stderr=""
-        )
+        manager.runner.run = AsyncMock(return_value=ProcessResult(args=[], returncode=0))
 
-        result = manager.create_worktree(sample_job)
+        result = await manager.create_worktree(sample_job)
 
         assert result.is_ok
         assert "skybridge-github-225-" in result.value
         assert sample_job.worktree_path == result.value
         assert sample_job.branch_name.startswith("webhook/github/issue/225/")
 
-        # Verifica que subprocess.run foi chamado corretamente
-        mock_run.assert_called_once()
-        call_args = mock_run.call_args
+        # Verifica que o runner foi chamado corretamente
+        manager.runner.run.assert_awaited_once()
+        call_args = manager.runner.run.call_args
         assert "git" in call_args[0][0]
         assert "worktree" in call_args[0][0]
         assert "add" in call_args[0][0]
 
-    @patch("subprocess.run")
-    def test_create_worktree_failure(self, mock_run, manager, sample_job):
+    @pytest.mark.asyncio
+    async def test_create_worktree_usa_pool(self, manager, sample_job):
+        """Com pool, entrega worktree pré-aquecido sem git worktree add."""
+        manager.pool = Mock(acquire=AsyncMock(return_value=True))
+        manager.runner.run = AsyncMock()
+
+        result = await manager.create_worktree(sample_job)
+
+        assert result.is_ok
+        assert sample_job.worktree_path == result.value
+        manager.pool.acquire.assert_awaited_once_with(
+            Path(result.value), sample_job.branch_name
+        )
+        manager.runner.run.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_create_worktree_failure(self, manager, sample_job):
         """Deve falhar quando git worktree add falha."""
         import subprocess
-        mock_run.side_effect = subprocess.CalledProcessError(
+        manager.runner.run = AsyncMock(side_effect=subprocess.CalledProcessError(
             returncode=1,
             cmd="git worktree add",
             stderr="Error: worktree already exists"
-        )
+        ))
 
-        result = manager.create_worktree(sample_job)
+        result = await manager.create_worktree(sample_job)
 
         assert result.is_err
         assert "Falha ao criar worktree" in result.error
 
-    @patch("subprocess.run")
-    def test_remove_worktree_success(self, mock_run, manager):
+    @pytest.mark.asyncio
+    async def test_remove_worktree_success(self, manager):
         """Deve remover worktree com sucesso."""
-        mock_run.return_value = Mock(
-            returncode=0,
-            stdout="",
-            stderr=""
-        )
+        manager.runner.run = AsyncMock(return_value=ProcessResult(args=[], returncode=0))
 
-        result = manager.remove_worktree("/path/to/worktree")
+        result = await manager.remove_worktree("/path/to/worktree")
 
         assert result.is_ok
 
-    @patch("subprocess.run")
-    def test_remove_worktree_failure(self, mock_run, manager):
+    @pytest.mark.asyncio
+    async def test_remove_worktree_failure(self, manager):
         """Deve falhar quando remoção falha."""
         import subprocess
-        mock_run.side_effect = subprocess.CalledProcessError(
+        manager.runner.run = AsyncMock(side_effect=subprocess.CalledProcessError(
             returncode=1,
             cmd="git worktree remove",
             stderr="Error: worktree not found"
-        )
+        ))
 
-        result = manager.remove_worktree("/path/to/worktree")
+        result = await manager.remove_worktree("/path/to/worktree")
 
         assert result.is_err
         assert "Falha ao remover worktree" in result.error
@@ -10,7 +10,7 @@ from __future__ import annotations
 import asyncio
 import json
 from datetime import datetime
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
@@ -126,7 +126,7 @@ class TestIssue4StrObjectDebug:
 
         # Mock worktree manager
         mock_worktree_manager = Mock()
-        mock_worktree_manager.create_worktree = Mock(return_value=Result.ok(
+        mock_worktree_manager.create_worktree = AsyncMock(return_value=Result.ok(
             webhook_job.worktree_path
         ))
 
@@ -0,0 +1,277 @@
+# -*- coding: utf-8 -*-
+"""
+Testes para os modos de dispatch do InMemoryEventBus.
+
+Valida:
+- Padrão sequencial preservado (ordem de inscrição)
+- Prioridade: tiers de maior prioridade entregues primeiro
+- concurrent_dispatch: handlers do mesmo tier rodam em paralelo
+- Timeout por handler não bloqueia os demais
+- fire_and_forget: publish() não espera listeners; fila limitada com backpressure
+- fire_and_forget a partir de loops efêmeros (asyncio.run em threads): eventos
+  repassados ao loop principal ou entregues inline, nunca perdidos
+- Log de eventos: sequence monotônica, cursor além do history_size, can_resume, wakeup
+  entre threads e retomada via subscribe_events(from_sequence)
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from core.domain_events.job_events import JobStartedEvent
+from infra.domain_events.in_memory_event_bus import InMemoryEventBus
+
+
+def _event(job_id: str = "job-1") -> JobStartedEvent:
+    return JobStartedEvent(aggregate_id=job_id, job_id=job_id)
+
+
+@pytest.mark.asyncio
+async def test_default_dispatch_is_sequential_in_subscription_order():
+    """Sem opções, handlers rodam um após o outro, na ordem de inscrição."""
+    bus = InMemoryEventBus()
+    calls: list[str] = []
+
+    async def first(event):
+        await asyncio.sleep(0.02)
+        calls.append("first")
+
+    def second(event):
+        calls.append("second")
+
+    await bus.subscribe(JobStartedEvent, first)
+    await bus.subscribe(JobStartedEvent, second)
+    await bus.publish(_event())
+
+    assert calls == ["first", "second"]
+
+
+@pytest.mark.asyncio
+async def test_priority_tiers_run_first():
+    """Handler de maior prioridade é entregue antes, mesmo inscrito depois."""
+    bus = InMemoryEventBus(concurrent_dispatch=True)
+    calls: list[str] = []
+
+    async def low(event):
+        calls.append("low")
+
+    async def high(event):
+        await asyncio.sleep(0.02)
+        calls.append("high")
+
+    await bus.subscribe(JobStartedEvent, low)
+    await bus.subscribe(JobStartedEvent, high, priority=10)
+    await bus.publish(_event())
+
+    assert calls == ["high", "low"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_dispatch_with_timeout():
+    """Handlers do mesmo tier em paralelo; handler lento é abandonado no timeout."""
+    bus = InMemoryEventBus(concurrent_dispatch=True, handler_timeout=0.1)
+    calls: list[str] = []
+
+    async def slow(event):
+        await asyncio.sleep(5)
+        calls.append("slow")
+
+    async def fast(event):
+        await asyncio.sleep(0.05)
+        calls.append("fast")
+
+    def sync_fast(event):
+        time.sleep(0.05)
+        calls.append("sync")
+
+    await bus.subscribe(JobStartedEvent, slow)
+    await bus.subscribe(JobStartedEvent, fast)
+    await bus.subscribe(JobStartedEvent, sync_fast)
+
+    started = time.perf_counter()
+    await bus.publish(_event())
+    elapsed = time.perf_counter() - started
+
+    assert sorted(calls) == ["fast", "sync"]
+    assert elapsed < 0.5
+    stats = bus.get_dispatch_stats()
+    assert stats["handler_timeouts"] == 1
+    assert stats["handler_calls"] == 3
+
+
+@pytest.mark.asyncio
+async def test_fire_and_forget_returns_before_listeners():
+    """publish() retorna sem esperar; entrega em background mantém a ordem."""
+    bus = InMemoryEventBus(fire_and_forget=True)
+    received: list[str] = []
+    inline: list[str] = []
+
+    async def slow_listener(event):
+        await asyncio.sleep(0.05)
+        received.append(event.job_id)
+
+    async def inline_listener(event):
+        inline.append(event.job_id)
+
+    await bus.subscribe(JobStartedEvent, slow_listener)
+    await bus.subscribe(JobStartedEvent, inline_listener, fire_and_forget=False)
+
+    started = time.perf_counter()
+    for i in range(3):
+        await bus.publish(_event(f"job-{i}"))
+    assert time.perf_counter() - started < 0.05
+    assert inline == ["job-0", "job-1", "job-2"]
+    assert received == []
+
+    assert await bus.drain(timeout=2)
+    assert received == ["job-0", "job-1", "job-2"]
+    assert bus.get_dispatch_stats()["background_delivered"] == 3
+    await bus.close()
+
+
+@pytest.mark.asyncio
+async def test_fire_and_forget_backpressure():
+    """Fila cheia faz publish() esperar e conta a espera nas métricas."""
+    bus = InMemoryEventBus(fire_and_forget=True, max_pending_events=1)
+    release = asyncio.Event()
+
+    async def blocked(event):
+        await release.wait()
+
+    await bus.subscribe(JobStartedEvent, blocked)
+    await bus.publish(_event("job-0"))  # dispatcher pega e bloqueia
+    await asyncio.sleep(0.01)
+    await bus.publish(_event("job-1"))  # ocupa a fila
+
+    third = asyncio.create_task(bus.publish(_event("job-2")))
+    await asyncio.sleep(0.05)
+    assert not third.done()
+    assert bus.get_dispatch_stats()["publish_blocked"] == 1
+
+    release.set()
+    await asyncio.wait_for(third, timeout=1)
+    assert await bus.drain(timeout=1)
+    await bus.close()
+
+
+@pytest.mark.asyncio
+async def test_cursor_sees_events_after_history_is_full():
+    """Com o ring buffer cheio, novos eventos continuam visíveis pelo cursor."""
+    bus = InMemoryEventBus(history_size=5)
+    for i in range(5):
+        await bus.publish(_event(f"job-{i}"))
+    cursor = bus.last_sequence
+
+    for i in range(5, 8):
+        await bus.publish(_event(f"job-{i}"))
+
+    new_events = bus.get_events_after(cursor)
+    assert [e["job_id"] for e in new_events] == ["job-5", "job-6", "job-7"]
+    assert [e["sequence"] for e in new_events] == [6, 7, 8]
+    assert len(bus.get_history()) == 5
+
+
+@pytest.mark.asyncio
+async def test_wait_for_events_woken_by_publish_from_other_thread():
+    """Publish em outra thread/loop (worker) acorda o consumidor sem polling."""
+    bus = InMemoryEventBus()
+    cursor = bus.last_sequence
+
+    def publish_in_thread():
+        time.sleep(0.05)
+        asyncio.run(bus.publish(_event("from-worker")))
+
+    thread = threading.Thread(target=publish_in_thread)
+    thread.start()
+    events = await bus.wait_for_events(cursor, timeout=2)
+    thread.join()
+
+    assert [e["job_id"] for e in events] == ["from-worker"]
+    assert await bus.wait_for_events(events[-1]["sequence"], timeout=0.01) == []
+
+
+@pytest.mark.asyncio
+async def test_subscribe_events_resumes_from_sequence():
+    """Iterador retoma após o último sequence visto (Last-Event-ID)."""
+    bus = InMemoryEventBus()
+    for i in range(3):
+        await bus.publish(_event(f"job-{i}"))
+
+    received: list[str] = []
+
+    async def consume():
+        async for event_dict in bus.subscribe_events(from_sequence=1):
+            received.append(event_dict["job_id"])
+
+    task = asyncio.create_task(consume())
+    await asyncio.sleep(0.01)
+    await bus.publish(_event("job-3"))
+    await asyncio.sleep(0.01)
+    await bus.close()
+    await asyncio.wait_for(task, timeout=1)
+
+    assert received == ["job-1", "job-2", "job-3"]
+
+
+@pytest.mark.asyncio
+async def test_fire_and_forget_from_short_lived_loop_is_handed_off():
+    """Evento publicado via asyncio.run() em thread é entregue no loop principal."""
+    bus = InMemoryEventBus(fire_and_forget=True)
+    bus.bind_loop()
+    main_loop = asyncio.get_running_loop()
+    delivered: list[tuple[str, asyncio.AbstractEventLoop]] = []
+
+    async def listener(event):
+        await asyncio.sleep(0.02)
+        delivered.append((event.job_id, asyncio.get_running_loop()))
+
+    await bus.subscribe(JobStartedEvent, listener)
+
+    # O loop da thread termina logo após publish() retornar
+    thread = threading.Thread(target=lambda: asyncio.run(bus.publish(_event("from-thread"))))
+    thread.start()
+    await asyncio.to_thread(thread.join)
+
+    assert await bus.drain(timeout=2)
+    assert delivered == [("from-thread", main_loop)]
+    assert bus.get_dispatch_stats()["handed_off"] == 1
+    await bus.close()
+
+
+def test_fire_and_forget_without_home_loop_delivers_inline():
+    """Sem loop de longa duração, a entrega acontece dentro do publish()."""
+    bus = InMemoryEventBus(fire_and_forget=True)
+    delivered: list[str] = []
+
+    async def listener(event):
+        delivered.append(event.job_id)
+
+    async def publish_from_worker():
+        await bus.subscribe(JobStartedEvent, listener)
+        await bus.publish(_event("from-thread"))
+
+    thread = threading.Thread(target=lambda: asyncio.run(publish_from_worker()))
+    thread.start()
+    thread.join()
+
+    assert delivered == ["from-thread"]
+    assert bus.get_dispatch_stats()["delivered_inline"] == 1
+
+
+@pytest.mark.asyncio
+async def test_can_resume_rejects_unknown_or_evicted_cursor():
+    """Cursor à frente do log ou fora do ring buffer exige resync."""
+    bus = InMemoryEventBus(history_size=3)
+    assert bus.can_resume(0)
+    assert not bus.can_resume(5)  # id de outra execução do servidor
+
+    for i in range(5):
+        await bus.publish(_event(f"job-{i}"))
+
+    assert bus.can_resume(5)
+    assert bus.can_resume(2)  # eventos 3..5 ainda retidos
+    assert not bus.can_resume(1)  # evento 2 já saiu do buffer
+    assert not bus.can_resume(6)
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+Testes para TrelloMetadataCache (TTL, invalidação e coalescing).
+"""
+
+import asyncio
+
+import pytest
+
+from infra.kanban.adapters.trello_metadata_cache import (
+    TrelloMetadataCache,
+    invalidate_board_metadata,
+    board_metadata_cache,
+)
+
+
+class TestTrelloMetadataCache:
+    """Testes unitários sem chamar API."""
+
+    @pytest.mark.asyncio
+    async def test_get_concorrente_faz_uma_unica_busca(self):
+        """GETs idênticos concorrentes compartilham a mesma requisição."""
+        cache = TrelloMetadataCache(ttl=60)
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return [{"id": "list-1", "name": "📋 A Fazer"}]
+
+        results = await asyncio.gather(*[cache.get("board-1", "lists", fetch) for _ in range(5)])
+
+        assert calls == 1
+        assert all(r == results[0] for r in results)
+
+        # Dentro do TTL: servido do cache
+        await cache.get("board-1", "lists", fetch)
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_ttl_e_invalidacao(self):
+        """Entradas expiram pelo TTL e são descartadas por invalidate()."""
+        cache = TrelloMetadataCache(ttl=0)
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await cache.get("board-1", "labels", fetch) == 1
+        assert await cache.get("board-1", "labels", fetch) == 2
+
+        cache.ttl = 60
+        await cache.get("board-1", "labels", fetch)
+        cache.invalidate("board-1", "lists")
+        assert await cache.get("board-1", "labels", fetch) == 3
+
+        cache.invalidate("board-1")
+        assert await cache.get("board-1", "labels", fetch) == 4
+
+    @pytest.mark.asyncio
+    async def test_erro_na_busca_nao_e_armazenado(self):
+        """Falha da API é propagada a todos e a próxima chamada tenta de novo."""
+        cache = TrelloMetadataCache(ttl=60)
+
+        async def failing():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("HTTP 429")
+
+        results = await asyncio.gather(
+            cache.get("board-1", "lists", failing),
+            cache.get("board-1", "lists", failing),
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+        async def ok():
+            return ["ok"]
+
+        assert await cache.get("board-1", "lists", ok) == ["ok"]
+
+    @pytest.mark.asyncio
+    async def test_webhook_invalida_apenas_actions_de_metadados(self):
+        """Só actions que mudam listas/labels invalidam o cache do board."""
+        async def fetch():
+            return ["cached"]
+
+        await board_metadata_cache.get("board-wh", "lists", fetch)
+
+        assert invalidate_board_metadata("board-wh", action_type="updateCard") is False
+        assert ("board-wh", "lists") in board_metadata_cache._entries
+
+        assert invalidate_board_metadata("board-wh", action_type="updateList") is True
+        assert ("board-wh", "lists") not in board_metadata_cache._entries
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""
+Testes para TrelloRateLimiter (token bucket + headers do Trello).
+"""
+
+import pytest
+
+from infra.kanban.adapters.trello_rate_limiter import TrelloRateLimiter, get_rate_limiter
+
+
+class TestTrelloRateLimiter:
+    """Testes unitários sem chamar API."""
+
+    def test_reserva_espera_quando_bucket_esvazia(self):
+        """Acima da capacidade, cada reserva espera a reposição da sua ficha."""
+        limiter = TrelloRateLimiter(capacity=2, interval=1.0)
+
+        assert limiter.reserve() == 0
+        assert limiter.reserve() == 0
+        assert limiter.reserve() == pytest.approx(0.5, abs=0.05)
+        assert limiter.reserve() == pytest.approx(1.0, abs=0.05)
+
+    def test_headers_ajustam_capacidade_e_saldo(self):
+        """Headers x-rate-limit-api-token-* são a fonte da verdade."""
+        limiter = TrelloRateLimiter()
+
+        limiter.update_from_headers(200, {
+            "x-rate-limit-api-token-max": "50",
+            "x-rate-limit-api-token-interval-ms": "5000",
+            "x-rate-limit-api-token-remaining": "0",
+        })
+
+        assert limiter.capacity == 50
+        assert limiter.interval == 5.0
+        assert limiter.reserve() == pytest.approx(0.1, abs=0.05)
+
+    def test_429_pausa_pelo_retry_after(self):
+        """Resposta 429 pausa todas as requisições do token."""
+        limiter = TrelloRateLimiter()
+
+        limiter.update_from_headers(429, {"Retry-After": "3"})
+
+        assert limiter.reserve() == pytest.approx(3.0, abs=0.1)
+
+    def test_limiter_compartilhado_por_token(self):
+        """Adapters com o mesmo token dividem o mesmo bucket."""
+        assert get_rate_limiter("token-a") is get_rate_limiter("token-a")
+        assert get_rate_limiter("token-a") is not get_rate_limiter("token-b")
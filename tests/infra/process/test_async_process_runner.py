@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+Testes para AsyncProcessRunner (timeout, cancelamento, limites).
+"""
+
+import asyncio
+import subprocess
+import sys
+import time
+
+import pytest
+
+from infra.process import AsyncProcessRunner
+
+
+def python_cmd(code: str) -> list[str]:
+    """Comando que executa código Python no interpretador atual."""
+    return [sys.executable, "-c", code]
+
+
+class TestAsyncProcessRunner:
+    """Testes executando processos reais (Python)."""
+
+    @pytest.mark.asyncio
+    async def test_captura_saida_e_returncode(self):
+        """stdout/stderr são decodificados como UTF-8 e check levanta erro."""
+        runner = AsyncProcessRunner()
+
+        result = await runner.run(python_cmd(
+            "import sys; sys.stdout.buffer.write('ok 🚀'.encode()); sys.stderr.write('warn')"
+        ))
+        assert result.ok
+        assert result.stdout == "ok 🚀"
+        assert result.stderr == "warn"
+
+        with pytest.raises(subprocess.CalledProcessError) as exc_info:
+            await runner.run(python_cmd("import sys; sys.stderr.write('boom'); sys.exit(3)"), check=True)
+        assert exc_info.value.returncode == 3
+        assert exc_info.value.stderr == "boom"
+
+    @pytest.mark.asyncio
+    async def test_timeout_mata_processo_sem_bloquear_loop(self):
+        """Timeout levanta TimeoutExpired e o loop continua respondendo."""
+        runner = AsyncProcessRunner()
+        ticks = 0
+
+        async def heartbeat():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        beat = asyncio.create_task(heartbeat())
+        started = time.monotonic()
+        with pytest.raises(subprocess.TimeoutExpired):
+            await runner.run(python_cmd("import time; time.sleep(30)"), timeout=0.3)
+        beat.cancel()
+
+        assert time.monotonic() - started < 5
+        assert ticks >= 10
+
+    @pytest.mark.asyncio
+    async def test_cancelamento_mata_processo(self):
+        """Cancelar a task que aguarda não deixa o processo rodando."""
+        runner = AsyncProcessRunner()
+        task = asyncio.create_task(runner.run(python_cmd("import time; time.sleep(30)")))
+        await asyncio.sleep(0.3)
+
+        started = time.monotonic()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert time.monotonic() - started < 5
+
+    @pytest.mark.asyncio
+    async def test_saida_truncada_no_limite(self):
+        """Saída acima do limite é descartada sem travar o processo."""
+        runner = AsyncProcessRunner(max_output_bytes=100)
+
+        result = await runner.run(python_cmd("print('x' * 500000)"))
+
+        assert result.ok
+        assert len(result.stdout) == 100
+        assert result.stdout_truncated
+        assert not result.stderr_truncated
+
+    @pytest.mark.asyncio
+    async def test_limite_de_concorrencia(self):
+        """No máximo max_concurrency processos rodam ao mesmo tempo."""
+        runner = AsyncProcessRunner(max_concurrency=1)
+        code = "import time; print(time.monotonic()); time.sleep(0.2); print(time.monotonic())"
+
+        results = await asyncio.gather(*[runner.run(python_cmd(code)) for _ in range(2)])
+
+        spans = sorted(tuple(map(float, r.stdout.split())) for r in results)
+        assert spans[1][0] >= spans[0][1]
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+Teste de deduplicação de enqueue_many() em todos os adapters de fila.
+
+Valida que reenviar o mesmo lote (em sequência ou concorrentemente)
+não grava jobs duplicados: o delivery_id é registrado junto com o lote.
+"""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from core.webhooks.domain import WebhookEvent, WebhookJob, WebhookSource
+from infra.webhooks.adapters.file_based_job_queue import FileBasedJobQueue
+from infra.webhooks.adapters.in_memory_queue import InMemoryJobQueue
+from infra.webhooks.adapters.log_structured_job_queue import LogStructuredJobQueue
+from infra.webhooks.adapters.sqlite_job_queue import SQLiteJobQueue
+
+
+@pytest.fixture(params=["memory", "sqlite", "file", "journal"])
+def queue(request, tmp_path):
+    """Instancia cada adapter de fila."""
+    if request.param == "memory":
+        return InMemoryJobQueue()
+    if request.param == "sqlite":
+        return SQLiteJobQueue(db_path=str(tmp_path / "jobs.db"))
+    if request.param == "file":
+        return FileBasedJobQueue(queue_dir=str(tmp_path / "queue"))
+    return LogStructuredJobQueue(queue_dir=str(tmp_path / "journal"))
+
+
+def _make_batch() -> list[WebhookJob]:
+    """Lote com dois deliveries distintos (job_ids novos a cada chamada)."""
+    return [
+        WebhookJob.create(
+            WebhookEvent(
+                source=WebhookSource.GITHUB,
+                event_type="issues.opened",
+                event_id=str(number),
+                payload={"issue": {"number": number}},
+                received_at=datetime.utcnow(),
+                delivery_id=delivery_id,
+            )
+        )
+        for number, delivery_id in ((1, "delivery-a"), (2, "delivery-b"))
+    ]
+
+
+@pytest.mark.asyncio
+async def test_same_batch_twice_is_enqueued_once(queue):
+    """O segundo envio do mesmo lote não grava nada."""
+    first = await queue.enqueue_many(_make_batch())
+    second = await queue.enqueue_many(_make_batch())
+
+    assert len(first) == 2
+    assert second == []
+    assert await queue.pending_count() == 2
+    assert await queue.exists_by_delivery("delivery-a")
+    assert await queue.exists_many_by_delivery(
+        ["delivery-a", "delivery-b", "delivery-c"]
+    ) == {"delivery-a", "delivery-b"}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_batches_are_enqueued_once(queue):
+    """Lotes concorrentes com os mesmos deliveries gravam cada um uma vez."""
+    results = await asyncio.gather(
+        queue.enqueue_many(_make_batch()),
+        queue.enqueue_many(_make_batch()),
+    )
+
+    assert sum(len(job_ids) for job_ids in results) == 2
+    assert await queue.pending_count() == 2
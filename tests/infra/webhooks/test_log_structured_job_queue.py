@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+"""
+Teste para LogStructuredJobQueue.
+
+Valida:
+- Fluxo completo (enqueue, dequeue, complete, fail)
+- Replay do journal ao reabrir a fila
+- Compactação preservando jobs vivos, ordem FIFO e contadores
+- Compartilhamento entre instâncias (tail incremental)
+- Recuperação de lease expirado
+- Tolerância a linha truncada (crash durante append)
+"""
+from __future__ import annotations
+
+import shutil
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from core.webhooks.domain import JobStatus, WebhookEvent, WebhookJob, WebhookSource
+from infra.webhooks.adapters.log_structured_job_queue import LogStructuredJobQueue
+
+
+@pytest.fixture
+def temp_queue_dir():
+    """Cria diretório temporário para testes."""
+    temp_dir = Path(tempfile.mkdtemp())
+    yield temp_dir
+    if temp_dir.exists():
+        shutil.rmtree(temp_dir)
+
+
+def _make_job(index: int) -> WebhookJob:
+    """Cria job com delivery único."""
+    event = WebhookEvent(
+        source=WebhookSource.GITHUB,
+        event_type="issues.opened",
+        event_id=f"event-{index}",
+        payload={
+            "action": "opened",
+            "issue": {"number": index, "title": "Test", "body": ""},
+            "repository": {"owner": {"login": "test-owner"}, "name": "test-repo"},
+        },
+        received_at=datetime.utcnow(),
+        delivery_id=f"delivery-{index}",
+    )
+    return WebhookJob.create(event)
+
+
+@pytest.mark.asyncio
+async def test_full_flow(temp_queue_dir):
+    """Enqueue → dequeue → complete/fail com consulta por ID."""
+    queue = LogStructuredJobQueue(queue_dir=str(temp_queue_dir))
+
+    first = await queue.enqueue(_make_job(1))
+    second = await queue.enqueue(_make_job(2))
+    assert queue.size() == 2
+    assert await queue.exists_by_delivery("delivery-1")
+
+    job = await queue.dequeue()
+    assert job.job_id == first
+    assert job.status == JobStatus.PROCESSING
+    await queue.complete(first, result={"ok": True})
+
+    job = await queue.dequeue()
+    assert job.job_id == second
+    await queue.fail(second, "boom")
+
+    assert await queue.dequeue() is None
+    assert (await queue.get_job(first)).status == JobStatus.COMPLETED
+    failed = await queue.get_job(second)
+    assert failed.status == JobStatus.FAILED
+    assert failed.error_message == "boom"
+
+    metrics = queue.get_metrics()
+    assert metrics["enqueue_count"] == 2
+    assert metrics["dequeue_count"] == 2
+    assert metrics["complete_count"] == 1
+    assert metrics["fail_count"] == 1
+    assert metrics["jobs_per_hour"] == pytest.approx(1 / 24)
+
+
+@pytest.mark.asyncio
+async def test_replay_rebuilds_index(temp_queue_dir):
+    """Reabrir a fila reconstrói jobs vivos, finalizados e contadores."""
+    queue = LogStructuredJobQueue(queue_dir=str(temp_queue_dir))
+    ids = [await queue.enqueue(_make_job(i)) for i in range(3)]
+    await queue.dequeue()
+    await queue.complete(ids[0])
+    await queue.update_metadata(ids[1], {"branch_name": "feature/x"})
+
+    reopened = LogStructuredJobQueue(queue_dir=str(temp_queue_dir))
+    assert reopened.size() == 2
+    assert (await reopened.get_job(ids[0])).status == JobStatus.COMPLETED
+    assert (await reopened.get_job(ids[1])).branch_name == "feature/x"
+    assert await reopened.exists_by_delivery("delivery-0")
+    assert reopened.get_metrics()["complete_count"] == 1
+    assert (await reopened.dequeue()).job_id == ids[1]
+
+
+@pytest.mark.asyncio
+async def test_compaction_keeps_live_jobs(temp_queue_dir):
+    """Compactação descarta registros mortos sem perder fila nem contadores."""
+    queue = LogStructuredJobQueue(queue_dir=str(temp_queue_dir), compact_threshold=20)
+
+    for i in range(30):
+        job_id = await queue.enqueue(_make_job(i))
+        if i < 25:
+            await queue.dequeue()
+            await queue.complete(job_id)
+
+    segments = list((temp_queue_dir / "journal").glob("segment-*.log"))
+    assert len(segments) == 1
+    assert segments[0].name != "segment-000001.log"
+
+    reopened = LogStructuredJobQueue(queue_dir=str(temp_queue_dir))
+    assert reopened.size() == 5
+    assert reopened.get_metrics()["complete_count"] == 25
+    assert await reopened.exists_by_delivery("delivery-0")
+    remaining = [(await reopened.dequeue()).event.delivery_id for _ in range(5)]
+    assert remaining == [f"delivery-{i}" for i in range(25, 30)]
+
+
+@pytest.mark.asyncio
+async def test_instances_share_journal(temp_queue_dir):
+    """Server e worker em instâncias distintas veem os mesmos jobs."""
+    server_queue = LogStructuredJobQueue(queue_dir=str(temp_queue_dir), compact_threshold=5)
+    worker_queue = LogStructuredJobQueue(queue_dir=str(temp_queue_dir), compact_threshold=5)
+
+    for i in range(4):
+        await server_queue.enqueue(_make_job(i))
+
+    claimed = [await worker_queue.dequeue() for _ in range(4)]
+    assert [job.event.delivery_id for job in claimed] == [f"delivery-{i}" for i in range(4)]
+    assert server_queue.size() == 0
+
+    # Compactação feita por uma instância é detectada pela outra
+    for job in claimed:
+        await worker_queue.complete(job.job_id)
+    await server_queue.enqueue(_make_job(10))
+    assert (await worker_queue.dequeue()).event.delivery_id == "delivery-10"
+    assert server_queue.get_metrics()["complete_count"] == 4
+
+
+@pytest.mark.asyncio
+async def test_expired_lease_is_requeued_then_failed(temp_queue_dir):
+    """Lease expirado volta à fila até max_attempts; depois o job falha."""
+    queue = LogStructuredJobQueue(
+        queue_dir=str(temp_queue_dir), lease_seconds=0.01, max_attempts=2
+    )
+    job_id = await queue.enqueue(_make_job(1))
+
+    await queue.dequeue()
+    time.sleep(0.02)
+    assert await queue.requeue_expired_leases() == 1
+    assert queue.size() == 1
+
+    await queue.dequeue()
+    time.sleep(0.02)
+    assert await queue.requeue_expired_leases() == 1
+    assert queue.size() == 0
+    assert (await queue.get_job(job_id)).status == JobStatus.FAILED
+
+
+@pytest.mark.asyncio
+async def test_truncated_record_is_discarded(temp_queue_dir):
+    """Linha parcial (crash no meio do append) é ignorada no replay."""
+    queue = LogStructuredJobQueue(queue_dir=str(temp_queue_dir))
+    job_id = await queue.enqueue(_make_job(1))
+
+    segment = next((temp_queue_dir / "journal").glob("segment-*.log"))
+    with open(segment, "ab") as f:
+        f.write(b'{"op": "claim", "job_id": "')
+
+    reopened = LogStructuredJobQueue(queue_dir=str(temp_queue_dir))
+    assert reopened.size() == 1
+    await reopened.enqueue(_make_job(2))
+    assert (await reopened.dequeue()).job_id == job_id
+
+
+@pytest.mark.asyncio
+async def test_batch_operations(temp_queue_dir):
+    """enqueue_many/complete_many/fail_many gravam o lote de uma vez."""
+    queue = LogStructuredJobQueue(queue_dir=str(temp_queue_dir))
+    await queue.enqueue(_make_job(0))
+
+    batch = [_make_job(i) for i in range(5)]
+    job_ids = await queue.enqueue_many(batch)
+
+    # delivery-0 já existia
+    assert job_ids == [job.job_id for job in batch[1:]]
+    assert queue.size() == 5
+
+    claimed = [await queue.dequeue() for _ in range(5)]
+    await queue.complete_many(
+        [job.job_id for job in claimed[:3]], results={claimed[0].job_id: {"ok": True}}
+    )
+    await queue.fail_many({claimed[3].job_id: "erro", claimed[4].job_id: "erro"})
+
+    reopened = LogStructuredJobQueue(queue_dir=str(temp_queue_dir))
+    metrics = reopened.get_metrics()
+    assert metrics["enqueue_count"] == 5
+    assert metrics["complete_count"] == 3
+    assert metrics["fail_count"] == 2
+    assert (await reopened.get_job(claimed[4].job_id)).status == JobStatus.FAILED
+    assert await reopened.exists_many_by_delivery(["delivery-3", "nope"]) == {"delivery-3"}
+
+
+@pytest.mark.asyncio
+async def test_dedup_uses_delivery_id(temp_queue_dir):
+    """Índice de dedup usa delivery_id (não event_id), inclusive após replay."""
+    queue = LogStructuredJobQueue(queue_dir=str(temp_queue_dir))
+    job_id = await queue.enqueue(_make_job(1))
+
+    assert await queue.exists_by_delivery("delivery-1")
+    assert not await queue.exists_by_delivery("event-1")
+
+    await queue.dequeue()
+    await queue.complete(job_id)
+    reopened = LogStructuredJobQueue(queue_dir=str(temp_queue_dir))
+    assert await reopened.exists_by_delivery("delivery-1")
+    assert (await reopened.get_job(job_id)).event.delivery_id == "delivery-1"
+
+
+@pytest.mark.asyncio
+async def test_journal_io_runs_off_event_loop(temp_queue_dir):
+    """Append/fsync/flock do journal rodam fora da thread do event loop."""
+    queue = LogStructuredJobQueue(queue_dir=str(temp_queue_dir), fsync=True)
+    writers: list[threading.Thread] = []
+    original = queue._write_lines
+
+    def tracking_write(path, records):
+        writers.append(threading.current_thread())
+        return original(path, records)
+
+    queue._write_lines = tracking_write
+    job_id = await queue.enqueue(_make_job(1))
+    await queue.dequeue()
+    await queue.complete(job_id)
+
+    assert writers
+    assert threading.main_thread() not in writers
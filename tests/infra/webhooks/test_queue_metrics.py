@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""
+Teste para as primitivas de métricas das filas.
+
+Valida:
+- Percentis do LatencyHistogram dentro do erro relativo configurado
+- Janela de amostras e serialização (incluindo formato legado)
+- SnapshotCache: TTL e descarte após invalidate()
+- FileBasedJobQueue migra metrics.json no formato antigo
+"""
+from __future__ import annotations
+
+import json
+import random
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from infra.webhooks.adapters.file_based_job_queue import FileBasedJobQueue
+from infra.webhooks.adapters.queue_metrics import LatencyHistogram, SnapshotCache
+
+
+def test_histogram_percentile_within_precision():
+    """p50/p95/p99 ficam a no máximo `precision` do valor exato."""
+    rng = random.Random(42)
+    values = [rng.lognormvariate(3, 1) for _ in range(1000)]
+    histogram = LatencyHistogram(precision=0.05, window=0)
+    for value in values:
+        histogram.record(value)
+
+    ordered = sorted(values)
+    for p in (50, 95, 99):
+        exact = ordered[int(len(ordered) * p / 100)]
+        assert histogram.percentile(p) == pytest.approx(exact, rel=0.05)
+    assert histogram.mean() == pytest.approx(sum(values) / len(values))
+
+
+def test_histogram_window_forgets_old_samples():
+    """Amostras de gerações antigas saem dos percentis."""
+    histogram = LatencyHistogram(window=10)
+    for _ in range(10):
+        histogram.record(1000.0)
+    for _ in range(20):
+        histogram.record(1.0)
+
+    assert histogram.percentile(99) == pytest.approx(1.0, rel=0.05)
+    assert histogram.count == 30
+
+
+def test_histogram_round_trip_and_legacy_list():
+    """to_dict/from_dict preservam o estado; lista antiga vira histograma."""
+    histogram = LatencyHistogram()
+    for value in (1.0, 2.0, 3.0):
+        histogram.record(value)
+
+    restored = LatencyHistogram.from_dict(json.loads(json.dumps(histogram.to_dict())))
+    assert restored.percentile(95) == histogram.percentile(95)
+    assert restored.count == 3
+
+    legacy = LatencyHistogram.from_dict([1.0, 2.0, 3.0])
+    assert legacy.percentile(95) == histogram.percentile(95)
+
+
+def test_snapshot_cache_invalidate_discards_stale_put():
+    """put() com geração antiga (escrita durante o cálculo) é descartado."""
+    cache = SnapshotCache(ttl_seconds=60)
+    generation = cache.generation
+    cache.invalidate()
+    cache.put({"queue_size": 1}, generation)
+    assert cache.get() is None
+
+    cache.put({"queue_size": 2}, cache.generation)
+    assert cache.get() == {"queue_size": 2}
+
+
+def test_file_queue_migrates_legacy_metrics():
+    """metrics.json antigo (listas de latência) continua sendo lido."""
+    queue_dir = Path(tempfile.mkdtemp())
+    try:
+        (queue_dir / "metrics.json").write_text(
+            json.dumps({
+                "enqueue_count": 7,
+                "dequeue_count": 3,
+                "complete_count": 2,
+                "fail_count": 1,
+                "enqueue_latency_ms": [5.0, 10.0],
+                "dequeue_latency_ms": [],
+            }),
+            encoding="utf-8",
+        )
+
+        metrics = FileBasedJobQueue(queue_dir=str(queue_dir)).get_metrics()
+        assert metrics["enqueue_count"] == 7
+        assert metrics["enqueue_latency_avg_ms"] == pytest.approx(7.5)
+        assert metrics["dequeue_latency_p95_ms"] == 0.0
+        assert metrics["jobs_per_hour"] == 0.0
+    finally:
+        shutil.rmtree(queue_dir)
@@ -22,6 +22,7 @@ from pathlib import Path
 import pytest
 
 from core.webhooks.domain import JobStatus, WebhookEvent, WebhookJob, WebhookSource
+from infra.webhooks.adapters.sqlite_connection_pool import SQLiteConnectionPool
 from infra.webhooks.adapters.sqlite_job_queue import SQLiteJobQueue
 
 
@@ -31,6 +32,7 @@ def temp_db_path():
     db_path = Path(tempfile.mktemp(suffix=".db"))
     yield db_path
     # Fechar todas as conexões explicitamente
+    SQLiteConnectionPool.close_all()
     gc.collect()
     # Cleanup
     for ext in ["", "-wal", "-shm"]:
@@ -285,8 +287,9 @@ async def test_size_calculation(temp_db_path, sample_event):
     # Dequeue um
     await queue.dequeue(timeout_seconds=1.0)
 
-    # Tamanho deve reduzir
+    # Tamanho deve reduzir (versão async roda no executor do pool)
     assert queue.size() == 2
+    assert await queue.pending_count() == 2
 
 
 @pytest.mark.asyncio
@@ -348,6 +351,399 @@ async def test_multiple_instances_share_queue(temp_db_path, sample_job):
     assert queue1.size() == 0
 
 
+@pytest.mark.asyncio
+async def test_instances_share_connection_pool(temp_db_path, sample_job):
+    """Testa que instâncias do mesmo jobs.db reutilizam um único pool."""
+    queue1 = SQLiteJobQueue(db_path=str(temp_db_path))
+    queue2 = SQLiteJobQueue(db_path=str(temp_db_path))
+
+    assert queue1._pool is queue2._pool
+    assert queue1._pool.schema_ready is True
+
+    # Writer é reutilizado entre operações (sem open/close por chamada)
+    with queue1._pool.writer() as conn_a:
+        pass
+    await queue1.enqueue(sample_job)
+    with queue2._pool.writer() as conn_b:
+        pass
+    assert conn_a is conn_b
+
+    # PRAGMAs aplicados uma vez na criação da conexão
+    with queue1._pool.reader() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
+
+@pytest.mark.asyncio
+async def test_db_wait_does_not_block_event_loop(temp_db_path, sample_job):
+    """Testa que espera por lock do banco não congela o event loop."""
+    import threading
+
+    queue = SQLiteJobQueue(db_path=str(temp_db_path))
+    writer_held = threading.Event()
+    release_writer = threading.Event()
+
+    def hold_writer():
+        with queue._pool.writer():
+            writer_held.set()
+            release_writer.wait(timeout=5)
+
+    holder = threading.Thread(target=hold_writer)
+    holder.start()
+    writer_held.wait(timeout=5)
+
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while not release_writer.is_set():
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    async def release_later():
+        await asyncio.sleep(0.3)
+        release_writer.set()
+
+    # enqueue fica bloqueado no executor enquanto o loop continua rodando
+    await asyncio.gather(queue.enqueue(sample_job), ticker(), release_later())
+    holder.join()
+
+    assert ticks >= 10
+    assert queue.size() == 1
+
+
+def _make_job(event, job_id: str, priority: int | None = None) -> WebhookJob:
+    """Cria job com prioridade opcional em metadata."""
+    metadata = {} if priority is None else {"priority": priority}
+    return WebhookJob(
+        job_id=job_id,
+        correlation_id=f"corr-{job_id}",
+        created_at=datetime.utcnow(),
+        status=JobStatus.PENDING,
+        event=event,
+        metadata=metadata,
+    )
+
+
+def _expire_lease(queue: SQLiteJobQueue, job_id: str) -> None:
+    """Força expiração do lease de um job (simula worker morto)."""
+    with queue._pool.writer() as conn:
+        conn.execute(
+            "UPDATE jobs SET lease_expires_at = datetime('now', '-1 minutes') WHERE id = ?",
+            (job_id,),
+        )
+        conn.commit()
+
+
+@pytest.mark.asyncio
+async def test_dequeue_fifo_and_priority_order(temp_db_path, sample_event):
+    """Testa que claim respeita prioridade e FIFO dentro da prioridade."""
+    queue = SQLiteJobQueue(db_path=str(temp_db_path))
+
+    await queue.enqueue(_make_job(sample_event, "low-1"))
+    await queue.enqueue(_make_job(sample_event, "low-2"))
+    await queue.enqueue(_make_job(sample_event, "high-1", priority=10))
+
+    order = []
+    for _ in range(3):
+        job = await queue.dequeue(timeout_seconds=1.0)
+        order.append(job.job_id)
+
+    assert order == ["high-1", "low-1", "low-2"]
+
+
+@pytest.mark.asyncio
+async def test_expired_lease_is_requeued(temp_db_path, sample_job):
+    """Testa que reaper devolve à fila job de worker que morreu."""
+    queue = SQLiteJobQueue(db_path=str(temp_db_path))
+    await queue.enqueue(sample_job)
+
+    claimed = await queue.dequeue(timeout_seconds=1.0)
+    assert claimed is not None
+    assert queue.size() == 0
+
+    # Lease válido: reaper não mexe
+    assert await queue.requeue_expired_leases() == 0
+
+    _expire_lease(queue, claimed.job_id)
+    assert await queue.requeue_expired_leases() == 1
+    assert queue.size() == 1
+
+    # Heartbeat de job que não está mais em processamento é rejeitado
+    assert await queue.heartbeat(claimed.job_id) is False
+
+    reclaimed = await queue.dequeue(timeout_seconds=1.0)
+    assert reclaimed.job_id == claimed.job_id
+    assert await queue.heartbeat(reclaimed.job_id) is True
+
+
+@pytest.mark.asyncio
+async def test_expired_lease_fails_after_max_attempts(temp_db_path, sample_job):
+    """Testa que job que esgota tentativas é marcado como falho."""
+    queue = SQLiteJobQueue(db_path=str(temp_db_path), max_attempts=1)
+    await queue.enqueue(sample_job)
+
+    claimed = await queue.dequeue(timeout_seconds=1.0)
+    _expire_lease(queue, claimed.job_id)
+
+    assert await queue.requeue_expired_leases() == 1
+    assert queue.size() == 0
+
+    metrics = await queue.get_metrics()
+    assert metrics["failed"] == 1
+    assert metrics["total_failed"] == 1
+
+
+def test_schema_migrates_legacy_database(temp_db_path):
+    """Testa que bancos sem colunas de lease são migrados."""
+    import sqlite3
+
+    conn = sqlite3.connect(temp_db_path)
+    conn.execute(
+        """
+        CREATE TABLE jobs (
+            id TEXT PRIMARY KEY, correlation_id TEXT NOT NULL,
+            created_at TEXT NOT NULL, status TEXT NOT NULL DEFAULT 'pending',
+            event_source TEXT NOT NULL, event_type TEXT NOT NULL,
+            event_id TEXT NOT NULL, payload TEXT NOT NULL,
+            metadata TEXT NOT NULL DEFAULT '{}', result TEXT,
+            error_message TEXT, locked_at TEXT, processing_started_at TEXT,
+            completed_at TEXT, failed_at TEXT
+        )
+        """
+    )
+    conn.commit()
+    conn.close()
+
+    queue = SQLiteJobQueue(db_path=str(temp_db_path))
+
+    with queue._pool.reader() as conn:
+        columns = {row["name"] for row in conn.execute("PRAGMA table_info(jobs)")}
+    assert {"priority", "attempts", "lease_expires_at"} <= columns
+
+
+@pytest.mark.asyncio
+async def test_enqueue_wakes_waiting_dequeue(temp_db_path, sample_job):
+    """Testa que enqueue acorda dequeue bloqueado sem esperar polling."""
+    import time
+
+    queue = SQLiteJobQueue(db_path=str(temp_db_path))
+
+    async def enqueue_later():
+        await asyncio.sleep(0.2)
+        await queue.enqueue(sample_job)
+
+    start = time.monotonic()
+    job, _ = await asyncio.gather(queue.dequeue(timeout_seconds=10.0), enqueue_later())
+    elapsed = time.monotonic() - start
+
+    assert job is not None
+    assert elapsed < 1.0
+
+
+@pytest.mark.asyncio
+async def test_enqueue_from_other_thread_wakes_worker(temp_db_path, sample_job):
+    """Testa wakeup entre event loops (handler em outra thread, worker aqui)."""
+    import threading
+    import time
+
+    queue = SQLiteJobQueue(db_path=str(temp_db_path))
+    assert await queue.dequeue(timeout_seconds=0.1) is None
+
+    def enqueue_in_thread():
+        time.sleep(0.2)
+        asyncio.run(queue.enqueue(sample_job))
+
+    thread = threading.Thread(target=enqueue_in_thread)
+    start = time.monotonic()
+    thread.start()
+    woke = await queue.wait_for_job(10.0)
+    elapsed = time.monotonic() - start
+    thread.join()
+
+    assert woke is True
+    assert elapsed < 1.0
+
+
+def test_connection_pool_close_all(temp_db_path):
+    """Testa que close_all() descarta pools e permite recriação."""
+    pool = SQLiteConnectionPool.for_path(temp_db_path)
+    assert SQLiteConnectionPool.for_path(temp_db_path) is pool
+
+    SQLiteConnectionPool.close_all()
+
+    assert SQLiteConnectionPool.for_path(temp_db_path) is not pool
+
+
 if __name__ == "__main__":
     # Executar testes
     pytest.main([__file__, "-v"])
+
+
+def _make_delivery_job(event, job_id: str, delivery_id: str) -> WebhookJob:
+    """Cria job com delivery_id próprio."""
+    job = _make_job(event, job_id)
+    job.event = WebhookEvent(
+        source=event.source,
+        event_type=event.event_type,
+        event_id=event.event_id,
+        payload=event.payload,
+        received_at=event.received_at,
+        delivery_id=delivery_id,
+    )
+    return job
+
+
+@pytest.mark.asyncio
+async def test_enqueue_many_single_transaction_with_dedup(temp_db_path, sample_event):
+    """Testa enqueue_many: dedup em lote, ordem FIFO e métrica agregada."""
+    queue = SQLiteJobQueue(db_path=str(temp_db_path))
+    await queue.mark_delivery_processed("already-seen", "old-job")
+
+    jobs = [
+        _make_delivery_job(sample_event, "batch-0", "already-seen"),
+        _make_delivery_job(sample_event, "batch-1", "d-1"),
+        _make_delivery_job(sample_event, "batch-2", "d-1"),
+        _make_delivery_job(sample_event, "batch-3", "d-3"),
+    ]
+    job_ids = await queue.enqueue_many(jobs)
+
+    assert job_ids == ["batch-1", "batch-3"]
+    assert queue.size() == 2
+    assert (await queue.get_metrics())["total_enqueued"] == 2
+    assert (await queue.dequeue()).job_id == "batch-1"
+
+
+@pytest.mark.asyncio
+async def test_enqueue_many_is_atomic(temp_db_path, sample_event):
+    """Testa que falha no lote não grava nenhum job."""
+    queue = SQLiteJobQueue(db_path=str(temp_db_path))
+    await queue.enqueue(_make_job(sample_event, "dup"))
+
+    with pytest.raises(Exception):
+        await queue.enqueue_many([
+            _make_job(sample_event, "new-1"),
+            _make_job(sample_event, "dup"),
+        ])
+
+    assert queue.size() == 1
+    assert await queue.get_job("new-1") is None
+
+
+@pytest.mark.asyncio
+async def test_complete_many_and_fail_many(temp_db_path, sample_event):
+    """Testa ack em lote com resultado por job e métricas agregadas."""
+    queue = SQLiteJobQueue(db_path=str(temp_db_path))
+    await queue.enqueue_many([_make_job(sample_event, f"job-{i}") for i in range(4)])
+    for _ in range(4):
+        await queue.dequeue()
+
+    await queue.complete_many(["job-0", "job-1"], results={"job-0": {"ok": True}})
+    await queue.fail_many({"job-2": "erro A", "job-3": "erro B"})
+
+    assert (await queue.get_job("job-0")).status == JobStatus.COMPLETED
+    assert (await queue.get_job("job-3")).status == JobStatus.FAILED
+
+    metrics = await queue.get_metrics()
+    assert metrics["total_completed"] == 2
+    assert metrics["total_failed"] == 2
+
+
+@pytest.mark.asyncio
+async def test_status_counters_follow_transitions(temp_db_path, sample_event):
+    """Testa que job_status_counts acompanha enqueue/claim/ack/cleanup/clear."""
+    queue = SQLiteJobQueue(db_path=str(temp_db_path))
+    await queue.enqueue_many([_make_job(sample_event, f"job-{i}") for i in range(4)])
+    await queue.dequeue()
+    await queue.dequeue()
+    await queue.complete("job-0")
+    await queue.fail("job-1", "erro")
+
+    def counts() -> dict[str, int]:
+        with queue._pool.reader() as conn:
+            rows = conn.execute("SELECT status, count FROM job_status_counts")
+            return {row["status"]: row["count"] for row in rows if row["count"]}
+
+    assert counts() == {"pending": 2, "completed": 1, "failed": 1}
+
+    metrics = await queue.get_metrics()
+    assert metrics["queue_size"] == 2
+    assert metrics["enqueue_latency_avg_ms"] > 0
+    assert metrics["dequeue_latency_p95_ms"] > 0
+
+    with queue._pool.writer() as conn:
+        conn.execute("UPDATE jobs SET completed_at = '2000-01-01' WHERE id = 'job-0'")
+        conn.commit()
+    await queue.cleanup_old_jobs(older_than_days=1)
+    assert counts() == {"pending": 2, "failed": 1}
+
+    await queue.clear()
+    assert counts() == {}
+    assert (await queue.get_metrics())["queue_size"] == 0
+
+
+def test_status_counters_backfilled_on_existing_database(temp_db_path, sample_event):
+    """Testa que bancos sem job_status_counts são populados na abertura."""
+    import sqlite3
+
+    queue = SQLiteJobQueue(db_path=str(temp_db_path))
+    asyncio.run(queue.enqueue_many([_make_job(sample_event, f"job-{i}") for i in range(3)]))
+    SQLiteConnectionPool.close_all()
+
+    conn = sqlite3.connect(temp_db_path)
+    conn.execute("DROP TABLE job_status_counts")
+    conn.execute("DROP TRIGGER trg_jobs_count_insert")
+    conn.commit()
+    conn.close()
+
+    reopened = SQLiteJobQueue(db_path=str(temp_db_path))
+    assert asyncio.run(reopened.get_metrics())["queue_size"] == 3
+
+
+@pytest.mark.asyncio
+async def test_archive_finished_jobs_keeps_get_job(temp_db_path, sample_event):
+    """Testa que jobs finalizados antigos saem da tabela quente sem sumir."""
+    queue = SQLiteJobQueue(db_path=str(temp_db_path))
+    await queue.enqueue_many([_make_job(sample_event, f"job-{i}") for i in range(5)])
+    for _ in range(3):
+        await queue.dequeue()
+    await queue.complete("job-0", result={"pr": 1})
+    await queue.fail("job-1", "erro")
+    await queue.complete("job-2")
+
+    with queue._pool.writer() as conn:
+        conn.execute(
+            "UPDATE jobs SET completed_at = '2000-01-01', failed_at = '2000-01-01' "
+            "WHERE id IN ('job-0', 'job-1')"
+        )
+        conn.commit()
+
+    assert await queue.archive_finished_jobs(older_than_days=7, batch_size=1) == 2
+
+    listed = {job["job_id"] for job in await queue.list_jobs()}
+    assert listed == {"job-2", "job-3", "job-4"}
+
+    archived = await queue.get_job("job-0")
+    assert archived.status == JobStatus.COMPLETED
+    assert archived.event.payload == sample_event.payload
+    assert (await queue.get_metrics())["completed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_compact_storage_reclaims_pages(temp_db_path, sample_event):
+    """Testa incremental_vacuum em bancos novos (auto_vacuum=INCREMENTAL)."""
+    queue = SQLiteJobQueue(db_path=str(temp_db_path))
+    with queue._pool.reader() as conn:
+        assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+
+    big_event = WebhookEvent(
+        source=sample_event.source,
+        event_type=sample_event.event_type,
+        event_id=sample_event.event_id,
+        payload={"blob": "x" * 20000},
+        received_at=sample_event.received_at,
+    )
+    await queue.enqueue_many([_make_job(big_event, f"job-{i}") for i in range(20)])
+    await queue.clear()
+
+    assert await queue.compact_storage(max_pages=10_000) > 0
@@ -50,9 +50,11 @@ class TestKanbanEventBus:
         DOC: kanban_event_bus.py - publish()
 
         Testa que:
-        - Evento publicado é adicionado à fila do workspace
+        - Evento publicado é adicionado ao log do workspace
         - Evento contém dados corretos (event_type, data, workspace_id)
         """
+        cursor = event_bus.last_sequence("test-workspace")
+
         # Act: Publica evento
         await event_bus.publish(
             event_type="card_created",
@@ -60,11 +62,12 @@ class TestKanbanEventBus:
             workspace_id="test-workspace"
         )
 
-        # Assert: Verifica que evento está na fila
-        queue = event_bus._get_or_create_queue("test-workspace")
-        assert not queue.empty()
+        # Assert: Verifica que evento está no log de replay
+        events = event_bus.get_events_after("test-workspace", cursor)
+        assert len(events) == 1
 
-        event = await queue.get()
+        event = events[0]
+        assert event.sequence == cursor + 1
         assert event.event_type == "card_created"
         assert event.data["id"] == "test-123"
         assert event.workspace_id == "test-workspace"
@@ -249,3 +252,138 @@ class TestKanbanEventBus:
             break
 
         assert len(events_received) == 1
+
+
+async def _collect(subscription, count: int) -> list:
+    """Consome `count` eventos de uma subscription."""
+    events = []
+    async for event in subscription:
+        events.append(event)
+        if len(events) >= count:
+            break
+    return events
+
+
+class TestKanbanEventBusFanOut:
+    """
+    Testes de fan-out, consumidor lento e replay.
+
+    Usa instâncias próprias (não o singleton) para controlar buffers.
+    """
+
+    @pytest.mark.asyncio
+    async def test_todos_subscribers_recebem_todos_eventos(self):
+        """
+        Testa que:
+        - Duas abas do mesmo workspace recebem cada evento (não competem)
+        """
+        bus = KanbanEventBus()
+        tab_a = asyncio.create_task(_collect(bus.subscribe("ws"), 2))
+        tab_b = asyncio.create_task(_collect(bus.subscribe("ws"), 2))
+        await asyncio.sleep(0.01)
+        assert bus.get_subscribers_count("ws") == 2
+
+        await bus.publish("card_created", {"id": "1"}, "ws")
+        await bus.publish("card_created", {"id": "2"}, "ws")
+
+        for events in await asyncio.gather(tab_a, tab_b):
+            assert [e.data["id"] for e in events] == ["1", "2"]
+        assert bus.get_subscribers_count("ws") == 0
+
+    @pytest.mark.asyncio
+    async def test_consumidor_lento_coalesce_updates_por_card(self):
+        """
+        Testa que:
+        - card_updated pendentes do mesmo card viram só o mais recente
+        - card_deleted descarta update pendente do card
+        - Ordem por sequence é preservada
+        """
+        bus = KanbanEventBus()
+        subscription = bus.subscribe("ws", after_sequence=0)
+
+        await bus.publish("card_updated", {"id": "a", "title": "v1"}, "ws")
+        await bus.publish("card_updated", {"id": "b", "title": "v1"}, "ws")
+        await bus.publish("card_updated", {"id": "a", "title": "v2"}, "ws")
+        await bus.publish("card_created", {"id": "c"}, "ws")
+
+        # Replay do log também passa pelo buffer (coalescência na entrada)
+        events = await _collect(subscription, 3)
+        assert [(e.data["id"], e.event_type) for e in events] == [
+            ("b", "card_updated"),
+            ("a", "card_updated"),
+            ("c", "card_created"),
+        ]
+        assert events[1].data["title"] == "v2"
+        assert [e.sequence for e in events] == sorted(e.sequence for e in events)
+
+        subscription = bus.subscribe("ws", after_sequence=bus.last_sequence("ws"))
+        await bus.publish("card_updated", {"id": "c", "title": "x"}, "ws")
+        await bus.publish("card_deleted", {"id": "c"}, "ws")
+        events = await _collect(subscription, 1)
+        assert [e.event_type for e in events] == ["card_deleted"]
+
+    @pytest.mark.asyncio
+    async def test_consumidor_lento_drop_oldest(self):
+        """
+        Testa que:
+        - Buffer cheio descarta os eventos mais antigos daquele subscriber
+        """
+        bus = KanbanEventBus(subscriber_buffer=2, slow_consumer_policy="drop_oldest")
+        for i in range(4):
+            await bus.publish("card_updated", {"id": "a", "n": i}, "ws")
+
+        events = await _collect(bus.subscribe("ws", after_sequence=0), 2)
+        assert [e.data["n"] for e in events] == [2, 3]
+
+    def test_politica_invalida(self):
+        """Política desconhecida é rejeitada."""
+        with pytest.raises(ValueError):
+            KanbanEventBus(slow_consumer_policy="block")
+
+    @pytest.mark.asyncio
+    async def test_reconexao_retoma_da_janela_de_replay(self):
+        """
+        Testa que:
+        - Last-Event-ID dentro da janela permite retomar só o que faltou
+        - Cursor fora da janela (ou de outra execução) exige snapshot
+        """
+        bus = KanbanEventBus(replay_window=3)
+        for i in range(5):
+            await bus.publish("card_created", {"id": str(i)}, "ws")
+
+        assert bus.can_resume("ws", 5)
+        assert bus.can_resume("ws", 2)
+        assert not bus.can_resume("ws", 1)
+        assert not bus.can_resume("ws", 99)
+
+        events = await _collect(bus.subscribe("ws", after_sequence=3), 2)
+        assert [e.sequence for e in events] == [4, 5]
+        assert "id: 5\n" in events[-1].to_sse_format()
+
+    @pytest.mark.asyncio
+    async def test_publish_de_outra_thread_acorda_subscriber(self):
+        """
+        Testa que:
+        - Publish feito no loop do worker (outra thread) entrega ao SSE
+        """
+        import threading
+
+        bus = KanbanEventBus()
+        consumer = asyncio.create_task(_collect(bus.subscribe("ws"), 1))
+        await asyncio.sleep(0.01)
+
+        thread = threading.Thread(
+            target=lambda: asyncio.run(bus.publish("card_updated", {"id": "w"}, "ws"))
+        )
+        thread.start()
+        events = await asyncio.wait_for(consumer, timeout=2)
+        thread.join()
+
+        assert events[0].data["id"] == "w"
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_sem_eventos(self):
+        """Com heartbeat, subscribe yield None quando ocioso."""
+        bus = KanbanEventBus()
+        events = await _collect(bus.subscribe("ws", heartbeat=0.01), 1)
+        assert events == [None]
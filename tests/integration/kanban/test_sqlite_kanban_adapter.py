@@ -657,3 +657,177 @@ async def test_delete_card_deve_adicionar_historico_deleted(adapter: SQLiteKanba
     # Verifica metadados contém título
     deleted = deleted_events[0]
     assert deleted.metadata is not None
+
+
+# =============================================================================
+# TESTES: ADAPTER COMPARTILHADO / VERSÃO DO SCHEMA
+# =============================================================================
+
+
+async def test_shared_deve_reusar_conexao_por_banco(tmp_path: Path):
+    """
+    DOC: SQLiteKanbanAdapter.shared()
+
+    Given: Dois kanban.db distintos
+    When: shared() é chamado mais de uma vez
+    Then: Mesmo adapter conectado por banco; arquivo recriado reconecta
+    """
+    db_a = tmp_path / "a" / "kanban.db"
+    db_b = tmp_path / "b" / "kanban.db"
+
+    try:
+        first = SQLiteKanbanAdapter.shared(db_a)
+        assert SQLiteKanbanAdapter.shared(db_a) is first
+        assert SQLiteKanbanAdapter.shared(db_b) is not first
+        assert first.list_boards().is_ok
+
+        # Banco removido (ex: reset do workspace) → nova conexão e schema
+        db_a.unlink()
+        recreated = SQLiteKanbanAdapter.shared(db_a)
+        assert recreated is not first
+        assert recreated.list_boards().is_ok
+    finally:
+        SQLiteKanbanAdapter.close_shared()
+
+
+async def test_shared_aposenta_instancia_substituida_sem_fechar_em_uso(tmp_path: Path):
+    """
+    DOC: SQLiteKanbanAdapter.shared() / _retire()
+
+    Given: Adapter compartilhado referenciado por um handler
+    When: O banco é recriado e shared() registra outra instância
+    Then: A instância antiga continua funcionando e fecha a conexão ao ficar ociosa
+    """
+    db_path = tmp_path / "kanban.db"
+
+    try:
+        old = SQLiteKanbanAdapter.shared(db_path)
+        db_path.unlink()
+
+        with old._lock:
+            # Operação em andamento na instância antiga (outra requisição)
+            old._in_use += 1
+            replacement = SQLiteKanbanAdapter.shared(db_path)
+            assert old._conn is not None
+            old._in_use -= 1
+
+        assert replacement is not old
+        assert old.list_boards().is_ok
+        assert old._conn is None
+        assert replacement.list_boards().is_ok
+    finally:
+        SQLiteKanbanAdapter.close_shared()
+
+
+async def test_shared_serializa_acesso_entre_threads(tmp_path: Path):
+    """
+    DOC: SQLiteKanbanAdapter._lock
+
+    Given: Um adapter compartilhado
+    When: Várias threads escrevem e leem ao mesmo tempo
+    Then: Todas as operações têm sucesso (conexão nunca usada em paralelo)
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    adapter = SQLiteKanbanAdapter.shared(tmp_path / "kanban.db")
+    adapter.create_board(KanbanBoard(id="board-1", name="Board"))
+    adapter.create_list(KanbanList(id="list-1", board_id="board-1", name="Lista"))
+
+    def work(index: int) -> bool:
+        created = adapter.create_card(
+            KanbanCard(id=f"card-{index}", list_id="list-1", title=f"Card {index}")
+        )
+        listed = adapter.list_cards()
+        return created.is_ok and listed.is_ok
+
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            assert all(executor.map(work, range(40)))
+        assert len(adapter.list_cards().value) == 40
+    finally:
+        SQLiteKanbanAdapter.close_shared()
+
+
+async def test_connect_nao_reaplica_schema_na_mesma_versao(temp_db_path):
+    """
+    DOC: SQLiteKanbanAdapter._ensure_schema()
+
+    Given: Banco já inicializado (PRAGMA user_version = versão do schema)
+    When: connect() é chamado novamente
+    Then: schema.sql não é reexecutado
+    """
+    first = SQLiteKanbanAdapter(temp_db_path)
+    assert first.connect().is_ok
+    first.disconnect()
+
+    with sqlite3.connect(temp_db_path) as conn:
+        assert conn.execute("PRAGMA user_version").fetchone()[0] != 0
+
+    second = SQLiteKanbanAdapter(temp_db_path)
+    statements = []
+    second.connect()
+    second._conn.set_trace_callback(statements.append)
+    second._ensure_schema()
+    second.disconnect()
+
+    assert statements == ["PRAGMA user_version"]
+
+
+async def test_transaction_desfaz_todas_as_escritas_em_erro(adapter: SQLiteKanbanAdapter):
+    """
+    DOC: SQLiteKanbanAdapter.transaction()
+
+    Given: Várias escritas dentro de transaction()
+    When: O bloco levanta exceção
+    Then: Nenhuma escrita é persistida
+    """
+    adapter.create_board(KanbanBoard(id="board-tx", name="TX"))
+
+    with pytest.raises(RuntimeError):
+        with adapter.transaction():
+            adapter.create_list(KanbanList(id="list-tx-1", board_id="board-tx", name="A"))
+            with adapter.transaction():
+                adapter.create_list(KanbanList(id="list-tx-2", board_id="board-tx", name="B"))
+            raise RuntimeError("falha no meio do lote")
+
+    assert adapter.list_lists("board-tx").value == []
+
+    with adapter.transaction():
+        adapter.create_list(KanbanList(id="list-tx-3", board_id="board-tx", name="C"))
+
+    assert [lst.id for lst in adapter.list_lists("board-tx").value] == ["list-tx-3"]
+
+
+async def test_transaction_isola_escritas_de_outras_threads(adapter: SQLiteKanbanAdapter):
+    """
+    DOC: SQLiteKanbanAdapter.transaction()
+
+    Given: Uma thread com transaction() aberta
+    When: Outra thread escreve no mesmo adapter e a transação é desfeita
+    Then: A escrita da outra thread espera o fim da transação e não é desfeita junto
+    """
+    import threading
+
+    adapter.create_board(KanbanBoard(id="board-iso", name="ISO"))
+    inside = threading.Event()
+    other_done = threading.Event()
+
+    def other_writer():
+        inside.wait()
+        adapter.create_list(KanbanList(id="list-other", board_id="board-iso", name="B"))
+        other_done.set()
+
+    thread = threading.Thread(target=other_writer)
+    thread.start()
+
+    with pytest.raises(RuntimeError):
+        with adapter.transaction():
+            adapter.create_list(KanbanList(id="list-tx", board_id="board-iso", name="A"))
+            inside.set()
+            # A outra thread não consegue entrar na transação aberta
+            assert not other_done.wait(timeout=0.2)
+            raise RuntimeError("rollback")
+
+    thread.join(timeout=2)
+    assert other_done.is_set()
+    assert [lst.id for lst in adapter.list_lists("board-iso").value] == ["list-other"]
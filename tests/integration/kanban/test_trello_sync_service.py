@@ -733,6 +733,49 @@ async def test_sync_from_trello_deve_criar_cards_que_nao_existem_no_kanban_db(ad
     assert created_card.list_id == "list-progress"  # "Em Andamento"
 
 
+async def test_sync_from_trello_incremental_busca_apenas_cards_alterados(adapter, mock_trello_adapter):
+    """
+    DOC: TrelloSyncService.sync_from_trello() - sync incremental
+
+    Given: Um sync completo já gravou a marca d'água do board
+    When: sync_from_trello() é chamado de novo
+    Then: Busca só os cards alterados (list_cards_since) desde a marca d'água
+    """
+    from core.kanban.application.trello_sync_service import TrelloSyncService, WATERMARK_OVERLAP
+    from core.kanban.domain.card import Card
+
+    adapter.create_board(KanbanBoard(id="board-1", name="Main", trello_board_id="board-1"))
+    adapter.create_list(KanbanList(id="list-1", board_id="board-1", name="A Fazer"))
+
+    mock_trello_adapter.list_cards.return_value = Result.ok([
+        Card(id="trello-1", title="Card 1", url="https://trello.com/c/1"),
+    ])
+    mock_trello_adapter.list_cards_since.return_value = Result.ok([
+        Card(id="trello-2", title="Card 2", url="https://trello.com/c/2"),
+    ])
+
+    sync_service = TrelloSyncService(adapter, mock_trello_adapter)
+
+    # Primeiro sync: completo
+    first = await sync_service.sync_from_trello("board-1")
+    assert first.is_ok and first.value == 1
+    watermark = adapter.get_sync_watermark("trello:board-1").value
+    assert watermark is not None
+
+    # Segundo sync: incremental a partir da marca d'água
+    second = await sync_service.sync_from_trello("board-1")
+    assert second.is_ok and second.value == 1
+    mock_trello_adapter.list_cards.assert_awaited_once()
+    mock_trello_adapter.list_cards_since.assert_awaited_once_with("board-1", watermark - WATERMARK_OVERLAP)
+
+    trello_ids = {card.trello_card_id for card in adapter.list_cards().value}
+    assert trello_ids == {"trello-1", "trello-2"}
+
+    # force=True ignora a marca d'água e volta ao sync completo
+    await sync_service.sync_from_trello("board-1", force=True)
+    assert mock_trello_adapter.list_cards.await_count == 2
+
+
 async def test_dead_letter_queue_deve_armazenar_operacoes_falhas(adapter, mock_trello_adapter):
     """
     DOC: TrelloSyncService - Dead Letter Queue
@@ -766,3 +809,62 @@ async def test_dead_letter_queue_deve_armazenar_operacoes_falhas(adapter, mock_t
     assert dlq_size >= 0  # DLQ existe
 
     await sync_service.stop_queue_worker()
+
+
+async def test_fila_agrupa_operacoes_redundantes_do_mesmo_card(adapter, mock_trello_adapter):
+    """
+    DOC: TrelloSyncService._merge_pending()
+
+    Given: Vários moves enfileirados para o mesmo card antes do worker rodar
+    When: Worker processa a fila
+    Then: Apenas um move é enviado ao Trello; create cobre update/move
+    """
+    from core.kanban.application.trello_sync_service import TrelloSyncService
+
+    sync_service = TrelloSyncService(adapter, mock_trello_adapter)
+
+    for _ in range(3):
+        await sync_service.enqueue_sync_operation("move", "card-1")
+    await sync_service.enqueue_sync_operation("update", "card-1")
+    await sync_service.enqueue_sync_operation("create", "card-2")
+    await sync_service.enqueue_sync_operation("move", "card-2")
+
+    # Um agendamento por card, operações agrupadas
+    assert sync_service._queue.qsize() == 2
+    assert [op.operation for op in sync_service._pending["card-1"]] == ["move", "update"]
+    assert [op.operation for op in sync_service._pending["card-2"]] == ["create"]
+
+
+async def test_dead_letter_queue_persiste_no_kanban_db(adapter, mock_trello_adapter):
+    """
+    DOC: TrelloSyncService._add_to_dlq()
+
+    Given: Operação que falha em todas as tentativas
+    When: Worker esgota os retries
+    Then: Operação é gravada em sync_dead_letters e sobrevive ao serviço
+    """
+    import asyncio
+    from core.kanban.application.trello_sync_service import TrelloSyncService
+
+    adapter.create_board(KanbanBoard(id="board-1", name="Main"))
+    adapter.create_list(KanbanList(id="list-1", board_id="board-1", name="To Do"))
+    adapter.create_card(KanbanCard(id="card-1", list_id="list-1", title="Card 1"))
+
+    mock_trello_adapter.create_card.return_value = Result.err("HTTP 429")
+
+    sync_service = TrelloSyncService(adapter, mock_trello_adapter, max_retries=1)
+    await sync_service.start_queue_worker()
+    try:
+        await sync_service.enqueue_sync_operation("create", "card-1")
+        await asyncio.wait_for(sync_service._queue.join(), timeout=2)
+    finally:
+        await sync_service.stop_queue_worker()
+
+    assert sync_service.get_dlq_size() == 1
+
+    # Novo serviço (ex: restart) enxerga a mesma DLQ
+    assert TrelloSyncService(adapter, mock_trello_adapter).get_dlq_size() == 1
+    dead = adapter.list_sync_dead_letters().value
+    assert dead[0]["operation"] == "create"
+    assert dead[0]["card_id"] == "card-1"
+    assert dead[0]["error"] == "Erro ao criar no Trello: HTTP 429"
@@ -13,9 +13,9 @@ Bug Original:
     CancelledError durante shutdown do Uvicorn quando webhook worker está ativo.
 
 Comportamento Esperado:
-    - Startup: Inicia worker em thread separada com event loop próprio
-    - Shutdown: Chama worker.stop(), aguarda thread com timeout, para listener
-    - Sem CancelledError: Event loops são encerrados graciosamente
+    - Startup: Inicia worker como task no event loop da API
+    - Shutdown: Chama worker.stop(), aguarda a task com timeout, para listener
+    - Sem CancelledError: jobs que não terminam a tempo são cancelados
 """
 
 import pytest
@@ -33,307 +33,122 @@ class TestLifespanGerenciamentoWorker:
         DOC: runtime/bootstrap/app.py - lifespan context manager
     """
 
-    @pytest.mark.asyncio
-    async def test_lifespan_shutdown_chama_worker_stop_graciosamente(self):
-        """
-        RED → GREEN: Shutdown deve chamar worker.stop() para evitar CancelledError.
-
-        BUG REPRODUZIDO:
-            Originalmente, o lifespan não chamava worker.stop(), causando
-            CancelledError quando Uvicorn tentava encerrar o event loop.
-
-        COMPORTAMENTO ESPERADO:
-            - worker.stop() é chamado no shutdown (after yield)
-            - Isso sinaliza o worker para parar o loop de processamento
-            - Event loop pode ser encerrado sem CancelledError
-
-        Dado:
-            - Worker instance existe (_webhook_worker_instance global)
-            - Worker thread está ativa
-
-        Quando:
-            - Lifespan shutdown é executado (after yield)
-
-        Então:
-            - worker.stop() é chamado exatamente uma vez
-        """
-        # Arrange
-        mock_app = Mock()
-        mock_worker = Mock()
-        mock_thread = Mock()
-        mock_thread.is_alive = Mock(side_effect=[True, False])  # Thread viva, depois encerra
-
-        # Patch nas globais do módulo
+    @pytest.fixture
+    def app_module(self):
+        """Módulo app com globais do worker restauradas ao final."""
         import runtime.bootstrap.app as app_module
-        original_worker_instance = app_module._webhook_worker_instance
-        original_worker_thread = app_module._webhook_worker_thread
-        original_listener = app_module._trello_listener
-
-        try:
-            # Configura mocks nas globais
-            app_module._webhook_worker_instance = mock_worker
-            app_module._webhook_worker_thread = mock_thread
-            app_module._trello_listener = None
-
-            # Act: Startup + Shutdown usando async with
-            from runtime.bootstrap.app import lifespan
-
-            with patch('runtime.config.config.get_webhook_config') as mock_config:
-                mock_config.return_value.enabled_sources = []  # Desabilita worker real
-
-                async with lifespan(mock_app):
-                    pass  # Startup aconteceu aqui
 
-            # Assert: worker.stop() foi chamado (no shutdown, após sair do async with)
-            mock_worker.stop.assert_called_once()
-        finally:
-            # Restore originals
-            app_module._webhook_worker_instance = original_worker_instance
-            app_module._webhook_worker_thread = original_worker_thread
-            app_module._trello_listener = original_listener
+        names = (
+            "_webhook_worker_instance",
+            "_webhook_worker_task",
+            "_worktree_pool_task",
+            "_trello_listener",
+        )
+        originals = {name: getattr(app_module, name) for name in names}
+        for name in names:
+            setattr(app_module, name, None)
+        yield app_module
+        for name, value in originals.items():
+            setattr(app_module, name, value)
+
+    @staticmethod
+    def worker_mock():
+        """Worker cuja task termina quando stop() é chamado."""
+        stopped = asyncio.Event()
+        worker = Mock()
+        worker.stop = Mock(side_effect=stopped.set)
+        worker.cancel_jobs = Mock(return_value=0)
+        return worker, stopped
+
+    async def run_lifespan(self, app_module):
+        """Executa startup + shutdown com worker real desabilitado."""
+        with patch('runtime.config.config.get_webhook_config') as mock_config:
+            mock_config.return_value.enabled_sources = []  # Desabilita worker real
+            async with app_module.lifespan(Mock()):
+                pass
 
     @pytest.mark.asyncio
-    async def test_lifespan_shutdown_aguarda_thread_com_timeout_5_segundos(self):
+    async def test_lifespan_shutdown_chama_worker_stop_graciosamente(self, app_module):
         """
-        GREEN: Shutdown deve aguardar thread com timeout de 5 segundos.
-
-        Dado:
-            - Worker thread está ativa
-            - worker.stop() já foi chamado
-
-        Quando:
-            - Lifespan shutdown é executado
+        Shutdown deve chamar worker.stop() para evitar CancelledError.
 
         Então:
-            - thread.join(timeout=5.0) é chamado
-            - Não bloqueia indefinidamente se thread não responder
+            - worker.stop() é chamado exatamente uma vez
+            - a task do worker termina sem ser cancelada
         """
-        # Arrange
-        mock_app = Mock()
-        mock_worker = Mock()
-        mock_thread = Mock()
-        mock_thread.is_alive = Mock(return_value=True)  # Thread está viva inicialmente
-
-        import runtime.bootstrap.app as app_module
-        original_worker_instance = app_module._webhook_worker_instance
-        original_worker_thread = app_module._webhook_worker_thread
-        original_listener = app_module._trello_listener
+        worker, stopped = self.worker_mock()
+        app_module._webhook_worker_instance = worker
+        app_module._webhook_worker_task = asyncio.create_task(stopped.wait())
 
-        try:
-            app_module._webhook_worker_instance = mock_worker
-            app_module._webhook_worker_thread = mock_thread
-            app_module._trello_listener = None
-
-            # Act
-            from runtime.bootstrap.app import lifespan
+        await self.run_lifespan(app_module)
 
-            with patch('runtime.config.config.get_webhook_config') as mock_config:
-                mock_config.return_value.enabled_sources = []
-
-                async with lifespan(mock_app):
-                    pass  # Startup
-
-            # Assert: thread.join() foi chamado com timeout de 5s
-            mock_thread.join.assert_called_once_with(timeout=5.0)
-        finally:
-            app_module._webhook_worker_instance = original_worker_instance
-            app_module._webhook_worker_thread = original_worker_thread
-            app_module._trello_listener = original_listener
+        worker.stop.assert_called_once()
+        assert app_module._webhook_worker_task.done()
+        assert not app_module._webhook_worker_task.cancelled()
+        worker.cancel_jobs.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_lifespan_shutdown_avisa_quando_thread_nao_termina(self):
+    async def test_lifespan_shutdown_cancela_worker_apos_timeout(self, app_module):
         """
-        GREEN: Deve avisar quando thread não termina em 5 segundos.
-
-        Dado:
-            - Worker thread continua ativa após join(timeout=5.0)
-
-        Quando:
-            - Lifespan shutdown é executado
+        Worker que não termina em WORKER_SHUTDOWN_TIMEOUT tem jobs e task cancelados.
 
         Então:
-            - Logger.warning é chamado com mensagem apropriada
+            - cancel_jobs() é chamado
+            - logger.warning informa o timeout
+            - shutdown não bloqueia indefinidamente
         """
-        # Arrange
-        mock_app = Mock()
+        worker = Mock(cancel_jobs=Mock(return_value=2))
+        never = asyncio.Event()
+        app_module._webhook_worker_instance = worker
+        app_module._webhook_worker_task = asyncio.create_task(never.wait())
         mock_logger = Mock()
-        mock_worker = Mock()
-        mock_thread = Mock()
-        mock_thread.is_alive = Mock(return_value=True)  # Thread ainda viva!
-
-        import runtime.bootstrap.app as app_module
-        original_worker_instance = app_module._webhook_worker_instance
-        original_worker_thread = app_module._webhook_worker_thread
-        original_listener = app_module._trello_listener
-
-        try:
-            app_module._webhook_worker_instance = mock_worker
-            app_module._webhook_worker_thread = mock_thread
-            app_module._trello_listener = None
-
-            # Act
-            from runtime.bootstrap.app import lifespan
-
-            with patch('runtime.config.config.get_webhook_config') as mock_config, \
-                 patch('runtime.observability.logger.get_logger', return_value=mock_logger):
-                mock_config.return_value.enabled_sources = []
 
-                async with lifespan(mock_app):
-                    pass  # Startup
+        with patch.object(app_module, "WORKER_SHUTDOWN_TIMEOUT", 0.05), \
+             patch('runtime.observability.logger.get_logger', return_value=mock_logger):
+            await self.run_lifespan(app_module)
 
-            # Assert: logger.warning foi chamado
-            assert any(
-                'não terminou em 5 segundos' in str(call)
-                for call in mock_logger.warning.call_args_list
-            ), "Deve emitir warning quando thread não termina"
-        finally:
-            app_module._webhook_worker_instance = original_worker_instance
-            app_module._webhook_worker_thread = original_worker_thread
-            app_module._trello_listener = original_listener
+        worker.cancel_jobs.assert_called_once()
+        assert app_module._webhook_worker_task.cancelled()
+        assert any(
+            'não terminou em' in str(call)
+            for call in mock_logger.warning.call_args_list
+        ), "Deve emitir warning quando o worker não termina"
 
     @pytest.mark.asyncio
-    async def test_lifespan_shutdown_para_trello_listener_se_ativo(self):
+    async def test_lifespan_shutdown_para_trello_listener_se_ativo(self, app_module):
         """
-        GREEN: TrelloListener.stop() deve ser chamado no shutdown.
-
-        Dado:
-            - TrelloListener foi iniciado no startup
-            - _trello_listener global não é None
-
-        Quando:
-            - Lifespan shutdown é executado
-
-        Então:
-            - trello_listener.stop() é chamado
+        TrelloListener.stop() deve ser chamado no shutdown.
         """
-        # Arrange
-        mock_app = Mock()
-        mock_worker = Mock()
-        mock_thread = Mock()
-        mock_thread.is_alive = Mock(side_effect=[True, False])  # Thread viva, depois encerra
+        worker, stopped = self.worker_mock()
         mock_listener = Mock()
         mock_listener.stop = AsyncMock()
+        app_module._webhook_worker_instance = worker
+        app_module._webhook_worker_task = asyncio.create_task(stopped.wait())
+        app_module._trello_listener = mock_listener
 
-        import runtime.bootstrap.app as app_module
-        original_worker_instance = app_module._webhook_worker_instance
-        original_worker_thread = app_module._webhook_worker_thread
-        original_listener = app_module._trello_listener
-
-        try:
-            app_module._webhook_worker_instance = mock_worker
-            app_module._webhook_worker_thread = mock_thread
-            app_module._trello_listener = mock_listener
-
-            # Act
-            from runtime.bootstrap.app import lifespan
-
-            with patch('runtime.config.config.get_webhook_config') as mock_config:
-                mock_config.return_value.enabled_sources = []
-
-                async with lifespan(mock_app):
-                    pass  # Startup
+        await self.run_lifespan(app_module)
 
-            # Assert: listener.stop() foi chamado
-            mock_listener.stop.assert_called_once()
-        finally:
-            app_module._webhook_worker_instance = original_worker_instance
-            app_module._webhook_worker_thread = original_worker_thread
-            app_module._trello_listener = original_listener
+        mock_listener.stop.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_lifespan_shutdown_faz_nothing_se_worker_nao_existe(self):
+    async def test_lifespan_shutdown_faz_nothing_se_worker_nao_existe(self, app_module):
         """
-        GREEN: Shutdown deve ser seguro mesmo se worker nunca foi iniciado.
-
-        Dado:
-            - _webhook_worker_instance é None
-            - _webhook_worker_thread é None
-
-        Quando:
-            - Lifespan shutdown é executado
-
-        Então:
-            - Nenhum erro é levantado
-            - Lifespan completa normalmente
+        Shutdown deve ser seguro mesmo se worker nunca foi iniciado.
         """
-        # Arrange
-        mock_app = Mock()
-
-        import runtime.bootstrap.app as app_module
-        original_worker_instance = app_module._webhook_worker_instance
-        original_worker_thread = app_module._webhook_worker_thread
-        original_listener = app_module._trello_listener
-
-        try:
-            app_module._webhook_worker_instance = None
-            app_module._webhook_worker_thread = None
-            app_module._trello_listener = None
-
-            # Act & Assert: Não deve levantar exceção
-            from runtime.bootstrap.app import lifespan
-
-            with patch('runtime.config.config.get_webhook_config') as mock_config:
-                mock_config.return_value.enabled_sources = []
-
-                async with lifespan(mock_app):
-                    pass  # Startup
-
-            # Se chegou aqui, não houve exceção - TESTE PASSA
-        finally:
-            app_module._webhook_worker_instance = original_worker_instance
-            app_module._webhook_worker_thread = original_worker_thread
-            app_module._trello_listener = original_listener
+        # Globais já são None (fixture); não deve levantar exceção
+        await self.run_lifespan(app_module)
 
     @pytest.mark.asyncio
-    async def test_lifespan_integration_shutdown_gracioso_com_worker_mock(self):
+    async def test_lifespan_para_pool_de_worktrees(self, app_module):
         """
-        GREEN: Integração completa de shutdown com worker mock.
-
-        Este teste valida o fluxo completo de shutdown:
-        1. worker.stop() é chamado
-        2. thread.join(timeout=5.0) é chamado
-        3. Thread encerra graciosamente
-        4. Nenhum erro é levantado
+        A task de manutenção do pool de worktrees é cancelada no shutdown.
         """
-        # Arrange
-        mock_app = Mock()
-        mock_worker = Mock()
-        mock_thread = Mock()
-        # Thread está viva inicialmente, após join encerra (is_alive retorna False)
-        mock_thread.is_alive = Mock(side_effect=[True, False])
+        pool_task = asyncio.create_task(asyncio.Event().wait())
+        app_module._worktree_pool_task = pool_task
 
-        import runtime.bootstrap.app as app_module
-        original_worker_instance = app_module._webhook_worker_instance
-        original_worker_thread = app_module._webhook_worker_thread
-        original_listener = app_module._trello_listener
+        await self.run_lifespan(app_module)
 
-        try:
-            app_module._webhook_worker_instance = mock_worker
-            app_module._webhook_worker_thread = mock_thread
-            app_module._trello_listener = None
-
-            # Act
-            from runtime.bootstrap.app import lifespan
-
-            with patch('runtime.config.config.get_webhook_config') as mock_config, \
-                 patch('runtime.observability.logger.get_logger') as mock_logger:
-                mock_config.return_value.enabled_sources = []
-
-                async with lifespan(mock_app):
-                    pass  # Startup
-
-            # Assert: fluxo completo de shutdown
-            mock_worker.stop.assert_called_once()
-            mock_thread.join.assert_called_once_with(timeout=5.0)
-            # Thread encerrou, então não há warning
-            assert not any(
-                'não terminou em 5 segundos' in str(call)
-                for call in mock_logger.warning.call_args_list
-            )
-        finally:
-            app_module._webhook_worker_instance = original_worker_instance
-            app_module._webhook_worker_thread = original_worker_thread
-            app_module._trello_listener = original_listener
+        assert pool_task.cancelled()
 
 
 class TestLifespanSemWorker:
@@ -344,30 +159,26 @@ class TestLifespanSemWorker:
     @pytest.mark.asyncio
     async def test_lifespan_com_github_desabilitado_nao_inicia_worker(self):
         """
-        GREEN: Com GitHub desabilitado, nenhuma thread deve ser criada.
-
-        Este é um teste de integração leve que verifica que o lifespan
-        não tenta iniciar worker quando GitHub não está habilitado.
+        Com GitHub desabilitado, nenhuma task de worker deve ser criada.
         """
-        # Arrange
-        mock_app = Mock()
+        import runtime.bootstrap.app as app_module
 
-        # Act
-        from runtime.bootstrap.app import lifespan
+        original_task = app_module._webhook_worker_task
+        app_module._webhook_worker_task = None
 
-        # Config: GitHub não habilitado (lista vazia)
-        with patch('runtime.config.config.get_webhook_config') as mock_config:
-            mock_config.return_value.enabled_sources = []  # Vazio = sem github
-            mock_config.return_value.worktree_base_path = '/tmp/test'
-            mock_config.return_value.base_branch = 'main'
+        try:
+            with patch('runtime.config.config.get_webhook_config') as mock_config:
+                mock_config.return_value.enabled_sources = []  # Vazio = sem github
+                mock_config.return_value.worktree_base_path = '/tmp/test'
+                mock_config.return_value.base_branch = 'main'
 
-            async with lifespan(mock_app):
-                # Startup aconteceu
-                pass
+                async with app_module.lifespan(Mock()):
+                    pass
 
-            # Assert: Nenhuma thread foi criada (globais ainda são None)
-            from runtime.bootstrap.app import _webhook_worker_thread
-            assert _webhook_worker_thread is None
+            # Assert: Nenhuma task foi criada (global ainda é None)
+            assert app_module._webhook_worker_task is None
+        finally:
+            app_module._webhook_worker_task = original_task
 
 
 # -----------------------------------------------------------------------------
@@ -379,31 +190,23 @@ REFACTOR NOTAS (após GREEN):
 
 Após todos os testes passarem, considerar melhorias:
 
-1. EXTRAIR run_worker_in_thread():
-   A função está aninhada no lifespan. Pode ser movida para module-level:
-   - Melhor testabilidade
-   - Permite testar isoladamente
-   - Reduz complexidade do lifespan
-
-2. CONFIGURAR timeout via ambiente:
-   Atualmente 5.0s está hardcoded. Considerar:
+1. CONFIGURAR timeout via ambiente:
+   Atualmente WORKER_SHUTDOWN_TIMEOUT (5.0s) é constante do módulo. Considerar:
    - WEBHOOK_WORKER_SHUTDOWN_TIMEOUT env var
    - Default de 5.0s se não configurado
 
-3. ADICIONAR métricas de shutdown:
+2. ADICIONAR métricas de shutdown:
    - Tempo que shutdown levou
-   - Quantas workers foram parados
-   - Quantas threads falharam em terminar
+   - Quantos jobs foram cancelados
 
-4. MELHORAR structured logging:
+3. MELHORAR structured logging:
    - Adicionar correlation_id nos logs de lifespan
    - Incluir timestamps relativos (startup duration, etc.)
 
-5. REVISAR estratégia de teste:
+4. REVISAR estratégia de teste:
    - Atualmente modificando globais diretamente
    - Considerar injeção de dependências para melhor testabilidade
 
-6. SIMPLIFICAR setup de testes:
-   - Criar fixture pytest para setup/teardown das globais
-   - Reduzir duplicação nos testes
+5. SIMPLIFICAR setup de testes:
+   - Fixture app_module já faz setup/teardown das globais do worker
 """
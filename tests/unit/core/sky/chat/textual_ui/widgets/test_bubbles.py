@@ -6,6 +6,8 @@ DOC: openspec/changes/sky-chat-textual-ui/specs/textual-chat-ui/spec.md
 DOC: openspec/changes/sky-chat-textual-ui/design.md - Message bubbles estilizados
 """
 
+import time
+
 import pytest
 from unittest.mock import Mock, patch
 
@@ -227,3 +229,85 @@ class TestBubblesStyling:
 
 
 __all__ = ["TestSkyBubble", "TestUserBubble", "TestBubblesMarkdownSupport", "TestBubblesStyling"]
+
+
+class TestSkyBubbleStreaming:
+    """
+    Testa o render coalescido do SkyBubble durante streaming.
+    """
+
+    @staticmethod
+    def app_com_bubble(bubble):
+        from textual.app import App
+
+        class BubbleApp(App):
+            def compose(self):
+                yield bubble
+
+        return BubbleApp()
+
+    @pytest.mark.asyncio
+    async def test_stream_coalesce_chunks_em_um_append(self):
+        """
+        QUANDO vários chunks chegam no mesmo frame
+        ENTÃO Markdown.append é chamado uma vez com o fragmento completo
+        """
+        from textual.widgets import Markdown
+
+        bubble = SkyBubble("")
+        async with self.app_com_bubble(bubble).run_test() as pilot:
+            markdown = bubble.query_one("#sky-message", Markdown)
+            with patch.object(markdown, "append", wraps=markdown.append) as append:
+                for chunk in ["Olá", ", ", "**Sky**", "!"]:
+                    bubble.stream(chunk)
+                await bubble.end_stream()
+                await pilot.pause()
+
+            append.assert_called_once_with("Olá, **Sky**!")
+            assert bubble.content == "Olá, **Sky**!"
+
+    @pytest.mark.asyncio
+    async def test_stream_nao_rerenderiza_conteudo_completo(self):
+        """
+        QUANDO chunks são transmitidos
+        ENTÃO Markdown.update (re-parse total) não é chamado
+        """
+        from textual.widgets import Markdown
+
+        bubble = SkyBubble("")
+        async with self.app_com_bubble(bubble).run_test() as pilot:
+            markdown = bubble.query_one("#sky-message", Markdown)
+            with patch.object(markdown, "update", wraps=markdown.update) as update:
+                bubble.stream("# Título\n\n")
+                await pilot.pause(0.1)
+                bubble.stream("Parágrafo")
+                await bubble.end_stream()
+
+            update.assert_not_called()
+            assert markdown.source == "# Título\n\nParágrafo"
+
+    @pytest.mark.asyncio
+    async def test_stream_respeita_limite_de_frames(self):
+        """
+        QUANDO chunks chegam continuamente
+        ENTÃO renders não excedem STREAM_FPS por segundo
+        """
+        from textual.widgets import Markdown
+
+        from src.core.sky.chat.textual_ui.widgets.bubbles import STREAM_FPS
+
+        bubble = SkyBubble("")
+        async with self.app_com_bubble(bubble).run_test() as pilot:
+            markdown = bubble.query_one("#sky-message", Markdown)
+            with patch.object(markdown, "append", wraps=markdown.append) as append:
+                inicio = time.monotonic()
+                for i in range(200):
+                    bubble.stream(f"palavra{i} ")
+                    await pilot.pause(0.001)
+                await bubble.end_stream()
+                duracao = time.monotonic() - inicio
+
+            # Um frame a cada 1/STREAM_FPS (+ frame inicial e o de end_stream)
+            assert 1 <= append.call_count < 200
+            assert append.call_count <= duracao * STREAM_FPS + 2
+            assert bubble.content == "".join(f"palavra{i} " for i in range(200))
@@ -118,7 +118,109 @@ class TestChatScroll:
         assert callable(scroll.limpar)
 
 
+
+class TestChatScrollVirtualizado:
+    """Testa a virtualização de turnos antigos no ChatScroll."""
+
+    @staticmethod
+    def app_com_scroll(scroll):
+        from textual.app import App
+
+        class ScrollApp(App):
+            def compose(self):
+                yield scroll
+
+        return ScrollApp()
+
+    @staticmethod
+    def placeholders(scroll):
+        from core.sky.chat.textual_ui.widgets.transcript import TurnPlaceholder
+
+        return [child for child in scroll.children if isinstance(child, TurnPlaceholder)]
+
+    @staticmethod
+    def turnos_vivos(scroll):
+        from core.sky.chat.textual_ui.widgets.turn import Turn
+
+        return [child for child in scroll.children if isinstance(child, Turn)]
+
+    @pytest.mark.asyncio
+    async def test_turnos_antigos_viram_placeholders(self):
+        """
+        QUANDO a sessão passa de max_live_turns turnos concluídos
+        ENTÃO turnos antigos saem do DOM e ficam no transcript
+        """
+        scroll = ChatScroll(max_live_turns=3)
+        async with self.app_com_scroll(scroll).run_test() as pilot:
+            for i in range(1, 9):
+                turn = scroll.iniciar_turno(f"pergunta {i}")
+                await pilot.pause()
+                turn.set_response(f"resposta **{i}**")
+                await pilot.pause()
+
+            assert scroll.turn_count == 8
+            assert len(self.turnos_vivos(scroll)) <= 4
+            assert [r.turn_number for r in scroll.transcript] == list(range(1, len(scroll.transcript) + 1))
+            assert len(self.placeholders(scroll)) == len(scroll.transcript) >= 4
+            assert scroll.transcript[0].user_message == "pergunta 1"
+            assert scroll.transcript[0].response == "resposta **1**"
+
+    @pytest.mark.asyncio
+    async def test_turno_em_andamento_nao_e_arquivado(self):
+        """
+        QUANDO um turno antigo ainda não terminou
+        ENTÃO continua montado como Turn
+        """
+        scroll = ChatScroll(max_live_turns=1)
+        async with self.app_com_scroll(scroll).run_test() as pilot:
+            pendente = scroll.iniciar_turno("ainda pensando")
+            await pilot.pause()
+            scroll.iniciar_turno("outra")
+            await pilot.pause()
+
+            assert pendente in self.turnos_vivos(scroll)
+            assert scroll.transcript == []
+
+    @pytest.mark.asyncio
+    async def test_placeholder_hidrata_ao_entrar_na_viewport(self):
+        """
+        QUANDO o usuário rola até um turno arquivado
+        ENTÃO o placeholder é re-hidratado; longe da viewport fica vazio
+        """
+        scroll = ChatScroll(max_live_turns=2)
+        async with self.app_com_scroll(scroll).run_test(size=(80, 20)) as pilot:
+            for i in range(1, 16):
+                turn = scroll.iniciar_turno(f"pergunta {i}")
+                await pilot.pause()
+                turn.set_response("linha\n\n" * 3)
+                await pilot.pause()
+
+            scroll.scroll_end(animate=False)
+            await pilot.pause()
+            primeiro = self.placeholders(scroll)[0]
+            assert not primeiro.is_hydrated
+
+            scroll.scroll_home(animate=False)
+            await pilot.pause()
+            assert primeiro.is_hydrated
+
+    def test_limpar_reseta_contagem(self):
+        """
+        QUANDO limpar() é chamado
+        ENTÃO contagem de turnos e transcript são resetados
+        """
+        scroll = ChatScroll()
+        scroll._turn_count = 5
+        scroll.remove_children = lambda: None
+
+        scroll.limpar()
+
+        assert scroll.turn_count == 0
+        assert scroll.transcript == []
+
+
 __all__ = [
     "TestChatLog",
     "TestChatScroll",
+    "TestChatScrollVirtualizado",
 ]
@@ -0,0 +1,91 @@
+# coding: utf-8
+"""
+Testes unitários para o cache de embeddings (LRU + SQLite persistente).
+"""
+
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from src.core.sky.memory.embedding.embedding import SentenceTransformerEmbedding
+
+
+class FakeModel:
+    """Modelo determinístico que registra os textos codificados."""
+
+    def __init__(self):
+        self.calls: list = []
+
+    def encode(self, texts):
+        self.calls.append(texts)
+        if isinstance(texts, str):
+            return np.array([float(len(texts)), 1.0])
+        return np.array([[float(len(t)), 1.0] for t in texts])
+
+
+@pytest.fixture
+def client():
+    with tempfile.TemporaryDirectory() as tmp:
+        model = FakeModel()
+        embedding = SentenceTransformerEmbedding(db_path=Path(tmp) / "cache.db", memory_cache_size=2)
+        with patch.object(embedding, "_get_model", return_value=model):
+            yield embedding, model
+        embedding.close()
+
+
+class TestEmbeddingCache:
+    """Testes do cache de embeddings."""
+
+    def test_encode_usa_cache_na_segunda_chamada(self, client):
+        """Texto já codificado não chama o modelo de novo."""
+        embedding, model = client
+
+        first = embedding.encode("olá")
+        second = embedding.encode("olá")
+
+        assert first == second == [3.0, 1.0]
+        assert model.calls == ["olá"]
+
+    def test_encode_batch_codifica_apenas_misses_uma_vez(self, client):
+        """Lote consulta o cache de uma vez e codifica só textos novos (sem duplicatas)."""
+        embedding, model = client
+        embedding.encode("a")
+
+        result = embedding.encode_batch(["a", "bb", "bb", "ccc"])
+
+        assert result == [[1.0, 1.0], [2.0, 1.0], [2.0, 1.0], [3.0, 1.0]]
+        assert model.calls == ["a", ["bb", "ccc"]]
+
+    def test_cache_persiste_entre_instancias(self, client):
+        """Vetores gravados no SQLite são lidos por outra instância (LRU vazio)."""
+        embedding, model = client
+        embedding.encode_batch(["x", "yy"])
+
+        other = SentenceTransformerEmbedding(db_path=embedding._db_path)
+        try:
+            with patch.object(other, "_get_model", side_effect=AssertionError("não deve codificar")):
+                assert other.encode_batch(["yy", "x"]) == [[2.0, 1.0], [1.0, 1.0]]
+        finally:
+            other.close()
+
+    def test_lru_limita_vetores_em_memoria(self, client):
+        """LRU mantém só os memory_cache_size vetores mais recentes."""
+        embedding, _model = client
+
+        embedding.encode_batch(["a", "b", "c"])
+
+        assert len(embedding._memory_cache) == 2
+        assert embedding._hash_text("a") not in embedding._memory_cache
+
+    def test_clear_cache_limpa_memoria_e_banco(self, client):
+        """clear_cache remove vetores do LRU e do SQLite."""
+        embedding, model = client
+        embedding.encode("texto")
+
+        embedding.clear_cache()
+        embedding.encode("texto")
+
+        assert model.calls == ["texto", "texto"]
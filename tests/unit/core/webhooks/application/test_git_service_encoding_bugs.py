@@ -24,15 +24,15 @@ class TestGitServiceEncodingBug:
         DOC: git_service.py - commit() deve handle caracteres especiais no output do git.
 
         Bug: UnicodeDecodeError quando git retorna caracteres como emoji ou aspas especiais.
-        Causa: subprocess.run() com text=True usa encoding do sistema (cp1252 no Windows).
+        Causa: subprocess.run() com text=True usava encoding do sistema (cp1252 no Windows).
 
-        Esperado: commit() usa encoding='utf-8' para evitar erro de decode.
+        Esperado: saída do git é decodificada como UTF-8 (AsyncProcessRunner).
         """
         mock_result = Mock()
         mock_result.stdout = "abc123\n"
         mock_result.stderr = ""
 
-        with patch('subprocess.run', return_value=mock_result):
+        with patch('infra.process.async_process_runner.AsyncProcessRunner.run', return_value=mock_result):
             with patch.object(GitService, '_get_last_commit_hash', return_value=Result.ok("abc123")):
                 with patch.object(GitService, '_get_commit_stats', return_value={}):
                     service = GitService()
@@ -66,7 +66,7 @@ class TestGitServiceStderrNoneBug:
             stderr=None
         )
 
-        with patch('subprocess.run', side_effect=mock_error):
+        with patch('infra.process.async_process_runner.AsyncProcessRunner.run', side_effect=mock_error):
             service = GitService()
 
             result = await service.commit(
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+Testes para JobGuardrails incremental (seleção de testes e cache).
+
+DOC: src/core/webhooks/application/guardrails.py
+DOC: src/core/webhooks/application/affected_tests.py
+"""
+
+import subprocess
+from unittest.mock import AsyncMock
+
+import pytest
+
+from core.webhooks.application.affected_tests import select_affected_tests
+from core.webhooks.application.guardrails import JobGuardrails
+from core.webhooks.application.guardrails_cache import GuardrailsCache
+from infra.process import AsyncProcessRunner, ProcessResult
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Repositório git com layout src/ e dois testes independentes."""
+    files = {
+        "src/app/__init__.py": "",
+        "src/app/calc.py": "def soma(a, b):\n    return a + b\n",
+        "src/app/texto.py": "def upper(s):\n    return s.upper()\n",
+        "src/app/api.py": "from app.calc import soma\n",
+        "tests/test_calc.py": "from app import api\n",
+        "tests/test_texto.py": "from app.texto import upper\n",
+        "README.md": "# repo\n",
+    }
+    for path, content in files.items():
+        target = tmp_path / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(content)
+
+    def git(*args):
+        subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True)
+
+    git("init", "-q")
+    git("add", ".")
+    git("-c", "user.name=t", "-c", "user.email=t@t", "commit", "-q", "-m", "init")
+    return tmp_path
+
+
+class TestSelectAffectedTests:
+    """Seleção por grafo de imports."""
+
+    def test_seleciona_testes_que_importam_transitivamente(self, repo):
+        """Mudança em calc.py afeta test_calc (via api.py), não test_texto."""
+        selection = select_affected_tests(str(repo), ["src/app/calc.py"], ["tests"], GuardrailsCache())
+
+        assert not selection.full_suite
+        assert selection.targets == ["tests/test_calc.py"]
+
+    def test_fallback_para_suite_inteira(self, repo):
+        """conftest/config e arquivos de dados forçam a suíte inteira."""
+        cache = GuardrailsCache()
+
+        assert select_affected_tests(str(repo), ["tests/conftest.py"], ["tests"], cache).full_suite
+        assert select_affected_tests(str(repo), ["tests/data.json"], ["tests"], cache).full_suite
+
+        docs_only = select_affected_tests(str(repo), ["README.md"], ["tests"], cache)
+        assert not docs_only.full_suite
+        assert docs_only.targets == []
+
+    def test_python_sem_testes_afetados_roda_suite_inteira(self, repo):
+        """Módulo sem importadores estáticos (ex: import dinâmico) não pula o pytest."""
+        (repo / "src/app/plugin.py").write_text("VALOR = 1\n")
+
+        selection = select_affected_tests(str(repo), ["src/app/plugin.py"], ["tests"], GuardrailsCache())
+
+        assert selection.full_suite
+        assert selection.reason == "no_affected_tests"
+
+
+class TestJobGuardrailsIncremental:
+    """validate_all com pytest mockado no runner."""
+
+    @pytest.mark.asyncio
+    async def test_revalidacao_sem_mudancas_reaproveita_cache(self, repo):
+        """Syntax e pytest não são refeitos quando o conteúdo não mudou."""
+        (repo / "src/app/calc.py").write_text("def soma(a, b):\n    return b + a\n")
+
+        runner = AsyncProcessRunner()
+        real_run = runner.run
+        pytest_calls = []
+
+        async def run(args, **kwargs):
+            if args[:3] == ["python", "-m", "pytest"]:
+                pytest_calls.append(args)
+                return ProcessResult(args=args, returncode=0, stdout="1 passed in 0.01s")
+            return await real_run(args, **kwargs)
+
+        runner.run = AsyncMock(side_effect=run)
+        guardrails = JobGuardrails(runner=runner, cache=GuardrailsCache())
+
+        first = await guardrails.validate_all(str(repo))
+        assert first.is_ok
+        assert first.value.passed == ["diff_check", "syntax_check", "pytest_check"]
+        assert pytest_calls[0][-1] == "tests/test_calc.py"
+        assert first.value.metadata["pytest"]["selection"]["mode"] == "affected"
+
+        second = await guardrails.validate_all(str(repo))
+        assert second.is_ok
+        assert second.value.metadata["pytest"]["cached"] is True
+        assert len(pytest_calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_novo_head_invalida_cache_do_pytest(self, repo):
+        """Mesmo path e mesmas mudanças sobre outro commit rodam o pytest de novo."""
+        (repo / "src/app/calc.py").write_text("def soma(a, b):\n    return b + a\n")
+
+        runner = AsyncProcessRunner()
+        real_run = runner.run
+        pytest_calls = []
+
+        async def run(args, **kwargs):
+            if args[:3] == ["python", "-m", "pytest"]:
+                pytest_calls.append(args)
+                return ProcessResult(args=args, returncode=0, stdout="1 passed in 0.01s")
+            return await real_run(args, **kwargs)
+
+        runner.run = AsyncMock(side_effect=run)
+        guardrails = JobGuardrails(runner=runner, cache=GuardrailsCache())
+
+        first = await guardrails.validate_all(str(repo))
+        assert first.is_ok
+        assert len(pytest_calls) == 1
+
+        # Simula slot do pool resetado para uma nova base (api.py muda no HEAD)
+        (repo / "src/app/api.py").write_text("from app.calc import soma as add\n")
+        subprocess.run(
+            ["git", "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-q", "-m", "base", "src/app/api.py"],
+            cwd=repo,
+            check=True,
+            capture_output=True,
+        )
+
+        second = await guardrails.validate_all(str(repo))
+        assert second.is_ok
+        assert "cached" not in second.value.metadata["pytest"]
+        assert len(pytest_calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_erro_de_syntax_bloqueia_e_cancela_pytest(self, repo):
+        """Syntax inválida retorna erro com arquivo e linha."""
+        (repo / "src/app/texto.py").write_text("def upper(s)\n    return s\n")
+
+        runner = AsyncProcessRunner()
+        guardrails = JobGuardrails(runner=runner, cache=GuardrailsCache())
+
+        result = await guardrails.validate_all(str(repo))
+
+        assert result.is_err
+        assert "src/app/texto.py:1" in result.error
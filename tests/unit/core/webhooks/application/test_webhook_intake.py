@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+"""
+Testes para ingestão de webhooks (inbox durável + intake).
+
+DOC: src/core/webhooks/application/webhook_intake.py
+DOC: src/infra/webhooks/adapters/journal_webhook_inbox.py
+"""
+
+import asyncio
+import json
+import threading
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from core.webhooks.application.webhook_intake import WebhookIntake
+from core.webhooks.application.webhook_processor import WebhookProcessor
+from core.webhooks.domain import WebhookDelivery
+from infra.webhooks.adapters.journal_webhook_inbox import JournalWebhookInbox
+from kernel.contracts.result import Result
+
+
+GITHUB_HEADERS = {
+    "X-GitHub-Event": "issues",
+    "X-GitHub-Delivery": "gh-delivery-1",
+    "X-Hub-Signature-256": "sha256=abc",
+    "User-Agent": "GitHub-Hookshot",
+}
+
+
+async def wait_until(predicate, timeout=2.0):
+    """Aguarda o intake (task em segundo plano) atingir um estado."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("condição não atingida")
+        await asyncio.sleep(0.01)
+
+
+class TestJournalWebhookInbox:
+    """Persistência, recuperação e compactação."""
+
+    @pytest.mark.asyncio
+    async def test_pendentes_sobrevivem_a_reabertura(self, tmp_path):
+        path = tmp_path / "inbox.log"
+        inbox = JournalWebhookInbox(path)
+        first = WebhookDelivery.create("github", b'{"a": 1}')
+        second = WebhookDelivery.create("github", b'{"a": 2}')
+
+        await asyncio.gather(inbox.append(first), inbox.append(second))
+        await inbox.ack(first.delivery_id)
+        await asyncio.sleep(0.05)  # ack é gravado sem aguardar o caller
+
+        reopened = JournalWebhookInbox(path)
+        assert [d.delivery_id for d in reopened.pending()] == [second.delivery_id]
+        assert reopened.pending()[0].body == '{"a": 2}'
+
+    @pytest.mark.asyncio
+    async def test_entrega_so_fica_pendente_apos_fsync(self, tmp_path):
+        """O intake não enxerga (nem confirma) entrega que ainda não é durável."""
+        inbox = JournalWebhookInbox(tmp_path / "inbox.log")
+        writing, release = threading.Event(), threading.Event()
+        real_write = inbox._write
+
+        def slow_write(lines, durable):
+            writing.set()
+            release.wait(timeout=2)
+            real_write(lines, durable)
+
+        inbox._write = slow_write
+        delivery = WebhookDelivery.create("github", b"{}")
+        append = asyncio.create_task(inbox.append(delivery))
+
+        await wait_until(writing.is_set)
+        assert inbox.pending() == []
+
+        release.set()
+        await append
+        assert [d.delivery_id for d in inbox.pending()] == [delivery.delivery_id]
+
+    @pytest.mark.asyncio
+    async def test_compacta_mantendo_pendentes(self, tmp_path):
+        path = tmp_path / "inbox.log"
+        inbox = JournalWebhookInbox(path, compact_threshold=4)
+        deliveries = [WebhookDelivery.create("trello", b"{}") for _ in range(3)]
+        for delivery in deliveries:
+            await inbox.append(delivery)
+        for delivery in deliveries[:2]:
+            await inbox.ack(delivery.delivery_id)
+        await asyncio.sleep(0.05)
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0])["delivery"]["delivery_id"] == deliveries[2].delivery_id
+
+
+class TestWebhookIngest:
+    """ingest() responde após o append; o intake cria o job depois."""
+
+    @pytest.fixture
+    def job_queue(self):
+        queue = Mock()
+        queue.enqueue = AsyncMock(side_effect=lambda job: job.job_id)
+        queue.exists_by_delivery = AsyncMock(return_value=False)
+        return queue
+
+    @pytest.fixture
+    def event_bus(self):
+        return Mock(publish=AsyncMock())
+
+    @pytest.mark.asyncio
+    async def test_ingest_github_enfileira_via_intake(self, tmp_path, job_queue, event_bus):
+        inbox = JournalWebhookInbox(tmp_path / "inbox.log")
+        worker = WebhookProcessor(job_queue, event_bus)
+        intake = WebhookIntake(inbox, worker.process_delivery)
+        processor = WebhookProcessor(job_queue, event_bus, intake=intake)
+
+        body = json.dumps({"action": "opened", "issue": {"number": 7, "title": "Bug"}})
+        result = await processor.ingest("github", body.encode(), GITHUB_HEADERS)
+
+        assert result.is_ok
+        await wait_until(lambda: not inbox.pending())
+
+        job = job_queue.enqueue.await_args[0][0]
+        assert job.event.event_type == "issues.opened"
+        assert job.event.delivery_id == "gh-delivery-1"
+        assert job.issue_number == 7
+
+        stored = JournalWebhookInbox(tmp_path / "inbox.log").pending()
+        assert stored == []
+
+    @pytest.mark.asyncio
+    async def test_payload_invalido_e_descartado(self, tmp_path, job_queue, event_bus):
+        inbox = JournalWebhookInbox(tmp_path / "inbox.log")
+        worker = WebhookProcessor(job_queue, event_bus)
+        results = []
+
+        async def process(delivery):
+            results.append(await worker.process_delivery(delivery))
+            return results[-1]
+
+        intake = WebhookIntake(inbox, process)
+        await intake.submit(WebhookDelivery.create("github", b"{not json", {"x-github-event": "issues"}))
+        await wait_until(lambda: not inbox.pending())
+
+        assert results[0].is_err
+        assert "JSON" in results[0].error
+        job_queue.enqueue.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_start_retoma_pendentes_do_inbox(self, tmp_path):
+        path = tmp_path / "inbox.log"
+        await JournalWebhookInbox(path).append(WebhookDelivery.create("github", b"{}"))
+
+        processed = []
+
+        async def process(delivery):
+            processed.append(delivery.delivery_id)
+            return Result.ok(None)
+
+        inbox = JournalWebhookInbox(path)
+        intake = WebhookIntake(inbox, process)
+        intake.start()
+        await wait_until(lambda: processed)
+        await intake.stop()
+
+        assert len(processed) == 1
+        assert inbox.pending() == []
+
+    @pytest.mark.asyncio
+    async def test_falha_transitoria_fica_pendente_e_e_repetida(self, tmp_path, monkeypatch):
+        from core.webhooks.application import webhook_intake
+        from core.webhooks.ports.job_queue_port import QueueError
+
+        monkeypatch.setattr(webhook_intake, "RETRY_BASE_DELAY", 0.01)
+        inbox = JournalWebhookInbox(tmp_path / "inbox.log")
+        first = WebhookDelivery.create("github", b'{"n": 1}')
+        second = WebhookDelivery.create("github", b'{"n": 2}')
+        attempts: list[str] = []
+
+        async def process(delivery):
+            attempts.append(delivery.delivery_id)
+            if len(attempts) <= 2:
+                raise QueueError("fila indisponível")
+            return Result.ok(None)
+
+        intake = WebhookIntake(inbox, process)
+        await inbox.append(first)
+        await inbox.append(second)
+        intake.start()
+        await wait_until(lambda: not inbox.pending())
+        await intake.stop()
+
+        # A primeira entrega é repetida antes de a segunda ser processada
+        assert attempts == [first.delivery_id] * 3 + [second.delivery_id]
+
+    @pytest.mark.asyncio
+    async def test_fila_indisponivel_propaga_em_process_delivery(self, tmp_path, event_bus):
+        from core.webhooks.ports.job_queue_port import QueueError
+
+        queue = Mock()
+        queue.exists_by_delivery = AsyncMock(return_value=False)
+        queue.enqueue = AsyncMock(side_effect=QueueError("disco cheio"))
+        worker = WebhookProcessor(queue, event_bus)
+        body = json.dumps({"action": "opened", "issue": {"number": 7, "title": "Bug"}})
+        delivery = WebhookDelivery.create("github", body.encode(), GITHUB_HEADERS)
+
+        with pytest.raises(QueueError):
+            await worker.process_delivery(delivery)
+
+    @pytest.mark.asyncio
+    async def test_fonte_nao_suportada(self, job_queue, event_bus):
+        processor = WebhookProcessor(job_queue, event_bus, intake=Mock())
+
+        result = await processor.ingest("discord", b"{}", {})
+
+        assert result.is_err
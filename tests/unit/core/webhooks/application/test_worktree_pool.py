@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+Testes para WorktreePool (pré-aquecimento, entrega, reciclagem).
+
+DOC: src/core/webhooks/application/worktree_pool.py
+"""
+
+import subprocess
+
+import pytest
+
+from core.webhooks.application.worktree_pool import WorktreePool
+from infra.process import AsyncProcessRunner
+
+
+def git(cwd, *args) -> str:
+    """Executa git de forma síncrona no setup dos testes."""
+    return subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        cwd=cwd, check=True, capture_output=True, text=True,
+    ).stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Repositório com branch base 'dev'."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    git(repo, "init", "-q", "-b", "dev")
+    (repo / "app.py").write_text("print('v1')\n")
+    git(repo, "add", ".")
+    git(repo, "commit", "-q", "-m", "v1")
+    return repo
+
+
+@pytest.fixture
+def pool(repo, tmp_path):
+    """Pool com 1 slot fora do repositório."""
+    return WorktreePool(
+        tmp_path / "worktrees" / ".pool",
+        "dev",
+        size=1,
+        repo_path=repo,
+        runner=AsyncProcessRunner(),
+    )
+
+
+class TestWorktreePool:
+    """Testes com git real."""
+
+    @pytest.mark.asyncio
+    async def test_acquire_entrega_slot_na_nova_branch(self, pool, repo, tmp_path):
+        """Slot pronto é movido para o caminho do job já na branch nova."""
+        await pool.warm()
+        assert pool.ready_count == 1
+
+        target = tmp_path / "worktrees" / "skybridge-github-1-abc"
+        assert await pool.acquire(target, "webhook/github/issue/1/abc") is True
+
+        assert (target / "app.py").read_text() == "print('v1')\n"
+        assert git(target, "rev-parse", "--abbrev-ref", "HEAD") == "webhook/github/issue/1/abc"
+
+        # Pool vazio: caller cria o worktree do zero; reposição em background
+        assert await pool.acquire(tmp_path / "worktrees" / "outro", "b2") is False
+
+    @pytest.mark.asyncio
+    async def test_refresh_acompanha_branch_base(self, pool, repo):
+        """Slots são atualizados quando a branch base avança."""
+        await pool.warm()
+        (repo / "app.py").write_text("print('v2')\n")
+        git(repo, "commit", "-q", "-am", "v2")
+
+        await pool.refresh()
+
+        slot = next(iter(pool._ready))
+        assert (slot / "app.py").read_text() == "print('v2')\n"
+        assert pool._ready[slot] == git(repo, "rev-parse", "dev")
+
+    @pytest.mark.asyncio
+    async def test_release_recicla_worktree_limpo(self, pool, repo, tmp_path):
+        """Worktree limpo volta ao pool na branch base e a branch do job é preservada."""
+        target = tmp_path / "worktrees" / "job"
+        git(repo, "worktree", "add", "-q", "-b", "job-branch", str(target), "dev")
+        (target / "app.py").write_text("alterado\n")
+        (target / "novo.txt").write_text("novo\n")
+        git(target, "add", ".")
+        git(target, "commit", "-q", "-m", "job")
+
+        assert await pool.release(target) is True
+
+        assert not target.exists()
+        slot = next(iter(pool._ready))
+        assert (slot / "app.py").read_text() == "print('v1')\n"
+        assert not (slot / "novo.txt").exists()
+        assert "job-branch" in git(repo, "branch", "--list", "job-branch")
+
+        # Pool cheio: caller remove normalmente
+        other = tmp_path / "worktrees" / "job2"
+        git(repo, "worktree", "add", "-q", "-b", "job2", str(other), "dev")
+        assert await pool.release(other) is False
+
+    @pytest.mark.asyncio
+    async def test_release_nao_recicla_worktree_com_mudancas(self, pool, repo, tmp_path):
+        """Mudanças não commitadas nunca são descartadas pela reciclagem."""
+        target = tmp_path / "worktrees" / "job"
+        git(repo, "worktree", "add", "-q", "-b", "job-branch", str(target), "dev")
+        (target / "app.py").write_text("alterado\n")
+        (target / "novo.txt").write_text("untracked\n")
+
+        assert await pool.release(target) is False
+
+        # Caller faz o `git worktree remove` sem --force, que recusa o diretório
+        assert (target / "app.py").read_text() == "alterado\n"
+        assert (target / "novo.txt").exists()
+        assert pool.ready_count == 0
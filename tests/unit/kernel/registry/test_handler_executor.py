@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+Testes para HandlerExecutor (execução de handlers fora do event loop).
+
+DOC: src/kernel/registry/handler_executor.py
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from kernel.contracts.result import Result
+from kernel.registry.handler_executor import HandlerExecutor, HandlerTimeoutError
+from kernel.registry.query_registry import QueryHandler
+
+
+@pytest.fixture
+def executor():
+    """Executor isolado do singleton global."""
+    executor = HandlerExecutor(max_threads=4)
+    yield executor
+    executor.shutdown(wait=True)
+
+
+class TestQueryHandlerExecution:
+    """Detecção/validação do modo de execução no registro."""
+
+    def test_detecta_modo_pela_assinatura(self):
+        async def async_handler():
+            return Result.ok(1)
+
+        def sync_handler():
+            return Result.ok(1)
+
+        assert QueryHandler(name="a", handler=async_handler).execution == "async"
+        assert QueryHandler(name="s", handler=sync_handler).execution == "thread"
+
+    def test_modo_invalido(self):
+        with pytest.raises(ValueError):
+            QueryHandler(name="x", handler=lambda: None, execution="gpu")
+
+
+class TestHandlerExecutor:
+    """Despacho, timeout e limite de concorrência."""
+
+    @pytest.mark.asyncio
+    async def test_handler_async_e_aguardado(self, executor):
+        async def handler(args):
+            await asyncio.sleep(0)
+            return Result.ok(args["x"] * 2)
+
+        result = await executor.execute(QueryHandler(name="t.async", handler=handler), {"x": 21})
+
+        assert result.is_ok
+        assert result.value == 42
+
+    @pytest.mark.asyncio
+    async def test_handler_sync_nao_bloqueia_loop(self, executor):
+        """O loop segue processando enquanto o handler síncrono dorme."""
+        def handler():
+            time.sleep(0.2)
+            return Result.ok("done")
+
+        ticks = 0
+
+        async def heartbeat():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        beat = asyncio.create_task(heartbeat())
+        result = await executor.execute(QueryHandler(name="t.sync", handler=handler))
+        beat.cancel()
+
+        assert result.value == "done"
+        assert ticks >= 5
+
+    @pytest.mark.asyncio
+    async def test_timeout(self, executor):
+        async def handler():
+            await asyncio.sleep(1)
+
+        with pytest.raises(HandlerTimeoutError) as exc:
+            await executor.execute(QueryHandler(name="t.slow", handler=handler, timeout=0.05))
+
+        assert exc.value.method == "t.slow"
+        assert exc.value.timeout == 0.05
+
+    @pytest.mark.asyncio
+    async def test_max_concurrency_serializa(self, executor):
+        running = 0
+        peak = 0
+
+        async def handler():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return Result.ok(None)
+
+        qh = QueryHandler(name="t.limited", handler=handler, max_concurrency=1)
+        await asyncio.gather(*(executor.execute(qh) for _ in range(5)))
+
+        assert peak == 1
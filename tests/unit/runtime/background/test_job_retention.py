@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+Testes para o JobRetentionService.
+
+Valida:
+- Ciclo chama arquivamento, purge de deliveries e compactação
+- Bancos SQLite antigos são convertidos para compactação incremental
+- Filas sem suporte (defaults do port) tornam o ciclo um no-op
+- stop() encerra o loop sem esperar o intervalo
+"""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from infra.webhooks.adapters.in_memory_queue import InMemoryJobQueue
+from infra.webhooks.adapters.sqlite_job_queue import SQLiteJobQueue
+from runtime.background.job_retention import JobRetentionService
+
+
+class RecordingQueue(InMemoryJobQueue):
+    """Fila em memória que registra chamadas de retenção."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls: list[tuple] = []
+
+    async def archive_finished_jobs(self, older_than_days: int, batch_size: int = 500) -> int:
+        self.calls.append(("archive", older_than_days, batch_size))
+        return 3
+
+    async def purge_expired_deliveries(self) -> int:
+        self.calls.append(("purge",))
+        return 4
+
+    async def compact_storage(self, max_pages: int = 1000) -> int:
+        self.calls.append(("compact", max_pages))
+        return 12
+
+
+@pytest.mark.asyncio
+async def test_run_once_archives_then_compacts():
+    """Ciclo arquiva, remove deliveries expirados e depois compacta."""
+    queue = RecordingQueue()
+    service = JobRetentionService(queue, retention_days=30, batch_size=100, vacuum_pages=50)
+
+    assert await service.run_once() == {
+        "archived": 3,
+        "purged_deliveries": 4,
+        "reclaimed_pages": 12,
+    }
+    assert queue.calls == [("archive", 30, 100), ("purge",), ("compact", 50)]
+
+
+@pytest.mark.asyncio
+async def test_run_once_noop_for_queue_without_archive():
+    """Defaults do port: nada arquivado, nada liberado."""
+    service = JobRetentionService(InMemoryJobQueue())
+    assert await service.run_once() == {
+        "archived": 0,
+        "purged_deliveries": 0,
+        "reclaimed_pages": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_stop_interrupts_interval_wait():
+    """stop() acorda o loop mesmo com intervalo longo."""
+    queue = RecordingQueue()
+    service = JobRetentionService(queue, interval=3600)
+    task = asyncio.create_task(service.start())
+    await asyncio.sleep(0.05)
+
+    service.stop()
+    await asyncio.wait_for(task, timeout=1)
+    assert queue.calls[0][0] == "archive"
+
+
+@pytest.mark.asyncio
+async def test_legacy_sqlite_database_is_converted_once(tmp_path):
+    """Banco sem auto_vacuum=INCREMENTAL é convertido no primeiro ciclo."""
+    queue = SQLiteJobQueue(db_path=str(tmp_path / "jobs.db"))
+    with queue._pool.writer() as conn:
+        conn.execute("PRAGMA auto_vacuum=NONE")
+        conn.execute("VACUUM")
+        conn.execute(
+            "INSERT INTO delivery_tracking VALUES "
+            "('old', 'job-0', '2000-01-01', '2000-01-02')"
+        )
+        conn.commit()
+        assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 0
+
+    service = JobRetentionService(queue)
+    stats = await service.run_once()
+
+    assert stats["purged_deliveries"] == 1
+    with queue._pool.reader() as conn:
+        assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+
+
+@pytest.mark.asyncio
+async def test_legacy_sqlite_database_without_conversion_skips_compaction(tmp_path):
+    """convert_storage=False mantém o banco e não tenta compactar."""
+    queue = SQLiteJobQueue(db_path=str(tmp_path / "jobs.db"))
+    with queue._pool.writer() as conn:
+        conn.execute("PRAGMA auto_vacuum=NONE")
+        conn.execute("VACUUM")
+        conn.commit()
+
+    service = JobRetentionService(queue, convert_storage=False)
+    assert (await service.run_once())["reclaimed_pages"] == 0
+    with queue._pool.reader() as conn:
+        assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 0
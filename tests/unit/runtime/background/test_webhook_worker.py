@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+"""
+Testes para o pool concorrente do WebhookWorker.
+
+Valida:
+- Jobs de issues diferentes executam em paralelo (até max_concurrent_jobs)
+- Jobs da mesma issue são serializados
+- Limite de jobs simultâneos por repositório
+- Backpressure: jobs excedentes permanecem na fila
+"""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from core.webhooks.domain import (
+    WebhookEvent,
+    WebhookJob,
+    WebhookSource,
+    get_concurrency_keys,
+)
+from infra.webhooks.adapters.in_memory_queue import InMemoryJobQueue
+from kernel.contracts.result import Result
+from runtime.background.webhook_worker import WebhookWorker
+
+
+def _make_job(job_id: str, repo: str = "h4mn/skybridge", issue: int = 1) -> WebhookJob:
+    """Cria job GitHub para o repositório/issue informados."""
+    owner, name = repo.split("/")
+    event = WebhookEvent(
+        source=WebhookSource.GITHUB,
+        event_type="issues.opened",
+        event_id=f"evt-{job_id}",
+        payload={
+            "action": "opened",
+            "issue": {"number": issue, "title": "Test", "body": ""},
+            "repository": {"owner": {"login": owner}, "name": name},
+        },
+        received_at=datetime.utcnow(),
+    )
+    job = WebhookJob.create(event)
+    job.job_id = job_id
+    return job
+
+
+class FakeOrchestrator:
+    """Orquestrador que registra concorrência e segura cada job por `delay`."""
+
+    def __init__(self, queue: InMemoryJobQueue, delay: float = 0.1):
+        self.queue = queue
+        self.delay = delay
+        self.running: set[str] = set()
+        self.max_parallel = 0
+        self.order: list[str] = []
+        self.overlaps: list[tuple[str, str]] = []
+
+    async def execute_job(self, job_id: str) -> Result:
+        job = await self.queue.get_job(job_id)
+        _, issue_key = get_concurrency_keys(job)
+        for other in self.running:
+            other_job = await self.queue.get_job(other)
+            if get_concurrency_keys(other_job)[1] == issue_key:
+                self.overlaps.append((other, job_id))
+
+        self.running.add(job_id)
+        self.order.append(job_id)
+        self.max_parallel = max(self.max_parallel, len(self.running))
+        await asyncio.sleep(self.delay)
+        self.running.discard(job_id)
+        await self.queue.complete(job_id)
+        return Result.ok({"job_id": job_id})
+
+
+async def _run_until_drained(worker: WebhookWorker, queue: InMemoryJobQueue, count: int):
+    """Executa o worker até `count` jobs completarem."""
+    task = asyncio.create_task(worker.start())
+    try:
+        for _ in range(200):
+            done = [
+                job for job in queue.get_all_jobs().values()
+                if job.status.value == "completed"
+            ]
+            if len(done) >= count:
+                break
+            await asyncio.sleep(0.02)
+    finally:
+        worker.stop()
+        await asyncio.wait_for(task, timeout=5)
+
+
+@pytest.mark.asyncio
+async def test_concurrency_keys_github_and_trello():
+    """Chaves identificam repositório e issue/card."""
+    repo_key, issue_key = get_concurrency_keys(_make_job("j1", "h4mn/skybridge", 7))
+    assert repo_key == "github:h4mn/skybridge"
+    assert issue_key == "github:h4mn/skybridge#7"
+
+    event = WebhookEvent(
+        source=WebhookSource.TRELLO,
+        event_type="updateCard",
+        event_id="evt-trello",
+        payload={
+            "model": {"id": "board1"},
+            "action": {"data": {"card": {"id": "card9"}}},
+        },
+        received_at=datetime.utcnow(),
+    )
+    assert get_concurrency_keys(WebhookJob.create(event)) == (
+        "trello:board1",
+        "trello:board1#card9",
+    )
+
+
+@pytest.mark.asyncio
+async def test_distinct_issues_run_in_parallel():
+    """Jobs de issues diferentes usam os slots disponíveis."""
+    queue = InMemoryJobQueue()
+    orchestrator = FakeOrchestrator(queue)
+    for i in range(4):
+        await queue.enqueue(_make_job(f"job-{i}", issue=i + 1))
+
+    worker = WebhookWorker(queue, orchestrator, poll_interval=0.05, max_concurrent_jobs=4)
+    await _run_until_drained(worker, queue, 4)
+
+    assert orchestrator.max_parallel == 4
+
+
+@pytest.mark.asyncio
+async def test_same_issue_is_serialized_in_order():
+    """Jobs da mesma issue nunca rodam juntos e mantêm a ordem de chegada."""
+    queue = InMemoryJobQueue()
+    orchestrator = FakeOrchestrator(queue, delay=0.05)
+    for i in range(3):
+        await queue.enqueue(_make_job(f"same-{i}", issue=42))
+    await queue.enqueue(_make_job("other", issue=43))
+
+    worker = WebhookWorker(queue, orchestrator, poll_interval=0.05, max_concurrent_jobs=4)
+    await _run_until_drained(worker, queue, 4)
+
+    assert orchestrator.overlaps == []
+    same = [job_id for job_id in orchestrator.order if job_id.startswith("same-")]
+    assert same == ["same-0", "same-1", "same-2"]
+    assert orchestrator.max_parallel == 2
+
+
+@pytest.mark.asyncio
+async def test_per_repository_limit():
+    """max_jobs_per_repository limita jobs simultâneos no mesmo repositório."""
+    queue = InMemoryJobQueue()
+    orchestrator = FakeOrchestrator(queue)
+    for i in range(4):
+        await queue.enqueue(_make_job(f"job-{i}", issue=i + 1))
+
+    worker = WebhookWorker(
+        queue,
+        orchestrator,
+        poll_interval=0.05,
+        max_concurrent_jobs=4,
+        max_jobs_per_repository=2,
+    )
+    await _run_until_drained(worker, queue, 4)
+
+    assert orchestrator.max_parallel == 2
+
+
+@pytest.mark.asyncio
+async def test_backpressure_keeps_excess_jobs_in_queue():
+    """Com slots e buffer cheios, o excedente permanece na fila."""
+    queue = InMemoryJobQueue()
+    orchestrator = FakeOrchestrator(queue, delay=0.3)
+    for i in range(6):
+        await queue.enqueue(_make_job(f"job-{i}", issue=i + 1))
+
+    worker = WebhookWorker(queue, orchestrator, poll_interval=0.05, max_concurrent_jobs=2)
+    task = asyncio.create_task(worker.start())
+    await asyncio.sleep(0.1)
+
+    stats = await worker.get_stats()
+    assert stats["in_flight"] == 2
+    assert stats["queue_depth"] == 4
+
+    worker.stop()
+    await asyncio.wait_for(task, timeout=5)